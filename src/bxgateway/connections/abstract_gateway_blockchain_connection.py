@@ -1,16 +1,20 @@
 import socket
 import time
 import typing
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Optional
 
+from bxcommon import constants
 from bxcommon.connections.abstract_connection import AbstractConnection
+from bxcommon.connections.connection_state import ConnectionState
 from bxcommon.connections.connection_type import ConnectionType
 from bxcommon.messages.abstract_block_message import AbstractBlockMessage
+from bxcommon.messages.abstract_message import AbstractMessage
 from bxcommon.utils import memory_utils
 from bxcommon.utils.stats import stats_format, hooks
 from bxcommon.utils.stats.block_stat_event_type import BlockStatEventType
 from bxcommon.utils.stats.block_statistics_service import block_stats
 from bxgateway import gateway_constants
+from bxgateway.utils.blockchain_message_scheduler import BlockchainMessageScheduler, BlockchainMessagePriority
 from bxutils import logging
 
 if TYPE_CHECKING:
@@ -50,6 +54,125 @@ class AbstractGatewayBlockchainConnection(AbstractConnection["AbstractGatewayNod
 
         self.connection_protocol = None
         self.is_server = False
+        self.outbound_scheduler = BlockchainMessageScheduler(
+            {
+                BlockchainMessagePriority.BLOCK: gateway_constants.BLOCKCHAIN_OUTBOUND_BLOCK_QUANTUM_BYTES,
+                BlockchainMessagePriority.BLOCK_ANNOUNCE:
+                    gateway_constants.BLOCKCHAIN_OUTBOUND_BLOCK_ANNOUNCE_QUANTUM_BYTES,
+                BlockchainMessagePriority.TRANSACTION: gateway_constants.BLOCKCHAIN_OUTBOUND_TRANSACTION_QUANTUM_BYTES,
+            },
+            {
+                BlockchainMessagePriority.BLOCK: gateway_constants.BLOCKCHAIN_OUTBOUND_BLOCK_TTL_S,
+                BlockchainMessagePriority.BLOCK_ANNOUNCE: gateway_constants.BLOCKCHAIN_OUTBOUND_BLOCK_ANNOUNCE_TTL_S,
+                BlockchainMessagePriority.TRANSACTION: gateway_constants.BLOCKCHAIN_OUTBOUND_TRANSACTION_TTL_S,
+            }
+        )
+        self._tx_batch_alarm_id = None
+
+    def enqueue_msg(self, msg, prepend=False):
+        """
+        Queues message for sending to the blockchain node.
+
+        Blocks, block announcements and transactions go through the outbound scheduler and are only written
+        to the output buffer while it is below the watermark, so a block never waits behind a transaction backlog.
+        Other (control) messages and prepended messages are written to the output buffer immediately.
+
+        Transactions are held for up to the transaction batch window (or until the batch size is reached),
+        so a burst of transactions is written to the node in a few large writes instead of one write per transaction.
+        """
+        priority = None if prepend else self.get_message_priority(msg)
+        if priority is None:
+            self._write_msg(msg, prepend)
+            return
+
+        if self.state & ConnectionState.MARK_FOR_CLOSE:
+            return
+
+        self.outbound_scheduler.push(priority, msg, self.get_message_size(msg))
+        if priority == BlockchainMessagePriority.TRANSACTION and self._should_delay_transactions():
+            return
+        self._flush_scheduled_messages()
+
+    def get_message_priority(self, msg: AbstractMessage) -> Optional[BlockchainMessagePriority]:
+        """
+        Returns the scheduling class of the message, or None if the message should be sent right away.
+        """
+        if isinstance(msg, AbstractBlockMessage):
+            return BlockchainMessagePriority.BLOCK
+        return None
+
+    def get_message_size(self, msg: AbstractMessage) -> int:
+        return len(msg.rawbytes())
+
+    def _write_msg(self, msg: AbstractMessage, prepend: bool = False) -> None:
+        super(AbstractGatewayBlockchainConnection, self).enqueue_msg(msg, prepend)
+
+    def _write_tx_batch(self, tx_msgs: List[AbstractMessage]) -> None:
+        """
+        Writes a batch of transaction messages to the output buffer.
+        Subclasses combine the batch into as few output buffer entries (socket writes) as the protocol allows.
+        """
+        for tx_msg in tx_msgs:
+            self._write_msg(tx_msg)
+
+    def _should_delay_transactions(self) -> bool:
+        batch_window_ms = self._get_tx_batch_window_ms()
+        if batch_window_ms <= 0 or \
+                self.outbound_scheduler.queued_bytes(BlockchainMessagePriority.TRANSACTION) >= \
+                self._get_tx_batch_max_bytes():
+            return False
+
+        if self._tx_batch_alarm_id is None:
+            self._tx_batch_alarm_id = self.node.alarm_queue.register_alarm(
+                batch_window_ms / 1000, self._on_tx_batch_window_end
+            )
+        return True
+
+    def _get_tx_batch_window_ms(self) -> int:
+        return getattr(
+            self.node.opts, "blockchain_tx_batch_window_ms", gateway_constants.DEFAULT_BLOCKCHAIN_TX_BATCH_WINDOW_MS
+        )
+
+    def _get_tx_batch_max_bytes(self) -> int:
+        return getattr(
+            self.node.opts, "blockchain_tx_batch_max_bytes", gateway_constants.DEFAULT_BLOCKCHAIN_TX_BATCH_MAX_BYTES
+        )
+
+    def _on_tx_batch_window_end(self):
+        self._tx_batch_alarm_id = None
+        self._flush_scheduled_messages()
+        return constants.CANCEL_ALARMS
+
+    def _flush_scheduled_messages(self) -> None:
+        if self.state & ConnectionState.MARK_FOR_CLOSE:
+            self.outbound_scheduler.clear()
+            return
+
+        max_batch_bytes = self._get_tx_batch_max_bytes()
+        tx_batch = []
+        tx_batch_bytes = 0
+        while self.outputbuf.length + tx_batch_bytes < gateway_constants.BLOCKCHAIN_OUTBOUND_BUFFER_WATERMARK_BYTES:
+            scheduled_message = self.outbound_scheduler.pop()
+            if scheduled_message is None:
+                break
+
+            if scheduled_message.priority != BlockchainMessagePriority.TRANSACTION:
+                if tx_batch:
+                    self._write_tx_batch(tx_batch)
+                    tx_batch = []
+                    tx_batch_bytes = 0
+                self._write_msg(scheduled_message.message)
+                continue
+
+            tx_batch.append(scheduled_message.message)
+            tx_batch_bytes += scheduled_message.size
+            if tx_batch_bytes >= max_batch_bytes:
+                self._write_tx_batch(tx_batch)
+                tx_batch = []
+                tx_batch_bytes = 0
+
+        if tx_batch:
+            self._write_tx_batch(tx_batch)
 
     def advance_sent_bytes(self, bytes_sent):
         if self.message_tracker and self.message_tracker.is_sending_block_message():
@@ -82,6 +205,9 @@ class AbstractGatewayBlockchainConnection(AbstractConnection["AbstractGatewayNod
         else:
             super(AbstractGatewayBlockchainConnection, self).advance_sent_bytes(bytes_sent)
 
+        if self.outbound_scheduler:
+            self._flush_scheduled_messages()
+
     def log_connection_mem_stats(self) -> None:
         """
         logs the connection's memory stats
@@ -1,5 +1,6 @@
 import time
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from argparse import Namespace
 from typing import Tuple, Optional, ClassVar, Type, Set, List, Iterable, Dict
 
@@ -18,7 +19,7 @@ from bxcommon.services import sdn_http_service
 from bxcommon.services.broadcast_service import BroadcastService
 from bxcommon.services.transaction_service import TransactionService
 from bxcommon.storage.block_encrypted_cache import BlockEncryptedCache
-from bxcommon.utils import network_latency, memory_utils
+from bxcommon.utils import network_latency, memory_utils, config
 from bxcommon.utils.alarm_queue import AlarmId
 from bxcommon.utils.expiring_dict import ExpiringDict
 from bxcommon.utils.expiring_set import ExpiringSet
@@ -38,8 +39,10 @@ from bxgateway.services.gateway_broadcast_service import GatewayBroadcastService
 from bxgateway.services.neutrality_service import NeutralityService
 from bxgateway.utils import configuration_utils
 from bxgateway.utils import node_cache
+from bxgateway.utils import tx_service_snapshot
 from bxgateway.utils.blockchain_message_queue import BlockchainMessageQueue
 from bxgateway.utils.stats.gateway_transaction_stats_service import gateway_transaction_stats_service
+from bxgateway.utils.tx_hash_worker_pool import TxHashWorkerPool, create_tx_hash_worker_pool
 from bxutils import logging
 
 logger = logging.get_logger(__name__)
@@ -73,6 +76,8 @@ class AbstractGatewayNode(AbstractNode):
     peer_relays: Set[OutboundPeerModel]
     peer_transaction_relays: Set[OutboundPeerModel]
     blocks_seen: ExpiringSet
+    # sizes of transactions recently sent to blockchain node, by transaction hash
+    txs_sent_to_node: ExpiringDict[Sha256Hash, int]
     in_progress_blocks: BlockEncryptedCache
     block_recovery_service: BlockRecoveryService
     block_queuing_service: BlockQueuingService
@@ -102,6 +107,8 @@ class AbstractGatewayNode(AbstractNode):
         self.remote_node_msg_queue = BlockchainMessageQueue(opts.remote_blockchain_message_ttl)
 
         self.blocks_seen = ExpiringSet(self.alarm_queue, gateway_constants.GATEWAY_BLOCKS_SEEN_EXPIRATION_TIME_S)
+        self.txs_sent_to_node = ExpiringDict(self.alarm_queue,
+                                             gateway_constants.GATEWAY_TXS_SENT_TO_NODE_EXPIRATION_TIME_S)
         self.in_progress_blocks = BlockEncryptedCache(self.alarm_queue)
         self.block_recovery_service = BlockRecoveryService(self.alarm_queue)
         self.neutrality_service = NeutralityService(self)
@@ -136,6 +143,18 @@ class AbstractGatewayNode(AbstractNode):
         else:
             self._tx_service = TransactionService(self, self.network_num)
 
+        self._tx_service_snapshot_path: Optional[str] = getattr(opts, "tx_service_snapshot_path", None)
+        self._tx_service_snapshot_interval: int = getattr(
+            opts, "tx_service_snapshot_interval", gateway_constants.TX_SERVICE_SNAPSHOT_INTERVAL_S
+        )
+        self._tx_service_snapshot_writer: Optional[ThreadPoolExecutor] = None
+        if self._tx_service_snapshot_path:
+            self._tx_service_snapshot_writer = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="tx-service-snapshot"
+            )
+            self._load_tx_service_snapshot()
+            self.alarm_queue.register_alarm(self._tx_service_snapshot_interval, self._save_tx_service_snapshot)
+
         self.init_transaction_stat_logging()
         self.init_node_config_update()
 
@@ -153,6 +172,8 @@ class AbstractGatewayNode(AbstractNode):
         self.block_cleanup_processed_blocks = ExpiringSet(self.alarm_queue,
                                                           gateway_constants.BLOCK_CONFIRMATION_EXPIRE_TIME_S)
 
+        # shared with the message converter, so worker processes are shut down with the node
+        self.tx_hash_pool: Optional[TxHashWorkerPool] = create_tx_hash_worker_pool(self.opts)
         self.message_converter = None
 
     @abstractmethod
@@ -218,6 +239,17 @@ class AbstractGatewayNode(AbstractNode):
 
         return self._tx_service
 
+    def close(self):
+        if self._tx_service_snapshot_writer is not None:
+            # snapshot is written on the writer thread, so wait for it before the process exits
+            self._start_tx_service_snapshot_save()
+            self._tx_service_snapshot_writer.shutdown(wait=True)
+            self._tx_service_snapshot_writer = None
+        self.block_processing_service.close()
+        if self.tx_hash_pool is not None:
+            self.tx_hash_pool.close()
+        super(AbstractGatewayNode, self).close()
+
     def get_preferred_gateway_connection(self):
         """
         Gets gateway connection of highest priority. This is usually a bloxroute owned node, but can also be
@@ -665,6 +697,30 @@ class AbstractGatewayNode(AbstractNode):
         raise EnvironmentError(f"Unexpectedly did not find network num {self.network} in set of blockchain networks: "
                                f"{self.opts.blockchain_networks}")
 
+    def _load_tx_service_snapshot(self):
+        snapshot_path = config.get_relative_file(self._tx_service_snapshot_path)
+        start_time = time.time()
+        try:
+            tx_count = tx_service_snapshot.load(self._tx_service, self.network_num, snapshot_path)
+        except Exception as ex:
+            logger.error("Failed to load transaction service snapshot from {}: {}", snapshot_path, ex)
+        else:
+            logger.info("Restored {} transactions from transaction service snapshot {} in {:.2f}s.",
+                        tx_count, snapshot_path, time.time() - start_time)
+
+    def _save_tx_service_snapshot(self) -> int:
+        self._start_tx_service_snapshot_save()
+        return self._tx_service_snapshot_interval
+
+    def _start_tx_service_snapshot_save(self) -> None:
+        snapshot_path = config.get_relative_file(self._tx_service_snapshot_path)
+        try:
+            tx_service_snapshot.save(
+                self._tx_service, self.network_num, snapshot_path, self._tx_service_snapshot_writer
+            )
+        except Exception as ex:
+            logger.error("Failed to save transaction service snapshot to {}: {}", snapshot_path, ex)
+
     def _sync_tx_services(self):
         if self.opts.sync_tx_service:
             retry = True
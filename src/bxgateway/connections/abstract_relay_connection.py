@@ -17,6 +17,7 @@ from bxcommon.utils import memory_utils
 from bxcommon.utils.stats import hooks
 from bxcommon.utils.stats.transaction_stat_event_type import TransactionStatEventType
 from bxcommon.utils.stats.transaction_statistics_service import tx_stats
+from bxgateway.utils.broadcast_blob_hasher import BroadcastBlobHasher
 from bxgateway.utils.stats.gateway_transaction_stats_service import gateway_transaction_stats_service
 
 if TYPE_CHECKING:
@@ -58,6 +59,11 @@ class AbstractRelayConnection(InternalNodeConnection["AbstractGatewayNode"]):
         msg_size_validation_settings = MessageSizeValidationSettings(self.node.network.max_block_size_bytes,
                                                                 self.node.network.max_tx_size_bytes)
         self.message_validator = BloxrouteMessageValidator(msg_size_validation_settings, self.protocol_version)
+        self.broadcast_blob_hasher = BroadcastBlobHasher()
+
+    def add_received_bytes(self, bytes_received):
+        super(AbstractRelayConnection, self).add_received_bytes(bytes_received)
+        self.broadcast_blob_hasher.feed(bytes_received)
 
     def msg_hello(self, msg):
         super(AbstractRelayConnection, self).msg_hello(msg)
@@ -68,8 +74,9 @@ class AbstractRelayConnection(InternalNodeConnection["AbstractGatewayNode"]):
         Handle broadcast message receive from bloXroute.
         This is typically an encrypted block.
         """
+        cipherblob_hash = self.broadcast_blob_hasher.pop_digest(len(msg.blob()))
         if self.CONNECTION_TYPE & ConnectionType.RELAY_BLOCK:
-            self.node.block_processing_service.process_block_broadcast(msg, self)
+            self.node.block_processing_service.process_block_broadcast(msg, self, cipherblob_hash)
         else:
             self.log_error("Received unexpected block message on non-block relay connection: {}", msg)
 
@@ -146,6 +153,8 @@ class AbstractRelayConnection(InternalNodeConnection["AbstractGatewayNode"]):
             if self.node.node_conn is not None:
                 btc_tx_msg = self.node.message_converter.bx_tx_to_tx(msg)
                 self.node.send_msg_to_node(btc_tx_msg)
+                if tx_hash not in self.node.txs_sent_to_node.contents:
+                    self.node.txs_sent_to_node.add(tx_hash, len(tx_val))
 
             tx_stats.add_tx_by_hash_event(tx_hash, TransactionStatEventType.TX_SENT_FROM_GATEWAY_TO_BLOCKCHAIN_NODE,
                                           network_num, short_id)
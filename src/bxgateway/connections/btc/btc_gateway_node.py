@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 from bxcommon.network.socket_connection import SocketConnection
 from bxgateway.connections.abstract_gateway_blockchain_connection import AbstractGatewayBlockchainConnection
@@ -14,6 +14,8 @@ from bxgateway.services.btc.btc_block_queuing_service import BtcBlockQueuingServ
 from bxgateway.services.btc.btc_normal_block_cleanup_service import BtcNormalBlockCleanupService
 from bxgateway.testing.btc_lossy_relay_connection import BtcLossyRelayConnection
 from bxgateway.testing.test_modes import TestModes
+from bxgateway.utils.btc.compact_block_short_id_matcher import CompactBlockShortIdMatcher
+from bxgateway.utils.btc.txid_cache import TxIdCache
 
 import bxgateway.messages.btc.btc_message_converter_factory as converter_factory
 
@@ -24,11 +26,27 @@ class BtcGatewayNode(AbstractGatewayNode):
 
         self.block_processing_service = BtcBlockProcessingService(self)
 
+        # blocks and compact blocks are compressed, and txids computed, by extensions when they are used
+        self.compact_block_short_id_matcher: Optional[CompactBlockShortIdMatcher] = \
+            None if self.opts.use_extensions else CompactBlockShortIdMatcher()
+        if self.compact_block_short_id_matcher is not None:
+            # transactions restored from transaction service snapshot
+            self.compact_block_short_id_matcher.sync_from_transaction_service(self._tx_service)
+        self.txid_cache: Optional[TxIdCache] = None if self.opts.use_extensions else TxIdCache()
+
         self.message_converter = converter_factory.create_btc_message_converter(
             self.opts.blockchain_net_magic,
-            self.opts
+            self.opts,
+            self.compact_block_short_id_matcher,
+            self.txid_cache,
+            self.tx_hash_pool
         )
 
+    def on_fully_updated_tx_service(self):
+        if self.compact_block_short_id_matcher is not None:
+            self.compact_block_short_id_matcher.sync_from_transaction_service(self._tx_service)
+        super(BtcGatewayNode, self).on_fully_updated_tx_service()
+
     def build_blockchain_connection(self, socket_connection: SocketConnection, address: Tuple[str, int],
                                     from_me: bool) -> AbstractGatewayBlockchainConnection:
         return BtcNodeConnection(socket_connection, address, self, from_me)
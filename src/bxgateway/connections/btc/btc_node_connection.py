@@ -1,7 +1,20 @@
 import weakref
+from collections import deque
+from typing import Deque, Iterator, List, Optional, Tuple, Union
 
+from bxcommon.connections.connection_state import ConnectionState
+from bxcommon.messages.abstract_message import AbstractMessage
+
+from bxgateway import gateway_constants
 from bxgateway.connections.abstract_gateway_blockchain_connection import AbstractGatewayBlockchainConnection
+from bxgateway.btc_constants import BTC_HDR_COMMON_OFF
 from bxgateway.connections.btc.btc_node_connection_protocol import BtcNodeConnectionProtocol
+from bxgateway.messages.btc.btc_message import BtcMessage
+from bxgateway.messages.btc.headers_btc_message import HeadersBtcMessage
+from bxgateway.messages.btc.inventory_btc_message import InvBtcMessage, InventoryType
+from bxgateway.messages.btc.streamed_block_btc_message import StreamedBlockBtcMessage
+from bxgateway.messages.btc.tx_btc_message import TxBtcMessage
+from bxgateway.utils.blockchain_message_scheduler import BlockchainMessagePriority
 
 
 class BtcNodeConnection(AbstractGatewayBlockchainConnection):
@@ -12,3 +25,113 @@ class BtcNodeConnection(AbstractGatewayBlockchainConnection):
     def __init__(self, sock, address, node, from_me=False):
         super(BtcNodeConnection, self).__init__(sock, address, node, from_me)
         self.connection_protocol = weakref.ref(BtcNodeConnectionProtocol(self))
+
+        # block whose chunks are being written to the output buffer
+        self._streamed_block: Optional[StreamedBlockBtcMessage] = None
+        self._streamed_block_chunks: Optional[Iterator[Union[bytearray, memoryview]]] = None
+        self._next_streamed_block_chunk: Optional[Union[bytearray, memoryview]] = None
+        # bytes left to send up to the end of the last streamed block
+        self._streamed_block_unsent_bytes = 0
+        # messages held back while a block is streamed, with their prepend flag
+        self._messages_after_streamed_block: Deque[Tuple[AbstractMessage, bool]] = deque()
+
+    def get_message_priority(self, msg: AbstractMessage) -> Optional[BlockchainMessagePriority]:
+        if isinstance(msg, TxBtcMessage):
+            return BlockchainMessagePriority.TRANSACTION
+        if isinstance(msg, HeadersBtcMessage):
+            return BlockchainMessagePriority.BLOCK_ANNOUNCE
+        if isinstance(msg, InvBtcMessage):
+            if any(InventoryType.is_block(inv_type) for inv_type, _ in msg):
+                return BlockchainMessagePriority.BLOCK_ANNOUNCE
+            return BlockchainMessagePriority.TRANSACTION
+        return super(BtcNodeConnection, self).get_message_priority(msg)
+
+    def get_message_size(self, msg: AbstractMessage) -> int:
+        if isinstance(msg, BtcMessage):
+            return msg.payload_len() + BTC_HDR_COMMON_OFF
+        return super(BtcNodeConnection, self).get_message_size(msg)
+
+    def advance_sent_bytes(self, bytes_sent):
+        if self._streamed_block_unsent_bytes > 0:
+            self._streamed_block_unsent_bytes -= bytes_sent
+        super(BtcNodeConnection, self).advance_sent_bytes(bytes_sent)
+
+    def _write_msg(self, msg: AbstractMessage, prepend: bool = False) -> None:
+        if self._streamed_block is not None or (prepend and self._streamed_block_unsent_bytes > 0):
+            # nothing may be written between chunks of a streamed block, and prepended messages wait until the block
+            # is sent, so they are not put in front of its remaining chunks
+            self._messages_after_streamed_block.append((msg, prepend))
+            return
+
+        if isinstance(msg, StreamedBlockBtcMessage) and not msg.is_materialized():
+            if self.state & ConnectionState.MARK_FOR_CLOSE:
+                return
+
+            self._log_message(msg.log_level(), "Enqueued message: {}", msg)
+            self._streamed_block = msg
+            self._streamed_block_chunks = msg.iter_chunks(gateway_constants.BLOCKCHAIN_STREAMED_BLOCK_CHUNK_BYTES)
+            self._next_streamed_block_chunk = next(self._streamed_block_chunks)
+            self._streamed_block_unsent_bytes = self.outputbuf.length + self.get_message_size(msg)
+            self._write_streamed_block()
+            return
+
+        super(BtcNodeConnection, self)._write_msg(msg, prepend)
+
+    def _flush_scheduled_messages(self) -> None:
+        if self._streamed_block is not None or self._messages_after_streamed_block:
+            self._write_streamed_block()
+            if self._streamed_block is not None:
+                return
+        super(BtcNodeConnection, self)._flush_scheduled_messages()
+
+    def _write_streamed_block(self) -> None:
+        """
+        Writes chunks of the streamed block while the output buffer is below the watermark, then the messages held
+        back while it was written.
+        """
+        if self.state & ConnectionState.MARK_FOR_CLOSE:
+            self._streamed_block = None
+            self._streamed_block_chunks = None
+            self._next_streamed_block_chunk = None
+            self._streamed_block_unsent_bytes = 0
+            self._messages_after_streamed_block.clear()
+            return
+
+        block_msg = self._streamed_block
+        if block_msg is not None:
+            chunk = self._next_streamed_block_chunk
+            while chunk is not None and \
+                    self.outputbuf.length < gateway_constants.BLOCKCHAIN_OUTBOUND_BUFFER_WATERMARK_BYTES:
+                next_chunk = next(self._streamed_block_chunks, None)
+                # message tracker reports the block as sent once its last chunk is sent
+                self.enqueue_msg_bytes(chunk, full_message=block_msg if next_chunk is None else None)
+                chunk = next_chunk
+
+            self._next_streamed_block_chunk = chunk
+            if chunk is not None:
+                return
+            self._streamed_block = None
+            self._streamed_block_chunks = None
+
+        messages = self._messages_after_streamed_block
+        self._messages_after_streamed_block = deque()
+        for msg, prepend in messages:
+            self._write_msg(msg, prepend)
+
+    def _write_tx_batch(self, tx_msgs: List[AbstractMessage]) -> None:
+        if len(tx_msgs) == 1:
+            self._write_msg(tx_msgs[0])
+            return
+
+        if self.state & ConnectionState.MARK_FOR_CLOSE:
+            return
+
+        # BTC has no multi transaction message, so the tx messages are packed into a single output buffer entry
+        buf = bytearray(sum(tx_msg.payload_len() + BTC_HDR_COMMON_OFF for tx_msg in tx_msgs))
+        off = 0
+        for tx_msg in tx_msgs:
+            self._log_message(tx_msg.log_level(), "Enqueued message: {}", tx_msg)
+            tx_bytes = tx_msg.rawbytes()
+            buf[off:off + len(tx_bytes)] = tx_bytes
+            off += len(tx_bytes)
+        self.enqueue_msg_bytes(buf)
@@ -21,6 +21,7 @@ from bxgateway.messages.btc.ver_ack_btc_message import VerAckBtcMessage
 from bxgateway.messages.btc.version_btc_message import VersionBtcMessage
 from bxgateway.utils.btc.btc_object_hash import NULL_BTC_BLOCK_HASH
 from bxgateway.utils.errors.message_conversion_error import MessageConversionError
+from bxgateway.utils.stats.gateway_transaction_stats_service import gateway_transaction_stats_service
 
 if TYPE_CHECKING:
     from bxgateway.connections.btc.btc_node_connection import BtcNodeConnection
@@ -91,20 +92,38 @@ class BtcNodeConnectionProtocol(BtcBaseConnectionProtocol):
         Handle an inventory message.
 
         Requests all transactions and blocks that haven't been previously seen.
+        Transactions the gateway already has, e.g. received from the BDN and sent to the node, are not requested.
         :param msg: INV message
         """
         contains_block = False
         inventory_requests = []
         block_hashes = []
+        tx_service = self.node.get_tx_service()
+        txs_sent_to_node = self.node.txs_sent_to_node.contents
+        requested_tx_count = 0
+        known_tx_count = 0
+        known_tx_bytes = 0
         for inventory_type, item_hash in msg:
             if InventoryType.is_block(inventory_type):
                 block_hashes.append(item_hash)
                 if item_hash not in self.node.blocks_seen.contents:
                     contains_block = True
                     inventory_requests.append((inventory_type, item_hash))
+            elif item_hash in txs_sent_to_node:
+                known_tx_count += 1
+                known_tx_bytes += txs_sent_to_node[item_hash]
+            elif tx_service.has_transaction_contents(item_hash):
+                known_tx_count += 1
+                known_tx_bytes += len(tx_service.get_transaction_by_hash(item_hash))
             else:
+                requested_tx_count += 1
                 inventory_requests.append((inventory_type, item_hash))
 
+        if requested_tx_count or known_tx_count:
+            gateway_transaction_stats_service.log_transaction_inventory_from_blockchain(
+                requested_tx_count, known_tx_count, known_tx_bytes
+            )
+
         self.node.block_cleanup_service.mark_blocks_and_request_cleanup(block_hashes)
 
         if inventory_requests:
@@ -260,3 +279,6 @@ class BtcNodeConnectionProtocol(BtcBaseConnectionProtocol):
 
     def _set_transaction_contents(self, tx_hash: Sha256Hash, tx_content: Union[memoryview, bytearray]) -> None:
         self.connection.node.get_tx_service().set_transaction_contents(tx_hash, tx_content)
+        short_id_matcher = self.connection.node.compact_block_short_id_matcher
+        if short_id_matcher is not None:
+            short_id_matcher.add_transaction(tx_hash)
@@ -1,5 +1,9 @@
+from typing import Iterable
+
 from bxgateway.messages.btc import btc_messages_util
 from bxcommon.messages.bloxroute.tx_message import TxMessage
+from bxcommon.messages.bloxroute.txs_message import TxsMessage
+from bxcommon.utils.object_hash import Sha256Hash
 from bxgateway.connections.abstract_relay_connection import AbstractRelayConnection
 from bxutils import logging
 
@@ -13,7 +17,11 @@ class BtcRelayConnection(AbstractRelayConnection):
 
     def msg_tx(self, msg):
         if msg.tx_val() != TxMessage.EMPTY_TX_VAL:
-            hash_val = btc_messages_util.get_txid(msg.tx_val())
+            txid_cache = self.node.txid_cache
+            if txid_cache is None:
+                hash_val = btc_messages_util.get_txid(msg.tx_val())
+            else:
+                hash_val = txid_cache.get_txid(msg.tx_val())
 
             if hash_val != msg.tx_hash():
                 self.log_error("Received malformed transaction message from the BDN."
@@ -21,3 +29,18 @@ class BtcRelayConnection(AbstractRelayConnection):
                 return
 
         super(BtcRelayConnection, self).msg_tx(msg)
+        self._add_to_short_id_matcher([msg.tx_hash()])
+
+    def msg_txs(self, msg: TxsMessage):
+        super(BtcRelayConnection, self).msg_txs(msg)
+        self._add_to_short_id_matcher(transaction.hash for transaction in msg.get_txs())
+
+    def _add_to_short_id_matcher(self, tx_hashes: Iterable[Sha256Hash]) -> None:
+        short_id_matcher = self.node.compact_block_short_id_matcher
+        if short_id_matcher is None:
+            return
+
+        tx_service = self.node.get_tx_service()
+        for tx_hash in tx_hashes:
+            if tx_service.has_transaction_contents(tx_hash):
+                short_id_matcher.add_transaction(tx_hash)
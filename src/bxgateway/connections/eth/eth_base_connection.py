@@ -1,14 +1,38 @@
+from typing import List, Optional
+
 from bxutils import logging
 
 from bxcommon.connections.connection_state import ConnectionState
+from bxcommon.messages.abstract_message import AbstractMessage
 
 from bxgateway.connections.abstract_gateway_blockchain_connection import AbstractGatewayBlockchainConnection
+from bxgateway.messages.eth.protocol.block_bodies_eth_protocol_message import BlockBodiesEthProtocolMessage
+from bxgateway.messages.eth.protocol.block_headers_eth_protocol_message import BlockHeadersEthProtocolMessage
+from bxgateway.messages.eth.protocol.new_block_hashes_eth_protocol_message import NewBlockHashesEthProtocolMessage
+from bxgateway.messages.eth.protocol.transactions_eth_protocol_message import TransactionsEthProtocolMessage
+from bxgateway.utils.blockchain_message_scheduler import BlockchainMessagePriority
 
 logger = logging.get_logger(__name__)
 
 
 class EthBaseConnection(AbstractGatewayBlockchainConnection):
-    def enqueue_msg(self, msg, prepend=False):
+    def get_message_priority(self, msg: AbstractMessage) -> Optional[BlockchainMessagePriority]:
+        if isinstance(msg, TransactionsEthProtocolMessage):
+            return BlockchainMessagePriority.TRANSACTION
+        if isinstance(msg, NewBlockHashesEthProtocolMessage):
+            return BlockchainMessagePriority.BLOCK_ANNOUNCE
+        if isinstance(msg, (BlockHeadersEthProtocolMessage, BlockBodiesEthProtocolMessage)):
+            return BlockchainMessagePriority.BLOCK
+        return super(EthBaseConnection, self).get_message_priority(msg)
+
+    def _write_tx_batch(self, tx_msgs: List[AbstractMessage]) -> None:
+        if len(tx_msgs) == 1:
+            self._write_msg(tx_msgs[0])
+        else:
+            # one Transactions message is framed and encrypted once for the whole batch
+            self._write_msg(TransactionsEthProtocolMessage.from_transactions_messages(tx_msgs))
+
+    def _write_msg(self, msg: AbstractMessage, prepend: bool = False) -> None:
         if self.state & ConnectionState.MARK_FOR_CLOSE:
             return
 
@@ -8,7 +8,6 @@ from bxcommon.utils import convert
 from bxcommon.utils.object_hash import Sha256Hash
 from bxcommon.utils.stats.block_stat_event_type import BlockStatEventType
 from bxcommon.utils.stats.block_statistics_service import block_stats
-from bxgateway import eth_constants
 from bxgateway.connections.abstract_gateway_blockchain_connection import AbstractGatewayBlockchainConnection
 from bxgateway.connections.abstract_gateway_node import AbstractGatewayNode
 from bxgateway.connections.abstract_relay_connection import AbstractRelayConnection
@@ -26,6 +25,8 @@ from bxgateway.services.eth.eth_normal_block_cleanup_service import EthNormalBlo
 from bxgateway.testing.eth_lossy_relay_connection import EthLossyRelayConnection
 from bxgateway.testing.test_modes import TestModes
 from bxgateway.utils.eth import crypto_utils
+from bxgateway.utils.eth.chain_state import ChainState
+from bxgateway.utils.eth.keccak_cache import KeccakCache
 from bxgateway.utils.stats.eth.eth_gateway_stats_service import eth_gateway_stats_service
 from bxutils import logging
 
@@ -51,8 +52,8 @@ class EthGatewayNode(AbstractGatewayNode):
         self.block_processing_service: EthBlockProcessingService = EthBlockProcessingService(self)
         self.block_queuing_service: EthBlockQueuingService = EthBlockQueuingService(self)
 
-        # List of know total difficulties, tuples of values (block hash, total difficulty)
-        self._last_known_difficulties = deque(maxlen=eth_constants.LAST_KNOWN_TOTAL_DIFFICULTIES_MAX_COUNT)
+        # known total difficulties of recent blocks
+        self._chain_state = ChainState()
 
         # queue of the block hashes requested from remote blockchain node during sync
         self._requested_remote_blocks_queue = deque()
@@ -62,7 +63,8 @@ class EthGatewayNode(AbstractGatewayNode):
 
         self.init_eth_gateway_stat_logging()
 
-        self.message_converter = EthMessageConverter()
+        self.keccak_cache = KeccakCache()
+        self.message_converter = EthMessageConverter(self.tx_hash_pool, self.keccak_cache)
 
     def build_blockchain_connection(self, socket_connection: SocketConnection, address: Tuple[str, int],
                                     from_me: bool) -> AbstractGatewayBlockchainConnection:
@@ -168,25 +170,27 @@ class EthGatewayNode(AbstractGatewayNode):
     def get_remote_public_key(self):
         return self._remote_public_key
 
-    def set_known_total_difficulty(self, block_hash: Sha256Hash, total_difficulty: int) -> None:
-        self._last_known_difficulties.append((block_hash, total_difficulty))
+    def set_known_total_difficulty(
+            self,
+            block_hash: Sha256Hash,
+            total_difficulty: int,
+            parent_hash: Optional[Sha256Hash] = None,
+            block_number: Optional[int] = None
+    ) -> None:
+        self._chain_state.add_block(block_hash, total_difficulty, parent_hash, block_number)
 
     def try_calculate_total_difficulty(self, block_hash: Sha256Hash, new_block_parts: NewBlockParts) -> Optional[int]:
-        previous_block_hash = new_block_parts.get_previous_block_hash()
-        previous_block_total_difficulty = None
-
-        for known_block_hash, known_total_difficulty in self._last_known_difficulties:
-            if previous_block_hash == known_block_hash:
-                previous_block_total_difficulty = known_total_difficulty
-                break
-
-        if previous_block_total_difficulty is None:
+        block_total_difficulty = self._chain_state.try_add_child_block(
+            block_hash,
+            new_block_parts.get_previous_block_hash(),
+            new_block_parts.get_block_difficulty(),
+            new_block_parts.get_header_block_number()
+        )
+
+        if block_total_difficulty is None:
             logger.debug("Unable to calculate total difficulty after block {}.", convert.bytes_to_hex(block_hash.binary))
             return None
 
-        block_total_difficulty = previous_block_total_difficulty + new_block_parts.get_block_difficulty()
-
-        self._last_known_difficulties.append((block_hash, block_total_difficulty))
         logger.debug("Calculated total difficulty after block {} = {}.",
                      convert.bytes_to_hex(block_hash.binary), block_total_difficulty)
 
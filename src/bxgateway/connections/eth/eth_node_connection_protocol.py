@@ -1,5 +1,5 @@
 from collections import deque
-from typing import List, Deque, Union
+from typing import List, Deque, Tuple, Union
 
 from bxcommon.messages.abstract_message import AbstractMessage
 from bxcommon.utils import convert
@@ -20,7 +20,7 @@ from bxgateway.messages.eth.protocol.get_block_headers_eth_protocol_message impo
 from bxgateway.messages.eth.protocol.get_receipts_eth_protocol_message import GetReceiptsEthProtocolMessage
 from bxgateway.messages.eth.protocol.new_block_eth_protocol_message import NewBlockEthProtocolMessage
 from bxgateway.messages.eth.protocol.new_block_hashes_eth_protocol_message import NewBlockHashesEthProtocolMessage
-from bxgateway.utils.eth import crypto_utils
+from bxgateway.messages.eth.protocol.status_eth_protocol_message import StatusEthProtocolMessage
 from bxutils import logging
 
 logger = logging.get_logger(__name__)
@@ -55,12 +55,17 @@ class EthNodeConnectionProtocol(EthBaseConnectionProtocol):
         # queue of lists of hashes that are awaiting block bodies response
         self._block_bodies_requests: Deque[List[Sha256Hash]] = deque(maxlen=eth_constants.REQUESTED_NEW_BLOCK_BODIES_MAX_COUNT)
 
+        self._new_block_parts_retry_scheduled = False
+
         self.connection.node.alarm_queue.register_alarm(
             self.block_cleanup_poll_interval_s,
             self._request_blocks_confirmation
         )
 
-    def msg_status(self, _msg):
+    def msg_status(self, msg: StatusEthProtocolMessage):
+        # total difficulty of the chain head of the node allows sending the next block to the node as NewBlock message
+        self.node.set_known_total_difficulty(Sha256Hash(msg.get_chain_head_hash()), msg.get_chain_difficulty())
+
         self.connection.on_connection_established()
 
         self.connection.send_ping()
@@ -70,7 +75,8 @@ class EthNodeConnectionProtocol(EthBaseConnectionProtocol):
                                              self._stop_waiting_checkpoint_headers_request)
 
     def msg_block(self, msg: NewBlockEthProtocolMessage):
-        self.node.set_known_total_difficulty(msg.block_hash(), msg.chain_difficulty())
+        self.node.set_known_total_difficulty(msg.block_hash(), msg.chain_difficulty(), msg.prev_block_hash(),
+                                             msg.number())
 
         internal_new_block_msg = InternalEthBlockInfo.from_new_block_msg(msg)
         super().msg_block(internal_new_block_msg)
@@ -103,11 +109,14 @@ class EthNodeConnectionProtocol(EthBaseConnectionProtocol):
 
         for block_hash, block_number in block_hash_number_pairs:
             self._pending_new_blocks_parts.add(block_hash, NewBlockParts(None, None, block_number))
+
+        for start_block_hash, amount in get_block_header_ranges(block_hash_number_pairs):
             self.node.send_msg_to_node(
-                GetBlockHeadersEthProtocolMessage(None, block_hash.binary, 1, 0, False)
+                GetBlockHeadersEthProtocolMessage(None, start_block_hash.binary, amount, 0, False)
             )
 
         self.request_block_body([block_hash for block_hash, _ in block_hash_number_pairs])
+        self._schedule_new_block_parts_retry()
 
     def request_block_body(self, block_hashes: List[Sha256Hash]):
         block_request_message = GetBlockBodiesEthProtocolMessage(
@@ -133,25 +142,34 @@ class EthNodeConnectionProtocol(EthBaseConnectionProtocol):
             self.msg_proxy_request(msg)
 
     def msg_block_headers(self, msg: BlockHeadersEthProtocolMessage):
-        block_headers = msg.get_block_headers()
+        block_headers_bytes = msg.get_block_headers_bytes()
+        if not block_headers_bytes:
+            return
 
-        if self._pending_new_blocks_parts.contents and len(block_headers) == 1:
-            header_bytes = msg.get_block_headers_bytes()[0]
-            block_hash_bytes = crypto_utils.keccak_hash(header_bytes)
-            block_hash = Sha256Hash(block_hash_bytes)
+        block_hashes = msg.get_block_hashes()
+        # indices of headers that are not headers of pending new blocks
+        other_header_indices = []
+        if self._pending_new_blocks_parts.contents:
+            for header_index, (header_bytes, block_hash) in enumerate(zip(block_headers_bytes, block_hashes)):
+                pending_new_block = self._pending_new_blocks_parts.contents.get(block_hash)
+                if pending_new_block is not None and pending_new_block.block_header_bytes is None:
+                    logger.debug("Received block header for new block {}", convert.bytes_to_hex(block_hash.binary))
+                    pending_new_block.block_header_bytes = header_bytes
+                    self._check_pending_new_block(block_hash)
+                else:
+                    other_header_indices.append(header_index)
 
-            if block_hash in self._pending_new_blocks_parts.contents:
-                logger.debug("Received block header for new block {}", convert.bytes_to_hex(block_hash.binary))
-                self._pending_new_blocks_parts.contents[block_hash].block_header_bytes = header_bytes
-                self._check_pending_new_block(block_hash)
+            if len(other_header_indices) < len(block_headers_bytes):
                 self._process_ready_new_blocks()
+            if not other_header_indices:
                 return
+        else:
+            other_header_indices = list(range(len(block_headers_bytes)))
 
-        if len(block_headers) > 0:
-            block_hashes = [blk.hash_object() for blk in block_headers]
-            block_hashes.insert(0, Sha256Hash(block_headers[0].prev_hash))
-            self.node.block_cleanup_service.mark_blocks_and_request_cleanup(block_hashes)
-            self.node.block_queuing_service.mark_blocks_seen_by_blockchain_node(block_hashes)
+        other_block_hashes = [block_hashes[header_index] for header_index in other_header_indices]
+        other_block_hashes.insert(0, msg.get_previous_block_hash(other_header_indices[0]))
+        self.node.block_cleanup_service.mark_blocks_and_request_cleanup(other_block_hashes)
+        self.node.block_queuing_service.mark_blocks_seen_by_blockchain_node(other_block_hashes)
 
     def msg_block_bodies(self, msg: BlockBodiesEthProtocolMessage):
         if self._block_bodies_requests:
@@ -160,7 +178,9 @@ class EthNodeConnectionProtocol(EthBaseConnectionProtocol):
             bodies_bytes = msg.get_block_bodies_bytes()
 
             if len(requested_hashes) != len(bodies_bytes):
-                logger.debug("Expected {} bodies in response but received {}. Proxy message to remote node.",
+                # node skips bodies it does not have, so bodies in the response cannot be matched to hashes, and
+                # later responses may not match their requests either. Missing bodies of new blocks are requested again.
+                logger.debug("Expected {} bodies in response but received {}. Ignoring response.",
                              len(requested_hashes), len(bodies_bytes))
                 self._block_bodies_requests.clear()
                 return
@@ -168,19 +188,20 @@ class EthNodeConnectionProtocol(EthBaseConnectionProtocol):
             logger.debug("Processing expected block bodies messages for blocks [{}]",
                          ", ".join([convert.bytes_to_hex(block_hash.binary) for block_hash in requested_hashes]))
 
-            for block_hash, block_body_bytes in zip(requested_hashes, bodies_bytes):
+            for body_index, (block_hash, block_body_bytes) in enumerate(zip(requested_hashes, bodies_bytes)):
                 if block_hash in self._pending_new_blocks_parts.contents:
                     logger.debug("Received block body for pending new block {}",
                                  convert.bytes_to_hex(block_hash.binary))
                     self._pending_new_blocks_parts.contents[block_hash].block_body_bytes = block_body_bytes
                     self._check_pending_new_block(block_hash)
                 elif self.node.block_cleanup_service.is_marked_for_cleanup(block_hash):
-                    transactions_list = \
-                        BlockBodiesEthProtocolMessage.from_body_bytes(block_body_bytes).get_blocks()[0].transactions
-                    self.node.block_cleanup_service.clean_block_transactions_by_block_components(
+                    block_cleanup_service = self.node.block_cleanup_service
+                    block_cleanup_service.clean_block_transactions_by_block_components(
                         transaction_service=self.node.get_tx_service(),
                         block_hash=block_hash,
-                        transactions_list=(tx.hash() for tx in transactions_list)
+                        transactions_list=block_cleanup_service.get_transaction_hashes(
+                            msg.get_block_transactions_bytes(body_index)
+                        )
                     )
                 else:
                     logger.warning(
@@ -203,6 +224,40 @@ class EthNodeConnectionProtocol(EthBaseConnectionProtocol):
             if pending_new_block.block_header_bytes is not None and pending_new_block.block_body_bytes is not None:
                 self._ready_new_blocks.append(block_hash)
 
+    def _schedule_new_block_parts_retry(self) -> None:
+        if not self._new_block_parts_retry_scheduled:
+            self._new_block_parts_retry_scheduled = True
+            self.node.alarm_queue.register_alarm(eth_constants.NEW_BLOCK_PARTS_RETRY_INTERVAL_S,
+                                                 self._retry_missing_new_block_parts)
+
+    def _retry_missing_new_block_parts(self) -> float:
+        """
+        Requests headers and bodies of pending new blocks that have not been received yet.
+        Pending new blocks expire after a while, so each block is requested a limited number of times.
+        """
+        missing_header_hashes = []
+        missing_body_hashes = []
+        for block_hash, pending_new_block in self._pending_new_blocks_parts.contents.items():
+            if pending_new_block.block_header_bytes is None:
+                missing_header_hashes.append(block_hash)
+            if pending_new_block.block_body_bytes is None:
+                missing_body_hashes.append(block_hash)
+
+        if not missing_header_hashes and not missing_body_hashes:
+            self._new_block_parts_retry_scheduled = False
+            return 0
+
+        logger.debug("Requesting {} headers and {} bodies of new blocks again.",
+                     len(missing_header_hashes), len(missing_body_hashes))
+
+        # headers are requested one by one, since missing blocks may not be on the same chain as blocks after them
+        for block_hash in missing_header_hashes:
+            self.node.send_msg_to_node(GetBlockHeadersEthProtocolMessage(None, block_hash.binary, 1, 0, False))
+        if missing_body_hashes:
+            self.request_block_body(missing_body_hashes)
+
+        return eth_constants.NEW_BLOCK_PARTS_RETRY_INTERVAL_S
+
     def _process_ready_new_blocks(self):
         while self._ready_new_blocks:
             ready_block_hash = self._ready_new_blocks.pop()
@@ -247,3 +302,27 @@ class EthNodeConnectionProtocol(EthBaseConnectionProtocol):
                 skip=0,
                 reverse=0
             )
+
+
+def get_block_header_ranges(
+        block_hash_number_pairs: List[Tuple[Sha256Hash, int]]
+) -> List[Tuple[Sha256Hash, int]]:
+    """
+    Coalesces announced blocks with consecutive numbers into ranges that can be requested with a single
+    GetBlockHeaders message. Blocks with the same number (e.g. uncles or blocks of competing chains) are put
+    into different ranges.
+
+    :param block_hash_number_pairs: list of block hash and block number pairs
+    :return: list of hash of the first block of the range and number of blocks in the range
+    """
+    block_ranges: List[List[Tuple[Sha256Hash, int]]] = []
+    for block_hash, block_number in sorted(block_hash_number_pairs, key=lambda pair: pair[1]):
+        for block_range in block_ranges:
+            if block_range[-1][1] + 1 == block_number and \
+                    len(block_range) < eth_constants.REQUESTED_NEW_BLOCK_HEADERS_MAX_COUNT:
+                block_range.append((block_hash, block_number))
+                break
+        else:
+            block_ranges.append([(block_hash, block_number)])
+
+    return [(block_range[0][0], len(block_range)) for block_range in block_ranges]
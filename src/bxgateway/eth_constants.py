@@ -44,6 +44,8 @@ FRAME_MSG_TYPE_LEN = 1
 DEFAULT_FRAME_SIZE = sys.maxsize
 DEFAULT_FRAME_PROTOCOL_ID = 0
 MAX_FRAME_SEQUENCE_ID = 2 ** 16
+# upper bound for total payload size announced by the first of chunked frames, used to preallocate the payload
+MAX_CHUNKED_FRAMES_PAYLOAD_SIZE = 64 * 1024 * 1024
 
 ENC_AUTH_MSG_LEN = 307
 EIP8_AUTH_PREFIX_LEN = 2
@@ -78,8 +80,14 @@ SENT_NEW_BLOCK_HEADERS_EXPIRE_TIME_S = 60
 MSG_CLS_SERIALIZER_ATTR = "serializer"
 
 BLOCK_CLEANUP_NODE_BLOCK_LIST_POLL_INTERVAL_S = 15
-LAST_KNOWN_TOTAL_DIFFICULTIES_MAX_COUNT = 10
+# number of blocks below the highest known block, total difficulty of which is kept
+CHAIN_STATE_MAX_DEPTH = 64
+# maximum number of blocks, total difficulty of which is kept
+CHAIN_STATE_MAX_BLOCK_COUNT = 256
 NEW_BLOCK_PARTS_MAX_WAIT_S = 5
+# interval of requesting headers and bodies of announced blocks again, if not received yet
+NEW_BLOCK_PARTS_RETRY_INTERVAL_S = 1
+# maximum number of consecutive announced blocks requested with a single GetBlockHeaders message
 REQUESTED_NEW_BLOCK_HEADERS_MAX_COUNT = 10
 REQUESTED_NEW_BLOCK_BODIES_MAX_COUNT = 10
 
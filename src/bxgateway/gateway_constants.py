@@ -4,6 +4,8 @@ from bxgateway.messages.gateway.gateway_message_type import GatewayMessageType
 GATEWAY_HELLO_MESSAGES = [GatewayMessageType.HELLO, BloxrouteMessageType.ACK]
 
 GATEWAY_BLOCKS_SEEN_EXPIRATION_TIME_S = 60 * 60 * 24
+# blockchain node announces transactions back to gateway shortly after receiving them from gateway
+GATEWAY_TXS_SENT_TO_NODE_EXPIRATION_TIME_S = 60
 
 # Delay for blockchain sync message request before broadcasting to everyone
 # This constants is currently unused
@@ -13,6 +15,8 @@ BLOCKCHAIN_PING_INTERVAL_S = 15
 BLOCK_RECOVERY_RECOVERY_INTERVAL_S = [0.1, 0.5, 1, 2, 5]
 BLOCK_RECOVERY_MAX_RETRY_ATTEMPTS = len(BLOCK_RECOVERY_RECOVERY_INTERVAL_S)
 BLOCK_RECOVERY_MAX_QUEUE_TIME = 15  # slightly more than sum(BLOCK_RECOVERY_RECOVERY_INTERVAL_S)
+# total size of compressed blocks held while waiting for recovery, oldest blocks are dropped first
+BLOCK_RECOVERY_MAX_BYTES = 64 * 1024 * 1024
 
 
 # enum for setting Gateway neutrality assertion policy for releasing encryption keys
@@ -48,6 +52,13 @@ MIN_PEER_RELAYS = 1
 BLOCKCHAIN_SOCKET_SEND_BUFFER_SIZE = 16 * 1024 * 1024
 
 COOKIE_FILE_PATH_TEMPLATE = ".gateway_cookies/.cookie.blxrbdn-gw-{}"
+# node cache file is rewritten with latest records only once appended records grow over this size
+NODE_CACHE_MAX_FILE_SIZE_BYTES = 1024 * 1024
+
+# interval of writing the transaction service snapshot, if enabled
+TX_SERVICE_SNAPSHOT_INTERVAL_S = 5 * 60
+# older snapshots are not loaded, since relays may have expired and reassigned their short ids
+TX_SERVICE_SNAPSHOT_MAX_AGE_S = 30 * 60
 
 SEND_REQUEST_RELAY_PEERS_MAX_NUM_OF_CALLS = 10
 SEND_REQUEST_GATEWAY_PEERS_MAX_NUM_OF_CALLS = 5
@@ -73,3 +84,45 @@ REMOTE_BLOCKCHAIN_MAX_CONNECT_RETRIES = 10
 REMOTE_BLOCKCHAIN_SDN_CONTACT_RETRY_SECONDS = 30
 
 BLOCK_CONFIRMATION_EXPIRE_TIME_S = 60 * 60
+
+# number of worker processes hashing block transactions during compression, 0 to hash on the main thread
+DEFAULT_COMPRESSION_WORKERS = 0
+# blocks with fewer transactions are not worth sending to worker processes
+PARALLEL_TX_HASHING_MIN_TX_COUNT = 500
+
+# number of worker threads verifying and decrypting encrypted blocks, 0 to decrypt on the event loop
+DEFAULT_BLOCK_DECRYPTION_WORKERS = 0
+# how often the event loop checks for blocks decrypted by worker threads
+ENCRYPTED_BLOCK_WORKERS_POLL_INTERVAL_S = 0.001
+# encrypted blocks verified on worker threads are kept until their key arrives, relays release keys within the
+# neutrality broadcast timeout
+ENCRYPTED_BLOCKS_AWAITING_KEY_EXPIRATION_TIME_S = NEUTRALITY_BROADCAST_BLOCK_TIMEOUT_S
+
+# outbound messages to blockchain nodes are only written to the connection output buffer while it holds fewer bytes
+# than this, so newly queued blocks never wait behind more than this many bytes of lower priority messages
+BLOCKCHAIN_OUTBOUND_BUFFER_WATERMARK_BYTES = 256 * 1024
+# decompressed blocks are streamed to blockchain nodes in output buffer entries of at least this size, so a block is
+# not written with a socket write per transaction
+BLOCKCHAIN_STREAMED_BLOCK_CHUNK_BYTES = 64 * 1024
+# bytes each message class may write per scheduling round
+BLOCKCHAIN_OUTBOUND_BLOCK_QUANTUM_BYTES = 2 * 1024 * 1024
+BLOCKCHAIN_OUTBOUND_BLOCK_ANNOUNCE_QUANTUM_BYTES = 128 * 1024
+BLOCKCHAIN_OUTBOUND_TRANSACTION_QUANTUM_BYTES = 64 * 1024
+# messages queued for longer are dropped instead of being sent to the blockchain node
+BLOCKCHAIN_OUTBOUND_BLOCK_TTL_S = 60
+BLOCKCHAIN_OUTBOUND_BLOCK_ANNOUNCE_TTL_S = 30
+BLOCKCHAIN_OUTBOUND_TRANSACTION_TTL_S = 10
+# transactions sent to blockchain nodes are held for up to this long to be written in batches, 0 to disable
+DEFAULT_BLOCKCHAIN_TX_BATCH_WINDOW_MS = 0
+# transaction batches are written once they reach this size, regardless of the batching window
+DEFAULT_BLOCKCHAIN_TX_BATCH_MAX_BYTES = 128 * 1024
+
+# most recent unconfirmed transactions compact block short ids are matched against
+COMPACT_BLOCK_MATCHER_MAX_WINDOW_SIZE = 200000
+# number of transaction hashes short ids are computed for before checking whether all short ids are found
+COMPACT_BLOCK_MATCHER_BATCH_SIZE = 2048
+
+# total size of transactions whose txids are cached until their block is cleaned up
+TXID_CACHE_MAX_SIZE_BYTES = 64 * 1024 * 1024
+# total size of Ethereum transactions whose Keccak hashes are cached until their block is compressed
+KECCAK_CACHE_MAX_SIZE_BYTES = 16 * 1024 * 1024
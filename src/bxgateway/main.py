@@ -167,6 +167,19 @@ def get_opts() -> argparse.Namespace:
         help="Cookie file path",
         type=str,
     )
+    arg_parser.add_argument(
+        "--tx-service-snapshot-path",
+        help="File to periodically save transactions and short ids to and to restore them from on start, "
+             "so the gateway can compress blocks right after a restart. Disabled if not set",
+        type=str,
+        default=None
+    )
+    arg_parser.add_argument(
+        "--tx-service-snapshot-interval",
+        help="Interval in seconds of saving transactions and short ids to --tx-service-snapshot-path",
+        type=int,
+        default=gateway_constants.TX_SERVICE_SNAPSHOT_INTERVAL_S
+    )
     arg_parser.add_argument(
         "--blockchain-message-ttl",
         help="Duration to queue up messages for if blockchain node connection is broken",
@@ -197,6 +210,33 @@ def get_opts() -> argparse.Namespace:
         type=int,
         default=gateway_constants.CONFIG_UPDATE_INTERVAL_S
     )
+    arg_parser.add_argument(
+        "--compression-workers",
+        help="Number of worker processes used to hash block transactions during compression when extensions "
+             "are not used, 0 to disable",
+        type=int,
+        default=gateway_constants.DEFAULT_COMPRESSION_WORKERS
+    )
+    arg_parser.add_argument(
+        "--block-decryption-workers",
+        help="Number of worker threads used to verify and decrypt blocks received from the BDN, "
+             "0 to decrypt on the main thread",
+        type=int,
+        default=gateway_constants.DEFAULT_BLOCK_DECRYPTION_WORKERS
+    )
+    arg_parser.add_argument(
+        "--blockchain-tx-batch-window-ms",
+        help="Maximum time in milliseconds transactions are held to be sent to the blockchain node in batches, "
+             "0 to send every transaction right away",
+        type=int,
+        default=gateway_constants.DEFAULT_BLOCKCHAIN_TX_BATCH_WINDOW_MS
+    )
+    arg_parser.add_argument(
+        "--blockchain-tx-batch-max-bytes",
+        help="Maximum size in bytes of a batch of transactions sent to the blockchain node",
+        type=int,
+        default=gateway_constants.DEFAULT_BLOCKCHAIN_TX_BATCH_MAX_BYTES
+    )
     arg_parser.add_argument("--require-blockchain-connection",
                             help="Close gateway if connection with blockchain node can't be established "
                                  "when the flag is set to True",
@@ -204,6 +244,10 @@ def get_opts() -> argparse.Namespace:
 
     opts = cli.parse_arguments(arg_parser)
 
+    if not opts.cookie_file_path:
+        opts.cookie_file_path = gateway_constants.COOKIE_FILE_PATH_TEMPLATE.format(
+            "{}_{}".format(get_sdn_hostname(opts.sdn_url), opts.external_ip))
+
     if not opts.blockchain_network:
         cache_file_info = node_cache.read(opts)
         if cache_file_info is not None:
@@ -216,10 +260,6 @@ def get_opts() -> argparse.Namespace:
     else:
         opts.remote_blockchain_peer = None
 
-    if not opts.cookie_file_path:
-        opts.cookie_file_path = gateway_constants.COOKIE_FILE_PATH_TEMPLATE.format(
-            "{}_{}".format(get_sdn_hostname(opts.sdn_url), opts.external_ip))
-
     return opts
 
 
@@ -9,8 +9,8 @@ from bxcommon.utils import crypto
 from bxgateway.btc_constants import BTC_HDR_COMMON_OFF, BTC_BLOCK_HDR_SIZE, BTC_SHA_HASH_LEN
 from bxgateway.messages.btc.btc_message import BtcMessage
 from bxgateway.messages.btc.btc_message_type import BtcMessageType
-from bxgateway.messages.btc.btc_messages_util import btc_varint_to_int, get_next_tx_size, pack_int_to_btc_varint, \
-    pack_block_header
+from bxgateway.messages.btc.btc_messages_util import btc_varint_to_int, pack_int_to_btc_varint, pack_block_header
+from bxgateway.messages.btc.tx_offset_table import TxOffsetTable
 from bxgateway.utils.btc.btc_object_hash import BtcObjectHash
 
 
@@ -45,6 +45,7 @@ class BlockBtcMessage(BtcMessage, AbstractBlockMessage):
         self._merkle_root = None
         self._bits = self._nonce = self._txn_count = self._txns = self._hash_val = None
         self._header = self._tx_offset = None
+        self._tx_offset_table: Optional[TxOffsetTable] = None
         self._timestamp = 0
 
     def log_level(self):
@@ -112,19 +113,20 @@ class BlockBtcMessage(BtcMessage, AbstractBlockMessage):
             self._header = self._memoryview[0:self._tx_offset]
         return self._header
 
-    def txns(self):
-        if self._txns is None:
+    def tx_offset_table(self) -> TxOffsetTable:
+        """
+        Returns block transactions indexed by their offsets in the message buffer.
+        Transaction boundaries are found once per message, and the table is shared by all users of the message.
+        """
+        if self._tx_offset_table is None:
             if self._tx_offset is None:
                 self.version()
+            self._tx_offset_table = TxOffsetTable.build(self._memoryview, self._tx_offset, self.txn_count())
+        return self._tx_offset_table
 
-            self._txns = list()
-
-            start = self._tx_offset
-            for _ in range(self.txn_count()):
-                size = get_next_tx_size(self.buf, start)
-                self._txns.append(self._memoryview[start:start + size])
-                start += size
-
+    def txns(self):
+        if self._txns is None:
+            self._txns = list(self.tx_offset_table())
         return self._txns
 
     def block_hash(self) -> BtcObjectHash:
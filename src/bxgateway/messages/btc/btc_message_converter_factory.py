@@ -1,11 +1,22 @@
+from typing import Optional
+
 from bxgateway.messages.btc.btc_normal_message_converter import BtcNormalMessageConverter
+from bxgateway.utils.btc.compact_block_short_id_matcher import CompactBlockShortIdMatcher
+from bxgateway.utils.btc.txid_cache import TxIdCache
+from bxgateway.utils.tx_hash_worker_pool import TxHashWorkerPool
 
 
-def create_btc_message_converter(magic, opts):
+def create_btc_message_converter(
+        magic,
+        opts,
+        short_id_matcher: Optional[CompactBlockShortIdMatcher] = None,
+        txid_cache: Optional[TxIdCache] = None,
+        tx_hash_pool: Optional[TxHashWorkerPool] = None
+):
     if opts.use_extensions or opts.import_extensions:
         from bxgateway.messages.btc.btc_extension_message_converter import BtcExtensionMessageConverter
 
     if opts.use_extensions:
         return BtcExtensionMessageConverter(magic)
     else:
-        return BtcNormalMessageConverter(magic)
+        return BtcNormalMessageConverter(magic, tx_hash_pool, short_id_matcher, txid_cache)
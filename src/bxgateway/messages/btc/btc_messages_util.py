@@ -1,12 +1,14 @@
 import socket
 import struct
+from array import array
 from bxcommon.utils import crypto
 from bxcommon import constants
 from bxcommon.constants import UL_INT_SIZE_IN_BYTES
+from bxcommon.exceptions import ParseError
 from bxgateway import btc_constants
 from bxgateway.btc_constants import BTC_HDR_COMMON_OFF, BTC_SHA_HASH_LEN
 from bxgateway.utils.btc.btc_object_hash import BtcObjectHash
-from typing import Union
+from typing import Optional, Tuple, Union
 from hashlib import sha256
 
 def ipaddrport_to_btcbytearray(ip_addr, ip_port):
@@ -90,6 +92,103 @@ def get_next_tx_size(buf, off, tail=-1):
         return get_next_non_segwit_tx_size(buf, off, tail)
 
 
+def get_tx_boundaries(
+        buf: Union[memoryview, bytearray, bytes], off: int, tx_count: int, typecode: str = "I"
+) -> Tuple[array, bytearray]:
+    """
+    Finds boundaries of consecutive transactions, e.g. all transactions of a block, in a single pass.
+
+    Does the same parsing as `get_next_tx_size` for every transaction, but in one loop over a single copy of
+    the buffer with varints decoded inline, which avoids per transaction function calls, memoryview wrapping
+    and struct unpacking.
+
+    :param buf: buffer with transactions
+    :param off: offset of the first transaction
+    :param tx_count: number of transactions
+    :param typecode: typecode of the offsets array
+    :return: array of `tx_count + 1` offsets (start offsets of transactions followed by end offset of the last one)
+             and bytearray of segwit flags (1 for segwit transactions, 0 otherwise)
+    """
+    data = bytes(buf[off:])
+    offsets = array(typecode, [0]) * (tx_count + 1)
+    segwit_flags = bytearray(tx_count)
+    pos = 0
+
+    try:
+        for index in range(tx_count):
+            offsets[index] = off + pos
+            pos += btc_constants.TX_VERSION_LEN
+
+            segwit = data[pos] == 0 and data[pos + 1] == btc_constants.TX_SEGWIT_FLAG_VALUE
+            if segwit:
+                segwit_flags[index] = 1
+                pos += btc_constants.TX_SEGWIT_FLAG_LEN
+
+            # inputs: previous output (36 bytes), script, sequence (4 bytes)
+            txin_count = data[pos]
+            if txin_count < btc_constants.BTC_VARINT_SHORT_INDICATOR:
+                pos += 1
+            else:
+                txin_count, size = _read_long_varint(data, pos)
+                pos += size
+            for _ in range(txin_count):
+                pos += 36
+                script_len = data[pos]
+                if script_len < btc_constants.BTC_VARINT_SHORT_INDICATOR:
+                    pos += 1
+                else:
+                    script_len, size = _read_long_varint(data, pos)
+                    pos += size
+                pos += script_len + 4
+
+            # outputs: value (8 bytes), script
+            txout_count = data[pos]
+            if txout_count < btc_constants.BTC_VARINT_SHORT_INDICATOR:
+                pos += 1
+            else:
+                txout_count, size = _read_long_varint(data, pos)
+                pos += size
+            for _ in range(txout_count):
+                pos += 8
+                script_len = data[pos]
+                if script_len < btc_constants.BTC_VARINT_SHORT_INDICATOR:
+                    pos += 1
+                else:
+                    script_len, size = _read_long_varint(data, pos)
+                    pos += size
+                pos += script_len
+
+            # witness stack of every input
+            if segwit:
+                for _ in range(txin_count):
+                    witness_count = data[pos]
+                    if witness_count < btc_constants.BTC_VARINT_SHORT_INDICATOR:
+                        pos += 1
+                    else:
+                        witness_count, size = _read_long_varint(data, pos)
+                        pos += size
+                    for _ in range(witness_count):
+                        witness_len = data[pos]
+                        if witness_len < btc_constants.BTC_VARINT_SHORT_INDICATOR:
+                            pos += 1
+                        else:
+                            witness_len, size = _read_long_varint(data, pos)
+                            pos += size
+                        pos += witness_len
+
+            pos += btc_constants.TX_LOCK_TIME_LEN
+    except IndexError:
+        raise ParseError(
+            "Transaction {} at offset {} exceeds buffer of length {}".format(index, offsets[index], len(buf))
+        )
+
+    if pos > len(data):
+        raise ParseError("Last transaction ends at offset {}, past buffer of length {}".format(off + pos, len(buf)))
+
+    offsets[tx_count] = off + pos
+    return offsets, segwit_flags
+
+
 def is_segwit(buf: Union[memoryview, bytearray], off: int = 0) -> bool:
     """
     Determines if a transaction is a segwit transaction by reading the marker and flag bytes
@@ -151,14 +250,17 @@ def get_next_segwit_tx_size(buf, off, tail=-1):
     return end - off
 
 
-def get_txid(buffer: Union[memoryview, bytearray]) -> BtcObjectHash:
+def get_txid(buffer: Union[memoryview, bytearray], segwit: Optional[bool] = None) -> BtcObjectHash:
     """
     Actually gets the txid, which is the same as the hash for non segwit transactions
     :param buffer: the bytes of the transaction contents
+    :param segwit: whether the transaction is a segwit transaction, read from the transaction if None
     :return: hash object
     """
 
-    flag_len = btc_constants.TX_SEGWIT_FLAG_LEN if is_segwit(buffer) else 0
+    if segwit is None:
+        segwit = is_segwit(buffer)
+    flag_len = btc_constants.TX_SEGWIT_FLAG_LEN if segwit else 0
     txid = sha256(buffer[:btc_constants.TX_VERSION_LEN])
     end = btc_constants.TX_VERSION_LEN + flag_len
     io_size, _, _ = _get_tx_io_count_and_size(buffer, end, tail=-1)
@@ -195,6 +297,22 @@ def pack_block_header(buffer: bytearray, version: int, prev_block: BtcObjectHash
     return off
 
 
+def _read_long_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """
+    Reads a varint of more than one byte, returning its value and size.
+    """
+    indicator = data[pos]
+    if indicator == btc_constants.BTC_VARINT_SHORT_INDICATOR:
+        size = 3
+    elif indicator == btc_constants.BTC_VARINT_INT_INDICATOR:
+        size = 5
+    else:
+        size = 9
+    if pos + size > len(data):
+        raise IndexError("varint exceeds buffer")
+    return int.from_bytes(data[pos + 1:pos + size], "little"), size
+
+
 def _get_tx_io_count_and_size(buf: Union[memoryview, bytearray], start, tail):
     end = start
 
@@ -5,13 +5,14 @@ from datetime import datetime
 
 from csiphash import siphash24
 from collections import deque
-from typing import Tuple, Optional, List, Deque, Union, NamedTuple
+from typing import Tuple, Optional, List, Deque, Union, NamedTuple, Iterable, Sequence
 
 from bxutils import logging
 
 from bxcommon import constants
 from bxcommon.messages.bloxroute import compact_block_short_ids_serializer
 from bxcommon.messages.abstract_message import AbstractMessage
+from bxcommon.messages.bloxroute.tx_message import TxMessage
 from bxcommon.utils import crypto, convert
 from bxcommon.messages.bloxroute.compact_block_short_ids_serializer import BlockOffsets
 from bxcommon.services.transaction_service import TransactionService
@@ -21,19 +22,25 @@ from bxgateway import btc_constants
 from bxgateway.utils.errors import message_conversion_error
 from bxgateway.messages.btc.abstract_btc_message_converter import AbstractBtcMessageConverter, get_block_info, \
     CompactBlockCompressionResult
+from bxgateway.messages.btc.streamed_block_btc_message import StreamedBlockBtcMessage
 from bxgateway.messages.btc.btc_message_type import BtcMessageType
 from bxgateway.messages.btc.compact_block_btc_message import CompactBlockBtcMessage
 from bxgateway.utils.block_info import BlockInfo
 from bxgateway.utils.btc.btc_object_hash import BtcObjectHash
-from bxgateway.messages.btc.block_btc_message import BlockBtcMessage
 from bxgateway.utils.block_header_info import BlockHeaderInfo
 from bxgateway.messages.btc import btc_messages_util
+from bxgateway.utils.tx_hash_worker_pool import TxHashWorkerPool
+from bxgateway.utils.btc.compact_block_short_id_matcher import CompactBlockShortIdMatcher
+from bxgateway.utils.btc.txid_cache import TxIdCache
+from bxgateway.messages.btc.tx_btc_message import TxBtcMessage
 
 logger = logging.get_logger(__name__)
 
 
 class CompactBlockRecoveryData(NamedTuple):
     block_transactions: List[Optional[Union[memoryview, int]]]
+    # hashes of transactions found in the transaction service, None for transactions that have to be hashed
+    block_tx_hashes: List[Optional[Sha256Hash]]
     block_header: memoryview
     magic: int
     tx_service: TransactionService
@@ -74,29 +81,44 @@ def parse_bx_block_header(
 def parse_bx_block_transactions(
         block_hash: Sha256Hash,
         bx_block: memoryview,
+        header: memoryview,
         offset: int,
-        short_ids: List[int],
         block_offsets: BlockOffsets,
-        tx_service: TransactionService,
-        block_pieces: Deque[Union[bytearray, memoryview]]
-) -> Tuple[List[int], List[Sha256Hash], int]:
-    has_missing, unknown_tx_sids, unknown_tx_hashes = \
-        tx_service.get_missing_transactions(short_ids)
-    if has_missing:
-        return unknown_tx_sids, unknown_tx_hashes, offset
+        short_ids: List[int],
+        tx_service: TransactionService
+) -> List[Union[bytearray, memoryview]]:
+    """
+    Collects transactions of a Bitcoin block from a bx block in block order, without copying them.
+
+    Short id bounds and the block size are checked here, so a block is rejected with a MessageConversionError
+    before it is queued for sending to the blockchain node.
+
+    :param block_hash: block hash, for error reporting
+    :param bx_block: compressed block
+    :param header: Bitcoin message header, block header and transaction count
+    :param offset: offset of the first transaction in the bx block
+    :param block_offsets: bx block offsets
+    :param short_ids: short ids of the bx block, all of them known to the transaction service
+    :param tx_service: transaction service
+    :return: transaction contents, in block order
+    """
+    payload_len, = struct.unpack_from(
+        "<L", header, btc_constants.BTC_HEADER_MINUS_CHECKSUM - constants.UL_INT_SIZE_IN_BYTES
+    )
+    size = btc_constants.BTC_HDR_COMMON_OFF + payload_len
+
+    tx_pieces = []
+    output_offset = len(header)
     short_tx_index = 0
-    output_offset = offset
     while offset < block_offsets.short_id_offset:
         if bx_block[offset] == btc_constants.BTC_SHORT_ID_INDICATOR:
-            try:
-                sid = short_ids[short_tx_index]
-            except IndexError:
+            if short_tx_index >= len(short_ids):
                 raise message_conversion_error.btc_block_decompression_error(
                     block_hash,
                     f"Message is improperly formatted, short id index ({short_tx_index}) "
                     f"exceeded its array bounds (size: {len(short_ids)})"
                 )
-            tx_hash, tx, _ = tx_service.get_transaction(sid)
+            _, tx, _ = tx_service.get_transaction(short_ids[short_tx_index])
             offset += btc_constants.BTC_SHORT_ID_INDICATOR_LENGTH
             short_tx_index += 1
         else:
@@ -104,30 +126,51 @@ def parse_bx_block_transactions(
             tx = bx_block[offset:offset + tx_size]
             offset += tx_size
 
-        block_pieces.append(tx)
+        tx_pieces.append(tx)
         output_offset += len(tx)
 
-    return unknown_tx_sids, unknown_tx_hashes, output_offset
-
-
-def build_btc_block(
-        block_pieces: Deque[Union[bytearray, memoryview]], size: int
-) -> Tuple[BlockBtcMessage, int]:
-    btc_block = bytearray(size)
-    offset = 0
-    for piece in block_pieces:
-        next_offset = offset + len(piece)
-        btc_block[offset:next_offset] = piece
-        offset = next_offset
-    return BlockBtcMessage(buf=btc_block), offset
+    if output_offset != size:
+        raise message_conversion_error.btc_block_decompression_error(
+            block_hash, f"Message is improperly formatted, transactions fill {output_offset} of {size} block bytes"
+        )
+    return tx_pieces
 
 
 def compute_short_id(key: bytes, tx_hash_binary: Union[bytearray, memoryview]) -> bytes:
     return siphash24(key, bytes(tx_hash_binary))[0:6]
 
 
+def get_txid_binary(tx: Union[bytes, bytearray, memoryview]) -> bytes:
+    return bytes(btc_messages_util.get_txid(tx).binary)
+
+
 class BtcNormalMessageConverter(AbstractBtcMessageConverter):
 
+    def __init__(
+            self,
+            btc_magic,
+            tx_hash_pool: Optional[TxHashWorkerPool] = None,
+            short_id_matcher: Optional[CompactBlockShortIdMatcher] = None,
+            txid_cache: Optional[TxIdCache] = None
+    ):
+        super(BtcNormalMessageConverter, self).__init__(btc_magic)
+        self._tx_hash_pool = tx_hash_pool
+        self._short_id_matcher = short_id_matcher
+        self._txid_cache = txid_cache
+
+    def tx_to_bx_txs(self, btc_tx_msg, network_num):
+        if self._txid_cache is None:
+            return super(BtcNormalMessageConverter, self).tx_to_bx_txs(btc_tx_msg, network_num)
+
+        if not isinstance(btc_tx_msg, TxBtcMessage):
+            raise TypeError("tx_msg is expected to be of type TxBTCMessage")
+
+        tx = btc_tx_msg.tx()
+        tx_hash = self._txid_cache.get_txid(tx)
+        tx_msg = TxMessage(tx_hash, network_num, tx_val=tx)
+
+        return [(tx_msg, tx_hash, tx)]
+
     def block_to_bx_block(
             self, block_msg, tx_service
     ) -> Tuple[memoryview, BlockInfo]:
@@ -136,38 +179,11 @@ class BtcNormalMessageConverter(AbstractBtcMessageConverter):
         """
         compress_start_datetime = datetime.utcnow()
         compress_start_timestamp = time.time()
-        size = 0
-        buf = deque()
-        short_ids = []
-        header = block_msg.header()
-        size += len(header)
-        buf.append(header)
-
-        for tx in block_msg.txns():
-
-            tx_hash = btc_messages_util.get_txid(tx)
-            short_id = tx_service.get_short_id(tx_hash)
-            if short_id == constants.NULL_TX_SID:
-                buf.append(tx)
-                size += len(tx)
-            else:
-                short_ids.append(short_id)
-                buf.append(btc_constants.BTC_SHORT_ID_INDICATOR_AS_BYTEARRAY)
-                size += 1
-
-        serialized_short_ids = compact_block_short_ids_serializer.serialize_short_ids_into_bytes(short_ids)
-        buf.append(serialized_short_ids)
-        size += constants.UL_ULL_SIZE_IN_BYTES
-        offset_buf = struct.pack("<Q", size)
-        buf.appendleft(offset_buf)
-        size += len(serialized_short_ids)
-
-        block = bytearray(size)
-        off = 0
-        for blob in buf:
-            next_off = off + len(blob)
-            block[off:next_off] = blob
-            off = next_off
+        txns = block_msg.tx_offset_table()
+        block, short_ids = self._pack_bx_block(
+            block_msg.header(), txns, self._get_tx_hashes(txns, txns.segwit_flags), tx_service
+        )
+        size = len(block)
 
         prev_block_hash = convert.bytes_to_hex(block_msg.prev_block_hash().binary)
         bx_block_hash = convert.bytes_to_hex(crypto.double_sha256(block))
@@ -188,6 +204,89 @@ class BtcNormalMessageConverter(AbstractBtcMessageConverter):
         )
         return memoryview(block), block_info
 
+    def _get_tx_hashes(
+            self, txns: Sequence[Union[bytearray, memoryview]], segwit_flags: Optional[Sequence[int]] = None
+    ) -> Iterable[Sha256Hash]:
+        """
+        Returns txids of block transactions, hashing transactions missing from the txid cache in worker processes
+        if there is a worker pool.
+
+        :param txns: block transactions
+        :param segwit_flags: 1 for segwit transactions and 0 otherwise, read from transactions if None
+        """
+        txid_cache = self._txid_cache
+        if self._tx_hash_pool is None:
+            get_txid = btc_messages_util.get_txid if txid_cache is None else txid_cache.get_txid
+            if segwit_flags is None:
+                return map(get_txid, txns)
+            return map(get_txid, txns, (segwit_flag == 1 for segwit_flag in segwit_flags))
+
+        if txid_cache is None:
+            return (
+                BtcObjectHash(binary=tx_hash)
+                for tx_hash in self._tx_hash_pool.hash_transactions(get_txid_binary, txns)
+            )
+
+        tx_hashes = [txid_cache.get(tx) for tx in txns]
+        missing_indices = [index for index, tx_hash in enumerate(tx_hashes) if tx_hash is None]
+        missing_tx_hashes = self._tx_hash_pool.hash_transactions(
+            get_txid_binary, [txns[index] for index in missing_indices]
+        )
+        for index, tx_hash_binary in zip(missing_indices, missing_tx_hashes):
+            tx_hash = BtcObjectHash(binary=tx_hash_binary)
+            txid_cache.add(txns[index], tx_hash)
+            tx_hashes[index] = tx_hash
+        return tx_hashes
+
+    def _pack_bx_block(
+            self,
+            header: Union[bytearray, memoryview],
+            txns: Sequence[Union[bytearray, memoryview]],
+            tx_hashes: Iterable[Sha256Hash],
+            tx_service: TransactionService
+    ) -> Tuple[bytearray, List[int]]:
+        """
+        Packs a Bitcoin block into a bloXroute block, replacing transactions known by the transaction service
+        with their short ids.
+
+        :param header: Bitcoin message header, block header and transaction count
+        :param txns: block transactions
+        :param tx_hashes: hashes of block transactions, in block order
+        :param tx_service: transaction service
+        :return: bloXroute block and short ids of replaced transactions
+        """
+        # first pass: resolve short ids and size the output from the tx offsets
+        tx_short_ids = [tx_service.get_short_id(tx_hash) for tx_hash in tx_hashes]
+        short_ids = []
+        short_id_offset = constants.UL_ULL_SIZE_IN_BYTES + len(header)
+        for tx, short_id in zip(txns, tx_short_ids):
+            if short_id == constants.NULL_TX_SID:
+                short_id_offset += len(tx)
+            else:
+                short_ids.append(short_id)
+                short_id_offset += btc_constants.BTC_SHORT_ID_INDICATOR_LENGTH
+
+        serialized_short_ids = compact_block_short_ids_serializer.serialize_short_ids_into_bytes(short_ids)
+        size = short_id_offset + len(serialized_short_ids)
+
+        # second pass: write everything straight into a single preallocated buffer
+        block = bytearray(size)
+        struct.pack_into("<Q", block, 0, short_id_offset)
+        off = constants.UL_ULL_SIZE_IN_BYTES
+        next_off = off + len(header)
+        block[off:next_off] = header
+        off = next_off
+        for tx, short_id in zip(txns, tx_short_ids):
+            if short_id == constants.NULL_TX_SID:
+                next_off = off + len(tx)
+                block[off:next_off] = tx
+                off = next_off
+            else:
+                block[off] = btc_constants.BTC_SHORT_ID_INDICATOR
+                off += btc_constants.BTC_SHORT_ID_INDICATOR_LENGTH
+        block[off:] = serialized_short_ids
+        return block, short_ids
+
     def bx_block_to_block(
             self, bx_block_msg, tx_service
     ) -> Tuple[Optional[AbstractMessage], BlockInfo, List[int], List[Sha256Hash]]:
@@ -206,19 +305,21 @@ class BtcNormalMessageConverter(AbstractBtcMessageConverter):
         # Initialize tracking of transaction and SID mapping
         block_pieces = deque()
         header_info = parse_bx_block_header(bx_block_msg, block_pieces)
-        unknown_tx_sids, unknown_tx_hashes, offset = parse_bx_block_transactions(
-            header_info.block_hash,
-            bx_block_msg,
-            header_info.offset,
-            header_info.short_ids,
-            header_info.block_offsets,
-            tx_service,
-            block_pieces
-        )
+        _, unknown_tx_sids, unknown_tx_hashes = tx_service.get_missing_transactions(header_info.short_ids)
         total_tx_count = header_info.txn_count
 
         if not unknown_tx_sids and not unknown_tx_hashes:
-            btc_block_msg, offset = build_btc_block(block_pieces, offset)
+            tx_pieces = parse_bx_block_transactions(
+                header_info.block_hash,
+                bx_block_msg,
+                block_pieces[0],
+                header_info.offset,
+                header_info.block_offsets,
+                header_info.short_ids,
+                tx_service
+            )
+            # transactions are written to the blockchain node as the connection drains, without rebuilding the block
+            btc_block_msg = StreamedBlockBtcMessage(block_pieces[0], tx_pieces)
             logger.debug(
                 "Successfully parsed bx_block broadcast message. {0} transactions in bx_block".format(total_tx_count)
             )
@@ -256,59 +357,49 @@ class BtcNormalMessageConverter(AbstractBtcMessageConverter):
 
         short_ids = compact_block.short_ids()
 
-        short_id_to_tx_contents = {}
-
-        for tx_hash in transaction_service.iter_transaction_hashes():
-            tx_hash_binary = tx_hash.binary[::-1]
-            tx_short_id = compute_short_id(key, tx_hash_binary)
-            if tx_short_id in short_ids:
-                tx_content = transaction_service.get_transaction_by_hash(tx_hash)
-                if tx_content is None:
-                    logger.debug("Hash {} is known by transactions service but content is missing.", tx_hash)
-                else:
-                    short_id_to_tx_contents[tx_short_id] = tx_content
-            if len(short_id_to_tx_contents) == len(short_ids):
-                break
+        if self._short_id_matcher is None:
+            short_id_to_tx = {}
+
+            for tx_hash in transaction_service.iter_transaction_hashes():
+                tx_hash_binary = tx_hash.binary[::-1]
+                tx_short_id = compute_short_id(key, tx_hash_binary)
+                if tx_short_id in short_ids:
+                    tx_content = transaction_service.get_transaction_by_hash(tx_hash)
+                    if tx_content is None:
+                        logger.debug("Hash {} is known by transactions service but content is missing.", tx_hash)
+                    else:
+                        short_id_to_tx[tx_short_id] = (tx_hash, tx_content)
+                if len(short_id_to_tx) == len(short_ids):
+                    break
+        else:
+            short_id_to_tx = self._short_id_matcher.match(key, short_ids, transaction_service)
 
         block_transactions = []
+        block_tx_hashes = []
         missing_transactions_indices = []
         pre_filled_transactions = compact_block.pre_filled_transactions()
         total_txs_count = len(pre_filled_transactions) + len(short_ids)
 
-        size = 0
-        block_msg_parts = deque()
-
-        block_msg_parts.append(block_header)
-        size += len(block_header)
-
-        tx_count_size = btc_messages_util.get_sizeof_btc_varint(total_txs_count)
-        tx_count_buf = bytearray(tx_count_size)
-        btc_messages_util.pack_int_to_btc_varint(total_txs_count, tx_count_buf, 0)
-        block_msg_parts.append(tx_count_buf)
-        size += tx_count_size
-
         short_ids_iter = iter(short_ids.keys())
 
         for index in range(total_txs_count):
             if index not in pre_filled_transactions:
                 short_id = next(short_ids_iter)
 
-                if short_id in short_id_to_tx_contents:
-                    short_tx = short_id_to_tx_contents[short_id]
-                    block_msg_parts.append(short_tx)
+                if short_id in short_id_to_tx:
+                    tx_hash, short_tx = short_id_to_tx[short_id]
                     block_transactions.append(short_tx)
-                    size += len(short_tx)
+                    block_tx_hashes.append(tx_hash)
                 else:
                     missing_transactions_indices.append(index)
                     block_transactions.append(None)
+                    block_tx_hashes.append(None)
             else:
-                pre_filled_transaction = pre_filled_transactions[index]
-                block_msg_parts.append(pre_filled_transaction)
-                block_transactions.append(pre_filled_transaction)
-                size += len(pre_filled_transaction)
+                block_transactions.append(pre_filled_transactions[index])
+                block_tx_hashes.append(None)
 
         recovered_item = CompactBlockRecoveryData(
-            block_transactions, block_header, compact_block.magic(), transaction_service
+            block_transactions, block_tx_hashes, block_header, compact_block.magic(), transaction_service
         )
 
         block_info = BlockInfo(
@@ -372,8 +463,11 @@ class BtcNormalMessageConverter(AbstractBtcMessageConverter):
     ) -> CompactBlockCompressionResult:
         """
         Handle recovery of Bitcoin compact block message.
-        """
 
+        The bloXroute block is packed straight from the compact block header and transactions, reusing hashes of
+        transactions found in the transaction service, without assembling and re-parsing the full Bitcoin block.
+        """
+        compress_start_datetime = compression_result.block_info.start_datetime  # pyre-ignore
         missing_indices = compression_result.missing_indices
         recovered_transactions = compression_result.recovered_transactions
         block_transactions = recovery_item.block_transactions
@@ -390,55 +484,52 @@ class BtcNormalMessageConverter(AbstractBtcMessageConverter):
             missing_index = missing_indices[i]
             block_transactions[missing_index] = recovered_transactions[i]
 
-        size = 0
         total_txs_count = len(block_transactions)
-        block_msg_parts = deque()
-
         block_header = recovery_item.block_header
-        block_msg_parts.append(block_header)
-        size += len(block_header)
-
         tx_count_size = btc_messages_util.get_sizeof_btc_varint(total_txs_count)
-        tx_count_buf = bytearray(tx_count_size)
-        btc_messages_util.pack_int_to_btc_varint(total_txs_count, tx_count_buf, 0)
-        block_msg_parts.append(tx_count_buf)
-        size += tx_count_size
-
+        header_size = btc_constants.BTC_HDR_COMMON_OFF + len(block_header) + tx_count_size
+
+        header = bytearray(header_size)
+        off = btc_constants.BTC_HDR_COMMON_OFF
+        header[off:off + len(block_header)] = block_header
+        off += len(block_header)
+        btc_messages_util.pack_int_to_btc_varint(total_txs_count, header, off)
+
+        # the Bitcoin message checksum is carried in the bloXroute block, so it is computed over the pieces instead
+        checksum_hash = hashlib.sha256()
+        checksum_hash.update(memoryview(header)[btc_constants.BTC_HDR_COMMON_OFF:])
+        payload_size = header_size - btc_constants.BTC_HDR_COMMON_OFF
         for transaction in block_transactions:
-            block_msg_parts.append(transaction)
-            size += len(transaction)  # pyre-ignore
-
-        msg_header = bytearray(btc_constants.BTC_HDR_COMMON_OFF)
-        struct.pack_into("<L12sL", msg_header, 0, recovery_item.magic, BtcMessageType.BLOCK, size)
-        block_msg_parts.appendleft(msg_header)
-        size += btc_constants.BTC_HDR_COMMON_OFF
-
-        block_msg_bytes = bytearray(size)
-        off = 0
-        for blob in block_msg_parts:
-            next_off = off + len(blob)
-            block_msg_bytes[off:next_off] = blob
-            off = next_off
-
-        checksum = crypto.bitcoin_hash(block_msg_bytes[btc_constants.BTC_HDR_COMMON_OFF:size])
-        block_msg_bytes[btc_constants.BTC_HEADER_MINUS_CHECKSUM:btc_constants.BTC_HDR_COMMON_OFF] = checksum[0:4]
-        bx_block, compression_block_info = self.block_to_bx_block(
-            BlockBtcMessage(buf=block_msg_bytes), recovery_item.tx_service
+            checksum_hash.update(transaction)  # pyre-ignore
+            payload_size += len(transaction)  # pyre-ignore
+        checksum = hashlib.sha256(checksum_hash.digest()).digest()
+        struct.pack_into("<L12sL", header, 0, recovery_item.magic, BtcMessageType.BLOCK, payload_size)
+        header[btc_constants.BTC_HEADER_MINUS_CHECKSUM:btc_constants.BTC_HDR_COMMON_OFF] = checksum[0:4]
+
+        get_txid = btc_messages_util.get_txid if self._txid_cache is None else self._txid_cache.get_txid
+        tx_hashes = [
+            get_txid(transaction) if tx_hash is None else tx_hash
+            for tx_hash, transaction in zip(recovery_item.block_tx_hashes, block_transactions)
+        ]
+        bx_block, short_ids = self._pack_bx_block(
+            header, block_transactions, tx_hashes, recovery_item.tx_service  # pyre-ignore
         )
-        compress_start_datetime = compression_block_info.start_datetime
+
+        prev_block_hash = BtcObjectHash(block_header, constants.UL_INT_SIZE_IN_BYTES, btc_constants.BTC_SHA_HASH_LEN)
         compress_end_datetime = datetime.utcnow()
+        original_size = btc_constants.BTC_HDR_COMMON_OFF + payload_size
+        compressed_size = len(bx_block)
         block_info = BlockInfo(
-            compression_block_info.block_hash,
-            compression_block_info.short_ids,
+            BtcObjectHash(buf=crypto.bitcoin_hash(block_header), length=btc_constants.BTC_SHA_HASH_LEN),
+            short_ids,
             compress_start_datetime,
             compress_end_datetime,
             (compress_end_datetime - compress_start_datetime).total_seconds() * 1000,
-            compression_block_info.txn_count,
-            compression_block_info.compressed_block_hash,
-            compression_block_info.prev_block_hash,
-            compression_block_info.original_size,
-            compression_block_info.compressed_size,
-            compression_block_info.compression_rate
+            total_txs_count,
+            convert.bytes_to_hex(crypto.double_sha256(bx_block)),
+            convert.bytes_to_hex(prev_block_hash.binary),
+            original_size,
+            compressed_size,
+            100 - float(compressed_size) / original_size * 100
         )
-        return CompactBlockCompressionResult(True, block_info, bx_block, None, [], [])
-
+        return CompactBlockCompressionResult(True, block_info, memoryview(bx_block), None, [], [])
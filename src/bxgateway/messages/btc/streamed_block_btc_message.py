@@ -0,0 +1,99 @@
+from typing import Iterator, List, Union
+
+from bxgateway.btc_constants import BTC_HDR_COMMON_OFF
+from bxgateway.messages.btc.block_btc_message import BlockBtcMessage
+
+
+class StreamedBlockBtcMessage(BlockBtcMessage):
+    """
+    Bitcoin block message built from a header piece and a list of transaction pieces, without copying them into
+    a single buffer.
+
+    The header piece must contain the full Bitcoin message header (including the checksum), the block header and
+    the transaction count, so all header fields are available without joining the pieces. Pieces are validated
+    by the message converter, so they always add up to the payload length in the message header.
+
+    `iter_chunks` produces the message bytes in chunks, which lets the blockchain node connection write the block
+    into its output buffer as it drains instead of rebuilding the block first. Accessing the full message bytes
+    (`rawbytes`, `payload`, `txns`, `tx_offset_table`) joins all pieces into one buffer.
+    """
+
+    def __init__(self, header: memoryview, tx_pieces: List[Union[bytearray, memoryview]]):
+        super(StreamedBlockBtcMessage, self).__init__(buf=header)
+        self._header_piece = header
+        self._tx_pieces = tx_pieces
+        self._is_materialized = False
+
+    def is_materialized(self) -> bool:
+        return self._is_materialized
+
+    def iter_chunks(self, chunk_size: int) -> Iterator[Union[bytearray, memoryview]]:
+        """
+        Yields the message bytes in order. Consecutive pieces smaller than `chunk_size` are copied into chunks of
+        at least `chunk_size` bytes, larger pieces are yielded as they are.
+
+        :param chunk_size: minimum size of a chunk, apart from the last one
+        """
+        if self._is_materialized:
+            yield self.rawbytes()
+            return
+
+        chunk = bytearray(self._header_piece)
+        for piece in self._tx_pieces:
+            if len(piece) >= chunk_size:
+                if chunk:
+                    yield chunk
+                    chunk = bytearray()
+                yield piece
+                continue
+
+            chunk += piece
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = bytearray()
+
+        if chunk:
+            yield chunk
+
+    def rawbytes(self) -> memoryview:
+        self._materialize()
+        return super(StreamedBlockBtcMessage, self).rawbytes()
+
+    def payload(self):
+        self._materialize()
+        return super(StreamedBlockBtcMessage, self).payload()
+
+    def txns(self):
+        self._materialize()
+        return super(StreamedBlockBtcMessage, self).txns()
+
+    def tx_offset_table(self):
+        self._materialize()
+        return super(StreamedBlockBtcMessage, self).tx_offset_table()
+
+    def _materialize(self):
+        if self._is_materialized:
+            return
+
+        buf = bytearray(self.payload_len() + BTC_HDR_COMMON_OFF)
+        off = len(self._header_piece)
+        buf[:off] = self._header_piece
+        for piece in self._tx_pieces:
+            next_off = off + len(piece)
+            buf[off:next_off] = piece
+            off = next_off
+
+        self.buf = buf
+        self._memoryview = memoryview(buf)
+        self._header = None
+        self._txns = None
+        self._tx_offset_table = None
+        self._payload = None
+        self._header_piece = self._memoryview[:len(self._header_piece)]
+        self._tx_pieces = []
+        self._is_materialized = True
+
+    def __repr__(self):
+        return "StreamedBlockBtcMessage<block_hash: {}, length: {}>".format(
+            self.block_hash(), self.payload_len() + BTC_HDR_COMMON_OFF
+        )
@@ -0,0 +1,71 @@
+from array import array
+from typing import Iterator, List, Sequence, Union
+
+from bxgateway.messages.btc import btc_messages_util
+
+TX_OFFSET_ARRAY_TYPECODE = "I"
+
+
+class TxOffsetTable(Sequence[memoryview]):
+    """
+    Transactions of a Bitcoin block, indexed by their offsets in the block message buffer.
+
+    Transaction boundaries are found once per block and stored in an array of `len(table) + 1` offsets, transaction
+    `i` spans `[offsets[i], offsets[i + 1])`. Segwit flags of transactions are stored in a bytearray. Transactions are
+    returned as memoryview slices created on access, so the table holds a few arrays instead of an object per
+    transaction.
+    """
+
+    def __init__(self, buf: memoryview, offsets: array, segwit_flags: bytearray):
+        """
+        :param buf: block message buffer
+        :param offsets: transaction start offsets in the buffer, followed by the end offset of the last transaction
+        :param segwit_flags: 1 for segwit transactions, 0 otherwise
+        """
+        self.buf = buf
+        self.offsets = offsets
+        self.segwit_flags = segwit_flags
+
+    @classmethod
+    def build(cls, buf: memoryview, off: int, tx_count: int) -> "TxOffsetTable":
+        """
+        Finds boundaries of transactions in a block.
+
+        :param buf: block message buffer
+        :param off: offset of the first transaction
+        :param tx_count: number of transactions
+        :return: transaction offset table
+        """
+        offsets, segwit_flags = btc_messages_util.get_tx_boundaries(buf, off, tx_count, TX_OFFSET_ARRAY_TYPECODE)
+        return cls(buf, offsets, segwit_flags)
+
+    def __len__(self) -> int:
+        return len(self.segwit_flags)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[memoryview, List[memoryview]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("transaction index out of range")
+        return self.buf[self.offsets[index]:self.offsets[index + 1]]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        buf = self.buf
+        offsets = self.offsets
+        for index in range(len(self)):
+            yield buf[offsets[index]:offsets[index + 1]]
+
+    def tx_size(self, index: int) -> int:
+        return self.offsets[index + 1] - self.offsets[index]
+
+    def is_segwit(self, index: int) -> bool:
+        return self.segwit_flags[index] == 1
+
+    def end_offset(self) -> int:
+        """
+        :return: offset right after the last transaction
+        """
+        return self.offsets[-1]
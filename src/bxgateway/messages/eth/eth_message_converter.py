@@ -18,12 +18,22 @@ from bxgateway.messages.eth.protocol.transactions_eth_protocol_message import Tr
 from bxgateway.utils.block_info import BlockInfo
 from bxgateway.utils.eth import crypto_utils
 from bxgateway.utils.eth import rlp_utils
+from bxgateway.utils.eth.keccak_cache import KeccakCache
+from bxgateway.utils.tx_hash_worker_pool import TxHashWorkerPool
 
 logger = logging.get_logger(__name__)
 
 
 class EthMessageConverter(AbstractMessageConverter):
 
+    def __init__(
+            self,
+            tx_hash_pool: Optional[TxHashWorkerPool] = None,
+            keccak_cache: Optional[KeccakCache] = None
+    ):
+        self._tx_hash_pool = tx_hash_pool
+        self._keccak_cache = keccak_cache
+
     def tx_to_bx_txs(self, tx_msg, network_num):
         """
         Converts Ethereum transactions message to array of internal transaction messages
@@ -46,11 +56,12 @@ class EthMessageConverter(AbstractMessageConverter):
         txs_bytes = msg_bytes[start:]
 
         tx_start_index = 0
+        keccak_hash = crypto_utils.keccak_hash if self._keccak_cache is None else self._keccak_cache.keccak_hash
 
         while True:
             _, tx_item_length, tx_item_start = rlp_utils.consume_length_prefix(txs_bytes, tx_start_index)
             tx_bytes = txs_bytes[tx_start_index:tx_item_start + tx_item_length]
-            tx_hash_bytes = crypto_utils.keccak_hash(tx_bytes)
+            tx_hash_bytes = keccak_hash(tx_bytes)
             msg_hash = Sha256Hash(tx_hash_bytes)
             bx_tx_msg = TxMessage(message_hash=msg_hash, network_num=network_num, tx_val=tx_bytes)
             bx_tx_msgs.append((bx_tx_msg, msg_hash, tx_bytes))
@@ -130,18 +141,27 @@ class EthMessageConverter(AbstractMessageConverter):
         buf = deque()
 
         tx_start_index = 0
-        tx_count = 0
+        txs = []
 
         while True:
             if tx_start_index >= len(txs_bytes):
                 break
 
             _, tx_item_length, tx_item_start = rlp_utils.consume_length_prefix(txs_bytes, tx_start_index)
-            tx_bytes = txs_bytes[tx_start_index:tx_item_start + tx_item_length]
-            tx_hash_bytes = crypto_utils.keccak_hash(tx_bytes)
-            tx_hash = Sha256Hash(tx_hash_bytes)
-            short_id = tx_service.get_short_id(tx_hash)
+            txs.append(txs_bytes[tx_start_index:tx_item_start + tx_item_length])
+            tx_start_index = tx_item_start + tx_item_length
 
+        tx_count = len(txs)
+        keccak_cache = self._keccak_cache
+        if keccak_cache is not None:
+            cache_hits_before = keccak_cache.get_stats().hits
+        tx_hashes = self._get_tx_hashes(txs)
+        tx_short_ids = [tx_service.get_short_id(tx_hash) for tx_hash in tx_hashes]
+        if keccak_cache is not None:
+            logger.debug("Keccak cache avoided {} of {} transaction hashes of block.",
+                         keccak_cache.get_stats().hits - cache_hits_before, tx_count)
+
+        for tx_bytes, short_id in zip(txs, tx_short_ids):
             if short_id <= 0:
                 is_full_tx_bytes = rlp_utils.encode_int(1)
                 tx_content_bytes = tx_bytes
@@ -164,10 +184,6 @@ class EthMessageConverter(AbstractMessageConverter):
 
             content_size += len(short_tx_content_prefix_bytes) + short_tx_content_size
 
-            tx_start_index = tx_item_start + tx_item_length
-
-            tx_count += 1
-
         list_of_txs_prefix_bytes = rlp_utils.get_length_prefix_list(content_size)
         buf.appendleft(list_of_txs_prefix_bytes)
         content_size += len(list_of_txs_prefix_bytes)
@@ -206,6 +222,29 @@ class EthMessageConverter(AbstractMessageConverter):
                                content_size, 100 - float(content_size) / original_size * 100)
         return memoryview(block), block_info
 
+    def _get_tx_hashes(self, txs: List[memoryview]) -> List[Sha256Hash]:
+        """
+        Returns hashes of block transactions, hashing transactions missing from the Keccak cache in worker processes
+        if there is a worker pool.
+        """
+        keccak_cache = self._keccak_cache
+        if self._tx_hash_pool is None:
+            keccak_hash = crypto_utils.keccak_hash if keccak_cache is None else keccak_cache.keccak_hash
+            return [Sha256Hash(keccak_hash(tx_bytes)) for tx_bytes in txs]
+
+        if keccak_cache is None:
+            return list(map(Sha256Hash, self._tx_hash_pool.hash_transactions(crypto_utils.keccak_hash, txs)))
+
+        tx_hashes = [keccak_cache.get(tx_bytes) for tx_bytes in txs]
+        missing_indices = [index for index, tx_hash in enumerate(tx_hashes) if tx_hash is None]
+        missing_tx_hashes = self._tx_hash_pool.hash_transactions(
+            crypto_utils.keccak_hash, [txs[index] for index in missing_indices]
+        )
+        for index, tx_hash in zip(missing_indices, missing_tx_hashes):
+            keccak_cache.add(txs[index], tx_hash)
+            tx_hashes[index] = tx_hash
+        return list(map(Sha256Hash, tx_hashes))
+
     def bx_block_to_block(self, bx_block_msg, tx_service) -> Tuple[Optional[AbstractMessage], BlockInfo, List[int],
                                                                    List[Sha256Hash]]:
         """
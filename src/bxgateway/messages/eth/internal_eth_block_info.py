@@ -10,6 +10,7 @@ from bxgateway.messages.eth.new_block_parts import NewBlockParts
 from bxgateway.messages.eth.protocol.new_block_eth_protocol_message import NewBlockEthProtocolMessage
 from bxgateway.messages.eth.serializers.block_header import BlockHeader
 from bxgateway.utils.eth import rlp_utils, crypto_utils
+from bxgateway.utils.eth.rlp_view import RlpListView
 
 
 class InternalEthBlockInfo(AbstractEthMessage, AbstractBlockMessage, ABC):
@@ -34,22 +35,21 @@ class InternalEthBlockInfo(AbstractEthMessage, AbstractBlockMessage, ABC):
         ("block_number", rlp.sedes.big_endian_int)
     ]
 
+    # indices of message items in RLP serialized message
+    HEADER_INDEX = 0
+    TRANSACTIONS_INDEX = 1
+    UNCLES_INDEX = 2
+    CHAIN_DIFFICULTY_INDEX = 3
+    BLOCK_NUMBER_INDEX = 4
+
     def __init__(self, msg_bytes, *args, **kwargs):
         super(InternalEthBlockInfo, self).__init__(msg_bytes, *args, **kwargs)
 
-        self._block_header: memoryview = None
-        self._block_hash: Sha256Hash = None
-        self._timestamp: int = None
+        self._rlp_view: Optional[RlpListView] = None
+        self._block_hash: Optional[Sha256Hash] = None
 
     def block_header(self) -> memoryview:
-        if self._block_header is None:
-            _, block_msg_itm_len, block_msg_itm_start = rlp_utils.consume_length_prefix(self._memory_view, 0)
-            block_msg_bytes = self._memory_view[block_msg_itm_start:block_msg_itm_start + block_msg_itm_len]
-
-            _, block_hdr_itm_len, block_hdr_itm_start = rlp_utils.consume_length_prefix(block_msg_bytes, 0)
-            self._block_header = block_msg_bytes[0:block_hdr_itm_start + block_hdr_itm_len]
-
-        return self._block_header
+        return self._get_rlp_view().get_item_bytes(self.HEADER_INDEX)
 
     def block_hash(self) -> Sha256Hash:
         if self._block_hash is None:
@@ -68,68 +68,19 @@ class InternalEthBlockInfo(AbstractEthMessage, AbstractBlockMessage, ABC):
             return "New Block msg"
 
     def prev_block_hash(self) -> Sha256Hash:
-        _, block_msg_itm_len, block_msg_itm_start = rlp_utils.consume_length_prefix(self._memory_view, 0)
-        block_msg_bytes = self._memory_view[block_msg_itm_start:block_msg_itm_start + block_msg_itm_len]
-
-        _, block_hdr_itm_len, block_hdr_itm_start = rlp_utils.consume_length_prefix(block_msg_bytes, 0)
-        block_hdr_bytes = block_msg_bytes[block_hdr_itm_start:block_hdr_itm_start + block_hdr_itm_len]
-
-        _, prev_block_itm_len, prev_block_itm_start = rlp_utils.consume_length_prefix(block_hdr_bytes, 0)
-        prev_block_bytes = block_hdr_bytes[prev_block_itm_start:prev_block_itm_start + prev_block_itm_len]
-
-        return Sha256Hash(prev_block_bytes)
+        return Sha256Hash(self._get_block_header_view().get_item_payload(BlockHeader.PREV_HASH_INDEX))
 
     def timestamp(self) -> int:
         """
         :return: seconds since epoch
         """
-        if self._timestamp is None:
-            _, block_msg_itm_len, block_msg_itm_start = rlp_utils.consume_length_prefix(self._memory_view, 0)
-            block_msg_bytes = self._memory_view[block_msg_itm_start:block_msg_itm_start + block_msg_itm_len]
-
-            _, block_hdr_itm_len, block_hdr_itm_start = rlp_utils.consume_length_prefix(block_msg_bytes, 0)
-            block_hdr_bytes = block_msg_bytes[block_hdr_itm_start:block_hdr_itm_start + block_hdr_itm_len]
-
-            offset = BlockHeader.FIXED_LENGTH_FIELD_OFFSET
-            _difficulty, difficulty_length = rlp_utils.decode_int(block_hdr_bytes, offset)
-            offset += difficulty_length
-            _number, number_length = rlp_utils.decode_int(block_hdr_bytes, offset)
-            offset += number_length
-            _gas_limit, gas_limit_length = rlp_utils.decode_int(block_hdr_bytes, offset)
-            offset += gas_limit_length
-            _gas_used, gas_used_length = rlp_utils.decode_int(block_hdr_bytes, offset)
-            offset += gas_used_length
-
-            timestamp, _timestamp_length = rlp_utils.decode_int(block_hdr_bytes, offset)
-            self._timestamp = timestamp
-
-        return self._timestamp
+        return self._get_block_header_view().get_int(BlockHeader.TIMESTAMP_INDEX)
 
     def has_total_difficulty(self) -> bool:
-        _, block_msg_itm_len, block_msg_itm_start = rlp_utils.consume_length_prefix(self._memory_view, 0)
-        block_msg_bytes = self._memory_view[block_msg_itm_start:block_msg_itm_start + block_msg_itm_len]
-
-        _, block_header_len, block_header_start = rlp_utils.consume_length_prefix(block_msg_bytes, 0)
-        _, txs_len, txs_start = rlp_utils.consume_length_prefix(block_msg_bytes, block_header_start + block_header_len)
-        _, uncles_len, uncles_start = rlp_utils.consume_length_prefix(block_msg_bytes, txs_start + txs_len)
-
-        chain_difficulty, _ = rlp_utils.decode_int(block_msg_bytes, uncles_start + uncles_len)
-
-        return chain_difficulty > 0
+        return self._get_rlp_view().get_int(self.CHAIN_DIFFICULTY_INDEX) > 0
 
     def has_block_number(self) -> bool:
-        _, block_msg_itm_len, block_msg_itm_start = rlp_utils.consume_length_prefix(self._memory_view, 0)
-        block_msg_bytes = self._memory_view[block_msg_itm_start:block_msg_itm_start + block_msg_itm_len]
-
-        _, block_header_len, block_header_start = rlp_utils.consume_length_prefix(block_msg_bytes, 0)
-        _, txs_len, txs_start = rlp_utils.consume_length_prefix(block_msg_bytes, block_header_start + block_header_len)
-        _, uncles_len, uncles_start = rlp_utils.consume_length_prefix(block_msg_bytes, txs_start + txs_len)
-        _, chain_difficulty_len, chain_difficulty_start = rlp_utils.consume_length_prefix(block_msg_bytes,
-                                                                                          uncles_start + uncles_len)
-
-        block_number, _ = rlp_utils.decode_int(block_msg_bytes, chain_difficulty_start + chain_difficulty_len)
-
-        return block_number > 0
+        return self._get_rlp_view().get_int(self.BLOCK_NUMBER_INDEX) > 0
 
     @classmethod
     def from_new_block_msg(cls, new_block_msg: NewBlockEthProtocolMessage) -> "InternalEthBlockInfo":
@@ -138,19 +89,13 @@ class InternalEthBlockInfo(AbstractEthMessage, AbstractBlockMessage, ABC):
         :param new_block_msg: new block message
         :return: NewBlockInternalEthMessage message
         """
-        new_block_msg_bytes = memoryview(new_block_msg.rawbytes())
-
-        _, block_msg_itm_len, block_msg_itm_start = rlp_utils.consume_length_prefix(new_block_msg_bytes, 0)
-        block_msg_bytes = new_block_msg_bytes[block_msg_itm_start:block_msg_itm_start + block_msg_itm_len]
-
         msg_size = 0
 
         # block item already include header, transactions and uncles
-        _, block_itm_len, block_itm_start = rlp_utils.consume_length_prefix(block_msg_bytes, 0)
-        block_itm_bytes = block_msg_bytes[block_msg_itm_start:block_msg_itm_start + block_itm_len]
+        block_itm_bytes = new_block_msg.get_block_rlp_view().payload()
         msg_size += len(block_itm_bytes)
 
-        difficulty_bytes = block_msg_bytes[block_msg_itm_start + block_itm_len:]
+        difficulty_bytes = new_block_msg.get_chain_difficulty_bytes()
         msg_size += len(difficulty_bytes)
 
         # use 0 for block number
@@ -237,34 +182,17 @@ class InternalEthBlockInfo(AbstractEthMessage, AbstractBlockMessage, ABC):
         Converts message to instance of NewBlockEthProtocolMessage
         :return: instance of NewBlockEthProtocolMessage
         """
-
-        _, msg_itm_len, msg_itm_start = rlp_utils.consume_length_prefix(self._memory_view, 0)
-        msg_itm_bytes = self._memory_view[msg_itm_start:]
-
-        offset = 0
+        rlp_view = self._get_rlp_view()
         msg_size = 0
 
-        _, header_len, header_start = rlp_utils.consume_length_prefix(msg_itm_bytes, offset)
-        header_bytes = msg_itm_bytes[offset:header_start + header_len]
-        offset = header_start + header_len
-        msg_size += len(header_bytes)
+        # header, transactions and uncles are stored next to each other and form the block item
+        block_content_bytes = rlp_view.get_items_bytes(self.HEADER_INDEX, self.UNCLES_INDEX + 1)
+        msg_size += len(block_content_bytes)
 
-        _, txs_len, txs_start = rlp_utils.consume_length_prefix(msg_itm_bytes, offset)
-        txs_bytes = msg_itm_bytes[offset:txs_start + txs_len]
-        offset = txs_start + txs_len
-        msg_size += len(txs_bytes)
-
-        _, uncles_len, uncles_start = rlp_utils.consume_length_prefix(msg_itm_bytes, offset)
-        uncles_bytes = msg_itm_bytes[offset:uncles_start + uncles_len]
-        offset = uncles_start + uncles_len
-        msg_size += len(uncles_bytes)
-
-        _, total_difficulty_len, total_difficulty_start = rlp_utils.consume_length_prefix(msg_itm_bytes, offset)
-        total_difficulty_bytes = msg_itm_bytes[offset:total_difficulty_start + total_difficulty_len]
+        total_difficulty_bytes = rlp_view.get_item_bytes(self.CHAIN_DIFFICULTY_INDEX)
         msg_size += len(total_difficulty_bytes)
 
-        block_prefix = rlp_utils.get_length_prefix_list(
-            len(header_bytes) + len(txs_bytes) + len(uncles_bytes))
+        block_prefix = rlp_utils.get_length_prefix_list(len(block_content_bytes))
         msg_size += len(block_prefix)
 
         msg_prefix = rlp_utils.get_length_prefix_list(msg_size)
@@ -279,14 +207,8 @@ class InternalEthBlockInfo(AbstractEthMessage, AbstractBlockMessage, ABC):
         result_msg_bytes[written_bytes:written_bytes + len(block_prefix)] = block_prefix
         written_bytes += len(block_prefix)
 
-        result_msg_bytes[written_bytes:written_bytes + len(header_bytes)] = header_bytes
-        written_bytes += len(header_bytes)
-
-        result_msg_bytes[written_bytes:written_bytes + len(txs_bytes)] = txs_bytes
-        written_bytes += len(txs_bytes)
-
-        result_msg_bytes[written_bytes:written_bytes + len(uncles_bytes)] = uncles_bytes
-        written_bytes += len(uncles_bytes)
+        result_msg_bytes[written_bytes:written_bytes + len(block_content_bytes)] = block_content_bytes
+        written_bytes += len(block_content_bytes)
 
         result_msg_bytes[written_bytes:written_bytes + len(total_difficulty_bytes)] = total_difficulty_bytes
         written_bytes += len(total_difficulty_bytes)
@@ -296,41 +218,28 @@ class InternalEthBlockInfo(AbstractEthMessage, AbstractBlockMessage, ABC):
         return NewBlockEthProtocolMessage(result_msg_bytes)
 
     def to_new_block_parts(self) -> NewBlockParts:
-        _, msg_itm_len, msg_itm_start = rlp_utils.consume_length_prefix(self._memory_view, 0)
-        msg_itm_bytes = self._memory_view[msg_itm_start:]
+        rlp_view = self._get_rlp_view()
 
-        offset = 0
+        header_bytes = rlp_view.get_item_bytes(self.HEADER_INDEX)
+        # transactions and uncles form the block body
+        block_body_content_bytes = rlp_view.get_items_bytes(self.TRANSACTIONS_INDEX, self.UNCLES_INDEX + 1)
+        block_number = rlp_view.get_int(self.BLOCK_NUMBER_INDEX)
 
-        _, header_len, header_start = rlp_utils.consume_length_prefix(msg_itm_bytes, offset)
-        header_bytes = msg_itm_bytes[offset:header_start + header_len]
-        offset = header_start + header_len
-
-        _, txs_len, txs_start = rlp_utils.consume_length_prefix(msg_itm_bytes, offset)
-        txs_bytes = msg_itm_bytes[offset:txs_start + txs_len]
-        offset = txs_start + txs_len
-
-        _, uncles_len, uncles_start = rlp_utils.consume_length_prefix(msg_itm_bytes, offset)
-        uncles_bytes = msg_itm_bytes[offset:uncles_start + uncles_len]
-        offset = uncles_start + uncles_len
-
-        _, total_difficulty_len, total_difficulty_start = rlp_utils.consume_length_prefix(msg_itm_bytes, offset)
-        offset = total_difficulty_start + total_difficulty_len
-
-        block_number, _ = rlp_utils.decode_int(msg_itm_bytes, offset)
-
-        block_body_prefix = rlp_utils.get_length_prefix_list(len(txs_bytes) + len(uncles_bytes))
-        block_body_bytes = bytearray(len(block_body_prefix) + len(txs_bytes) + len(uncles_bytes))
+        block_body_prefix = rlp_utils.get_length_prefix_list(len(block_body_content_bytes))
+        block_body_bytes = bytearray(len(block_body_prefix) + len(block_body_content_bytes))
 
         block_body_bytes[:len(block_body_prefix)] = block_body_prefix
-        written_bytes = len(block_body_prefix)
+        block_body_bytes[len(block_body_prefix):] = block_body_content_bytes
 
-        block_body_bytes[written_bytes:written_bytes + len(txs_bytes)] = txs_bytes
-        written_bytes += len(txs_bytes)
+        return NewBlockParts(header_bytes, block_body_bytes, block_number)
 
-        block_body_bytes[written_bytes:written_bytes + len(uncles_bytes)] = uncles_bytes
-        written_bytes += len(uncles_bytes)
+    def _get_rlp_view(self) -> RlpListView:
+        if self._rlp_view is None:
+            self._rlp_view = RlpListView(memoryview(self.rawbytes()))
+        return self._rlp_view
 
-        return NewBlockParts(header_bytes, block_body_bytes, block_number)
+    def _get_block_header_view(self) -> RlpListView:
+        return self._get_rlp_view().get_list(self.HEADER_INDEX)
 
     @classmethod
     def unpack(cls, buf):
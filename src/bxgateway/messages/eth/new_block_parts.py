@@ -1,9 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 from bxcommon.utils.object_hash import Sha256Hash
 from bxgateway.messages.eth.serializers.block_header import BlockHeader
-from bxgateway.utils.eth import crypto_utils, rlp_utils
+from bxgateway.utils.eth import crypto_utils
+from bxgateway.utils.eth.rlp_view import RlpListView
 
 
 @dataclass
@@ -11,33 +12,50 @@ class NewBlockParts:
     block_header_bytes: memoryview
     block_body_bytes: memoryview
     block_number: int
+    # block hash and header view are recomputed only if the header buffer is replaced
+    _hashed_block_header_bytes: Optional[memoryview] = field(default=None, init=False, repr=False, compare=False)
+    _block_hash: Optional[Sha256Hash] = field(default=None, init=False, repr=False, compare=False)
+    _viewed_block_header_bytes: Optional[memoryview] = field(default=None, init=False, repr=False, compare=False)
+    _header_rlp_view: Optional[RlpListView] = field(default=None, init=False, repr=False, compare=False)
 
     def get_block_hash(self) -> Optional[Sha256Hash]:
         if self.block_header_bytes is None:
             return None
 
-        raw_hash = crypto_utils.keccak_hash(self.block_header_bytes)
-        return Sha256Hash(raw_hash)
+        if self._hashed_block_header_bytes is not self.block_header_bytes:
+            self._block_hash = Sha256Hash(crypto_utils.keccak_hash(self.block_header_bytes))
+            self._hashed_block_header_bytes = self.block_header_bytes
+        return self._block_hash
 
     def get_previous_block_hash(self) -> Optional[Sha256Hash]:
-        if self.block_header_bytes is None:
+        header_rlp_view = self._get_header_rlp_view()
+        if header_rlp_view is None:
             return None
 
-        _, header_items_len, header_items_start = rlp_utils.consume_length_prefix(self.block_header_bytes, 0)
-        header_items_bytes = self.block_header_bytes[header_items_start:]
+        return Sha256Hash(header_rlp_view.get_item_payload(BlockHeader.PREV_HASH_INDEX))
 
-        _, prev_block_itm_len, prev_block_itm_start = rlp_utils.consume_length_prefix(header_items_bytes, 0)
-        prev_block_bytes = header_items_bytes[prev_block_itm_start:prev_block_itm_start + prev_block_itm_len]
+    def get_block_difficulty(self) -> Optional[int]:
+        header_rlp_view = self._get_header_rlp_view()
+        if header_rlp_view is None:
+            return None
 
-        return Sha256Hash(prev_block_bytes)
+        return header_rlp_view.get_int(BlockHeader.DIFFICULTY_INDEX)
 
-    def get_block_difficulty(self) -> Optional[int]:
-        if self.block_header_bytes is None:
+    def get_header_block_number(self) -> Optional[int]:
+        """
+        :return: block number from the block header, unlike block_number it is known for blocks of NewBlock messages
+        """
+        header_rlp_view = self._get_header_rlp_view()
+        if header_rlp_view is None:
             return None
 
-        _, header_items_len, header_items_start = rlp_utils.consume_length_prefix(self.block_header_bytes, 0)
-        header_items_bytes = self.block_header_bytes[header_items_start:]
+        return header_rlp_view.get_int(BlockHeader.NUMBER_INDEX)
 
-        block_difficulty, _ = rlp_utils.decode_int(header_items_bytes, BlockHeader.FIXED_LENGTH_FIELD_OFFSET)
+    def _get_header_rlp_view(self) -> Optional[RlpListView]:
+        if self.block_header_bytes is None:
+            return None
 
-        return block_difficulty
+        if self._viewed_block_header_bytes is not self.block_header_bytes:
+            self._header_rlp_view = RlpListView(memoryview(self.block_header_bytes))
+            self._viewed_block_header_bytes = self.block_header_bytes
+        return self._header_rlp_view
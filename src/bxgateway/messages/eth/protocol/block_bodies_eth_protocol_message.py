@@ -1,29 +1,55 @@
 import rlp
+from typing import List, Optional
 
 from bxutils.logging.log_level import LogLevel
 
+from bxcommon.utils.object_hash import Sha256Hash
+
 from bxgateway.messages.eth.protocol.eth_protocol_message import EthProtocolMessage
 from bxgateway.messages.eth.protocol.eth_protocol_message_type import EthProtocolMessageType
 from bxgateway.messages.eth.serializers.transient_block_body import TransientBlockBody
-from bxgateway.utils.eth import rlp_utils
+from bxgateway.utils.eth import rlp_utils, crypto_utils
+from bxgateway.utils.eth.rlp_view import RlpListView
 
 
 class BlockBodiesEthProtocolMessage(EthProtocolMessage):
     msg_type = EthProtocolMessageType.BLOCK_BODIES
 
     fields = [("blocks", rlp.sedes.CountableList(TransientBlockBody))]
-    
+
+    # index of transactions list in RLP serialized block body
+    BODY_TRANSACTIONS_INDEX = 0
+
+    def __init__(self, msg_bytes, *args, **kwargs):
+        super(BlockBodiesEthProtocolMessage, self).__init__(msg_bytes, *args, **kwargs)
+
+        self._bodies_rlp_view: Optional[RlpListView] = None
+
     def __repr__(self):
-        return f"BlockBodiesEthProtocolMessage<bodies_count: {len(self.get_block_bodies_bytes())}>"
+        return f"BlockBodiesEthProtocolMessage<bodies_count: {len(self._get_bodies_rlp_view())}>"
 
     def get_blocks(self):
         return self.get_field_value("blocks")
 
-    def get_block_bodies_bytes(self):
-        if self._memory_view is None:
-            self.serialize()
+    def get_block_bodies_bytes(self) -> List[memoryview]:
+        return self._get_bodies_rlp_view().get_items_list()
+
+    def get_block_transactions_bytes(self, body_index: int) -> List[memoryview]:
+        """
+        Returns serialized transactions of a block body as slices of the message bytes, without decoding them.
+
+        :param body_index: index of the block body in the message
+        :return: list of transactions bytes
+        """
+        return self._get_bodies_rlp_view().get_list(body_index).get_list(self.BODY_TRANSACTIONS_INDEX).get_items_list()
 
-        return rlp_utils.get_first_list_field_items_bytes(self._memory_view)
+    def get_block_transaction_hashes(self, body_index: int) -> List[Sha256Hash]:
+        """
+        :param body_index: index of the block body in the message
+        :return: hashes of transactions of the block body
+        """
+        return [Sha256Hash(crypto_utils.keccak_hash(tx_bytes))
+                for tx_bytes in self.get_block_transactions_bytes(body_index)]
 
     @classmethod
     def from_body_bytes(cls, body_bytes: memoryview) -> "BlockBodiesEthProtocolMessage":
@@ -38,3 +64,8 @@ class BlockBodiesEthProtocolMessage(EthProtocolMessage):
     def log_level(self):
         return LogLevel.DEBUG
 
+    def _get_bodies_rlp_view(self) -> RlpListView:
+        if self._bodies_rlp_view is None:
+            # message with a single field is serialized as that field, the list of block bodies
+            self._bodies_rlp_view = RlpListView(memoryview(self.rawbytes()))
+        return self._bodies_rlp_view
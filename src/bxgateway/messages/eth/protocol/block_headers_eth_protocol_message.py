@@ -1,11 +1,15 @@
 import rlp
+from typing import List, Optional
 
 from bxutils.logging.log_level import LogLevel
 
+from bxcommon.utils.object_hash import Sha256Hash
+
 from bxgateway.messages.eth.protocol.eth_protocol_message import EthProtocolMessage
 from bxgateway.messages.eth.protocol.eth_protocol_message_type import EthProtocolMessageType
 from bxgateway.messages.eth.serializers.block_header import BlockHeader
-from bxgateway.utils.eth import rlp_utils
+from bxgateway.utils.eth import rlp_utils, crypto_utils
+from bxgateway.utils.eth.rlp_view import RlpListView
 
 
 class BlockHeadersEthProtocolMessage(EthProtocolMessage):
@@ -13,22 +17,37 @@ class BlockHeadersEthProtocolMessage(EthProtocolMessage):
 
     fields = [("block_headers", rlp.sedes.CountableList(BlockHeader))]
 
+    def __init__(self, msg_bytes, *args, **kwargs):
+        super(BlockHeadersEthProtocolMessage, self).__init__(msg_bytes, *args, **kwargs)
+
+        self._headers_rlp_view: Optional[RlpListView] = None
+
     def __repr__(self):
-        headers = self.get_block_headers()
-        headers_repr = list(headers[:1])
-        if len(headers) > 1:
-            headers_repr.append(headers[-1])
-        return f"BlockHeadersEthProtocolMessage<headers_count: {len(headers)} " \
-               f"headers: [{'...'.join([h.hash().hex() for h in headers_repr])}]>"
+        block_hashes = self.get_block_hashes()
+        hashes_repr = block_hashes[:1]
+        if len(block_hashes) > 1:
+            hashes_repr.append(block_hashes[-1])
+        return f"BlockHeadersEthProtocolMessage<headers_count: {len(block_hashes)} " \
+               f"headers: [{'...'.join([block_hash.binary.hex() for block_hash in hashes_repr])}]>"
 
     def get_block_headers(self):
         return self.get_field_value("block_headers")
 
-    def get_block_headers_bytes(self):
-        if self._memory_view is None:
-            self.serialize()
+    def get_block_headers_bytes(self) -> List[memoryview]:
+        return self._get_headers_rlp_view().get_items_list()
 
-        return rlp_utils.get_first_list_field_items_bytes(self._memory_view)
+    def get_block_hashes(self) -> List[Sha256Hash]:
+        return [Sha256Hash(crypto_utils.keccak_hash(header_bytes)) for header_bytes in self.get_block_headers_bytes()]
+
+    def get_previous_block_hash(self, header_index: int = 0) -> Optional[Sha256Hash]:
+        """
+        :param header_index: index of the header in the message
+        :return: hash of the parent of the block, if the message has a header at that index
+        """
+        headers_rlp_view = self._get_headers_rlp_view()
+        if len(headers_rlp_view) <= header_index:
+            return None
+        return Sha256Hash(headers_rlp_view.get_list(header_index).get_item_payload(BlockHeader.PREV_HASH_INDEX))
 
     @classmethod
     def from_header_bytes(cls, header_bytes: memoryview) -> "BlockHeadersEthProtocolMessage":
@@ -42,3 +61,9 @@ class BlockHeadersEthProtocolMessage(EthProtocolMessage):
 
     def log_level(self):
         return LogLevel.DEBUG
+
+    def _get_headers_rlp_view(self) -> RlpListView:
+        if self._headers_rlp_view is None:
+            # message with a single field is serialized as that field, the list of headers
+            self._headers_rlp_view = RlpListView(memoryview(self.rawbytes()))
+        return self._headers_rlp_view
@@ -1,5 +1,5 @@
 import rlp
-from typing import List
+from typing import List, Optional
 
 from bxutils.logging.log_level import LogLevel
 
@@ -13,6 +13,7 @@ from bxgateway.messages.eth.serializers.block import Block
 from bxgateway.messages.eth.serializers.transaction import Transaction
 from bxgateway.messages.eth.serializers.block_header import BlockHeader
 from bxgateway.utils.eth import rlp_utils, crypto_utils
+from bxgateway.utils.eth.rlp_view import RlpListView
 
 
 class NewBlockEthProtocolMessage(EthProtocolMessage, AbstractBlockMessage):
@@ -23,14 +24,19 @@ class NewBlockEthProtocolMessage(EthProtocolMessage, AbstractBlockMessage):
 
     block = None
 
+    # indices of message items in RLP serialized message
+    BLOCK_INDEX = 0
+    CHAIN_DIFFICULTY_INDEX = 1
+
+    # indices of block items in RLP serialized block
+    BLOCK_HEADER_INDEX = 0
+    BLOCK_TRANSACTIONS_INDEX = 1
+
     def __init__(self, msg_bytes, *args, **kwargs):
         super(NewBlockEthProtocolMessage, self).__init__(msg_bytes, *args, **kwargs)
 
-        self._block_header = None
-        self._block_body = None
-        self._block_hash = None
-        self._timestamp = None
-        self._chain_difficulty = None
+        self._rlp_view: Optional[RlpListView] = None
+        self._block_hash: Optional[Sha256Hash] = None
 
     def extra_stats_data(self):
         return "Full block"
@@ -85,29 +91,17 @@ class NewBlockEthProtocolMessage(EthProtocolMessage, AbstractBlockMessage):
     def get_block(self) -> Block:
         return self.get_field_value("block")
 
-    def chain_difficulty(self):
-        if self._chain_difficulty is None:
-            _, block_msg_itm_len, block_msg_itm_start = rlp_utils.consume_length_prefix(self._memory_view, 0)
-            block_msg_bytes = self._memory_view[block_msg_itm_start:block_msg_itm_start + block_msg_itm_len]
-
-            _, block_itm_len, block_itm_start = rlp_utils.consume_length_prefix(block_msg_bytes, 0)
-
-            self._chain_difficulty, _ = rlp_utils.decode_int(block_msg_bytes, block_itm_start + block_itm_len)
-
-        return self._chain_difficulty
-
-    def block_header(self):
-        if self._block_header is None:
-            _, block_msg_itm_len, block_msg_itm_start = rlp_utils.consume_length_prefix(self._memory_view, 0)
-            block_msg_bytes = self._memory_view[block_msg_itm_start:block_msg_itm_start + block_msg_itm_len]
+    def chain_difficulty(self) -> int:
+        return self.get_rlp_view().get_int(self.CHAIN_DIFFICULTY_INDEX)
 
-            _, block_itm_len, block_itm_start = rlp_utils.consume_length_prefix(block_msg_bytes, 0)
-            block_itm_bytes = block_msg_bytes[block_msg_itm_start:block_msg_itm_start + block_itm_len]
-
-            _, block_hdr_itm_len, block_hdr_itm_start = rlp_utils.consume_length_prefix(block_itm_bytes, 0)
-            self._block_header = block_itm_bytes[0:block_hdr_itm_start + block_hdr_itm_len]
+    def get_chain_difficulty_bytes(self) -> memoryview:
+        """
+        :return: RLP serialized chain difficulty item
+        """
+        return self.get_rlp_view().get_item_bytes(self.CHAIN_DIFFICULTY_INDEX)
 
-        return self._block_header
+    def block_header(self) -> memoryview:
+        return self.get_block_rlp_view().get_item_bytes(self.BLOCK_HEADER_INDEX)
 
     def block_hash(self) -> Sha256Hash:
         if self._block_hash is None:
@@ -117,53 +111,38 @@ class NewBlockEthProtocolMessage(EthProtocolMessage, AbstractBlockMessage):
         return self._block_hash
 
     def prev_block_hash(self) -> Sha256Hash:
-        _, block_msg_itm_len, block_msg_itm_start = rlp_utils.consume_length_prefix(self._memory_view, 0)
-        block_msg_bytes = self._memory_view[block_msg_itm_start:block_msg_itm_start + block_msg_itm_len]
-
-        _, block_itm_len, block_itm_start = rlp_utils.consume_length_prefix(block_msg_bytes, 0)
-        block_itm_bytes = block_msg_bytes[block_msg_itm_start:block_msg_itm_start + block_itm_len]
-
-        _, diff_itm_len, diff_itm_start = rlp_utils.consume_length_prefix(block_msg_bytes,
-                                                                          block_itm_start + block_itm_len)
+        return Sha256Hash(self._get_block_header_view().get_item_payload(BlockHeader.PREV_HASH_INDEX))
 
-        _, block_hdr_itm_len, block_hdr_itm_start = rlp_utils.consume_length_prefix(block_itm_bytes, 0)
-        block_hdr_bytes = block_itm_bytes[block_hdr_itm_start:block_hdr_itm_start + block_hdr_itm_len]
-
-        _, prev_block_itm_len, prev_block_itm_start = rlp_utils.consume_length_prefix(block_hdr_bytes, 0)
-        prev_block_bytes = block_hdr_bytes[prev_block_itm_start:prev_block_itm_start + prev_block_itm_len]
-
-        return Sha256Hash(prev_block_bytes)
+    def number(self) -> int:
+        return self._get_block_header_view().get_int(BlockHeader.NUMBER_INDEX)
 
     def timestamp(self) -> int:
         """
         :return: seconds since epoch
         """
-        if self._timestamp is None:
-            _, block_msg_itm_len, block_msg_itm_start = rlp_utils.consume_length_prefix(self._memory_view, 0)
-            block_msg_bytes = self._memory_view[block_msg_itm_start:block_msg_itm_start + block_msg_itm_len]
-
-            _, block_itm_len, block_itm_start = rlp_utils.consume_length_prefix(block_msg_bytes, 0)
-            block_itm_bytes = block_msg_bytes[block_msg_itm_start:block_msg_itm_start + block_itm_len]
-
-            _, block_hdr_itm_len, block_hdr_itm_start = rlp_utils.consume_length_prefix(block_itm_bytes, 0)
-            block_hdr_bytes = block_itm_bytes[block_hdr_itm_start:block_hdr_itm_start + block_hdr_itm_len]
-
-            offset = BlockHeader.FIXED_LENGTH_FIELD_OFFSET
-            _difficulty, difficulty_length = rlp_utils.decode_int(block_hdr_bytes, offset)
-            offset += difficulty_length
-            _number, number_length = rlp_utils.decode_int(block_hdr_bytes, offset)
-            offset += number_length
-            _gas_limit, gas_limit_length = rlp_utils.decode_int(block_hdr_bytes, offset)
-            offset += gas_limit_length
-            _gas_used, gas_used_length = rlp_utils.decode_int(block_hdr_bytes, offset)
-            offset += gas_used_length
-
-            timestamp, _timestamp_length = rlp_utils.decode_int(block_hdr_bytes, offset)
-            self._timestamp = timestamp
-        assert self._timestamp is not None
-        return self._timestamp
+        return self._get_block_header_view().get_int(BlockHeader.TIMESTAMP_INDEX)
+
+    def get_rlp_view(self) -> RlpListView:
+        if self._rlp_view is None:
+            self._rlp_view = RlpListView(memoryview(self.rawbytes()))
+        return self._rlp_view
+
+    def get_block_rlp_view(self) -> RlpListView:
+        """
+        :return: view of the block item, which consists of block header, transactions and uncles
+        """
+        return self.get_rlp_view().get_list(self.BLOCK_INDEX)
 
     def txns(self) -> List[Transaction]:
         txns = self.get_block().transactions
         assert txns is not None
         return txns
+
+    def get_transactions_bytes(self) -> List[memoryview]:
+        """
+        :return: serialized transactions of the block as slices of the message bytes, without decoding them
+        """
+        return self.get_block_rlp_view().get_list(self.BLOCK_TRANSACTIONS_INDEX).get_items_list()
+
+    def _get_block_header_view(self) -> RlpListView:
+        return self.get_block_rlp_view().get_list(self.BLOCK_HEADER_INDEX)
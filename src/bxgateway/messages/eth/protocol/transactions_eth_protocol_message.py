@@ -1,8 +1,11 @@
+from typing import List
+
 import rlp
 
 from bxgateway.messages.eth.protocol.eth_protocol_message import EthProtocolMessage
 from bxgateway.messages.eth.protocol.eth_protocol_message_type import EthProtocolMessageType
 from bxgateway.messages.eth.serializers.transaction import Transaction
+from bxgateway.utils.eth import rlp_utils
 
 
 class TransactionsEthProtocolMessage(EthProtocolMessage):
@@ -12,3 +15,27 @@ class TransactionsEthProtocolMessage(EthProtocolMessage):
 
     def get_transactions(self):
         return self.get_field_value("transactions")
+
+    @classmethod
+    def from_transactions_messages(
+            cls, transactions_messages: List["TransactionsEthProtocolMessage"]
+    ) -> "TransactionsEthProtocolMessage":
+        """
+        Combines several transactions messages into one message with all the transactions, in order.
+        Works on serialized bytes and does not deserialize transactions.
+        """
+        txs_bytes = [
+            rlp_utils.remove_length_prefix(memoryview(transactions_message.rawbytes()))
+            for transactions_message in transactions_messages
+        ]
+        txs_size = sum(len(tx_bytes) for tx_bytes in txs_bytes)
+        txs_prefix = rlp_utils.get_length_prefix_list(txs_size)
+
+        msg_bytes = bytearray(len(txs_prefix) + txs_size)
+        msg_bytes[:len(txs_prefix)] = txs_prefix
+        off = len(txs_prefix)
+        for tx_bytes in txs_bytes:
+            msg_bytes[off:off + len(tx_bytes)] = tx_bytes
+            off += len(tx_bytes)
+
+        return cls(msg_bytes)
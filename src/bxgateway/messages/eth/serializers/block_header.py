@@ -9,6 +9,12 @@ from bxcommon.utils.object_hash import Sha256Hash
 class BlockHeader(rlp.Serializable):
     FIXED_LENGTH_FIELD_OFFSET = 2 * eth_constants.BLOCK_HASH_LEN + eth_constants.ADDRESS_LEN + 3 * eth_constants.MERKLE_ROOT_LEN + eth_constants.BLOOM_LEN + 9
 
+    # indices of header items in RLP serialized header
+    PREV_HASH_INDEX = 0
+    DIFFICULTY_INDEX = 7
+    NUMBER_INDEX = 8
+    TIMESTAMP_INDEX = 11
+
     fields = [
         ("prev_hash", rlp.sedes.Binary.fixed_length(eth_constants.BLOCK_HASH_LEN)),
         ("uncles_hash", rlp.sedes.Binary.fixed_length(eth_constants.BLOCK_HASH_LEN)),
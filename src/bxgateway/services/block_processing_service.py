@@ -1,5 +1,6 @@
 import datetime
 import time
+from functools import partial
 from typing import TYPE_CHECKING, Optional, Iterable
 
 from bxcommon.connections.abstract_connection import AbstractConnection
@@ -20,6 +21,7 @@ from bxgateway.connections.abstract_gateway_blockchain_connection import Abstrac
 from bxgateway.connections.abstract_relay_connection import AbstractRelayConnection
 from bxgateway.messages.gateway.block_received_message import BlockReceivedMessage
 from bxgateway.services.block_recovery_service import BlockRecoveryInfo
+from bxgateway.utils.encrypted_block_worker_pool import EncryptedBlockResult, create_encrypted_block_worker_pool
 from bxgateway.utils.errors.message_conversion_error import MessageConversionError
 from bxutils import logging
 
@@ -62,6 +64,10 @@ class BlockProcessingService:
     def __init__(self, node):
         self._node: AbstractGatewayNode = node
         self._holds = ExpiringDict(node.alarm_queue, node.opts.blockchain_block_hold_timeout_s)
+        self._encrypted_block_workers = create_encrypted_block_worker_pool(node.opts, node.alarm_queue)
+        self._encrypted_blocks_awaiting_key: ExpiringDict[Sha256Hash, memoryview] = ExpiringDict(
+            node.alarm_queue, gateway_constants.ENCRYPTED_BLOCKS_AWAITING_KEY_EXPIRATION_TIME_S
+        )
 
     def place_hold(self, block_hash, connection):
         """
@@ -134,10 +140,15 @@ class BlockProcessingService:
                 self._node.alarm_queue.unregister_alarm(hold.alarm)
             del self._holds.contents[block_hash]
 
-    def process_block_broadcast(self, msg, connection: AbstractRelayConnection):
+    def process_block_broadcast(self, msg, connection: AbstractRelayConnection,
+                                cipherblob_hash: Optional[bytes] = None):
         """
         Handle broadcast message receive from bloXroute.
         This is typically an encrypted block.
+
+        :param msg: broadcast message
+        :param connection: relay connection the message was received on
+        :param cipherblob_hash: binary double SHA256 of the blob computed while the message was read, if available
         """
 
         block_stats.add_block_event(msg,
@@ -155,7 +166,22 @@ class BlockProcessingService:
             return
 
         cipherblob = msg.blob()
-        expected_hash = Sha256Hash(crypto.double_sha256(cipherblob))
+        # hash computed while reading is only trusted when it matches, otherwise the blob is hashed again below
+        hash_verified = cipherblob_hash is not None and cipherblob_hash == block_hash.binary
+        if self._encrypted_block_workers is not None:
+            key = None
+            if self._node.in_progress_blocks.has_encryption_key_for_hash(block_hash):
+                key = self._node.in_progress_blocks.get_encryption_key(block_hash)
+            self._encrypted_block_workers.submit(
+                cipherblob, None if hash_verified else bytes(block_hash.binary), key,
+                partial(self._on_encrypted_block_verified, msg, connection, key)
+            )
+            return
+
+        if hash_verified:
+            expected_hash = block_hash
+        else:
+            expected_hash = Sha256Hash(crypto.double_sha256(cipherblob))
         if block_hash != expected_hash:
             connection.log_warning("Received a block with inconsistent hashes from the BDN. "
                                    "Expected: {}. Actual: {}. Dropping.",
@@ -182,14 +208,7 @@ class BlockProcessingService:
                                             BlockStatEventType.ENC_BLOCK_DECRYPTION_ERROR,
                                             network_num=connection.network_num)
         else:
-            connection.log_trace("Received encrypted block. Storing.")
-            self._node.in_progress_blocks.add_ciphertext(block_hash, cipherblob)
-            block_received_message = BlockReceivedMessage(block_hash)
-            conns = self._node.broadcast(block_received_message, self, connection_types=[ConnectionType.GATEWAY])
-            block_stats.add_block_event_by_block_hash(block_hash,
-                                                      BlockStatEventType.ENC_BLOCK_SENT_BLOCK_RECEIPT,
-                                                      network_num=connection.network_num,
-                                                      more_info=stats_format.connections(conns))
+            self._store_encrypted_block(block_hash, cipherblob, connection)
 
     def process_block_key(self, msg, connection: AbstractRelayConnection):
         """
@@ -208,7 +227,15 @@ class BlockProcessingService:
         if self._node.in_progress_blocks.has_encryption_key_for_hash(block_hash):
             return
 
-        if self._node.in_progress_blocks.has_ciphertext_for_hash(block_hash):
+        if block_hash in self._encrypted_blocks_awaiting_key.contents:
+            connection.log_trace("Cipher text found. Decrypting on worker thread.")
+            cipherblob = self._encrypted_blocks_awaiting_key.contents[block_hash]
+            self._encrypted_blocks_awaiting_key.remove_item(block_hash)
+            self._node.in_progress_blocks.add_key(block_hash, key)
+            self._encrypted_block_workers.submit(
+                cipherblob, None, key, partial(self._on_encrypted_block_decrypted, block_hash, connection)
+            )
+        elif self._node.in_progress_blocks.has_ciphertext_for_hash(block_hash):
             connection.log_trace("Cipher text found. Decrypting and sending to node.")
             decrypt_start_timestamp = time.time()
             decrypt_start_datetime = datetime.datetime.utcnow()
@@ -239,6 +266,10 @@ class BlockProcessingService:
                                                       network_num=self._node.network_num,
                                                       more_info=stats_format.connections(conns))
 
+    def close(self):
+        if self._encrypted_block_workers is not None:
+            self._encrypted_block_workers.close()
+
     def retry_broadcast_recovered_blocks(self, connection):
         if self._node.block_recovery_service.recovered_blocks:
             for msg in self._node.block_recovery_service.recovered_blocks:
@@ -246,6 +277,65 @@ class BlockProcessingService:
 
             self._node.block_recovery_service.clean_up_recovered_blocks()
 
+    def _store_encrypted_block(self, block_hash: Sha256Hash, cipherblob: memoryview,
+                               connection: AbstractRelayConnection):
+        connection.log_trace("Received encrypted block. Storing.")
+        self._node.in_progress_blocks.add_ciphertext(block_hash, cipherblob)
+        if self._encrypted_block_workers is not None:
+            self._encrypted_blocks_awaiting_key.add(block_hash, cipherblob)
+
+        block_received_message = BlockReceivedMessage(block_hash)
+        conns = self._node.broadcast(block_received_message, self, connection_types=[ConnectionType.GATEWAY])
+        block_stats.add_block_event_by_block_hash(block_hash,
+                                                  BlockStatEventType.ENC_BLOCK_SENT_BLOCK_RECEIPT,
+                                                  network_num=connection.network_num,
+                                                  more_info=stats_format.connections(conns))
+
+    def _on_encrypted_block_verified(self, msg, connection: AbstractRelayConnection, key: Optional[bytes],
+                                     result: EncryptedBlockResult):
+        """
+        Handles encrypted block broadcast verified (and decrypted if its key was known) on a worker thread.
+        """
+        block_hash = msg.block_hash()
+        if not result.hash_matches:
+            connection.log_warning("Received a block with inconsistent hashes from the BDN. "
+                                   "Expected: {}. Dropping.", block_hash)
+            return
+
+        cipherblob = msg.blob()
+        if key is not None:
+            connection.log_trace("Already had key for received block. Sending block to node.")
+            self._node.in_progress_blocks.add_ciphertext(block_hash, cipherblob)
+            self._on_encrypted_block_decrypted(block_hash, connection, result)
+        elif self._node.in_progress_blocks.has_encryption_key_for_hash(block_hash):
+            connection.log_trace("Received key for block during verification. Decrypting on worker thread.")
+            self._node.in_progress_blocks.add_ciphertext(block_hash, cipherblob)
+            self._encrypted_block_workers.submit(
+                cipherblob, None, self._node.in_progress_blocks.get_encryption_key(block_hash),
+                partial(self._on_encrypted_block_decrypted, block_hash, connection)
+            )
+        else:
+            self._store_encrypted_block(block_hash, cipherblob, connection)
+
+    def _on_encrypted_block_decrypted(self, block_hash: Sha256Hash, connection: AbstractRelayConnection,
+                                      result: EncryptedBlockResult):
+        if result.block is None:
+            block_stats.add_block_event_by_block_hash(block_hash,
+                                                      BlockStatEventType.ENC_BLOCK_DECRYPTION_ERROR,
+                                                      network_num=connection.network_num)
+            return
+
+        block_stats.add_block_event_by_block_hash(
+            block_hash,
+            BlockStatEventType.ENC_BLOCK_DECRYPTED_SUCCESS,
+            start_date_time=datetime.datetime.utcfromtimestamp(result.decrypt_start_time),
+            end_date_time=datetime.datetime.utcfromtimestamp(result.decrypt_end_time),
+            network_num=connection.network_num,
+            more_info=stats_format.timespan(result.decrypt_start_time, result.decrypt_end_time)
+        )
+        self._handle_decrypted_block(memoryview(result.block), connection,
+                                     encrypted_block_hash_hex=convert.bytes_to_hex(block_hash.binary))
+
     def _compute_hold_timeout(self, block_message):
         """
         Computes timeout after receiving block message before sending the block anyway if not received from network.
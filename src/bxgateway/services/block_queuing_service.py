@@ -72,6 +72,9 @@ class BlockQueuingService(Generic[T], metaclass=ABCMeta):
     def on_block_sent(self, block_hash: Sha256Hash, block_message: T):
         pass
 
+    def get_block_message_size(self, block_message: T) -> int:
+        return len(block_message.rawbytes())
+
     def can_send_block_message(self, block_hash: Sha256Hash, block_message: T) -> bool:
         """
         Determines if a block can be sent.
@@ -241,7 +244,7 @@ class BlockQueuingService(Generic[T], metaclass=ABCMeta):
         if not self.node.opts.track_detailed_sent_messages:
             block_stats.add_block_event_by_block_hash(
                 block_hash, BlockStatEventType.BLOCK_SENT_TO_BLOCKCHAIN_NODE, network_num=self.node.network_num,
-                more_info="{} bytes; Handled in {}; R - {}; {}".format(len(block_msg.rawbytes()),
+                more_info="{} bytes; Handled in {}; R - {}; {}".format(self.get_block_message_size(block_msg),
                                                                        stats_format.duration(handling_time),
                                                                        relay_desc, block_msg.extra_stats_data())
             )
@@ -1,11 +1,10 @@
 import time
 from collections import defaultdict
-from typing import Dict, Set, List, NamedTuple
+from typing import Dict, Set, List, NamedTuple, Iterable
 
 from bxgateway import gateway_constants
 from bxutils import logging
 
-from bxcommon.utils import crypto
 from bxcommon.utils.alarm_queue import AlarmQueue
 from bxcommon.utils.expiration_queue import ExpirationQueue
 from bxcommon.utils.object_hash import Sha256Hash
@@ -20,53 +19,86 @@ class BlockRecoveryInfo(NamedTuple):
     recovery_start_time: float
 
 
+class BlockRecoveryStats(NamedTuple):
+    blocks_awaiting_recovery: int
+    bx_blocks_awaiting_recovery: int
+    bytes_awaiting_recovery: int
+    unknown_short_ids: int
+    unknown_transaction_hashes: int
+    evicted_bx_blocks: int
+
+
+class RecoveringBlock(object):
+    """
+    Compressed block awaiting recovery, with the short ids and transaction hashes it is still missing.
+
+    The block is recovered once both sets are empty, so sizes of the sets are the remaining missing counters.
+    """
+    __slots__ = ["recovery_id", "block_hash", "bx_block", "unknown_short_ids", "unknown_transaction_hashes",
+                 "recovery_start_time"]
+
+    def __init__(self, recovery_id: int, block_hash: Sha256Hash, bx_block: memoryview, unknown_short_ids: Set[int],
+                 unknown_transaction_hashes: Set[Sha256Hash], recovery_start_time: float):
+        self.recovery_id = recovery_id
+        self.block_hash = block_hash
+        self.bx_block = bx_block
+        self.unknown_short_ids = unknown_short_ids
+        self.unknown_transaction_hashes = unknown_transaction_hashes
+        self.recovery_start_time = recovery_start_time
+
+    def is_recovered(self) -> bool:
+        return not self.unknown_short_ids and not self.unknown_transaction_hashes
+
+
 class BlockRecoveryService:
     """
     Service class that handles blocks gateway receives with unknown transaction short ids are contents.
 
+    Each compressed block awaiting recovery gets a recovery id instead of being keyed by the hash of its bytes,
+    so adding a block does not hash it. Short ids and transaction hashes index the recovery ids that are waiting
+    for them, so an arriving short id or transaction only touches the blocks that miss it.
+
     Attributes
     ----------
     recovered blocks: queue to which recovered blocks are pushed to
+    recovery_attempts_by_block: number of recovery retries made per block hash
     _alarm_queue: reference to alarm queue to schedule cleanup on
 
-    _bx_block_hash_to_sids: map of compressed block hash to its set of unknown short ids
-    _bx_block_hash_to_tx_hashes: map of compressed block hash to its set of unknown transaction hashes
-    _bx_block_hash_to_block_hash: map of compressed block hash to its original block hash
-    _bx_block_hash_to_block: map of compressed block hash to its compressed byte representation
-    _block_hash_to_bx_block_hashes: map of original block hash to compressed block hashes waiting for recovery
-    _sid_to_bx_block_hashes: map of short id to compressed block hashes waiting for recovery
-    _tx_hash_to_bx_block_hashes: map of transaction hash to block hashes waiting for recovery
+    _recovering_blocks: map of recovery id to compressed block awaiting recovery, in order blocks were added
+    _block_hash_to_recovery_ids: map of original block hash to recovery ids of its compressed versions
+    _sid_to_recovery_ids: map of short id to recovery ids of compressed blocks waiting for it
+    _tx_hash_to_recovery_ids: map of transaction hash to recovery ids of compressed blocks waiting for it
+    _bytes_awaiting_recovery: total size of compressed blocks awaiting recovery, kept under `_max_bytes`
+    _evicted_bx_blocks: number of compressed blocks dropped to keep under the byte budget
 
     _cleanup_scheduled: whether block recovery has an alarm scheduled to clean up recovering blocks
-    _blocks_expiration_queue: queue to trigger expiration of waiting for block recovery
+    _blocks_expiration_queue: queue of recovery ids to trigger expiration of waiting for block recovery
     """
 
     _alarm_queue: AlarmQueue
-    _bx_block_hash_to_sids: Dict[Sha256Hash, Set[int]]
-    _bx_block_hash_to_tx_hashes: Dict[Sha256Hash, Set[Sha256Hash]]
-    _bx_block_hash_to_block_hash: Dict[Sha256Hash, Sha256Hash]
-    _bx_block_hash_to_block: Dict[Sha256Hash, memoryview]
-    _block_hash_to_bx_block_hashes: Dict[Sha256Hash, Set[Sha256Hash]]
-    _sid_to_bx_block_hashes: Dict[int, Set[Sha256Hash]]
-    _tx_hash_to_bx_block_hashes: Dict[Sha256Hash, Set[Sha256Hash]]
+    _recovering_blocks: Dict[int, RecoveringBlock]
+    _block_hash_to_recovery_ids: Dict[Sha256Hash, Set[int]]
+    _sid_to_recovery_ids: Dict[int, Set[int]]
+    _tx_hash_to_recovery_ids: Dict[Sha256Hash, Set[int]]
     _blocks_expiration_queue: ExpirationQueue
     _cleanup_scheduled: bool = False
 
     recovery_attempts_by_block: Dict[Sha256Hash, int]
 
-    def __init__(self, alarm_queue: AlarmQueue):
+    def __init__(self, alarm_queue: AlarmQueue, max_bytes: int = gateway_constants.BLOCK_RECOVERY_MAX_BYTES):
         self.recovered_blocks = []
 
         self._alarm_queue = alarm_queue
+        self._max_bytes = max_bytes
 
-        self._bx_block_hash_to_sids = {}
-        self._bx_block_hash_to_tx_hashes = {}
-        self._bx_block_hash_to_block_hash = {}
-        self._bx_block_hash_to_block = {}
+        self._next_recovery_id = 0
+        self._recovering_blocks = {}
+        self._bytes_awaiting_recovery = 0
+        self._evicted_bx_blocks = 0
         self.recovery_attempts_by_block = defaultdict(int)
-        self._block_hash_to_bx_block_hashes = defaultdict(set)
-        self._sid_to_bx_block_hashes = defaultdict(set)
-        self._tx_hash_to_bx_block_hashes: Dict[Sha256Hash, Set[Sha256Hash]] = defaultdict(set)
+        self._block_hash_to_recovery_ids = defaultdict(set)
+        self._sid_to_recovery_ids = defaultdict(set)
+        self._tx_hash_to_recovery_ids = defaultdict(set)
         self._blocks_expiration_queue = ExpirationQueue(gateway_constants.BLOCK_RECOVERY_MAX_QUEUE_TIME)
 
     def add_block(self, bx_block: memoryview, block_hash: Sha256Hash, unknown_tx_sids: List[int],
@@ -80,20 +112,31 @@ class BlockRecoveryService:
         """
         logger.trace("Recovering block with {} unknown short ids and {} contents: {}", len(unknown_tx_sids),
                      len(unknown_tx_hashes), block_hash)
-        bx_block_hash = Sha256Hash(crypto.double_sha256(bx_block))
-
-        self._bx_block_hash_to_block[bx_block_hash] = bx_block
-        self._bx_block_hash_to_block_hash[bx_block_hash] = block_hash
-        self._bx_block_hash_to_sids[bx_block_hash] = set(unknown_tx_sids)
-        self._bx_block_hash_to_tx_hashes[bx_block_hash] = set(unknown_tx_hashes)
 
-        self._block_hash_to_bx_block_hashes[block_hash].add(bx_block_hash)
-        for sid in unknown_tx_sids:
-            self._sid_to_bx_block_hashes[sid].add(bx_block_hash)
-        for tx_hash in unknown_tx_hashes:
-            self._tx_hash_to_bx_block_hashes[tx_hash].add(bx_block_hash)
-
-        self._blocks_expiration_queue.add(bx_block_hash)
+        recovery_start_time = time.time()
+        # the same compressed block can be processed again, only compared against versions of the same block
+        for recovery_id in list(self._block_hash_to_recovery_ids.get(block_hash, ())):
+            recovering_block = self._recovering_blocks[recovery_id]
+            if len(recovering_block.bx_block) == len(bx_block) and recovering_block.bx_block == bx_block:
+                recovery_start_time = recovering_block.recovery_start_time
+                self._remove_recovering_block(recovery_id)
+
+        recovery_id = self._next_recovery_id
+        self._next_recovery_id += 1
+
+        recovering_block = RecoveringBlock(recovery_id, block_hash, bx_block, set(unknown_tx_sids),
+                                           set(unknown_tx_hashes), recovery_start_time)
+        self._recovering_blocks[recovery_id] = recovering_block
+        self._bytes_awaiting_recovery += len(bx_block)
+
+        self._block_hash_to_recovery_ids[block_hash].add(recovery_id)
+        for sid in recovering_block.unknown_short_ids:
+            self._sid_to_recovery_ids[sid].add(recovery_id)
+        for tx_hash in recovering_block.unknown_transaction_hashes:
+            self._tx_hash_to_recovery_ids[tx_hash].add(recovery_id)
+
+        self._blocks_expiration_queue.add(recovery_id)
+        self._evict_over_budget(recovery_id)
         self._schedule_cleanup()
 
     def get_blocks_awaiting_recovery(self) -> List[BlockRecoveryInfo]:
@@ -101,14 +144,18 @@ class BlockRecoveryService:
         Fetch all blocks still awaiting recovery and retry.
         """
         blocks_awaiting_recovery = []
-        for block_hash, bx_block_hashes in self._block_hash_to_bx_block_hashes.items():
+        for block_hash, recovery_ids in self._block_hash_to_recovery_ids.items():
             unknown_short_ids = set()
             unknown_transaction_hashes = set()
-            for bx_block_hash in bx_block_hashes:
-                unknown_short_ids.update(self._bx_block_hash_to_sids[bx_block_hash])
-                unknown_transaction_hashes.update(self._bx_block_hash_to_tx_hashes[bx_block_hash])
+            recovery_start_time = None
+            for recovery_id in recovery_ids:
+                recovering_block = self._recovering_blocks[recovery_id]
+                unknown_short_ids.update(recovering_block.unknown_short_ids)
+                unknown_transaction_hashes.update(recovering_block.unknown_transaction_hashes)
+                if recovery_start_time is None or recovering_block.recovery_start_time < recovery_start_time:
+                    recovery_start_time = recovering_block.recovery_start_time
             blocks_awaiting_recovery.append(BlockRecoveryInfo(block_hash, unknown_short_ids, unknown_transaction_hashes,
-                                                              time.time()))
+                                                              recovery_start_time))
         return blocks_awaiting_recovery
 
     def check_missing_sid(self, sid: int) -> bool:
@@ -116,47 +163,41 @@ class BlockRecoveryService:
         Resolves recovering blocks depend on sid.
         :param sid: SID info that has been processed
         """
-        if sid in self._sid_to_bx_block_hashes:
-            logger.trace("Resolved previously unknown short id: {0}.", sid)
-
-            bx_block_hashes = self._sid_to_bx_block_hashes[sid]
-            for bx_block_hash in bx_block_hashes:
-                if bx_block_hash in self._bx_block_hash_to_sids:
-                    if sid in self._bx_block_hash_to_sids[bx_block_hash]:
-                        self._bx_block_hash_to_sids[bx_block_hash].discard(sid)
-                        self._check_if_recovered(bx_block_hash)
-
-            del self._sid_to_bx_block_hashes[sid]
-            return True
-        else:
+        recovery_ids = self._sid_to_recovery_ids.pop(sid, None)
+        if recovery_ids is None:
             return False
 
+        logger.trace("Resolved previously unknown short id: {0}.", sid)
+        for recovery_id in recovery_ids:
+            recovering_block = self._recovering_blocks.get(recovery_id)
+            if recovering_block is not None:
+                recovering_block.unknown_short_ids.discard(sid)
+                self._check_if_recovered(recovering_block)
+        return True
+
     def check_missing_tx_hash(self, tx_hash: Sha256Hash) -> bool:
         """
         Resolves recovering blocks depend on transaction hash.
         :param tx_hash: transaction info that has been processed
         """
-        if tx_hash in self._tx_hash_to_bx_block_hashes:
-            logger.trace("Resolved previously unknown transaction hash {0}.", tx_hash)
-
-            bx_block_hashes = self._tx_hash_to_bx_block_hashes[tx_hash]
-            for bx_block_hash in bx_block_hashes:
-                if bx_block_hash in self._bx_block_hash_to_tx_hashes:
-                    if tx_hash in self._bx_block_hash_to_tx_hashes[bx_block_hash]:
-                        self._bx_block_hash_to_tx_hashes[bx_block_hash].discard(tx_hash)
-                        self._check_if_recovered(bx_block_hash)
-
-            del self._tx_hash_to_bx_block_hashes[tx_hash]
-            return True
-        else:
+        recovery_ids = self._tx_hash_to_recovery_ids.pop(tx_hash, None)
+        if recovery_ids is None:
             return False
 
+        logger.trace("Resolved previously unknown transaction hash {0}.", tx_hash)
+        for recovery_id in recovery_ids:
+            recovering_block = self._recovering_blocks.get(recovery_id)
+            if recovering_block is not None:
+                recovering_block.unknown_transaction_hashes.discard(tx_hash)
+                self._check_if_recovered(recovering_block)
+        return True
+
     def cancel_recovery_for_block(self, block_hash: Sha256Hash) -> bool:
         """
         Cancels recovery for all compressed blocks matching a block hash
         :param block_hash: ObjectHash
         """
-        if block_hash in self._block_hash_to_bx_block_hashes:
+        if block_hash in self._block_hash_to_recovery_ids:
             logger.trace("Cancelled block recovery for block: {}", block_hash)
             self._remove_recovered_block_hash(block_hash)
             return True
@@ -169,13 +210,13 @@ class BlockRecoveryService:
         :param clean_up_time:
         """
         logger.debug("Cleaning up block recovery.")
-        num_blocks_awaiting_recovery = len(self._bx_block_hash_to_block)
+        num_blocks_awaiting_recovery = len(self._recovering_blocks)
         self._blocks_expiration_queue.remove_expired(current_time=clean_up_time,
                                                      remove_callback=self._remove_not_recovered_block)
         logger.debug("Cleaned up {} blocks awaiting recovery.",
-                     num_blocks_awaiting_recovery - len(self._bx_block_hash_to_block))
+                     num_blocks_awaiting_recovery - len(self._recovering_blocks))
 
-        if self._bx_block_hash_to_block:
+        if self._recovering_blocks:
             return gateway_constants.BLOCK_RECOVERY_MAX_QUEUE_TIME
 
         # disable clean up until receive the next block with unknown tx
@@ -190,28 +231,30 @@ class BlockRecoveryService:
         logger.trace("Cleaning up {} recovered blocks.", len(self.recovered_blocks))
         del self.recovered_blocks[:]
 
-    def _check_if_recovered(self, bx_block_hash: Sha256Hash):
+    def get_recovery_stats(self) -> BlockRecoveryStats:
         """
-        Checks if a compressed block has received all short ids and transaction hashes necessary to recover.
-        Adds block to recovered blocks if so.
-        :param bx_block_hash: ObjectHash
-        :return:
+        Returns counters describing the backlog of blocks awaiting recovery.
         """
-        if self._is_block_recovered(bx_block_hash):
-            logger.trace("Recovered block: {}", bx_block_hash)
-            bx_block = self._bx_block_hash_to_block[bx_block_hash]
-            block_hash = self._bx_block_hash_to_block_hash[bx_block_hash]
-            self._remove_recovered_block_hash(block_hash)
-            self.recovered_blocks.append(bx_block)
-
-    def _is_block_recovered(self, bx_block_hash: Sha256Hash):
+        return BlockRecoveryStats(
+            len(self._block_hash_to_recovery_ids),
+            len(self._recovering_blocks),
+            self._bytes_awaiting_recovery,
+            len(self._sid_to_recovery_ids),
+            len(self._tx_hash_to_recovery_ids),
+            self._evicted_bx_blocks
+        )
+
+    def _check_if_recovered(self, recovering_block: RecoveringBlock):
         """
-        Indicates if a compressed block has received all short ids and transaction hashes necessary to recover.
-        :param bx_block_hash: ObjectHash
+        Checks if a compressed block has received all short ids and transaction hashes necessary to recover.
+        Adds block to recovered blocks if so.
+        :param recovering_block: compressed block awaiting recovery
         :return:
         """
-        return len(self._bx_block_hash_to_sids[bx_block_hash]) == 0 and len(
-            self._bx_block_hash_to_tx_hashes[bx_block_hash]) == 0
+        if recovering_block.is_recovered():
+            logger.trace("Recovered block: {}", recovering_block.block_hash)
+            self._remove_recovered_block_hash(recovering_block.block_hash)
+            self.recovered_blocks.append(recovering_block.bx_block)
 
     def _remove_recovered_block_hash(self, block_hash: Sha256Hash):
         """
@@ -219,55 +262,64 @@ class BlockRecoveryService:
         :param block_hash: ObjectHash
         :return:
         """
-        if block_hash in self._block_hash_to_bx_block_hashes:
-            for bx_block_hash in self._block_hash_to_bx_block_hashes[block_hash]:
-                if bx_block_hash in self._bx_block_hash_to_block:
-                    self._remove_sid_and_tx_mapping_for_bx_block_hash(bx_block_hash)
-                    del self._bx_block_hash_to_block[bx_block_hash]
-                    del self._bx_block_hash_to_block_hash[bx_block_hash]
-            del self._block_hash_to_bx_block_hashes[block_hash]
-
-    def _remove_sid_and_tx_mapping_for_bx_block_hash(self, bx_block_hash: Sha256Hash):
+        recovery_ids = self._block_hash_to_recovery_ids.get(block_hash)
+        if recovery_ids is not None:
+            for recovery_id in list(recovery_ids):
+                self._remove_recovering_block(recovery_id)
+        self.recovery_attempts_by_block.pop(block_hash, None)
+
+    def _remove_recovering_block(self, recovery_id: int):
         """
-        Removes all short id and transaction mapping for a compressed block.
-        :param bx_block_hash:
-        :return:
+        Removes a compressed block and its short id and transaction mapping.
+        :param recovery_id: recovery id of the compressed block
         """
-        if bx_block_hash not in self._bx_block_hash_to_block:
-            raise ValueError("Can't remove mapping for a block that isn't being recovered.")
-
-        for sid in self._bx_block_hash_to_sids[bx_block_hash]:
-            if sid in self._sid_to_bx_block_hashes:
-                self._sid_to_bx_block_hashes[sid].discard(bx_block_hash)
-                if len(self._sid_to_bx_block_hashes[sid]) == 0:
-                    del self._sid_to_bx_block_hashes[sid]
-        del self._bx_block_hash_to_sids[bx_block_hash]
-
-        for tx_hash in self._bx_block_hash_to_tx_hashes[bx_block_hash]:
-            if tx_hash in self._tx_hash_to_bx_block_hashes:
-                self._tx_hash_to_bx_block_hashes[tx_hash].discard(bx_block_hash)
-                if len(self._tx_hash_to_bx_block_hashes[tx_hash]) == 0:
-                    del self._tx_hash_to_bx_block_hashes[tx_hash]
-        del self._bx_block_hash_to_tx_hashes[bx_block_hash]
-
-    def _remove_not_recovered_block(self, bx_block_hash: Sha256Hash):
+        recovering_block = self._recovering_blocks.pop(recovery_id)
+        self._bytes_awaiting_recovery -= len(recovering_block.bx_block)
+
+        self._discard_recovery_id(self._sid_to_recovery_ids, recovering_block.unknown_short_ids, recovery_id)
+        self._discard_recovery_id(self._tx_hash_to_recovery_ids, recovering_block.unknown_transaction_hashes,
+                                  recovery_id)
+
+        block_hash = recovering_block.block_hash
+        block_recovery_ids = self._block_hash_to_recovery_ids[block_hash]
+        block_recovery_ids.discard(recovery_id)
+        if not block_recovery_ids:
+            del self._block_hash_to_recovery_ids[block_hash]
+
+    def _discard_recovery_id(self, index: Dict, keys: Iterable, recovery_id: int):
+        for key in keys:
+            recovery_ids = index.get(key)
+            if recovery_ids is not None:
+                recovery_ids.discard(recovery_id)
+                if not recovery_ids:
+                    del index[key]
+
+    def _remove_not_recovered_block(self, recovery_id: int):
         """
         Removes compressed block that has not recovered.
-        :param bx_block_hash: ObjectHash
+        :param recovery_id: recovery id of the compressed block
         """
-        if bx_block_hash in self._bx_block_hash_to_block:
-            logger.trace("Block has failed recovery: {}", bx_block_hash)
+        if recovery_id in self._recovering_blocks:
+            logger.trace("Block has failed recovery: {}", self._recovering_blocks[recovery_id].block_hash)
+            self._remove_recovering_block(recovery_id)
 
-            self._remove_sid_and_tx_mapping_for_bx_block_hash(bx_block_hash)
-            del self._bx_block_hash_to_block[bx_block_hash]
+    def _evict_over_budget(self, added_recovery_id: int):
+        """
+        Drops the oldest compressed blocks awaiting recovery while over the byte budget.
+        The block that was just added is always kept.
+        """
+        while self._bytes_awaiting_recovery > self._max_bytes:
+            oldest_recovery_id = next(iter(self._recovering_blocks))
+            if oldest_recovery_id == added_recovery_id:
+                break
 
-            block_hash = self._bx_block_hash_to_block_hash.pop(bx_block_hash)
-            self._block_hash_to_bx_block_hashes[block_hash].discard(bx_block_hash)
-            if len(self._block_hash_to_bx_block_hashes[block_hash]) == 0:
-                del self._block_hash_to_bx_block_hashes[block_hash]
+            logger.debug("Block recovery is over budget of {} bytes, dropping compressed block for {}.",
+                         self._max_bytes, self._recovering_blocks[oldest_recovery_id].block_hash)
+            self._remove_recovering_block(oldest_recovery_id)
+            self._evicted_bx_blocks += 1
 
     def _schedule_cleanup(self):
-        if not self._cleanup_scheduled and self._bx_block_hash_to_block:
+        if not self._cleanup_scheduled and self._recovering_blocks:
             logger.trace("Scheduling block recovery cleanup in {} seconds.",
                          gateway_constants.BLOCK_RECOVERY_MAX_QUEUE_TIME)
             self._alarm_queue.register_alarm(gateway_constants.BLOCK_RECOVERY_MAX_QUEUE_TIME, self.cleanup_old_blocks)
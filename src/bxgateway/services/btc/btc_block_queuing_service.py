@@ -1,4 +1,5 @@
 from bxcommon.utils.object_hash import Sha256Hash
+from bxgateway.btc_constants import BTC_HDR_COMMON_OFF
 from bxgateway.messages.btc.block_btc_message import BlockBtcMessage
 from bxgateway.messages.btc.inventory_btc_message import InvBtcMessage, InventoryType
 from bxgateway.services.block_queuing_service import BlockQueuingService
@@ -8,6 +9,10 @@ class BtcBlockQueuingService(BlockQueuingService[BlockBtcMessage]):
     def get_previous_block_hash_from_message(self, block_message: BlockBtcMessage) -> Sha256Hash:
         return block_message.prev_block_hash()
 
+    def get_block_message_size(self, block_message: BlockBtcMessage) -> int:
+        # taken from the message header, so streamed blocks are not joined just to report their size
+        return block_message.payload_len() + BTC_HDR_COMMON_OFF
+
     def on_block_sent(self, block_hash: Sha256Hash, block_message: BlockBtcMessage):
         # After sending block message to Bitcoin node sending INV message for the same block to the node
         # This is needed to update Synced Headers value of the gateway peer on the Bitcoin node
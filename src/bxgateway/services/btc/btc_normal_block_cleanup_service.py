@@ -3,14 +3,13 @@ import time
 from bxutils import logging
 from bxutils.logging.log_record_type import LogRecordType
 
-from bxcommon.utils import crypto
 from bxcommon.services.transaction_service import TransactionService
 from bxcommon.messages.bloxroute.block_confirmation_message import BlockConfirmationMessage
 
+from bxgateway.messages.btc import btc_messages_util
 from bxgateway.messages.btc.block_btc_message import BlockBtcMessage
 
 from bxgateway.services.btc.abstract_btc_block_cleanup_service import AbstractBtcBlockCleanupService
-from bxgateway.utils.btc.btc_object_hash import BtcObjectHash, BTC_SHA_HASH_LEN
 
 from bxcommon.services import normal_cleanup_service_helpers
 
@@ -37,10 +36,19 @@ class BtcNormalBlockCleanupService(AbstractBtcBlockCleanupService):
 
         tx_hash_to_contents_len_before_cleanup = transaction_service.get_tx_hash_to_contents_len()
         short_id_count_before_cleanup = transaction_service.get_short_id_count()
+        short_id_matcher = self.node.compact_block_short_id_matcher
+        txid_cache = self.node.txid_cache
 
-        for tx in block_msg.txns():
-            tx_hash = BtcObjectHash(buf=crypto.double_sha256(tx), length=BTC_SHA_HASH_LEN)
+        txns = block_msg.tx_offset_table()
+        for tx, segwit_flag in zip(txns, txns.segwit_flags):
+            if txid_cache is None:
+                tx_hash = btc_messages_util.get_txid(tx, segwit_flag == 1)
+            else:
+                # transactions of a cleaned up block are not expected again, so their txids are dropped from cache
+                tx_hash = txid_cache.pop_txid(tx, segwit_flag == 1)
             short_ids = transaction_service.remove_transaction_by_tx_hash(tx_hash)
+            if short_id_matcher is not None:
+                short_id_matcher.remove_transaction(tx_hash)
             if short_ids is None:
                 unknown_tx_hashes_count += 1
                 block_unknown_tx_hashes.append(tx_hash)
@@ -61,6 +69,13 @@ class BtcNormalBlockCleanupService(AbstractBtcBlockCleanupService):
             "short ids. Took {:.3f}s.",
             block_hash, transactions_processed, unknown_tx_hashes_count, short_ids_count, duration
         )
+        if txid_cache is not None:
+            txid_cache_stats = txid_cache.get_stats()
+            logger.debug(
+                "Txid cache: {} transactions, {} bytes, hit rate {:.2f} ({} hits, {} misses), {} evicted.",
+                txid_cache_stats.tx_count, txid_cache_stats.size_bytes, txid_cache_stats.hit_rate(),
+                txid_cache_stats.hits, txid_cache_stats.misses, txid_cache_stats.evicted
+            )
 
         transaction_service.log_block_transaction_cleanup_stats(block_hash, block_msg.txn_count(),
                                                                 tx_hash_to_contents_len_before_cleanup,
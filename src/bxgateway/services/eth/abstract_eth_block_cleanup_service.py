@@ -1,5 +1,5 @@
 import typing
-from typing import Iterable
+from typing import Iterable, List
 from abc import abstractmethod
 
 from bxutils import logging
@@ -10,6 +10,7 @@ from bxcommon.utils.object_hash import Sha256Hash
 
 from bxgateway.messages.eth.protocol.new_block_eth_protocol_message import NewBlockEthProtocolMessage
 from bxgateway.services.abstract_block_cleanup_service import AbstractBlockCleanupService
+from bxgateway.utils.eth import crypto_utils
 
 logger = logging.get_logger(LogRecordType.BlockCleanup)
 
@@ -47,13 +48,24 @@ class AbstractEthBlockCleanupService(AbstractBlockCleanupService):
             transaction_service: TransactionService
     ) -> None:
         block_hash = block_msg.block_hash()
-        transactions_list = block_msg.txns()
         self.clean_block_transactions_by_block_components(
             block_hash=block_hash,
-            transactions_list=(tx.hash() for tx in transactions_list),
+            transactions_list=self.get_transaction_hashes(block_msg.get_transactions_bytes()),
             transaction_service=transaction_service
         )
 
+    def get_transaction_hashes(self, transactions_bytes: Iterable[memoryview]) -> List[Sha256Hash]:
+        """
+        Hashes transactions of a block that is cleaned up. Transactions of a cleaned up block are not expected again,
+        so their hashes are taken out of the node's Keccak cache instead of being cached.
+
+        :param transactions_bytes: serialized transactions of the block
+        :return: transaction hashes
+        """
+        keccak_cache = self.node.keccak_cache
+        keccak_hash = crypto_utils.keccak_hash if keccak_cache is None else keccak_cache.pop_hash
+        return [Sha256Hash(keccak_hash(tx_bytes)) for tx_bytes in transactions_bytes]
+
     @abstractmethod
     def clean_block_transactions_by_block_components(
             self,
@@ -33,7 +33,8 @@ class EthBlockQueuingService(BlockQueuingService[NewBlockEthProtocolMessage]):
         if block_msg.has_total_difficulty():
             new_block_msg = block_msg.to_new_block_msg()
             super(EthBlockQueuingService, self)._send_block_to_node(block_hash, new_block_msg)
-            self.node.set_known_total_difficulty(new_block_msg.block_hash(), new_block_msg.chain_difficulty())
+            self.node.set_known_total_difficulty(new_block_msg.block_hash(), new_block_msg.chain_difficulty(),
+                                                 new_block_msg.prev_block_hash(), new_block_msg.number())
         else:
             new_block_parts = block_msg.to_new_block_parts()
             calculated_total_difficulty = self.node.try_calculate_total_difficulty(block_hash, new_block_parts)
@@ -0,0 +1,176 @@
+import time
+from typing import List, Tuple, Union
+
+from bxcommon.constants import LOCALHOST
+from bxcommon.messages.bloxroute.broadcast_message import BroadcastMessage
+from bxcommon.messages.bloxroute.tx_message import TxMessage
+from bxcommon.models.outbound_peer_model import OutboundPeerModel
+from bxcommon.test_utils import helpers
+from bxcommon.utils import convert, crypto
+
+from bxgateway import gateway_constants
+from bxgateway.btc_constants import BTC_HDR_COMMON_OFF
+from bxgateway.messages.btc import btc_messages_util
+from bxgateway.messages.btc.block_btc_message import BlockBtcMessage
+from bxgateway.messages.btc.btc_message import BtcMessage
+from bxgateway.messages.btc.tx_btc_message import TxBtcMessage
+from bxgateway.testing import benchmark_utils
+from bxgateway.testing.abstract_btc_gateway_integration_test import AbstractBtcGatewayIntegrationTest
+from bxgateway.testing.benchmark_utils import BenchmarkResult
+from bxgateway.utils.btc.btc_object_hash import BtcObjectHash
+
+BLOCK_VERSION = 536870912
+BLOCK_BITS = 2
+
+
+class AbstractBtcGatewayBenchmarkTest(AbstractBtcGatewayIntegrationTest):
+    """
+    Benchmarks block and transaction propagation through two in-process gateways.
+
+    Gateway 1 receives blocks and transactions from a fake blockchain node and sends them to a fake relay,
+    which forwards them to gateway 2, which in turn sends them to its own fake blockchain node.
+    All connections are in-memory mock sockets, so results measure gateway processing time only and can be
+    reproduced without network access.
+
+    Only Bitcoin gateways are covered. Ethereum gateways exchange encrypted RLPx frames with their nodes, so
+    replaying Ethereum blocks and transactions needs fake peers completing the handshake, which is out of scope here.
+    """
+    # share of block transactions both gateways already know when a block is propagated
+    COMPRESSED_TX_RATIO = 0.9
+
+    def gateway_1_opts(self):
+        return helpers.get_gateway_opts(9000, peer_gateways=[OutboundPeerModel(LOCALHOST, 7002)],
+                                        sync_tx_service=False, include_default_btc_args=True, encrypt_blocks=False)
+
+    def gateway_2_opts(self):
+        return helpers.get_gateway_opts(9001, peer_gateways=[OutboundPeerModel(LOCALHOST, 7002)],
+                                        sync_tx_service=False, include_default_btc_args=True, encrypt_blocks=False)
+
+    def setUp(self):
+        super().setUp()
+        self.magic = self.node1.opts.blockchain_net_magic
+        self._previous_block_hash = BtcObjectHash(bytearray(crypto.double_sha256(b"benchmark")),
+                                                  length=crypto.SHA256_HASH_LEN)
+        self._next_short_id = 1
+
+    def load_recorded_block_transactions(self, file_path: str) -> List[memoryview]:
+        """
+        Reads transactions of a block recorded as a hex string (block payload, without the message header).
+        """
+        with open(file_path) as sample_file:
+            block_payload = convert.hex_to_bytes(sample_file.read().strip("\n"))
+        buf = bytearray(BTC_HDR_COMMON_OFF + len(block_payload))
+        buf[BTC_HDR_COMMON_OFF:] = block_payload
+        msg = BtcMessage(magic=self.magic, command=BlockBtcMessage.MESSAGE_TYPE, payload_len=len(block_payload),
+                         buf=buf)
+        return BlockBtcMessage(buf=msg.buf).txns()
+
+    def build_block(self, txns: List[Union[bytearray, memoryview]], nonce: int) -> BlockBtcMessage:
+        """
+        Builds the next block of a chain of replayed blocks, so gateway 2 can send every block to its node right away.
+        """
+        merkle_root = BtcObjectHash(bytearray(crypto.double_sha256(nonce.to_bytes(8, "little"))),
+                                    length=crypto.SHA256_HASH_LEN)
+        block = BlockBtcMessage(self.magic, BLOCK_VERSION, self._previous_block_hash, merkle_root, int(time.time()),
+                                BLOCK_BITS, nonce, txns)
+        self._previous_block_hash = block.block_hash()
+        return block
+
+    def populate_transaction_services(self, txns: List[Union[bytearray, memoryview]]) -> None:
+        for tx in txns[:int(len(txns) * self.COMPRESSED_TX_RATIO)]:
+            tx_hash = btc_messages_util.get_txid(tx)
+            for node in (self.node1, self.node2):
+                node.get_tx_service().assign_short_id(tx_hash, self._next_short_id)
+                node.get_tx_service().set_transaction_contents(tx_hash, tx)
+            self._next_short_id += 1
+
+    def propagate_block(self, block: BlockBtcMessage) -> Tuple[float, float]:
+        """
+        Sends block from the node of gateway 1 to the node of gateway 2.
+
+        :return: node to BDN time and BDN to node time, in milliseconds
+        """
+        start_time = time.perf_counter()
+        helpers.receive_node_message(self.node1, self.blockchain_fileno, block.rawbytes())
+        broadcast_bytes = helpers.get_queued_node_message(self.node1, self.relay_fileno,
+                                                          BroadcastMessage.MESSAGE_TYPE)
+        node_to_bdn_ms = (time.perf_counter() - start_time) * 1000
+
+        start_time = time.perf_counter()
+        helpers.receive_node_message(self.node2, self.relay_fileno, broadcast_bytes)
+        block_bytes = self.get_all_bytes_to_send(self.node2, self.blockchain_fileno)
+        bdn_to_node_ms = (time.perf_counter() - start_time) * 1000
+
+        self.assertEqual(len(block.rawbytes()), len(block_bytes))
+
+        # the fake node of gateway 2 accepts the block, so the next block of the chain can be sent
+        self.node2.block_queuing_service.mark_blocks_seen_by_blockchain_node([block.block_hash()])
+        self.clear_all_buffers()
+        return node_to_bdn_ms, bdn_to_node_ms
+
+    def run_block_propagation_benchmark(
+            self, txns: List[Union[bytearray, memoryview]], iterations: int
+    ) -> Tuple[BenchmarkResult, BenchmarkResult]:
+        """
+        Replays blocks with the given transactions.
+
+        :return: node to BDN latency and BDN to node latency
+        """
+        self.populate_transaction_services(txns)
+
+        # warm up
+        self.propagate_block(self.build_block(txns, 0))
+
+        node_to_bdn_durations = []
+        bdn_to_node_durations = []
+        for nonce in range(1, iterations + 1):
+            node_to_bdn_ms, bdn_to_node_ms = self.propagate_block(self.build_block(txns, nonce))
+            node_to_bdn_durations.append(node_to_bdn_ms)
+            bdn_to_node_durations.append(bdn_to_node_ms)
+        return benchmark_utils.summarize(node_to_bdn_durations), benchmark_utils.summarize(bdn_to_node_durations)
+
+    def run_transaction_benchmark(self, txns: List[Union[bytearray, memoryview]]) -> Tuple[float, float]:
+        """
+        Replays a stream of transactions unknown to both gateways.
+
+        :return: node to BDN and BDN to node throughput, in transactions per second
+        """
+        btc_tx_messages = []
+        for tx in txns:
+            buf = bytearray(BTC_HDR_COMMON_OFF + len(tx))
+            buf[BTC_HDR_COMMON_OFF:] = tx
+            raw_msg = BtcMessage(self.magic, TxBtcMessage.MESSAGE_TYPE, len(tx), buf)
+            btc_tx_messages.append(TxBtcMessage(buf=raw_msg.buf))
+
+        start_time = time.perf_counter()
+        for btc_tx_message in btc_tx_messages:
+            helpers.receive_node_message(self.node1, self.blockchain_fileno, btc_tx_message.rawbytes())
+        self.get_all_bytes_to_send(self.node1, self.relay_fileno)
+        node_to_bdn_s = time.perf_counter() - start_time
+
+        # fake relay assigns short ids
+        bx_tx_messages = []
+        for btc_tx_message in btc_tx_messages:
+            tx_message = self.node1.message_converter.tx_to_bx_txs(btc_tx_message, self.node2.network_num)[0][0]
+            bx_tx_messages.append(TxMessage(tx_message.tx_hash(), tx_message.network_num(), "",
+                                            self._next_short_id, tx_message.tx_val()))
+            self._next_short_id += 1
+
+        start_time = time.perf_counter()
+        for bx_tx_message in bx_tx_messages:
+            helpers.receive_node_message(self.node2, self.relay_fileno, bx_tx_message.rawbytes())
+        sent_bytes = len(self.get_all_bytes_to_send(self.node2, self.blockchain_fileno))
+        bdn_to_node_s = time.perf_counter() - start_time
+
+        # transactions still held for batching are written when the batching window ends. Waiting for the window
+        # is idle time, so it is left out of the measurement.
+        time.sleep(getattr(
+            self.node2.opts, "blockchain_tx_batch_window_ms", gateway_constants.DEFAULT_BLOCKCHAIN_TX_BATCH_WINDOW_MS
+        ) / 1000)
+        start_time = time.perf_counter()
+        self.node2.alarm_queue.fire_alarms()
+        sent_bytes += len(self.get_all_bytes_to_send(self.node2, self.blockchain_fileno))
+        bdn_to_node_s += time.perf_counter() - start_time
+
+        self.assertEqual(sum(len(btc_tx_message.rawbytes()) for btc_tx_message in btc_tx_messages), sent_bytes)
+        return len(txns) / node_to_bdn_s, len(txns) / bdn_to_node_s
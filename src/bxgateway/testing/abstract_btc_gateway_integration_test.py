@@ -82,3 +82,16 @@ class AbstractBtcGatewayIntegrationTest(AbstractTestCase):
         helpers.clear_node_buffer(self.node2, self.blockchain_fileno)
         helpers.clear_node_buffer(self.node2, self.relay_fileno)
         helpers.clear_node_buffer(self.node2, self.gateway_fileno)
+
+    def get_all_bytes_to_send(self, node, fileno) -> memoryview:
+        """
+        Collects all bytes queued on a connection, draining every output buffer entry instead of reading only the
+        first one. Decompressed blocks are streamed to the blockchain node in several entries.
+        """
+        all_bytes = bytearray()
+        bytes_to_send = node.get_bytes_to_send(fileno)
+        while bytes_to_send:
+            all_bytes.extend(bytes_to_send)
+            node.on_bytes_sent(fileno, len(bytes_to_send))
+            bytes_to_send = node.get_bytes_to_send(fileno)
+        return memoryview(all_bytes)
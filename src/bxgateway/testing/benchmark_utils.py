@@ -0,0 +1,94 @@
+import gc
+import time
+import tracemalloc
+from typing import Callable, NamedTuple, List
+
+
+class BenchmarkResult(NamedTuple):
+    iterations: int
+    mean_ms: float
+    p50_ms: float
+    p99_ms: float
+
+
+def percentile(sorted_durations: List[float], percent: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list of durations.
+    """
+    if not sorted_durations:
+        return 0.0
+    rank = int(round(percent / 100.0 * (len(sorted_durations) - 1)))
+    return sorted_durations[rank]
+
+
+def summarize(durations_ms: List[float]) -> BenchmarkResult:
+    sorted_durations = sorted(durations_ms)
+    return BenchmarkResult(
+        len(sorted_durations),
+        sum(sorted_durations) / max(len(sorted_durations), 1),
+        percentile(sorted_durations, 50),
+        percentile(sorted_durations, 99)
+    )
+
+
+def run_benchmark(func: Callable[[], object], iterations: int, warmup_iterations: int = 1) -> BenchmarkResult:
+    """
+    Times repeated calls of a function.
+
+    :param func: function to benchmark, called without arguments
+    :param iterations: number of timed calls
+    :param warmup_iterations: number of untimed calls done beforehand
+    :return: summary of call durations
+    """
+    for _ in range(warmup_iterations):
+        func()
+
+    durations_ms = []
+    for _ in range(iterations):
+        start_time = time.perf_counter()
+        func()
+        durations_ms.append((time.perf_counter() - start_time) * 1000)
+    return summarize(durations_ms)
+
+
+class AllocationResult(NamedTuple):
+    peak_bytes: int
+    allocated_blocks: int
+
+
+def measure_allocations(func: Callable[[], object]) -> AllocationResult:
+    """
+    Traces memory allocations of a single function call.
+
+    :param func: function to measure, called without arguments
+    :return: peak memory allocated during the call and number of memory blocks held by the returned value
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        allocated_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    finally:
+        tracemalloc.stop()
+    del result
+    return AllocationResult(peak_bytes, allocated_blocks)
+
+
+def format_allocation_result(name: str, result: AllocationResult) -> str:
+    return "{}: peak {:.1f} KB, {} allocated blocks".format(name, result.peak_bytes / 1024, result.allocated_blocks)
+
+
+def format_result(name: str, result: BenchmarkResult) -> str:
+    return "{}: {} iterations, mean {:.3f} ms, p50 {:.3f} ms, p99 {:.3f} ms".format(
+        name, result.iterations, result.mean_ms, result.p50_ms, result.p99_ms
+    )
+
+
+def throughput_mb_per_second(num_bytes: int, result: BenchmarkResult) -> float:
+    """
+    Average throughput of a benchmark that processed `num_bytes` per iteration.
+    """
+    if not result.mean_ms:
+        return 0.0
+    return num_bytes / (1024 * 1024) / (result.mean_ms / 1000)
@@ -45,6 +45,9 @@ class MockGatewayNode(AbstractGatewayNode):
         self.block_cleanup_service = self._get_cleanup_service()
         self.block_queuing_service = BtcBlockQueuingService(self)
         self.message_converter = MockMessageConverter()
+        self.compact_block_short_id_matcher = None
+        self.txid_cache = None
+        self.keccak_cache = None
         if opts.use_extensions:
             from bxcommon.services.extension_transaction_service import ExtensionTransactionService
             self._tx_service = ExtensionTransactionService(self, self.network_num)
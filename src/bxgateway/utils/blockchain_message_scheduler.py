@@ -0,0 +1,135 @@
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Deque, Dict, NamedTuple, Optional
+
+from bxcommon.messages.abstract_message import AbstractMessage
+
+
+class BlockchainMessagePriority(IntEnum):
+    """
+    Classes of outbound messages to blockchain nodes, in order of priority.
+    """
+    BLOCK = 0
+    BLOCK_ANNOUNCE = 1
+    TRANSACTION = 2
+
+
+class ScheduledMessage(NamedTuple):
+    priority: BlockchainMessagePriority
+    message: AbstractMessage
+    size: int
+    queued_time: float
+
+
+class BlockchainMessageSchedulerStats(NamedTuple):
+    queued_messages: Dict[BlockchainMessagePriority, int]
+    queued_bytes: Dict[BlockchainMessagePriority, int]
+    expired_messages: Dict[BlockchainMessagePriority, int]
+    expired_bytes: Dict[BlockchainMessagePriority, int]
+
+
+class BlockchainMessageScheduler:
+    """
+    Outbound message scheduler with a separate queue per message priority.
+
+    Queues are served with deficit round robin: every round each non-empty queue, highest priority first,
+    is credited with its quantum of bytes and may release messages while it has credit left. Giving blocks
+    a much larger quantum than transactions bounds how many transaction bytes can be written ahead of a block,
+    while transactions still get a share of every round and are never starved.
+
+    Messages that stayed queued longer than the time to live of their priority are dropped.
+    """
+    _queues: Dict[BlockchainMessagePriority, Deque[ScheduledMessage]]
+    _quantums: Dict[BlockchainMessagePriority, int]
+    _time_to_live: Dict[BlockchainMessagePriority, float]
+    _deficits: Dict[BlockchainMessagePriority, int]
+    _expired_messages: Dict[BlockchainMessagePriority, int]
+    _expired_bytes: Dict[BlockchainMessagePriority, int]
+
+    def __init__(
+            self,
+            quantums: Dict[BlockchainMessagePriority, int],
+            time_to_live: Dict[BlockchainMessagePriority, float]
+    ):
+        """
+        :param quantums: number of bytes each priority is credited with per round
+        :param time_to_live: maximum time in seconds a message of each priority may stay queued
+        """
+        self._priorities = sorted(BlockchainMessagePriority)
+        self._queues = {priority: deque() for priority in self._priorities}
+        self._quantums = quantums
+        self._time_to_live = time_to_live
+        self._deficits = {priority: 0 for priority in self._priorities}
+        self._expired_messages = {priority: 0 for priority in self._priorities}
+        self._expired_bytes = {priority: 0 for priority in self._priorities}
+        self._queued_bytes = {priority: 0 for priority in self._priorities}
+        self._current_index = 0
+        self._is_credited = False
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def queued_bytes(self, priority: Optional[BlockchainMessagePriority] = None) -> int:
+        if priority is None:
+            return sum(self._queued_bytes.values())
+        return self._queued_bytes[priority]
+
+    def push(self, priority: BlockchainMessagePriority, message: AbstractMessage, size: int) -> None:
+        self._queues[priority].append(ScheduledMessage(priority, message, size, time.time()))
+        self._queued_bytes[priority] += size
+
+    def pop(self) -> Optional[ScheduledMessage]:
+        """
+        Returns the next message to be sent with its priority and size, or None if there are no messages waiting.
+        """
+        self._remove_expired(time.time())
+        if not any(self._queues.values()):
+            return None
+
+        while True:
+            priority = self._priorities[self._current_index]
+            queue = self._queues[priority]
+            if queue:
+                if not self._is_credited:
+                    self._deficits[priority] += self._quantums[priority]
+                    self._is_credited = True
+
+                scheduled_message = queue[0]
+                if self._deficits[priority] >= scheduled_message.size:
+                    queue.popleft()
+                    self._deficits[priority] -= scheduled_message.size
+                    self._queued_bytes[priority] -= scheduled_message.size
+                    if not queue:
+                        self._deficits[priority] = 0
+                    return scheduled_message
+            else:
+                self._deficits[priority] = 0
+
+            self._current_index = (self._current_index + 1) % len(self._priorities)
+            self._is_credited = False
+
+    def clear(self) -> None:
+        for priority in self._priorities:
+            self._queues[priority].clear()
+            self._deficits[priority] = 0
+            self._queued_bytes[priority] = 0
+
+    def get_stats(self) -> BlockchainMessageSchedulerStats:
+        return BlockchainMessageSchedulerStats(
+            {priority: len(queue) for priority, queue in self._queues.items()},
+            dict(self._queued_bytes),
+            dict(self._expired_messages),
+            dict(self._expired_bytes)
+        )
+
+    def _remove_expired(self, current_time: float) -> None:
+        for priority in self._priorities:
+            queue = self._queues[priority]
+            time_to_live = self._time_to_live[priority]
+            # messages are queued in order, so only the head of each queue needs to be checked
+            while queue and current_time - queue[0].queued_time > time_to_live:
+                scheduled_message = queue.popleft()
+                self._queued_bytes[priority] -= scheduled_message.size
+                self._expired_messages[priority] += 1
+                self._expired_bytes[priority] += scheduled_message.size
@@ -0,0 +1,93 @@
+import hashlib
+from collections import deque
+from typing import Deque, Optional, Tuple, Union
+
+from bxcommon import constants
+from bxcommon.messages.bloxroute.abstract_bloxroute_message import AbstractBloxrouteMessage
+from bxcommon.messages.bloxroute.bloxroute_message_type import BloxrouteMessageType
+from bxcommon.messages.bloxroute.broadcast_message import BroadcastMessage
+
+HEADER_LENGTH = AbstractBloxrouteMessage.HEADER_LENGTH
+# broadcast message blob starts after the fixed fields and is followed by the control flags
+BROADCAST_BLOB_OFFSET = HEADER_LENGTH + BroadcastMessage.PAYLOAD_LENGTH - constants.CONTROL_FLAGS_LEN
+
+
+class BroadcastBlobHasher(object):
+    """
+    Follows bloXroute messages read off a relay connection and hashes blobs of broadcast messages while their bytes
+    arrive, so the double SHA256 of an encrypted block is known as soon as the last byte of the message is read.
+
+    Received bytes must be fed in order, starting at a message boundary. Digests of complete broadcast messages are
+    queued in the order their messages were read and popped by message handlers, which run in the same order.
+    """
+
+    def __init__(self):
+        self._header = bytearray()
+        self._message_len = 0
+        self._message_offset = 0
+        self._blob_end = 0
+        self._sha256 = None
+        self._digests: Deque[Tuple[int, bytes]] = deque()
+
+    def feed(self, data: Union[bytearray, memoryview]):
+        """
+        :param data: bytes read off the connection
+        """
+        data = memoryview(data)
+        data_len = len(data)
+        off = 0
+        while off < data_len:
+            if self._message_len == 0:
+                header_bytes = min(HEADER_LENGTH - len(self._header), data_len - off)
+                self._header += data[off:off + header_bytes]
+                off += header_bytes
+                if len(self._header) < HEADER_LENGTH:
+                    return
+                self._start_message()
+
+            message_bytes = min(data_len - off, self._message_len - self._message_offset)
+            if self._sha256 is not None:
+                blob_start = max(self._message_offset, BROADCAST_BLOB_OFFSET) - self._message_offset
+                blob_end = min(self._message_offset + message_bytes, self._blob_end) - self._message_offset
+                if blob_start < blob_end:
+                    self._sha256.update(data[off + blob_start:off + blob_end])
+            off += message_bytes
+            self._message_offset += message_bytes
+
+            if self._message_offset == self._message_len:
+                self._end_message()
+
+    def pop_digest(self, blob_len: int) -> Optional[bytes]:
+        """
+        Gets double SHA256 of the blob of the oldest broadcast message read.
+
+        :param blob_len: length of the blob of the handled message
+        :return: binary hash, None if the message was not hashed
+        """
+        if not self._digests:
+            return None
+
+        hashed_len, digest = self._digests.popleft()
+        if hashed_len != blob_len:
+            self._digests.clear()
+            return None
+        return digest
+
+    def _start_message(self):
+        msg_type, payload_len = AbstractBloxrouteMessage.unpack(self._header)
+        self._header = bytearray()
+        self._message_len = HEADER_LENGTH + payload_len
+        self._message_offset = HEADER_LENGTH
+        self._blob_end = self._message_len - constants.CONTROL_FLAGS_LEN
+        if msg_type == BloxrouteMessageType.BROADCAST and self._blob_end >= BROADCAST_BLOB_OFFSET:
+            self._sha256 = hashlib.sha256()
+        else:
+            self._sha256 = None
+
+    def _end_message(self):
+        if self._sha256 is not None:
+            self._digests.append(
+                (self._blob_end - BROADCAST_BLOB_OFFSET, hashlib.sha256(self._sha256.digest()).digest())
+            )
+            self._sha256 = None
+        self._message_len = 0
@@ -0,0 +1,200 @@
+from collections import deque
+from typing import Collection, Deque, Dict, List, Optional, Tuple, Union
+
+from csiphash import siphash24
+
+from bxcommon.services.transaction_service import TransactionService
+from bxcommon.utils.object_hash import Sha256Hash
+from bxutils import logging
+
+from bxgateway import btc_constants, gateway_constants
+
+logger = logging.get_logger(__name__)
+
+SHORT_ID_LEN = 6
+
+
+class CompactBlockShortIdMatcher(object):
+    """
+    Matches BIP-152 short ids of compact blocks against a window of recently seen, unconfirmed transactions.
+
+    Transaction hashes are kept byte reversed in one contiguous buffer, in the order they were seen. Matching hashes
+    the window in batches starting from the newest transactions, which are the most likely to be included
+    in the next block, and stops as soon as every short id is found, instead of hashing the whole transaction service.
+
+    Transactions are added when they are received from the blockchain node or the BDN and removed when their block
+    is cleaned up. The window is bounded: the oldest transactions are dropped once it is full. Transactions that reach
+    the transaction service in bulk (transaction service sync, snapshot) are added with
+    `sync_from_transaction_service`, once per bulk update, never per block.
+    """
+
+    def __init__(
+            self,
+            max_window_size: int = gateway_constants.COMPACT_BLOCK_MATCHER_MAX_WINDOW_SIZE,
+            batch_size: int = gateway_constants.COMPACT_BLOCK_MATCHER_BATCH_SIZE
+    ):
+        """
+        :param max_window_size: maximum number of transactions kept in the window
+        :param batch_size: number of transaction hashes short ids are computed for at once
+        """
+        if max_window_size < 1 or batch_size < 1:
+            raise ValueError("max_window_size and batch_size must be positive")
+
+        self.max_window_size = max_window_size
+        self.batch_size = batch_size
+
+        self._reversed_hashes = bytearray()
+        # removed transactions are set to None, and dropped from the buffer when it is compacted
+        self._tx_hashes: List[Optional[Sha256Hash]] = []
+        self._tx_hash_indices: Dict[Sha256Hash, int] = {}
+        self._start_index = 0
+
+    def __len__(self) -> int:
+        return len(self._tx_hash_indices)
+
+    def __contains__(self, tx_hash: Sha256Hash) -> bool:
+        return tx_hash in self._tx_hash_indices
+
+    def add_transaction(self, tx_hash: Sha256Hash) -> None:
+        if tx_hash in self._tx_hash_indices:
+            return
+
+        self._tx_hash_indices[tx_hash] = len(self._tx_hashes)
+        self._tx_hashes.append(tx_hash)
+        self._reversed_hashes += tx_hash.binary[::-1]
+
+        if len(self._tx_hash_indices) > self.max_window_size:
+            self._remove_oldest_transaction()
+
+    def remove_transaction(self, tx_hash: Sha256Hash) -> None:
+        index = self._tx_hash_indices.pop(tx_hash, None)
+        if index is not None:
+            self._tx_hashes[index] = None
+            self._compact_if_sparse()
+
+    def clear(self) -> None:
+        self._reversed_hashes = bytearray()
+        self._tx_hashes = []
+        self._tx_hash_indices = {}
+        self._start_index = 0
+
+    def match(
+            self,
+            key: bytes,
+            short_ids: Collection[bytes],
+            transaction_service: TransactionService
+    ) -> Dict[bytes, Tuple[Sha256Hash, Union[bytearray, memoryview]]]:
+        """
+        Finds hashes and contents of transactions with the given short ids.
+
+        :param key: siphash key of the compact block
+        :param short_ids: short ids of the compact block
+        :param transaction_service: transaction service holding transaction contents
+        :return: transaction hash and contents by short id, for found transactions only
+        """
+        remaining_short_ids = set(short_ids)
+        short_id_to_tx = {}
+        stale_tx_hashes = []
+        hash_len = btc_constants.BTC_SHA_HASH_LEN
+
+        with memoryview(self._reversed_hashes) as reversed_hashes:
+            end_index = len(self._tx_hashes)
+            while remaining_short_ids and end_index > self._start_index:
+                start_index = max(self._start_index, end_index - self.batch_size)
+                batch_short_ids = {
+                    siphash24(key, bytes(reversed_hashes[index * hash_len:(index + 1) * hash_len]))[0:SHORT_ID_LEN]:
+                        index
+                    for index in range(start_index, end_index)
+                }
+
+                for short_id in remaining_short_ids.intersection(batch_short_ids):
+                    tx_hash = self._tx_hashes[batch_short_ids[short_id]]
+                    if tx_hash is None:
+                        continue
+                    tx_contents = transaction_service.get_transaction_by_hash(tx_hash)
+                    if tx_contents is None:
+                        logger.debug("Hash {} is in compact block matcher window but content is missing.", tx_hash)
+                        stale_tx_hashes.append(tx_hash)
+                    else:
+                        short_id_to_tx[short_id] = (tx_hash, tx_contents)
+                        remaining_short_ids.discard(short_id)
+
+                end_index = start_index
+
+        for tx_hash in stale_tx_hashes:
+            self.remove_transaction(tx_hash)
+
+        return short_id_to_tx
+
+    def sync_from_transaction_service(self, transaction_service: TransactionService) -> None:
+        """
+        Fills free window space with transactions of the transaction service the window does not hold yet.
+
+        Iterates the whole transaction service, so it is meant to be called after bulk updates only. Added
+        transactions are treated as older than every transaction already in the window, so newly seen transactions
+        are still matched first and synced transactions are the first to be dropped.
+
+        :param transaction_service: transaction service to read transaction hashes from
+        """
+        free_window_size = self.max_window_size - len(self._tx_hash_indices)
+        if free_window_size <= 0:
+            return
+
+        # transaction service iterates transactions in the order they were added, so the newest ones are kept
+        synced_tx_hashes: Deque[Sha256Hash] = deque(maxlen=free_window_size)
+        for tx_hash in transaction_service.iter_transaction_hashes():
+            if tx_hash not in self._tx_hash_indices:
+                synced_tx_hashes.append(tx_hash)
+        if not synced_tx_hashes:
+            return
+
+        logger.debug("Adding {} transactions from transaction service to compact block matcher window of {}.",
+                     len(synced_tx_hashes), len(self._tx_hash_indices))
+        hash_len = btc_constants.BTC_SHA_HASH_LEN
+        reversed_hashes = bytearray()
+        tx_hashes = []
+        for tx_hash in synced_tx_hashes:
+            reversed_hashes += tx_hash.binary[::-1]
+            tx_hashes.append(tx_hash)
+        with memoryview(self._reversed_hashes) as old_reversed_hashes:
+            for index in range(self._start_index, len(self._tx_hashes)):
+                tx_hash = self._tx_hashes[index]
+                if tx_hash is not None:
+                    reversed_hashes += old_reversed_hashes[index * hash_len:(index + 1) * hash_len]
+                    tx_hashes.append(tx_hash)
+
+        self._reversed_hashes = reversed_hashes
+        self._tx_hashes = tx_hashes
+        self._tx_hash_indices = {tx_hash: index for index, tx_hash in enumerate(tx_hashes)}
+        self._start_index = 0
+
+    def _remove_oldest_transaction(self) -> None:
+        while self._tx_hashes[self._start_index] is None:
+            self._start_index += 1
+
+        del self._tx_hash_indices[self._tx_hashes[self._start_index]]
+        self._tx_hashes[self._start_index] = None
+        self._start_index += 1
+        self._compact_if_sparse()
+
+    def _compact_if_sparse(self) -> None:
+        removed_count = len(self._tx_hashes) - len(self._tx_hash_indices)
+        if removed_count <= max(len(self._tx_hash_indices), self.batch_size):
+            return
+
+        hash_len = btc_constants.BTC_SHA_HASH_LEN
+        reversed_hashes = bytearray(len(self._tx_hash_indices) * hash_len)
+        tx_hashes = []
+        with memoryview(self._reversed_hashes) as old_reversed_hashes:
+            for index in range(self._start_index, len(self._tx_hashes)):
+                tx_hash = self._tx_hashes[index]
+                if tx_hash is not None:
+                    new_index = len(tx_hashes)
+                    reversed_hashes[new_index * hash_len:(new_index + 1) * hash_len] = \
+                        old_reversed_hashes[index * hash_len:(index + 1) * hash_len]
+                    self._tx_hash_indices[tx_hash] = new_index
+                    tx_hashes.append(tx_hash)
+
+        self._reversed_hashes = reversed_hashes
+        self._tx_hashes = tx_hashes
+        self._start_index = 0
@@ -0,0 +1,93 @@
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Union
+
+from bxgateway import gateway_constants
+from bxgateway.messages.btc import btc_messages_util
+from bxgateway.utils.btc.btc_object_hash import BtcObjectHash
+
+
+class TxIdCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evicted: int
+    tx_count: int
+    size_bytes: int
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0
+
+
+class TxIdCache(object):
+    """
+    Bitcoin txids by transaction contents.
+
+    A transaction's txid is needed when it is received from the blockchain node or the BDN, again when its block is
+    compressed and once more when the block is cleaned up. Computing it means stripping witness data and
+    double SHA256 hashing, so txids are cached from the first time they are computed until the block with the
+    transaction is cleaned up. The cache is bounded by the total size of cached transactions, the oldest
+    transactions are evicted first.
+    """
+
+    def __init__(self, max_size_bytes: int = gateway_constants.TXID_CACHE_MAX_SIZE_BYTES):
+        self.max_size_bytes = max_size_bytes
+        self._txids: OrderedDict = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._txids)
+
+    def get(self, tx: Union[bytes, bytearray, memoryview]) -> Optional[BtcObjectHash]:
+        txid = self._txids.get(bytes(tx))
+        if txid is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return txid
+
+    def add(self, tx: Union[bytes, bytearray, memoryview], txid: BtcObjectHash) -> None:
+        key = bytes(tx)
+        if key in self._txids:
+            return
+
+        self._txids[key] = txid
+        self._size_bytes += len(key)
+        while self._size_bytes > self.max_size_bytes:
+            evicted_key, _ = self._txids.popitem(last=False)
+            self._size_bytes -= len(evicted_key)
+            self._evicted += 1
+
+    def get_txid(self, tx: Union[bytes, bytearray, memoryview], segwit: Optional[bool] = None) -> BtcObjectHash:
+        """
+        Returns the cached txid of a transaction, computing and caching it if it is not cached.
+        Segwit flag of the transaction is read from the transaction if it is not provided.
+        """
+        txid = self.get(tx)
+        if txid is None:
+            txid = btc_messages_util.get_txid(tx, segwit)
+            self.add(tx, txid)
+        return txid
+
+    def pop_txid(self, tx: Union[bytes, bytearray, memoryview], segwit: Optional[bool] = None) -> BtcObjectHash:
+        """
+        Returns the txid of a transaction that is no longer expected to be seen, removing it from the cache.
+        """
+        key = bytes(tx)
+        txid = self._txids.pop(key, None)
+        if txid is None:
+            self._misses += 1
+            return btc_messages_util.get_txid(tx, segwit)
+
+        self._hits += 1
+        self._size_bytes -= len(key)
+        return txid
+
+    def clear(self) -> None:
+        self._txids.clear()
+        self._size_bytes = 0
+
+    def get_stats(self) -> TxIdCacheStats:
+        return TxIdCacheStats(self._hits, self._misses, self._evicted, len(self._txids), self._size_bytes)
@@ -0,0 +1,141 @@
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, NamedTuple, Optional, Tuple, Union
+
+from bxcommon.utils import crypto
+from bxcommon.utils.alarm_queue import AlarmQueue
+from bxutils import logging
+
+from bxgateway import gateway_constants
+
+logger = logging.get_logger(__name__)
+
+
+class EncryptedBlockResult(NamedTuple):
+    hash_matches: bool
+    block: Optional[bytes]
+    decrypt_start_time: float
+    decrypt_end_time: float
+
+
+EncryptedBlockCallback = Callable[[EncryptedBlockResult], None]
+
+
+def process_encrypted_block(
+        cipherblob: Union[bytearray, memoryview], expected_hash: Optional[bytes], key: Optional[bytes]
+) -> EncryptedBlockResult:
+    """
+    Verifies hash of an encrypted block and decrypts it. Runs on a worker thread, so must not touch node state.
+
+    :param cipherblob: encrypted block
+    :param expected_hash: binary double SHA256 the encrypted block is announced with, None to skip verification
+    :param key: encryption key, None to only verify the hash
+    :return: result of verification and decryption, block is None if it was not decrypted
+    """
+    cipherblob = bytes(cipherblob)
+    if expected_hash is not None and crypto.double_sha256(cipherblob) != expected_hash:
+        return EncryptedBlockResult(False, None, 0, 0)
+    if key is None:
+        return EncryptedBlockResult(True, None, 0, 0)
+
+    decrypt_start_time = time.time()
+    try:
+        block = crypto.symmetric_decrypt(key, cipherblob)
+    except Exception as e:
+        logger.debug("Failed to decrypt block: {}", e)
+        block = None
+    return EncryptedBlockResult(True, block, decrypt_start_time, time.time())
+
+
+class EncryptedBlockWorkerPool(object):
+    """
+    Verifies and decrypts encrypted blocks on worker threads, off the event loop.
+
+    Hashing and decryption release the GIL on block sized buffers, so threads run alongside the event loop without
+    copying blocks to other processes. Results are handed back to the event loop by an alarm polling the submitted
+    blocks, and callbacks are run in submission order: a block finishing before an earlier one waits for it, so blocks
+    reach the block queuing service in the same order as without workers.
+    """
+
+    def __init__(
+            self,
+            alarm_queue: AlarmQueue,
+            worker_count: int,
+            poll_interval_s: float = gateway_constants.ENCRYPTED_BLOCK_WORKERS_POLL_INTERVAL_S
+    ):
+        if worker_count < 1:
+            raise ValueError("worker_count must be positive")
+
+        self.worker_count = worker_count
+        self.poll_interval_s = poll_interval_s
+        self._alarm_queue = alarm_queue
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Deque[Tuple[Future, EncryptedBlockCallback]] = deque()
+        self._poll_alarm_scheduled = False
+
+    def __len__(self) -> int:
+        """
+        :return: number of blocks submitted and not yet handed back to the event loop
+        """
+        return len(self._pending)
+
+    def submit(
+            self,
+            cipherblob: Union[bytearray, memoryview],
+            expected_hash: Optional[bytes],
+            key: Optional[bytes],
+            callback: EncryptedBlockCallback
+    ):
+        """
+        Queues an encrypted block for verification and decryption.
+
+        :param cipherblob: encrypted block
+        :param expected_hash: binary double SHA256 the encrypted block is announced with, None to skip verification
+        :param key: encryption key, None to only verify the hash
+        :param callback: function called on the event loop with the result
+        """
+        future = self._get_executor().submit(process_encrypted_block, cipherblob, expected_hash, key)
+        self._pending.append((future, callback))
+        if not self._poll_alarm_scheduled:
+            self._poll_alarm_scheduled = True
+            self._alarm_queue.register_alarm(self.poll_interval_s, self._run_completed_callbacks)
+
+    def close(self):
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _run_completed_callbacks(self) -> float:
+        pending = self._pending
+        while pending and pending[0][0].done():
+            future, callback = pending.popleft()
+            try:
+                callback(future.result())
+            except Exception as e:
+                logger.error("Failed to process encrypted block: {}", e)
+
+        if pending:
+            return self.poll_interval_s
+
+        self._poll_alarm_scheduled = False
+        return 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            logger.debug("Starting {} block decryption worker threads.", self.worker_count)
+            self._executor = ThreadPoolExecutor(max_workers=self.worker_count)
+        return self._executor
+
+
+def create_encrypted_block_worker_pool(opts, alarm_queue: AlarmQueue) -> Optional[EncryptedBlockWorkerPool]:
+    """
+    Creates worker pool if blocks are set to be decrypted off the event loop.
+    """
+    block_decryption_workers = getattr(
+        opts, "block_decryption_workers", gateway_constants.DEFAULT_BLOCK_DECRYPTION_WORKERS
+    )
+    if block_decryption_workers < 1:
+        return None
+    return EncryptedBlockWorkerPool(alarm_queue, block_decryption_workers)
@@ -0,0 +1,129 @@
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from bxcommon.utils.object_hash import Sha256Hash
+
+from bxgateway import eth_constants
+
+
+class ChainStateEntry(NamedTuple):
+    total_difficulty: int
+    parent_hash: Optional[Sha256Hash]
+    block_number: Optional[int]
+
+
+class ChainState(object):
+    """
+    Total difficulties of recent Ethereum blocks, by block hash.
+
+    Total difficulty of a block is the total difficulty of its parent plus the block difficulty, so it is resolved
+    with a single lookup of the parent hash. Blocks of all branches are kept, so total difficulty is also known for
+    blocks on short forks.
+
+    Blocks are kept in the order they were added. Blocks more than `max_depth` below the highest known block number
+    are dropped, as well as the oldest blocks once there are more than `max_block_count` of them. Blocks added without
+    a block number, such as the chain head from the Status message, are numbered once a numbered child is added.
+    """
+
+    def __init__(
+            self,
+            max_depth: int = eth_constants.CHAIN_STATE_MAX_DEPTH,
+            max_block_count: int = eth_constants.CHAIN_STATE_MAX_BLOCK_COUNT
+    ):
+        self.max_depth = max_depth
+        self.max_block_count = max_block_count
+        self._blocks: OrderedDict = OrderedDict()
+        self._best_block_number: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def __contains__(self, block_hash: Sha256Hash) -> bool:
+        return block_hash in self._blocks
+
+    def get_entry(self, block_hash: Sha256Hash) -> Optional[ChainStateEntry]:
+        return self._blocks.get(block_hash)
+
+    def get_total_difficulty(self, block_hash: Sha256Hash) -> Optional[int]:
+        entry = self._blocks.get(block_hash)
+        return None if entry is None else entry.total_difficulty
+
+    def add_block(
+            self,
+            block_hash: Sha256Hash,
+            total_difficulty: int,
+            parent_hash: Optional[Sha256Hash] = None,
+            block_number: Optional[int] = None
+    ) -> None:
+        """
+        Records total difficulty of a block, e.g. reported by the blockchain node.
+
+        :param block_hash: block hash
+        :param total_difficulty: total difficulty of the chain ending with the block
+        :param parent_hash: hash of the parent block, if known
+        :param block_number: block number, if known
+        """
+        self._blocks[block_hash] = ChainStateEntry(total_difficulty, parent_hash, block_number)
+
+        # chain head reported in the Status message has no block number, so it is numbered by its first child
+        if block_number is not None and parent_hash is not None:
+            parent_entry = self._blocks.get(parent_hash)
+            if parent_entry is not None and parent_entry.block_number is None:
+                self._blocks[parent_hash] = parent_entry._replace(block_number=block_number - 1)
+
+        if block_number is not None and (self._best_block_number is None or block_number > self._best_block_number):
+            self._best_block_number = block_number
+
+        self._prune()
+
+    def try_add_child_block(
+            self,
+            block_hash: Sha256Hash,
+            parent_hash: Sha256Hash,
+            difficulty: int,
+            block_number: Optional[int] = None
+    ) -> Optional[int]:
+        """
+        Calculates and records total difficulty of a block if total difficulty of its parent is known.
+
+        :param block_hash: block hash
+        :param parent_hash: hash of the parent block
+        :param difficulty: difficulty of the block
+        :param block_number: block number, if known
+        :return: total difficulty of the block or None if total difficulty of the parent is unknown
+        """
+        parent_entry = self._blocks.get(parent_hash)
+        if parent_entry is None:
+            return None
+
+        if block_number is None and parent_entry.block_number is not None:
+            block_number = parent_entry.block_number + 1
+
+        total_difficulty = parent_entry.total_difficulty + difficulty
+        self.add_block(block_hash, total_difficulty, parent_hash, block_number)
+        return total_difficulty
+
+    def clear(self) -> None:
+        self._blocks.clear()
+        self._best_block_number = None
+
+    def _prune(self) -> None:
+        while len(self._blocks) > self.max_block_count:
+            self._blocks.popitem(last=False)
+
+        if self._best_block_number is None:
+            return
+
+        # blocks are mostly added in order of block numbers, so old blocks are at the front. Blocks without block
+        # numbers are skipped, they are only dropped once there are more than `max_block_count` blocks.
+        min_block_number = self._best_block_number - self.max_depth
+        stale_block_hashes = []
+        for block_hash, entry in self._blocks.items():
+            if entry.block_number is None:
+                continue
+            if entry.block_number >= min_block_number:
+                break
+            stale_block_hashes.append(block_hash)
+
+        for block_hash in stale_block_hashes:
+            del self._blocks[block_hash]
@@ -176,6 +176,21 @@ class Frame(object):
         assert isinstance(self._payload, memoryview)
         return crypto_utils.right_0_pad_16(encoded_msg_type + self._payload.tobytes())
 
+    def write_body(self, buf):
+        """
+        Writes frame body into a buffer without building intermediate copies of the payload.
+        The buffer must be at least `get_body_size(padded=True)` long; padding bytes are not written.
+        :param buf: writable buffer (bytearray or memoryview)
+        :return: number of bytes written
+        """
+
+        encoded_msg_type = self.get_encoded_msg_type()
+        msg_type_len = len(encoded_msg_type)
+        body_len = msg_type_len + len(self._payload)
+        buf[:msg_type_len] = encoded_msg_type
+        buf[msg_type_len:body_len] = self._payload
+        return body_len
+
     def get_msg_type(self):
         """
         Returns message type
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from bxcommon.exceptions import ParseError
 from bxcommon.utils.buffers.input_buffer import InputBuffer
 from bxgateway import eth_constants
@@ -8,6 +10,10 @@ from bxgateway.utils.eth.rlpx_cipher import RLPxCipher
 class FramedInputBuffer(object):
     """
     Input buffer for Ethereum framed messages
+
+    All complete frames of the current message available in the input buffer are decrypted in a single call.
+    Frame bodies are decrypted directly into one payload buffer (preallocated from the total payload size of chunked
+    frames), and the message is handed back as a memoryview of that buffer without further copies.
     """
 
     def __init__(self, rlpx_cipher):
@@ -17,7 +23,10 @@ class FramedInputBuffer(object):
                             .format(type(rlpx_cipher)))
 
         self._rlpx_cipher = rlpx_cipher
-        self._payload_buffer = InputBuffer()
+
+        self._payload_buffer: Optional[memoryview] = None
+        self._payload_start = 0
+        self._payload_end = 0
 
         self._receiving_frame = False
         self._chunked_frames_in_progress = False
@@ -36,7 +45,7 @@ class FramedInputBuffer(object):
 
     def peek_message(self, input_buffer):
         """
-        Peeks message from input frame
+        Peeks message from input frame, decrypting all complete frames of the message available in the input buffer
         :param input_buffer: input buffer
         :return: tuple (flag if full message is received, message type)
         """
@@ -47,65 +56,33 @@ class FramedInputBuffer(object):
         if self._full_message_received:
             raise ValueError("Get full message before trying to peek another one")
 
-        if not self._receiving_frame and input_buffer.length >= eth_constants.FRAME_HDR_TOTAL_LEN:
-            enc_header_bytes = input_buffer.remove_bytes(eth_constants.FRAME_HDR_TOTAL_LEN)
-            header_bytes = self._rlpx_cipher.decrypt_frame_header(enc_header_bytes)
-            body_size, protocol_id, sequence_id, total_payload_len = frame_utils.parse_frame_header(header_bytes)
-
-            self._current_frame_body_size = body_size
-            self._current_frame_protocol_id = protocol_id
-            self._current_frame_size = frame_utils.get_full_frame_size(body_size)
-            self._current_frame_enc_body_size = self._current_frame_size - eth_constants.FRAME_HDR_TOTAL_LEN
-            self._current_frame_sequence_id = sequence_id
-
-            if sequence_id == 0 and total_payload_len is not None:
-                self._chunked_frames_in_progress = True
-                self._chunked_frames_total_body_size = total_payload_len
-
-            self._receiving_frame = True
-
-        if self._receiving_frame and input_buffer.length >= self._current_frame_enc_body_size:
-            frame_enc_body_bytes = input_buffer.remove_bytes(self._current_frame_enc_body_size)
-
-            body = self._rlpx_cipher.decrypt_frame_body(frame_enc_body_bytes, self._current_frame_body_size)
-
-            msg_type_is_expected = not self._chunked_frames_in_progress or self._current_frame_sequence_id == 0
-            payload, msg_type = frame_utils.parse_frame_body(body, msg_type_is_expected)
-
-            if msg_type_is_expected:
-                self._current_msg_type = msg_type
+        while not self._full_message_received:
+            if not self._receiving_frame:
+                if input_buffer.length < eth_constants.FRAME_HDR_TOTAL_LEN:
+                    break
+                self._read_frame_header(input_buffer)
 
-            self._payload_buffer.add_bytes(bytearray(rlp_utils.str_to_bytes(payload)))
-
-            if not self._chunked_frames_in_progress:
-                self._full_message_received = True
-            else:
-                self._chunked_frames_body_size_received += len(body)
-
-                if self._chunked_frames_body_size_received > self._chunked_frames_total_body_size:
-                    raise ParseError("Expected total body length for frame message is {0} but received {1}"
-                                     .format(self._chunked_frames_total_body_size,
-                                             self._chunked_frames_body_size_received))
-
-                if self._chunked_frames_body_size_received == self._chunked_frames_total_body_size:
-                    self._full_message_received = True
-
-            self._receiving_frame = False
+            if input_buffer.length < self._current_frame_enc_body_size:
+                break
+            self._read_frame_body(input_buffer)
 
         return self._full_message_received, self._current_msg_type
 
     def get_full_message(self):
         """
         Returns full message from input buffer
-        :return: full message
+        :return: tuple (memoryview of message payload, message type)
         """
 
         assert self._full_message_received
 
-        message_length = self._payload_buffer.length
-        message = self._payload_buffer.remove_bytes(message_length)
+        message = self._payload_buffer[self._payload_start:self._payload_end]
         msg_type = self._current_msg_type
 
+        self._payload_buffer = None
+        self._payload_start = 0
+        self._payload_end = 0
+
         self._full_message_received = False
 
         self._receiving_frame = False
@@ -121,3 +98,61 @@ class FramedInputBuffer(object):
         self._current_frame_sequence_id = None
 
         return message, msg_type
+
+    def _read_frame_header(self, input_buffer):
+        enc_header_bytes = input_buffer.remove_bytes(eth_constants.FRAME_HDR_TOTAL_LEN)
+        header_bytes = self._rlpx_cipher.decrypt_frame_header(enc_header_bytes)
+        body_size, protocol_id, sequence_id, total_payload_len = frame_utils.parse_frame_header(header_bytes)
+
+        self._current_frame_body_size = body_size
+        self._current_frame_protocol_id = protocol_id
+        self._current_frame_size = frame_utils.get_full_frame_size(body_size)
+        self._current_frame_enc_body_size = self._current_frame_size - eth_constants.FRAME_HDR_TOTAL_LEN
+        self._current_frame_sequence_id = sequence_id
+
+        if sequence_id == 0 and total_payload_len is not None:
+            if total_payload_len > eth_constants.MAX_CHUNKED_FRAMES_PAYLOAD_SIZE:
+                raise ParseError("Total body length for frame message {0} exceeds the limit of {1}"
+                                 .format(total_payload_len, eth_constants.MAX_CHUNKED_FRAMES_PAYLOAD_SIZE))
+
+            self._chunked_frames_in_progress = True
+            self._chunked_frames_total_body_size = total_payload_len
+            # frame bodies are decrypted back to back, the last one may spill its padding past the payload
+            self._payload_buffer = memoryview(bytearray(total_payload_len + eth_constants.MSG_PADDING))
+
+        self._receiving_frame = True
+
+    def _read_frame_body(self, input_buffer):
+        frame_enc_body_bytes = input_buffer.remove_bytes(self._current_frame_enc_body_size)
+        body_size = self._current_frame_body_size
+        msg_type_is_expected = not self._chunked_frames_in_progress or self._current_frame_sequence_id == 0
+
+        if self._chunked_frames_in_progress:
+            body_start = self._chunked_frames_body_size_received
+            body_end = body_start + body_size
+
+            if body_end > self._chunked_frames_total_body_size:
+                raise ParseError("Expected total body length for frame message is {0} but received {1}"
+                                 .format(self._chunked_frames_total_body_size, body_end))
+
+            self._rlpx_cipher.decrypt_frame_body(
+                frame_enc_body_bytes, body_size, self._payload_buffer[body_start:]
+            )
+            self._chunked_frames_body_size_received = body_end
+            self._payload_end = body_end
+
+            if body_end == self._chunked_frames_total_body_size:
+                self._full_message_received = True
+        else:
+            self._payload_buffer = memoryview(
+                self._rlpx_cipher.decrypt_frame_body(frame_enc_body_bytes, body_size)
+            )
+            self._payload_start = 0
+            self._payload_end = body_size
+            self._full_message_received = True
+
+        if msg_type_is_expected:
+            self._current_msg_type, msg_type_len = rlp_utils.decode_int(self._payload_buffer, self._payload_start)
+            self._payload_start += msg_type_len
+
+        self._receiving_frame = False
@@ -0,0 +1,98 @@
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Union
+
+from bxgateway import gateway_constants
+from bxgateway.utils.eth import crypto_utils
+
+
+class KeccakCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evicted: int
+    entry_count: int
+    size_bytes: int
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0
+
+
+class KeccakCache(object):
+    """
+    Least recently used cache of Keccak hashes of Ethereum transactions, by content.
+
+    The same transaction is hashed when it is received and again when its block is compressed. Copying transaction
+    bytes into a dict key and looking it up is cheaper than hashing them again (see keccak cache benchmark), so hashes
+    are cached from receipt until the block with the transaction is compressed. The cache is owned by the gateway
+    node and bounded by the total size of cached transactions.
+    """
+
+    def __init__(self, max_size_bytes: int = gateway_constants.KECCAK_CACHE_MAX_SIZE_BYTES):
+        self.max_size_bytes = max_size_bytes
+        self._hashes: OrderedDict = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def keccak_hash(self, buf: Union[bytes, bytearray, memoryview]) -> bytes:
+        """
+        Returns the Keccak hash of the content, computing and caching it if it is not cached.
+        """
+        key = bytes(buf)
+        hash_bytes = self._hashes.get(key)
+        if hash_bytes is not None:
+            self._hits += 1
+            self._hashes.move_to_end(key)
+            return hash_bytes
+
+        self._misses += 1
+        hash_bytes = crypto_utils.keccak_hash(key)
+        self.add(key, hash_bytes)
+        return hash_bytes
+
+    def get(self, buf: Union[bytes, bytearray, memoryview]) -> Optional[bytes]:
+        key = bytes(buf)
+        hash_bytes = self._hashes.get(key)
+        if hash_bytes is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+            self._hashes.move_to_end(key)
+        return hash_bytes
+
+    def add(self, buf: Union[bytes, bytearray, memoryview], hash_bytes: bytes) -> None:
+        key = bytes(buf)
+        if key in self._hashes:
+            return
+
+        self._hashes[key] = hash_bytes
+        self._size_bytes += len(key)
+        while self._size_bytes > self.max_size_bytes:
+            evicted_key, _ = self._hashes.popitem(last=False)
+            self._size_bytes -= len(evicted_key)
+            self._evicted += 1
+
+    def pop_hash(self, buf: Union[bytes, bytearray, memoryview]) -> bytes:
+        """
+        Returns the Keccak hash of content that is no longer expected to be seen, removing it from the cache.
+        """
+        key = bytes(buf)
+        hash_bytes = self._hashes.pop(key, None)
+        if hash_bytes is None:
+            self._misses += 1
+            return crypto_utils.keccak_hash(key)
+
+        self._hits += 1
+        self._size_bytes -= len(key)
+        return hash_bytes
+
+    def clear(self) -> None:
+        self._hashes.clear()
+        self._size_bytes = 0
+
+    def get_stats(self) -> KeccakCacheStats:
+        return KeccakCacheStats(self._hits, self._misses, self._evicted, len(self._hashes), self._size_bytes)
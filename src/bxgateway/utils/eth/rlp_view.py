@@ -0,0 +1,121 @@
+from typing import Dict, List, Optional, Tuple
+
+from bxcommon.exceptions import ParseError
+
+from bxgateway.utils.eth import rlp_utils
+
+
+class RlpListView(object):
+    """
+    Read-only view of an RLP serialized list.
+
+    Offsets of the list items are found in a single pass over the list the first time an item is accessed,
+    so any item can be returned afterwards without parsing preceding items again. Items are returned as slices
+    of the underlying memoryview and are never copied. Views of nested lists are created on demand and reused.
+    """
+
+    def __init__(self, buf: memoryview, start: int = 0):
+        """
+        :param buf: buffer with RLP serialized list
+        :param start: offset of the list length prefix in the buffer
+        """
+        item_type, payload_len, payload_start = rlp_utils.consume_length_prefix(buf, start)
+        if item_type is not list:
+            raise ParseError("Expected RLP list at offset {} but found string".format(start))
+        if payload_start + payload_len > len(buf):
+            raise ParseError("RLP list of length {} at offset {} exceeds buffer of length {}"
+                             .format(payload_len, start, len(buf)))
+
+        self._buf = buf
+        self._start = start
+        self._payload_start = payload_start
+        self._end = payload_start + payload_len
+
+        # (item start, item payload start, item end) for each item
+        self._item_offsets: Optional[List[Tuple[int, int, int]]] = None
+        self._list_views: Dict[int, "RlpListView"] = {}
+
+    def __len__(self) -> int:
+        return len(self._get_item_offsets())
+
+    def raw_bytes(self) -> memoryview:
+        """
+        :return: list bytes including its length prefix
+        """
+        return self._buf[self._start:self._end]
+
+    def payload(self) -> memoryview:
+        """
+        :return: serialized list items without the list length prefix
+        """
+        return self._buf[self._payload_start:self._end]
+
+    def get_item_bytes(self, index: int) -> memoryview:
+        """
+        :return: serialized item including its length prefix
+        """
+        item_start, _, item_end = self._get_item_offsets()[index]
+        return self._buf[item_start:item_end]
+
+    def get_item_payload(self, index: int) -> memoryview:
+        """
+        :return: item bytes without the length prefix
+        """
+        _, payload_start, item_end = self._get_item_offsets()[index]
+        return self._buf[payload_start:item_end]
+
+    def get_items_bytes(self, start_index: int = 0, end_index: Optional[int] = None) -> memoryview:
+        """
+        Returns serialized items in range [start_index, end_index) as a single slice.
+        Items are stored contiguously, so no copying is necessary.
+        """
+        item_offsets = self._get_item_offsets()
+        if end_index is None:
+            end_index = len(item_offsets)
+        if start_index >= end_index:
+            return self._buf[self._end:self._end]
+        return self._buf[item_offsets[start_index][0]:item_offsets[end_index - 1][2]]
+
+    def get_items_list(self) -> List[memoryview]:
+        """
+        :return: list of serialized items, each including its length prefix
+        """
+        return [self._buf[item_start:item_end] for item_start, _, item_end in self._get_item_offsets()]
+
+    def get_int(self, index: int) -> int:
+        payload = self.get_item_payload(index)
+        if len(payload) == 0:
+            return 0
+        return rlp_utils.big_endian_to_int(payload)
+
+    def get_list(self, index: int) -> "RlpListView":
+        """
+        :return: view of a nested list item
+        """
+        if index < 0:
+            index += len(self)
+
+        list_view = self._list_views.get(index)
+        if list_view is None:
+            item_start, _, item_end = self._get_item_offsets()[index]
+            list_view = RlpListView(self._buf[:item_end], item_start)
+            self._list_views[index] = list_view
+        return list_view
+
+    def _get_item_offsets(self) -> List[Tuple[int, int, int]]:
+        if self._item_offsets is None:
+            item_offsets = []
+            buf = self._buf
+            offset = self._payload_start
+            while offset < self._end:
+                _, item_len, item_payload_start = rlp_utils.consume_length_prefix(buf, offset)
+                item_end = item_payload_start + item_len
+                item_offsets.append((offset, item_payload_start, item_end))
+                offset = item_end
+
+            if offset != self._end:
+                raise ParseError("RLP list items end at offset {} but list ends at offset {}"
+                                 .format(offset, self._end))
+            self._item_offsets = item_offsets
+
+        return self._item_offsets
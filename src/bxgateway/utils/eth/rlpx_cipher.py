@@ -2,7 +2,6 @@ import os
 import random
 import struct
 import sys
-import pyelliptic
 import rlp
 from Crypto.Cipher import AES
 from rlp import sedes
@@ -343,11 +342,10 @@ class RLPxCipher(object):
         else:
             self._egress_mac, self._ingress_mac = mac2, mac1
 
-        iv = "\x00" * eth_constants.IV_LEN
-        self._aes_enc = pyelliptic.Cipher(self._aes_secret, iv, eth_constants.CIPHER_ENCRYPT_DO,
-                                          ciphername=eth_constants.RLPX_CIPHER_NAME)
-        self._aes_dec = pyelliptic.Cipher(self._aes_secret, iv, eth_constants.CIPHER_DECRYPT_DO,
-                                          ciphername=eth_constants.RLPX_CIPHER_NAME)
+        # aes-256-ctr with a zero IV; pycryptodome ciphers accept memoryviews and can write into a given buffer
+        iv = bytes(eth_constants.IV_LEN)
+        self._aes_enc = AES.new(self._aes_secret, AES.MODE_CTR, nonce=b"", initial_value=iv)
+        self._aes_dec = AES.new(self._aes_secret, AES.MODE_CTR, nonce=b"", initial_value=iv)
         self._mac_enc = AES.new(self.mac_secret, AES.MODE_ECB).encrypt
 
         self._is_ready = True
@@ -366,27 +364,37 @@ class RLPxCipher(object):
             raise CipherNotInitializedError(f"failed to encrypt frame {frame}, the cipher was never initialized!")
 
         header = frame.get_header()
-        body = frame.get_body()
+        body_size = frame.get_body_size(padded=True)
+
+        # header || header-mac || frame-ciphertext || frame-mac, encrypted in place in a single buffer
+        header_end = eth_constants.FRAME_HDR_DATA_LEN
+        header_mac_end = eth_constants.FRAME_HDR_TOTAL_LEN
+        body_end = header_mac_end + body_size
+        encrypted_frame = bytearray(body_end + eth_constants.FRAME_MAC_LEN)
+        encrypted_frame_view = memoryview(encrypted_frame)
 
         # header
-        header_ciphertext = self.aes_encode(header)
+        header_ciphertext = encrypted_frame_view[:header_end]
+        self.aes_encode(header, header_ciphertext)
 
         # egress-mac.update(aes(mac-secret,egress-mac) ^ header-ciphertext).digest
-        header_mac = self.mac_egress(
+        encrypted_frame_view[header_end:header_mac_end] = self.mac_egress(
             crypto_utils.string_xor(self._mac_enc(self.mac_egress()[:eth_constants.FRAME_MAC_LEN]),
                                     header_ciphertext))[:eth_constants.FRAME_MAC_LEN]
 
-        # frame
-        frame_ciphertext = self.aes_encode(body)
-        assert len(frame_ciphertext) == len(body)
+        # frame, padding is already zero filled
+        frame_ciphertext = encrypted_frame_view[header_mac_end:body_end]
+        frame.write_body(frame_ciphertext)
+        self.aes_encode(frame_ciphertext, frame_ciphertext)
+
         # egress-mac.update(aes(mac-secret,egress-mac) ^
         # left128(egress-mac.update(frame-ciphertext).digest))
         fmac_seed = self.mac_egress(frame_ciphertext)
-        frame_mac = self.mac_egress(
+        encrypted_frame_view[body_end:] = self.mac_egress(
             crypto_utils.string_xor(self._mac_enc(self.mac_egress()[:eth_constants.FRAME_MAC_LEN]),
                                     fmac_seed[:eth_constants.FRAME_MAC_LEN]))[:eth_constants.FRAME_MAC_LEN]
 
-        return bytearray(header_ciphertext + header_mac + frame_ciphertext + frame_mac)
+        return encrypted_frame
 
     def decrypt_frame_header(self, data):
         """
@@ -418,12 +426,14 @@ class RLPxCipher(object):
 
         return self.aes_decode(header_cipher_text)
 
-    def decrypt_frame_body(self, data, body_size):
+    def decrypt_frame_body(self, data, body_size, output=None):
         """
         Decrypts frame body
         :param data: frame data
         :param body_size: body size
-        :return: decrypted frame body
+        :param output: optional writable buffer, at least padded body size long, to decrypt the body into.
+                       Padding is written after the body and is expected to be overwritten by the caller.
+        :return: decrypted frame body, or output if provided
         """
 
         if not self._is_ready:
@@ -438,6 +448,7 @@ class RLPxCipher(object):
         if not len(data) >= read_size + eth_constants.FRAME_MAC_LEN:
             raise ParseError("Insufficient body length")
 
+        data = data if isinstance(data, memoryview) else memoryview(data)
         frame_cipher_text = data[:read_size]
         frame_mac = data[read_size:read_size + eth_constants.FRAME_MAC_LEN]
 
@@ -451,35 +462,54 @@ class RLPxCipher(object):
         if not frame_mac == expected_frame_mac:
             raise AuthenticationError("Invalid frame mac")
 
-        return self.aes_decode(frame_cipher_text)[:body_size]
+        if output is not None:
+            output = output if isinstance(output, memoryview) else memoryview(output)
+            self.aes_decode(frame_cipher_text, output[:read_size])
+            return output
 
-    def aes_encode(self, data=""):
-        if isinstance(data, bytearray):
-            bytes_to_encode = bytes(data)
-        elif isinstance(data, memoryview):
-            bytes_to_encode = data.tobytes()
-        else:
-            bytes_to_encode = data
+        body = bytearray(read_size)
+        self.aes_decode(frame_cipher_text, body)
+        # drop padding without copying the body
+        del body[body_size:]
+        return body
 
-        return self._aes_enc.update(bytes_to_encode)
+    def aes_encode(self, data=b"", output=None):
+        """
+        Encrypts data with the egress AES stream
+        :param data: bytes-like object to encrypt
+        :param output: optional writable buffer of the same length to write the cipher text into
+        :return: cipher text, or output if provided
+        """
 
-    def aes_decode(self, data=""):
-        if isinstance(data, bytearray):
-            bytes_to_decode = bytes(data)
-        elif isinstance(data, memoryview):
-            bytes_to_decode = data.tobytes()
-        else:
-            bytes_to_decode = data
+        if output is None:
+            return self._aes_enc.encrypt(data)
+
+        self._aes_enc.encrypt(data, output=output)
+        return output
+
+    def aes_decode(self, data=b"", output=None):
+        """
+        Decrypts data with the ingress AES stream
+        :param data: bytes-like object to decrypt
+        :param output: optional writable buffer of the same length to write the plain text into
+        :return: plain text, or output if provided
+        """
+
+        if output is None:
+            return self._aes_dec.decrypt(data)
 
-        return self._aes_dec.update(bytes_to_decode)
+        self._aes_dec.decrypt(data, output=output)
+        return output
 
     def mac_egress(self, data=b""):
-        data = rlp_utils.str_to_bytes(data)
+        if isinstance(data, str):
+            data = rlp_utils.str_to_bytes(data)
         self._egress_mac.update(data)
         return self._egress_mac.digest()
 
     def mac_ingress(self, data=b""):
-        data = rlp_utils.str_to_bytes(data)
+        if isinstance(data, str):
+            data = rlp_utils.str_to_bytes(data)
         self._ingress_mac.update(data)
         return self._ingress_mac.digest()
 
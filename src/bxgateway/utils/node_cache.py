@@ -1,7 +1,10 @@
 import json
+import mmap
 import os
+import struct
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional
 from argparse import Namespace
 
 from bxutils import logging
@@ -11,8 +14,24 @@ from bxcommon.models.outbound_peer_model import OutboundPeerModel
 from bxcommon.utils import model_loader, config
 from bxcommon.utils.class_json_encoder import ClassJsonEncoder
 
+from bxgateway import gateway_constants
+
 logger = logging.get_logger(__name__)
 
+CACHE_FILE_MAGIC = b"BXNC"
+CACHE_FILE_VERSION = 1
+
+# magic, version
+HEADER_STRUCT = struct.Struct("<4sB")
+# record type, payload length
+RECORD_HEADER_STRUCT = struct.Struct("<BI")
+
+
+class CacheRecordType(object):
+    SOURCE_VERSION = 1
+    RELAY_PEERS = 2
+    BLOCKCHAIN_NETWORK = 3
+
 
 @dataclass
 class CacheNetworkInfo:
@@ -21,37 +40,55 @@ class CacheNetworkInfo:
     blockchain_network: List[BlockchainNetworkModel]
 
 
-def update(opts: Namespace, potential_relay_peers: List[OutboundPeerModel]):
-    try:
-        cookie_file_path = config.get_relative_file(opts.cookie_file_path)
-        os.makedirs(os.path.dirname(cookie_file_path), exist_ok=True)
-        with open(cookie_file_path, "r") as cookie_file:
-            data = json.load(cookie_file)
-    except (FileNotFoundError, json.decoder.JSONDecodeError):
-        data = {}
+# single thread keeps writes to the cache file in order
+_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="node-cache")
 
-    # if gateway was upgraded, its version number has changed and its relays are no longer relevant
-    if "source_version" in data and data["source_version"] != opts.source_version:
-        data = {}
-
-    cache_network_info = CacheNetworkInfo(
-        source_version=opts.source_version,
-        relay_peers=[relay for relay in potential_relay_peers],
-        blockchain_network=[blockchain for blockchain in opts.blockchain_networks
-                            if opts.blockchain_network_num == blockchain.network_num]
-    )
-    cache_info = {
-        "source_version": opts.source_version,
-        "relay_peers": [relay.__dict__ for relay in cache_network_info.relay_peers],
-        "blockchain_network": [blockchain_network.__dict__ for blockchain_network in
-                               cache_network_info.blockchain_network]
+# latest record payloads and cache file size by cache file path, as of the last update
+_records_by_path: Dict[str, Dict[int, bytes]] = {}
+_file_size_by_path: Dict[str, int] = {}
+
+
+def update(opts: Namespace, potential_relay_peers: List[OutboundPeerModel]) -> Future:
+    """
+    Updates relay peers and blockchain network in the cache file.
+
+    Cache file is a header followed by records of (type, payload length, payload). Only records that changed are
+    appended to the file, latest record of each type wins. The file is rewritten with latest records only on the
+    first update by the process, after gateway upgrade and when it grows over NODE_CACHE_MAX_FILE_SIZE_BYTES.
+    Records are serialized on the calling thread, and file is written in the background.
+
+    :param opts: gateway options
+    :param potential_relay_peers: relay peers to store
+    :return: future completed when the cache file is written
+    """
+    cookie_file_path = config.get_relative_file(opts.cookie_file_path)
+    records = {
+        CacheRecordType.SOURCE_VERSION: _serialize(opts.source_version),
+        CacheRecordType.RELAY_PEERS: _serialize([relay.__dict__ for relay in potential_relay_peers]),
+        CacheRecordType.BLOCKCHAIN_NETWORK: _serialize(
+            [blockchain_network.__dict__ for blockchain_network in opts.blockchain_networks
+             if opts.blockchain_network_num == blockchain_network.network_num]
+        )
     }
-    data.update(cache_info)
-    try:
-        with open(config.get_relative_file(opts.cookie_file_path), "w") as cookie_file:
-            json.dump(data, cookie_file, indent=4, cls=ClassJsonEncoder)
-    except Exception as ex:
-        logger.error(f"Failed when tried to write to cache file: {opts.cookie_file_path} with exception: {ex}")
+
+    previous_records = _records_by_path.get(cookie_file_path)
+    file_size = _file_size_by_path.get(cookie_file_path, 0)
+    _records_by_path[cookie_file_path] = records
+
+    # if gateway was upgraded, its version number has changed and its relays are no longer relevant
+    if previous_records is None or \
+            previous_records[CacheRecordType.SOURCE_VERSION] != records[CacheRecordType.SOURCE_VERSION] or \
+            file_size > gateway_constants.NODE_CACHE_MAX_FILE_SIZE_BYTES:
+        data = HEADER_STRUCT.pack(CACHE_FILE_MAGIC, CACHE_FILE_VERSION) + _pack_records(records)
+        _file_size_by_path[cookie_file_path] = len(data)
+        return _writer.submit(_write, cookie_file_path, data, False)
+
+    data = _pack_records({
+        record_type: payload for record_type, payload in records.items()
+        if previous_records[record_type] != payload
+    })
+    _file_size_by_path[cookie_file_path] = file_size + len(data)
+    return _writer.submit(_write, cookie_file_path, data, True)
 
 
 def read(opts: Namespace) -> Optional[CacheNetworkInfo]:
@@ -61,10 +98,99 @@ def read(opts: Namespace) -> Optional[CacheNetworkInfo]:
 
     try:
         relative_path = config.get_relative_file(opts.cookie_file_path)
-        if os.path.exists(relative_path):
-            with open(relative_path, "r") as cookie_file:
-                cache_file_info = model_loader.load_model(CacheNetworkInfo, json.load(cookie_file))
+        records = _records_by_path.get(relative_path)
+        if records is None and os.path.exists(relative_path):
+            records = _read_records(relative_path)
+
+        if records is not None:
+            cache_file_info = model_loader.load_model(CacheNetworkInfo, {
+                "source_version": _deserialize(records, CacheRecordType.SOURCE_VERSION, None),
+                "relay_peers": _deserialize(records, CacheRecordType.RELAY_PEERS, []),
+                "blockchain_network": _deserialize(records, CacheRecordType.BLOCKCHAIN_NETWORK, [])
+            })
     except Exception as ex:
         logger.error(f"Failed when tried to read from cache file: {opts.cookie_file_path} with exception: {ex}")
     finally:
         return cache_file_info
+
+
+def _serialize(value) -> bytes:
+    return json.dumps(value, cls=ClassJsonEncoder).encode("utf-8")
+
+
+def _deserialize(records: Dict[int, bytes], record_type: int, default):
+    payload = records.get(record_type)
+    if payload is None:
+        return default
+    return json.loads(payload.decode("utf-8"))
+
+
+def _pack_records(records: Dict[int, bytes]) -> bytes:
+    return b"".join(
+        RECORD_HEADER_STRUCT.pack(record_type, len(payload)) + payload for record_type, payload in records.items()
+    )
+
+
+def _write(cookie_file_path: str, data: bytes, append: bool) -> None:
+    try:
+        os.makedirs(os.path.dirname(cookie_file_path), exist_ok=True)
+        if append:
+            with open(cookie_file_path, "ab") as cookie_file:
+                cookie_file.write(data)
+        else:
+            tmp_file_path = "{}.tmp".format(cookie_file_path)
+            with open(tmp_file_path, "wb") as cookie_file:
+                cookie_file.write(data)
+            os.replace(tmp_file_path, cookie_file_path)
+    except Exception as ex:
+        logger.error(f"Failed when tried to write to cache file: {cookie_file_path} with exception: {ex}")
+
+
+def _read_records(cookie_file_path: str) -> Optional[Dict[int, bytes]]:
+    """
+    Reads latest record of each type from the cache file. Incomplete record at the end of the file, left by
+    an interrupted append, is ignored.
+    """
+    if os.path.getsize(cookie_file_path) == 0:
+        return None
+
+    with open(cookie_file_path, "rb") as cookie_file, \
+            mmap.mmap(cookie_file.fileno(), 0, access=mmap.ACCESS_READ) as cache:
+        if len(cache) < HEADER_STRUCT.size or cache[:len(CACHE_FILE_MAGIC)] != CACHE_FILE_MAGIC:
+            return _read_json_records(cache)
+
+        _, version = HEADER_STRUCT.unpack_from(cache, 0)
+        if version != CACHE_FILE_VERSION:
+            return None
+
+        records = {}
+        cache_len = len(cache)
+        offset = HEADER_STRUCT.size
+        while offset + RECORD_HEADER_STRUCT.size <= cache_len:
+            record_type, payload_len = RECORD_HEADER_STRUCT.unpack_from(cache, offset)
+            payload_start = offset + RECORD_HEADER_STRUCT.size
+            if payload_start + payload_len > cache_len:
+                break
+            records[record_type] = cache[payload_start:payload_start + payload_len]
+            offset = payload_start + payload_len
+        return records
+
+
+def _read_json_records(cache: mmap.mmap) -> Optional[Dict[int, bytes]]:
+    """
+    Reads cache file of previous gateway versions, which stored the cache as a JSON object.
+    """
+    try:
+        data = json.loads(cache[:].decode("utf-8"))
+    except ValueError:
+        return None
+
+    records = {}
+    for record_type, key in [
+        (CacheRecordType.SOURCE_VERSION, "source_version"),
+        (CacheRecordType.RELAY_PEERS, "relay_peers"),
+        (CacheRecordType.BLOCKCHAIN_NETWORK, "blockchain_network")
+    ]:
+        if key in data:
+            records[record_type] = _serialize(data[key])
+    return records
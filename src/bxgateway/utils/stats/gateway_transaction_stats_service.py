@@ -15,6 +15,9 @@ class GatewayTransactionStatInterval(StatsIntervalData):
         "duplicate_transactions_received_from_relays",
         "short_id_assignments_processed",
         "redundant_transaction_content_messages",
+        "transaction_inventory_requested_from_blockchain",
+        "known_transaction_inventory_from_blockchain",
+        "known_transaction_inventory_bytes_from_blockchain",
         "transaction_tracker",
         "transaction_intervals"
     ]
@@ -28,6 +31,9 @@ class GatewayTransactionStatInterval(StatsIntervalData):
         self.duplicate_transactions_received_from_relays = 0
         self.short_id_assignments_processed = 0
         self.redundant_transaction_content_messages = 0
+        self.transaction_inventory_requested_from_blockchain = 0
+        self.known_transaction_inventory_from_blockchain = 0
+        self.known_transaction_inventory_bytes_from_blockchain = 0
         self.transaction_tracker = {}
         self.transaction_intervals = deque()
 
@@ -69,6 +75,16 @@ class _GatewayTransactionStatsService(StatisticsService):
     def log_redundant_transaction_content(self):
         self.interval_data.redundant_transaction_content_messages += 1
 
+    def log_transaction_inventory_from_blockchain(self, requested_count, known_count, known_bytes):
+        """
+        :param requested_count: number of announced transactions requested from blockchain node
+        :param known_count: number of announced transactions not requested, since gateway already has them
+        :param known_bytes: size of transactions not requested, i.e. redundant downloads avoided
+        """
+        self.interval_data.transaction_inventory_requested_from_blockchain += requested_count
+        self.interval_data.known_transaction_inventory_from_blockchain += known_count
+        self.interval_data.known_transaction_inventory_bytes_from_blockchain += known_bytes
+
     def get_info(self):
         if len(self.interval_data.transaction_intervals) > 0:
             min_short_id_assign_time = min(self.interval_data.transaction_intervals)
@@ -89,12 +105,19 @@ class _GatewayTransactionStatsService(StatisticsService):
             "duplicate_transactions_received_from_relays": self.interval_data.duplicate_transactions_received_from_relays,
             "short_ids_assignments_processed": self.interval_data.short_id_assignments_processed,
             "redundant_transaction_content_messages": self.interval_data.redundant_transaction_content_messages,
+            "transaction_inventory_requested_from_blockchain":
+                self.interval_data.transaction_inventory_requested_from_blockchain,
+            "known_transaction_inventory_from_blockchain":
+                self.interval_data.known_transaction_inventory_from_blockchain,
+            "known_transaction_inventory_bytes_from_blockchain":
+                self.interval_data.known_transaction_inventory_bytes_from_blockchain,
             "start_time": self.interval_data.start_time,
             "end_time": self.interval_data.end_time,
             "min_short_id_assign_time": min_short_id_assign_time,
             "max_short_id_assign_time": max_short_id_assign_time,
             "avg_short_id_assign_time": avg_short_id_assign_time,
-            **self.node._tx_service.get_aggregate_stats()
+            **self.node._tx_service.get_aggregate_stats(),
+            **self.node.block_recovery_service.get_recovery_stats()._asdict()
         }
 
 
@@ -0,0 +1,79 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
+from typing import Callable, List, Optional, Sequence, Union
+
+from bxutils import logging
+
+from bxgateway import gateway_constants
+
+logger = logging.get_logger(__name__)
+
+TxHashFunc = Callable[[bytes], bytes]
+
+
+def _hash_shard(hash_func: TxHashFunc, shard: List[bytes]) -> List[bytes]:
+    return [hash_func(tx) for tx in shard]
+
+
+class TxHashWorkerPool(object):
+    """
+    Shards hashing of a block's transactions across worker processes and stitches results back in block order.
+
+    Hash functions must be module level functions (so they can be sent to workers) taking transaction bytes and
+    returning the binary hash. Blocks with fewer than `min_tx_count` transactions are hashed in the calling process,
+    since sending them to workers costs more than hashing.
+    """
+
+    def __init__(
+            self, worker_count: int, min_tx_count: int = gateway_constants.PARALLEL_TX_HASHING_MIN_TX_COUNT
+    ):
+        if worker_count < 1:
+            raise ValueError("worker_count must be positive")
+
+        self.worker_count = worker_count
+        self.min_tx_count = min_tx_count
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def hash_transactions(
+            self, hash_func: TxHashFunc, txs: Sequence[Union[bytearray, memoryview]]
+    ) -> List[bytes]:
+        """
+        Hashes transactions, in parallel if there are enough of them.
+
+        :param hash_func: module level function returning binary hash of transaction bytes
+        :param txs: transaction contents, in block order
+        :return: list of binary hashes, in block order
+        """
+        tx_count = len(txs)
+        if tx_count < self.min_tx_count:
+            return [hash_func(tx) for tx in txs]
+
+        shard_size = math.ceil(tx_count / self.worker_count)
+        shards = [
+            [bytes(tx) for tx in txs[shard_start:shard_start + shard_size]]
+            for shard_start in range(0, tx_count, shard_size)
+        ]
+        results = self._get_executor().map(_hash_shard, repeat(hash_func), shards)
+        return list(chain.from_iterable(results))
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            logger.debug("Starting {} transaction hashing worker processes.", self.worker_count)
+            self._executor = ProcessPoolExecutor(max_workers=self.worker_count)
+        return self._executor
+
+
+def create_tx_hash_worker_pool(opts) -> Optional[TxHashWorkerPool]:
+    """
+    Creates worker pool if parallel compression is enabled. Extension converters have their own parallelism.
+    """
+    compression_workers = getattr(opts, "compression_workers", gateway_constants.DEFAULT_COMPRESSION_WORKERS)
+    if opts.use_extensions or compression_workers < 1:
+        return None
+    return TxHashWorkerPool(compression_workers)
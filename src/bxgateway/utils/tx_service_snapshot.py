@@ -0,0 +1,147 @@
+import mmap
+import os
+import struct
+import time
+from concurrent.futures import Executor, Future
+from typing import List
+
+from bxcommon import constants
+from bxcommon.services.transaction_service import TransactionService
+from bxcommon.utils.object_hash import Sha256Hash
+from bxutils import logging
+
+from bxgateway import gateway_constants
+
+logger = logging.get_logger(__name__)
+
+SNAPSHOT_MAGIC = b"BXTXSNAP"
+SNAPSHOT_VERSION = 2
+
+# magic, version, network number, creation timestamp, number of records
+HEADER_STRUCT = struct.Struct("<8sHIdI")
+# transaction hash, number of short ids, contents length (0 if no contents)
+RECORD_STRUCT = struct.Struct("<32sHI")
+SHORT_ID_STRUCT = struct.Struct("<I")
+
+
+def save(tx_service: TransactionService, network_num: int, file_path: str, writer: Executor) -> Future:
+    """
+    Writes transaction hashes, short ids and contents of the transaction service to a binary snapshot file.
+
+    Only the list of transaction hashes is taken on the calling thread. Short ids and contents are looked up, packed
+    and written on `writer`, so the event loop is not blocked by walking the transaction service or by disk IO.
+    Every lookup is a single dict or set operation, which does not interleave with the event loop thread. Transactions
+    removed from the transaction service before they are written are skipped.
+
+    File consists of a header followed by one record per transaction: a fixed size record header, the transaction
+    short ids and transaction contents. Records are streamed to a temporary file as they are packed, which is then
+    renamed, so a crash while writing never leaves a truncated snapshot behind.
+
+    :param tx_service: transaction service
+    :param network_num: network number of the transaction service
+    :param file_path: snapshot file path
+    :param writer: single threaded executor writing snapshots, so snapshots are written one at a time
+    :return: future resolving to number of saved transactions
+    """
+    return writer.submit(_write, tx_service, network_num, file_path, list(tx_service.iter_transaction_hashes()),
+                         time.time())
+
+
+def load(
+        tx_service: TransactionService,
+        network_num: int,
+        file_path: str,
+        max_age_s: int = gateway_constants.TX_SERVICE_SNAPSHOT_MAX_AGE_S
+) -> int:
+    """
+    Restores transaction hashes, short ids and contents from a snapshot file written by `save`.
+
+    File is memory mapped, so only transaction contents are copied. Snapshots of other networks, of unknown versions
+    or older than `max_age_s` are ignored, since their short ids may have been reassigned by relays since.
+
+    :param tx_service: transaction service
+    :param network_num: network number of the transaction service
+    :param file_path: snapshot file path
+    :param max_age_s: maximum age of the snapshot in seconds
+    :return: number of restored transactions
+    """
+    if not os.path.exists(file_path) or os.path.getsize(file_path) < HEADER_STRUCT.size:
+        return 0
+
+    with open(file_path, "rb") as snapshot_file, \
+            mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ) as snapshot:
+        magic, version, snapshot_network_num, timestamp, record_count = HEADER_STRUCT.unpack_from(snapshot, 0)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            logger.warning("Ignoring transaction service snapshot {} of unknown format.", file_path)
+            return 0
+        if snapshot_network_num != network_num:
+            logger.warning("Ignoring transaction service snapshot {} of network {}.", file_path, snapshot_network_num)
+            return 0
+        if time.time() - timestamp > max_age_s:
+            logger.info("Ignoring transaction service snapshot {} older than {} seconds.", file_path, max_age_s)
+            return 0
+
+        snapshot_len = len(snapshot)
+        offset = HEADER_STRUCT.size
+        for restored_count in range(record_count):
+            if offset + RECORD_STRUCT.size > snapshot_len:
+                logger.warning("Transaction service snapshot {} is truncated after {} transactions.",
+                               file_path, restored_count)
+                return restored_count
+            tx_hash_bytes, short_id_count, contents_len = RECORD_STRUCT.unpack_from(snapshot, offset)
+            offset += RECORD_STRUCT.size
+            short_ids_len = short_id_count * SHORT_ID_STRUCT.size
+            if offset + short_ids_len + contents_len > snapshot_len:
+                logger.warning("Transaction service snapshot {} is truncated after {} transactions.",
+                               file_path, restored_count)
+                return restored_count
+
+            tx_hash = Sha256Hash(bytearray(tx_hash_bytes))
+            for short_id, in SHORT_ID_STRUCT.iter_unpack(snapshot[offset:offset + short_ids_len]):
+                tx_service.assign_short_id(tx_hash, short_id)
+            offset += short_ids_len
+            if contents_len:
+                tx_service.set_transaction_contents(tx_hash, bytearray(snapshot[offset:offset + contents_len]))
+                offset += contents_len
+
+    return record_count
+
+
+def _write(tx_service: TransactionService, network_num: int, file_path: str, tx_hashes: List[Sha256Hash],
+           start_time: float) -> int:
+    record_count = 0
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        tmp_file_path = "{}.tmp".format(file_path)
+        with open(tmp_file_path, "wb") as snapshot_file:
+            # number of records is only known once all records are written
+            snapshot_file.write(HEADER_STRUCT.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, network_num, start_time, 0))
+            for tx_hash in tx_hashes:
+                short_ids = [
+                    short_id for short_id in tuple(tx_service.get_short_ids(tx_hash))
+                    if short_id != constants.NULL_TX_SID
+                ]
+                tx_contents = tx_service.get_transaction_by_hash(tx_hash)
+                if not short_ids and not tx_contents:
+                    continue
+
+                contents_len = len(tx_contents) if tx_contents else 0
+                snapshot_file.write(RECORD_STRUCT.pack(tx_hash.binary, len(short_ids), contents_len))
+                for short_id in short_ids:
+                    snapshot_file.write(SHORT_ID_STRUCT.pack(short_id))
+                if contents_len:
+                    snapshot_file.write(tx_contents)
+                record_count += 1
+
+            snapshot_file.seek(0)
+            snapshot_file.write(
+                HEADER_STRUCT.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, network_num, start_time, record_count)
+            )
+        os.replace(tmp_file_path, file_path)
+    except Exception as ex:
+        logger.error("Failed to save transaction service snapshot to {}: {}", file_path, ex)
+        return 0
+
+    logger.debug("Saved {} transactions to transaction service snapshot {} in {:.2f}s.",
+                 record_count, file_path, time.time() - start_time)
+    return record_count
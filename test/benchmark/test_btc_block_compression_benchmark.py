@@ -0,0 +1,104 @@
+import os
+import struct
+from collections import deque
+from typing import List
+
+from bxcommon import constants
+from bxcommon.messages.bloxroute import compact_block_short_ids_serializer
+from bxcommon.services.transaction_service import TransactionService
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.test_utils.mocks.mock_node import MockNode
+from bxcommon.utils import convert
+
+from bxgateway import btc_constants
+from bxgateway.btc_constants import BTC_HDR_COMMON_OFF
+from bxgateway.messages.btc import btc_messages_util
+from bxgateway.messages.btc.block_btc_message import BlockBtcMessage
+from bxgateway.messages.btc.btc_message import BtcMessage
+from bxgateway.messages.btc.btc_normal_message_converter import BtcNormalMessageConverter
+from bxgateway.testing import benchmark_utils
+
+ITERATIONS = 50
+COMPRESSED_TX_RATIO = 0.9
+
+
+def get_segwit_block() -> BlockBtcMessage:
+    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with open(os.path.join(root_dir, "unit", "segwit_block.txt")) as sample_file:
+        btc_block = sample_file.read().strip("\n")
+    block = convert.hex_to_bytes(btc_block)
+    buf = bytearray(BTC_HDR_COMMON_OFF + len(block))
+    buf[BTC_HDR_COMMON_OFF:] = block
+    msg = BtcMessage(magic="main", command=BlockBtcMessage.MESSAGE_TYPE, payload_len=len(block), buf=buf)
+    return BlockBtcMessage(buf=msg.buf)
+
+
+def block_to_bx_block_with_pieces(block_msg: BlockBtcMessage, tx_service: TransactionService) -> memoryview:
+    """
+    Previous way of packing a bx block, collecting pieces in a deque and copying them into a new buffer.
+    """
+    size = 0
+    buf = deque()
+    short_ids: List[int] = []
+    header = block_msg.header()
+    size += len(header)
+    buf.append(header)
+
+    for tx in block_msg.txns():
+        tx_hash = btc_messages_util.get_txid(tx)
+        short_id = tx_service.get_short_id(tx_hash)
+        if short_id == constants.NULL_TX_SID:
+            buf.append(tx)
+            size += len(tx)
+        else:
+            short_ids.append(short_id)
+            buf.append(btc_constants.BTC_SHORT_ID_INDICATOR_AS_BYTEARRAY)
+            size += 1
+
+    serialized_short_ids = compact_block_short_ids_serializer.serialize_short_ids_into_bytes(short_ids)
+    buf.append(serialized_short_ids)
+    size += constants.UL_ULL_SIZE_IN_BYTES
+    buf.appendleft(struct.pack("<Q", size))
+    size += len(serialized_short_ids)
+
+    block = bytearray(size)
+    off = 0
+    for blob in buf:
+        next_off = off + len(blob)
+        block[off:next_off] = blob
+        off = next_off
+    return memoryview(block)
+
+
+class BtcBlockCompressionBenchmark(AbstractTestCase):
+
+    def setUp(self):
+        self.converter = BtcNormalMessageConverter(12345)
+        self.tx_service = TransactionService(MockNode(helpers.get_gateway_opts(8999)), 0)
+        self.block = get_segwit_block()
+
+        txns = self.block.txns()
+        for short_id, tx in enumerate(txns[:int(len(txns) * COMPRESSED_TX_RATIO)]):
+            tx_hash = btc_messages_util.get_txid(tx)
+            self.tx_service.assign_short_id(tx_hash, short_id + 1)
+            self.tx_service.set_transaction_contents(tx_hash, tx)
+
+    def test_block_to_bx_block(self):
+        bx_block, _ = self.converter.block_to_bx_block(self.block, self.tx_service)
+        ref_block, _, _, _ = self.converter.bx_block_to_block(bx_block, self.tx_service)
+        self.assertEqual(self.block.rawbytes().tobytes(), ref_block.rawbytes().tobytes())
+        self.assertEqual(bx_block.tobytes(), block_to_bx_block_with_pieces(self.block, self.tx_service).tobytes())
+        name_suffix = "(segwit, {} txs)".format(self.block.txn_count())
+
+        for name, func in [
+            ("block_to_bx_block deque of pieces", block_to_bx_block_with_pieces),
+            ("block_to_bx_block preallocated buffer",
+             lambda block_msg, tx_service: self.converter.block_to_bx_block(block_msg, tx_service)[0])
+        ]:
+            # a new message per run, so transaction offsets parsed by an earlier run are not reused
+            result = benchmark_utils.run_benchmark(
+                lambda: func(BlockBtcMessage(buf=self.block.buf), self.tx_service), ITERATIONS
+            )
+            print(benchmark_utils.format_result("{} {}".format(name, name_suffix), result))
+            self.assertEqual(ITERATIONS, result.iterations)
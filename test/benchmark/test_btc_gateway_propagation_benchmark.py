@@ -0,0 +1,38 @@
+import os
+
+from mock import patch
+
+from bxgateway.testing import benchmark_utils
+from bxgateway.testing.abstract_btc_gateway_benchmark_test import AbstractBtcGatewayBenchmarkTest
+
+BLOCK_ITERATIONS = 20
+
+
+def get_segwit_block_file_path() -> str:
+    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(root_dir, "unit", "segwit_block.txt")
+
+
+@patch("bxcommon.constants.OUTPUT_BUFFER_MIN_SIZE", 0)
+@patch("bxcommon.constants.OUTPUT_BUFFER_BATCH_MAX_HOLD_TIME", 0)
+class BtcGatewayPropagationBenchmark(AbstractBtcGatewayBenchmarkTest):
+
+    def test_block_propagation(self):
+        txns = self.load_recorded_block_transactions(get_segwit_block_file_path())
+
+        node_to_bdn, bdn_to_node = self.run_block_propagation_benchmark(txns, BLOCK_ITERATIONS)
+        print(benchmark_utils.format_result("block node to BDN ({} txs)".format(len(txns)), node_to_bdn))
+        print(benchmark_utils.format_result("block BDN to node ({} txs)".format(len(txns)), bdn_to_node))
+
+        self.assertEqual(BLOCK_ITERATIONS, node_to_bdn.iterations)
+        self.assertEqual(BLOCK_ITERATIONS, bdn_to_node.iterations)
+
+    def test_transaction_throughput(self):
+        txns = self.load_recorded_block_transactions(get_segwit_block_file_path())
+
+        node_to_bdn_tps, bdn_to_node_tps = self.run_transaction_benchmark(txns)
+        print("transactions node to BDN ({} txs): {:.0f} tx/s".format(len(txns), node_to_bdn_tps))
+        print("transactions BDN to node ({} txs): {:.0f} tx/s".format(len(txns), bdn_to_node_tps))
+
+        self.assertGreater(node_to_bdn_tps, 0)
+        self.assertGreater(bdn_to_node_tps, 0)
@@ -0,0 +1,62 @@
+import os
+from typing import List
+
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils import convert
+
+from bxgateway.btc_constants import BTC_HDR_COMMON_OFF
+from bxgateway.messages.btc import btc_messages_util
+from bxgateway.messages.btc.block_btc_message import BlockBtcMessage
+from bxgateway.messages.btc.btc_message import BtcMessage
+from bxgateway.testing import benchmark_utils
+
+ITERATIONS = 50
+
+
+def get_segwit_block() -> BlockBtcMessage:
+    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with open(os.path.join(root_dir, "unit", "segwit_block.txt")) as sample_file:
+        btc_block = sample_file.read().strip("\n")
+    block = convert.hex_to_bytes(btc_block)
+    buf = bytearray(BTC_HDR_COMMON_OFF + len(block))
+    buf[BTC_HDR_COMMON_OFF:] = block
+    msg = BtcMessage(magic="main", command=BlockBtcMessage.MESSAGE_TYPE, payload_len=len(block), buf=buf)
+    return BlockBtcMessage(buf=msg.buf)
+
+
+def get_tx_boundaries_per_tx(buf: bytearray, off: int, tx_count: int) -> List[int]:
+    """
+    Previous way of finding transaction boundaries, parsing every transaction with a separate call.
+    """
+    offsets = []
+    for _ in range(tx_count):
+        offsets.append(off)
+        off += btc_messages_util.get_next_tx_size(buf, off)
+    offsets.append(off)
+    return offsets
+
+
+class BtcTxBoundariesBenchmark(AbstractTestCase):
+    """
+    Compares finding transaction boundaries of a segwit block one transaction at a time with the bulk scanner.
+    """
+
+    def setUp(self):
+        self.block = get_segwit_block()
+        self.buf = self.block.buf
+        self.tx_offset = len(self.block.header())
+        self.tx_count = self.block.txn_count()
+
+    def test_tx_boundaries(self):
+        offsets, _ = btc_messages_util.get_tx_boundaries(self.buf, self.tx_offset, self.tx_count)
+        self.assertEqual(get_tx_boundaries_per_tx(self.buf, self.tx_offset, self.tx_count), list(offsets))
+        name_suffix = "({} txs, {} bytes)".format(self.tx_count, len(self.buf))
+
+        for name, func in [
+            ("tx boundaries per tx", get_tx_boundaries_per_tx),
+            ("tx boundaries bulk scan", btc_messages_util.get_tx_boundaries)
+        ]:
+            result = benchmark_utils.run_benchmark(
+                lambda: func(self.buf, self.tx_offset, self.tx_count), ITERATIONS
+            )
+            print(benchmark_utils.format_result("{} {}".format(name, name_suffix), result))
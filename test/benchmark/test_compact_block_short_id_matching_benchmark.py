@@ -0,0 +1,77 @@
+import hashlib
+import random
+
+from bxcommon.services.transaction_service import TransactionService
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.test_utils.mocks.mock_node import MockNode
+from bxcommon.utils import crypto
+from bxcommon.utils.crypto import SHA256_HASH_LEN
+from bxcommon.utils.object_hash import Sha256Hash
+
+from bxgateway.messages.btc.btc_normal_message_converter import BtcNormalMessageConverter, compute_short_id
+from bxgateway.messages.btc.compact_block_btc_message import CompactBlockBtcMessage
+from bxgateway.testing import benchmark_utils
+from bxgateway.utils.btc.btc_object_hash import BtcObjectHash
+from bxgateway.utils.btc.compact_block_short_id_matcher import CompactBlockShortIdMatcher
+
+ITERATIONS = 5
+MEMPOOL_SIZES = [10000, 50000, 100000]
+BLOCK_TX_COUNT = 2000
+# block transactions are picked from the most recently seen transactions
+RECENT_TX_RATIO = 0.25
+SHORT_NONCE = 12345
+
+
+class CompactBlockShortIdMatchingBenchmark(AbstractTestCase):
+    """
+    Compares compact block decompression time of scanning the whole transaction service with the short id matcher,
+    for increasing mempool sizes.
+    """
+
+    def _build_mempool(self, mempool_size: int):
+        tx_service = TransactionService(MockNode(helpers.get_gateway_opts(8999)), 0)
+        matcher = CompactBlockShortIdMatcher()
+        tx_hashes = []
+        for _ in range(mempool_size):
+            tx_hash = Sha256Hash(helpers.generate_bytearray(SHA256_HASH_LEN))
+            tx_service.set_transaction_contents(tx_hash, helpers.generate_bytearray(250))
+            matcher.add_transaction(tx_hash)
+            tx_hashes.append(tx_hash)
+        return tx_service, matcher, tx_hashes
+
+    def _build_compact_block(self, tx_hashes) -> CompactBlockBtcMessage:
+        recent_tx_hashes = tx_hashes[-int(len(tx_hashes) * RECENT_TX_RATIO):]
+        block_tx_hashes = random.sample(recent_tx_hashes, BLOCK_TX_COUNT)
+
+        prev_block = BtcObjectHash(bytearray(crypto.double_sha256(b"prev")), length=SHA256_HASH_LEN)
+        merkle_root = BtcObjectHash(bytearray(crypto.double_sha256(b"merkle")), length=SHA256_HASH_LEN)
+        compact_block = CompactBlockBtcMessage(12345, 536870912, prev_block, merkle_root, 0, 2, 0, SHORT_NONCE, [], [])
+
+        sha256_hash = hashlib.sha256()
+        sha256_hash.update(compact_block.block_header())
+        sha256_hash.update(compact_block.short_nonce_buf())
+        key = sha256_hash.digest()[0:16]
+        short_ids = [compute_short_id(key, tx_hash.binary[::-1]) for tx_hash in block_tx_hashes]
+
+        return CompactBlockBtcMessage(12345, 536870912, prev_block, merkle_root, 0, 2, 0, SHORT_NONCE, short_ids, [])
+
+    def test_compact_block_to_bx_block(self):
+        for mempool_size in MEMPOOL_SIZES:
+            tx_service, matcher, tx_hashes = self._build_mempool(mempool_size)
+            compact_block = self._build_compact_block(tx_hashes)
+
+            for name, converter in [
+                ("full scan", BtcNormalMessageConverter(12345)),
+                ("short id matcher", BtcNormalMessageConverter(12345, short_id_matcher=matcher))
+            ]:
+                result = converter.compact_block_to_bx_block(compact_block, tx_service)
+                self.assertTrue(result.success)
+
+                result = benchmark_utils.run_benchmark(
+                    lambda: converter.compact_block_to_bx_block(compact_block, tx_service), ITERATIONS
+                )
+                print(benchmark_utils.format_result(
+                    "compact_block_to_bx_block, {} ({} txs in mempool)".format(name, mempool_size), result
+                ))
+                self.assertEqual(ITERATIONS, result.iterations)
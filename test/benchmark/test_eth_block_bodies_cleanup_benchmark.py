@@ -0,0 +1,71 @@
+import os
+from typing import List, Tuple
+
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils import convert
+from bxcommon.utils.object_hash import Sha256Hash
+
+from bxgateway.messages.eth.protocol.block_bodies_eth_protocol_message import BlockBodiesEthProtocolMessage
+from bxgateway.messages.eth.protocol.new_block_eth_protocol_message import NewBlockEthProtocolMessage
+from bxgateway.messages.eth.serializers.transaction import Transaction
+from bxgateway.testing import benchmark_utils
+from bxgateway.utils.eth import rlp_utils
+
+ITERATIONS = 50
+
+
+def get_block_bodies_message_bytes() -> bytearray:
+    """
+    Builds block bodies message with the body of the sample block.
+    """
+    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with open(os.path.join(root_dir, "unit", "eth_block_sample.txt")) as sample_file:
+        eth_block = sample_file.read().strip("\n")
+    new_block_msg = NewBlockEthProtocolMessage(msg_bytes=bytearray(convert.hex_to_bytes(eth_block)))
+
+    # block body consists of transactions and uncles of the block
+    block_body_content = new_block_msg.get_block_rlp_view().get_items_bytes(1)
+    block_body_bytes = rlp_utils.get_length_prefix_list(len(block_body_content)) + block_body_content.tobytes()
+    return bytearray(BlockBodiesEthProtocolMessage.from_body_bytes(memoryview(block_body_bytes)).rawbytes())
+
+
+def get_transaction_hashes_with_decoding(msg_bytes: bytearray) -> Tuple[List[Transaction], List[Sha256Hash]]:
+    """
+    Previous cleanup of block bodies, which decodes the block body to get transaction hashes.
+    Decoded transactions are returned as well, since they are alive while their hashes are computed.
+    """
+    msg = BlockBodiesEthProtocolMessage(msg_bytes)
+    block_body_bytes = msg.get_block_bodies_bytes()[0]
+    transactions = BlockBodiesEthProtocolMessage.from_body_bytes(block_body_bytes).get_blocks()[0].transactions
+    return transactions, [tx.hash() for tx in transactions]
+
+
+def get_transaction_hashes(msg_bytes: bytearray) -> Tuple[List[memoryview], List[Sha256Hash]]:
+    msg = BlockBodiesEthProtocolMessage(msg_bytes)
+    return msg.get_block_transactions_bytes(0), msg.get_block_transaction_hashes(0)
+
+
+class EthBlockBodiesCleanupBenchmark(AbstractTestCase):
+    """
+    Compares getting hashes of block transactions for block cleanup by decoding the block body with
+    hashing slices of the message bytes.
+    """
+
+    def setUp(self):
+        self.msg_bytes = get_block_bodies_message_bytes()
+
+    def test_block_bodies_cleanup_transaction_hashes(self):
+        _, expected_tx_hashes = get_transaction_hashes_with_decoding(self.msg_bytes)
+        _, tx_hashes = get_transaction_hashes(self.msg_bytes)
+        self.assertEqual(expected_tx_hashes, tx_hashes)
+        name_suffix = "({} txs)".format(len(tx_hashes))
+
+        for name, func in [
+            ("block bodies cleanup with decoding", get_transaction_hashes_with_decoding),
+            ("block bodies cleanup", get_transaction_hashes)
+        ]:
+            allocation_result = benchmark_utils.measure_allocations(lambda: func(self.msg_bytes))
+            result = benchmark_utils.run_benchmark(lambda: func(self.msg_bytes), ITERATIONS)
+
+            print(benchmark_utils.format_result("{} {}".format(name, name_suffix), result))
+            print(benchmark_utils.format_allocation_result("{} {}".format(name, name_suffix), allocation_result))
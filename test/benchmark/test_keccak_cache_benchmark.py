@@ -0,0 +1,72 @@
+import os
+from typing import List
+
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils import convert
+
+from bxgateway.messages.eth.protocol.new_block_eth_protocol_message import NewBlockEthProtocolMessage
+from bxgateway.testing import benchmark_utils
+from bxgateway.utils.eth import crypto_utils
+from bxgateway.utils.eth.keccak_cache import KeccakCache
+
+ITERATIONS = 50
+
+
+def get_block_transactions_bytes() -> List[memoryview]:
+    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with open(os.path.join(root_dir, "unit", "eth_block_sample.txt")) as sample_file:
+        eth_block = sample_file.read().strip("\n")
+    new_block_msg = NewBlockEthProtocolMessage(msg_bytes=bytearray(convert.hex_to_bytes(eth_block)))
+    return new_block_msg.get_transactions_bytes()
+
+
+def hash_on_receipt_and_compression(txs: List[memoryview]) -> List[bytes]:
+    """
+    Previous way of getting transaction hashes, hashing every transaction when it is received from the blockchain
+    node and again when its block is compressed.
+    """
+    for tx_bytes in txs:
+        crypto_utils.keccak_hash(tx_bytes)
+    return [crypto_utils.keccak_hash(tx_bytes) for tx_bytes in txs]
+
+
+def cache_on_receipt_and_compression(txs: List[memoryview]) -> List[bytes]:
+    keccak_cache = KeccakCache()
+    for tx_bytes in txs:
+        keccak_cache.keccak_hash(tx_bytes)
+    return [keccak_cache.keccak_hash(tx_bytes) for tx_bytes in txs]
+
+
+class KeccakCacheBenchmark(AbstractTestCase):
+    """
+    Compares hashing transactions of the sample Ethereum block on receipt and again on block compression with caching
+    their hashes on receipt. Cache lookups copy transaction bytes into a dict key, so the cache is only worth it if
+    copying and looking up a transaction sized buffer is cheaper than hashing it.
+    """
+
+    def setUp(self):
+        self.txs = get_block_transactions_bytes()
+
+    def test_keccak_cache_lookup(self):
+        keccak_cache = KeccakCache()
+        for tx_bytes in self.txs:
+            keccak_cache.keccak_hash(tx_bytes)
+        name_suffix = "({} txs, {} bytes)".format(len(self.txs), sum(len(tx_bytes) for tx_bytes in self.txs))
+
+        for name, func in [
+            ("keccak hash", crypto_utils.keccak_hash),
+            ("keccak cache hit", keccak_cache.keccak_hash)
+        ]:
+            result = benchmark_utils.run_benchmark(lambda: [func(tx_bytes) for tx_bytes in self.txs], ITERATIONS)
+            print(benchmark_utils.format_result("{} {}".format(name, name_suffix), result))
+
+    def test_keccak_cache_transaction_lifetime(self):
+        self.assertEqual(hash_on_receipt_and_compression(self.txs), cache_on_receipt_and_compression(self.txs))
+        name_suffix = "({} txs)".format(len(self.txs))
+
+        for name, func in [
+            ("hashing on receipt and compression", hash_on_receipt_and_compression),
+            ("keccak cache on receipt and compression", cache_on_receipt_and_compression)
+        ]:
+            result = benchmark_utils.run_benchmark(lambda: func(self.txs), ITERATIONS)
+            print(benchmark_utils.format_result("{} {}".format(name, name_suffix), result))
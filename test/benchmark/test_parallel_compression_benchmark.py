@@ -0,0 +1,87 @@
+import os
+
+from bxcommon.services.transaction_service import TransactionService
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.test_utils.mocks.mock_node import MockNode
+from bxcommon.utils import convert
+
+from bxgateway.btc_constants import BTC_HDR_COMMON_OFF
+from bxgateway.messages.btc.block_btc_message import BlockBtcMessage
+from bxgateway.messages.btc.btc_message import BtcMessage
+from bxgateway.messages.btc.btc_normal_message_converter import BtcNormalMessageConverter
+from bxgateway.messages.eth.eth_message_converter import EthMessageConverter
+from bxgateway.messages.eth.internal_eth_block_info import InternalEthBlockInfo
+from bxgateway.messages.eth.protocol.new_block_eth_protocol_message import NewBlockEthProtocolMessage
+from bxgateway.testing import benchmark_utils
+from bxgateway.utils.tx_hash_worker_pool import TxHashWorkerPool
+
+ITERATIONS = 20
+
+
+def get_worker_counts():
+    worker_counts = [1]
+    while worker_counts[-1] * 2 <= (os.cpu_count() or 1):
+        worker_counts.append(worker_counts[-1] * 2)
+    return worker_counts
+
+
+def get_segwit_block() -> BlockBtcMessage:
+    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with open(os.path.join(root_dir, "unit", "segwit_block.txt")) as sample_file:
+        btc_block = sample_file.read().strip("\n")
+    block = convert.hex_to_bytes(btc_block)
+    buf = bytearray(BTC_HDR_COMMON_OFF + len(block))
+    buf[BTC_HDR_COMMON_OFF:] = block
+    msg = BtcMessage(magic="main", command=BlockBtcMessage.MESSAGE_TYPE, payload_len=len(block), buf=buf)
+    return BlockBtcMessage(buf=msg.buf)
+
+
+def get_eth_block() -> InternalEthBlockInfo:
+    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with open(os.path.join(root_dir, "unit", "eth_block_sample.txt")) as sample_file:
+        eth_block = sample_file.read().strip("\n")
+    new_block_msg = NewBlockEthProtocolMessage(msg_bytes=bytearray(convert.hex_to_bytes(eth_block)))
+    return InternalEthBlockInfo.from_new_block_msg(new_block_msg)
+
+
+class ParallelCompressionBenchmark(AbstractTestCase):
+    """
+    Compares block compression hashing transactions in the event loop process with sharding across worker processes.
+    Worker pools are used regardless of block size, so the results show the scaling by core count.
+    """
+
+    def setUp(self):
+        self.tx_service = TransactionService(MockNode(helpers.get_gateway_opts(8999)), 0)
+
+    def test_btc_block_to_bx_block(self):
+        block = get_segwit_block()
+        self._run_benchmarks(
+            "btc block_to_bx_block ({} txs)".format(block.txn_count()),
+            lambda pool: BtcNormalMessageConverter(12345, pool),
+            block
+        )
+
+    def test_eth_block_to_bx_block(self):
+        self._run_benchmarks("eth block_to_bx_block", EthMessageConverter, get_eth_block())
+
+    def _run_benchmarks(self, name, create_converter, block):
+        expected_bx_block, _ = create_converter(None).block_to_bx_block(block, self.tx_service)
+        result = benchmark_utils.run_benchmark(
+            lambda: create_converter(None).block_to_bx_block(block, self.tx_service), ITERATIONS
+        )
+        print(benchmark_utils.format_result("{}, no workers".format(name), result))
+
+        for worker_count in get_worker_counts():
+            pool = TxHashWorkerPool(worker_count, min_tx_count=0)
+            converter = create_converter(pool)
+            try:
+                bx_block, _ = converter.block_to_bx_block(block, self.tx_service)
+                self.assertEqual(expected_bx_block.tobytes(), bx_block.tobytes())
+
+                result = benchmark_utils.run_benchmark(
+                    lambda: converter.block_to_bx_block(block, self.tx_service), ITERATIONS
+                )
+                print(benchmark_utils.format_result("{}, {} workers".format(name, worker_count), result))
+            finally:
+                pool.close()
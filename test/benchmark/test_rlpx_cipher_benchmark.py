@@ -0,0 +1,76 @@
+from bxcommon.test_utils import helpers
+
+from bxgateway import eth_constants
+from bxgateway.testing import benchmark_utils
+from bxgateway.testing.abstract_rlpx_cipher_test import AbstractRLPxCipherTest
+from bxgateway.utils.eth import crypto_utils, frame_utils
+from bxgateway.utils.eth.frame import Frame
+from bxgateway.utils.eth.rlpx_cipher import RLPxCipher
+
+ITERATIONS = 20
+PAYLOAD_SIZE = 2 * 1024 * 1024
+MSG_TYPE = 7
+
+
+def encrypt_frame_with_copies(cipher: RLPxCipher, frame: Frame) -> bytearray:
+    """
+    Previous implementation of RLPxCipher.encrypt_frame, which converts every piece to bytes and concatenates them.
+    """
+    header_ciphertext = cipher.aes_encode(bytes(frame.get_header()))
+    header_mac = cipher.mac_egress(
+        crypto_utils.string_xor(cipher._mac_enc(cipher.mac_egress()[:eth_constants.FRAME_MAC_LEN]),
+                                header_ciphertext))[:eth_constants.FRAME_MAC_LEN]
+    frame_ciphertext = cipher.aes_encode(bytes(frame.get_body()))
+    fmac_seed = cipher.mac_egress(bytes(frame_ciphertext))
+    frame_mac = cipher.mac_egress(
+        crypto_utils.string_xor(cipher._mac_enc(cipher.mac_egress()[:eth_constants.FRAME_MAC_LEN]),
+                                fmac_seed[:eth_constants.FRAME_MAC_LEN]))[:eth_constants.FRAME_MAC_LEN]
+    return bytearray(header_ciphertext + header_mac + frame_ciphertext + frame_mac)
+
+
+class RLPxCipherBenchmark(AbstractRLPxCipherTest):
+
+    def setUp(self):
+        self.cipher1, self.cipher2 = self.setup_ciphers()
+        payload = memoryview(helpers.generate_bytearray(PAYLOAD_SIZE))
+        self.frames = frame_utils.get_frames(
+            MSG_TYPE, payload, eth_constants.DEFAULT_FRAME_PROTOCOL_ID, eth_constants.DEFAULT_FRAME_SIZE
+        )
+        self.frames_size = sum(frame.get_frame_size() for frame in self.frames)
+
+    def test_encrypt_frames(self):
+        previous_result = benchmark_utils.run_benchmark(
+            lambda: [encrypt_frame_with_copies(self.cipher1, frame) for frame in self.frames], ITERATIONS
+        )
+        result = benchmark_utils.run_benchmark(
+            lambda: [self.cipher1.encrypt_frame(frame) for frame in self.frames], ITERATIONS
+        )
+
+        print(benchmark_utils.format_result("encrypt_frame with copies", previous_result))
+        print(benchmark_utils.format_result("encrypt_frame", result))
+        print("encrypt_frame throughput: {:.1f} MB/s with copies, {:.1f} MB/s in place".format(
+            benchmark_utils.throughput_mb_per_second(self.frames_size, previous_result),
+            benchmark_utils.throughput_mb_per_second(self.frames_size, result)
+        ))
+
+    def test_decrypt_frames(self):
+        encrypted_frames = [
+            memoryview(self.cipher1.encrypt_frame(frame))
+            for _ in range(ITERATIONS + 1)
+            for frame in self.frames
+        ]
+        frames_per_iteration = len(self.frames)
+        iteration = iter(range(ITERATIONS + 1))
+
+        def decrypt_frames():
+            start = next(iteration) * frames_per_iteration
+            for encrypted_frame in encrypted_frames[start:start + frames_per_iteration]:
+                header = self.cipher2.decrypt_frame_header(encrypted_frame[:eth_constants.FRAME_HDR_TOTAL_LEN])
+                body_size, _, _, _ = frame_utils.parse_frame_header(header)
+                self.cipher2.decrypt_frame_body(encrypted_frame[eth_constants.FRAME_HDR_TOTAL_LEN:], body_size)
+
+        result = benchmark_utils.run_benchmark(decrypt_frames, ITERATIONS)
+        print(benchmark_utils.format_result("decrypt_frame", result))
+        print("decrypt_frame throughput: {:.1f} MB/s".format(
+            benchmark_utils.throughput_mb_per_second(self.frames_size, result)
+        ))
@@ -115,7 +115,11 @@ class BlockRecoveryTest(AbstractBtcGatewayIntegrationTest):
             self.node1.on_bytes_sent(self.blockchain_fileno, len(bytes_to_send))
             bytes_to_send = self.node1.get_bytes_to_send(self.blockchain_fileno)
         self.assertTrue(found_block)
-        self.assertEqual(self.block.rawbytes(), bytes_to_send)
+
+        # decompressed block is streamed into several output buffer entries
+        block_bytes = self.block.rawbytes().tobytes()
+        bytes_to_send = self.get_all_bytes_to_send(self.node1, self.blockchain_fileno)
+        self.assertEqual(block_bytes, bytes_to_send[:len(block_bytes)].tobytes())
 
     def _build_txs_message(self, short_ids: List[int]):
         txs: List[TransactionInfo] = []
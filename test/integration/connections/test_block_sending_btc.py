@@ -72,7 +72,7 @@ class BlockSendingBtcTest(AbstractBtcGatewayIntegrationTest):
         self.assertIn(KeyMessage.MESSAGE_TYPE, key_message.tobytes())
 
         helpers.receive_node_message(self.node2, self.relay_fileno, key_message)
-        bytes_to_blockchain = self.node2.get_bytes_to_send(self.blockchain_fileno)
+        bytes_to_blockchain = self.get_all_bytes_to_send(self.node2, self.blockchain_fileno)
         self.assertEqual(len(block.rawbytes()), len(bytes_to_blockchain))
 
         return BlockBtcMessage(buf=bytearray(bytes_to_blockchain))
@@ -104,7 +104,7 @@ class BlockSendingBtcTest(AbstractBtcGatewayIntegrationTest):
 
         # block directly propagated
         helpers.receive_node_message(self.node2, self.relay_fileno, relayed_block)
-        bytes_to_blockchain = self.node2.get_bytes_to_send(self.blockchain_fileno)
+        bytes_to_blockchain = self.get_all_bytes_to_send(self.node2, self.blockchain_fileno)
         self.assertEqual(len(send_block.rawbytes()), len(bytes_to_blockchain))
 
         received_block = BlockBtcMessage(buf=bytearray(bytes_to_blockchain))
@@ -213,6 +213,6 @@ class BlockSendingBtcTest(AbstractBtcGatewayIntegrationTest):
         self.assertNotEqual(OutputBuffer.EMPTY, bytearray(key_message.tobytes()))
 
         helpers.receive_node_message(self.node2, self.relay_fileno, key_message)
-        bytes_to_blockchain = self.node2.get_bytes_to_send(self.blockchain_fileno)
+        bytes_to_blockchain = self.get_all_bytes_to_send(self.node2, self.blockchain_fileno)
         block_bytes = block.rawbytes().tobytes()
         self.assertEqual(block_bytes, bytes_to_blockchain[0:len(block_bytes)].tobytes())
@@ -0,0 +1,63 @@
+from mock import patch
+
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.test_utils import helpers
+
+from bxgateway.connections.btc.btc_gateway_node import BtcGatewayNode
+from bxgateway.connections.btc.btc_node_connection import BtcNodeConnection
+from bxgateway.messages.btc.ping_btc_message import PingBtcMessage
+from bxgateway.messages.btc.streamed_block_btc_message import StreamedBlockBtcMessage
+from bxgateway.testing.mocks import mock_btc_messages
+
+
+@patch("bxcommon.constants.OUTPUT_BUFFER_MIN_SIZE", 0)
+@patch("bxcommon.constants.OUTPUT_BUFFER_BATCH_MAX_HOLD_TIME", 0)
+class BtcNodeConnectionTest(AbstractTestCase):
+    def setUp(self) -> None:
+        opts = helpers.get_gateway_opts(8000, include_default_btc_args=True)
+        if opts.use_extensions:
+            helpers.set_extensions_parallelism()
+        self.node = BtcGatewayNode(opts)
+        self.connection_fileno = 1
+        self.connection = helpers.create_connection(BtcNodeConnection, node=self.node, fileno=self.connection_fileno)
+
+    @patch("bxgateway.gateway_constants.BLOCKCHAIN_OUTBOUND_BUFFER_WATERMARK_BYTES", 100)
+    @patch("bxgateway.gateway_constants.BLOCKCHAIN_STREAMED_BLOCK_CHUNK_BYTES", 64)
+    def test_streamed_block_written_in_chunks(self):
+        block, streamed_block = self._create_streamed_block()
+        self.connection.enqueue_msg(streamed_block)
+        self.assertLess(self.connection.outputbuf.length, len(block.rawbytes()))
+
+        # control message waits until all chunks of the block are written
+        ping = PingBtcMessage(self.node.opts.blockchain_net_magic)
+        self.connection.enqueue_msg(ping)
+
+        self.assertEqual(block.rawbytes().tobytes() + ping.rawbytes().tobytes(), self._get_all_bytes_to_send())
+        self.assertFalse(streamed_block.is_materialized())
+
+    def test_prepended_message_written_after_streamed_block(self):
+        block, streamed_block = self._create_streamed_block()
+        self.connection.enqueue_msg(streamed_block)
+        self.assertEqual(len(block.rawbytes()), self.connection.outputbuf.length)
+
+        ping = PingBtcMessage(self.node.opts.blockchain_net_magic)
+        self.connection.enqueue_msg(ping, prepend=True)
+        self.assertEqual(len(block.rawbytes()), self.connection.outputbuf.length)
+
+        self.assertEqual(block.rawbytes().tobytes() + ping.rawbytes().tobytes(), self._get_all_bytes_to_send())
+
+    def _create_streamed_block(self):
+        block = mock_btc_messages.btc_block()
+        txns = block.txns()
+        block_bytes = block.rawbytes()
+        header = block_bytes[:len(block_bytes) - sum(len(tx) for tx in txns)]
+        return block, StreamedBlockBtcMessage(header, list(txns))
+
+    def _get_all_bytes_to_send(self) -> bytes:
+        all_bytes = bytearray()
+        bytes_to_send = self.node.get_bytes_to_send(self.connection_fileno)
+        while bytes_to_send:
+            all_bytes.extend(bytes_to_send)
+            self.node.on_bytes_sent(self.connection_fileno, len(bytes_to_send))
+            bytes_to_send = self.node.get_bytes_to_send(self.connection_fileno)
+        return bytes(all_bytes)
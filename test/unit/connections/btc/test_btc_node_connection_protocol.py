@@ -66,6 +66,30 @@ class BtcNodeConnectionProtocolTest(AbstractTestCase):
         self.assertIn((InventoryType.MSG_TX, seen_block_hash), get_data_msg)
         self.assertIn((InventoryType.MSG_BLOCK, not_seen_block_hash), get_data_msg)
 
+    def test_get_data_only_unknown_transactions(self):
+        known_tx_hash = BtcObjectHash(buf=helpers.generate_bytearray(BTC_SHA_HASH_LEN), length=BTC_SHA_HASH_LEN)
+        sent_tx_hash = BtcObjectHash(buf=helpers.generate_bytearray(BTC_SHA_HASH_LEN), length=BTC_SHA_HASH_LEN)
+        unknown_tx_hash = BtcObjectHash(buf=helpers.generate_bytearray(BTC_SHA_HASH_LEN), length=BTC_SHA_HASH_LEN)
+        self.node.get_tx_service().set_transaction_contents(known_tx_hash, helpers.generate_bytearray(250))
+        self.node.txs_sent_to_node.add(sent_tx_hash, 300)
+
+        inv_message = InvBtcMessage(magic=123, inv_vects=[
+            (InventoryType.MSG_TX, known_tx_hash),
+            (InventoryType.MSG_TX, sent_tx_hash),
+            (InventoryType.MSG_TX, unknown_tx_hash)
+        ])
+        self.sut.msg_inv(inv_message)
+
+        get_data_msg_bytes = self.sut.connection.get_bytes_to_send()
+        get_data_msg = GetDataBtcMessage(buf=get_data_msg_bytes)
+        self.assertEqual(1, get_data_msg.count())
+        self.assertIn((InventoryType.MSG_TX, unknown_tx_hash), get_data_msg)
+
+        self.sut.connection.advance_sent_bytes(len(get_data_msg_bytes))
+        inv_message = InvBtcMessage(magic=123, inv_vects=[(InventoryType.MSG_TX, known_tx_hash)])
+        self.sut.msg_inv(inv_message)
+        self.assertEqual(0, self.sut.connection.outputbuf.length)
+
     def test_get_data_segwit(self):
         self._test_get_data(True)
 
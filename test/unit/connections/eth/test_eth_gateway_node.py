@@ -1,15 +1,21 @@
+import rlp
+
 from bxcommon.test_utils.abstract_test_case import AbstractTestCase
 from bxcommon.constants import LOCALHOST
 from bxcommon.models.outbound_peer_model import OutboundPeerModel
 from bxcommon.network.transport_layer_protocol import TransportLayerProtocol
 from bxcommon.test_utils import helpers
 from bxcommon.test_utils.mocks.mock_socket_connection import MockSocketConnection
+from bxcommon.utils.object_hash import Sha256Hash
 
 
 from bxgateway import eth_constants
 from bxgateway.connections.eth.eth_gateway_node import EthGatewayNode
 from bxgateway.connections.eth.eth_node_connection import EthNodeConnection
 from bxgateway.connections.eth.eth_node_discovery_connection import EthNodeDiscoveryConnection
+from bxgateway.messages.eth.new_block_parts import NewBlockParts
+from bxgateway.messages.eth.serializers.block_header import BlockHeader
+from bxgateway.testing.mocks import mock_eth_messages
 from bxgateway.utils.eth import crypto_utils
 
 
@@ -90,6 +96,27 @@ class EthGatewayNodeTest(AbstractTestCase):
         updated_node_public_key = node.get_node_public_key()
         self.assertIsNotNone(updated_node_public_key)
 
+    def test_try_calculate_total_difficulty(self):
+        node = self._set_up_test_node(False)
+
+        block_header = mock_eth_messages.get_dummy_block_header(1)
+        block_header_bytes = memoryview(rlp.encode(BlockHeader.serialize(block_header)))
+        block_hash = block_header.hash_object()
+        new_block_parts = NewBlockParts(block_header_bytes, memoryview(b""), 0)
+
+        self.assertIsNone(node.try_calculate_total_difficulty(block_hash, new_block_parts))
+
+        node.set_known_total_difficulty(Sha256Hash(block_header.prev_hash), 1000)
+        self.assertEqual(1000 + block_header.difficulty,
+                         node.try_calculate_total_difficulty(block_hash, new_block_parts))
+
+        child_block_header = mock_eth_messages.get_dummy_block_header(2)
+        child_block_header.prev_hash = block_hash.binary
+        child_block_parts = NewBlockParts(memoryview(rlp.encode(BlockHeader.serialize(child_block_header))),
+                                          memoryview(b""), 0)
+        self.assertEqual(1000 + block_header.difficulty + child_block_header.difficulty,
+                         node.try_calculate_total_difficulty(child_block_header.hash_object(), child_block_parts))
+
     def _test_get_outbound_peer_addresses(self, initiate_handshake, expected_node_con_protocol):
         node = self._set_up_test_node(initiate_handshake)
         assert isinstance(node, EthGatewayNode)
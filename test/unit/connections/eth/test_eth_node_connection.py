@@ -9,6 +9,7 @@ from bxcommon.utils.stats.block_statistics_service import block_stats
 from bxgateway.connections.eth.eth_gateway_node import EthGatewayNode
 from bxgateway.connections.eth.eth_node_connection import EthNodeConnection
 from bxgateway.messages.eth.protocol.new_block_eth_protocol_message import NewBlockEthProtocolMessage
+from bxgateway.messages.eth.protocol.transactions_eth_protocol_message import TransactionsEthProtocolMessage
 from bxgateway.testing.abstract_rlpx_cipher_test import AbstractRLPxCipherTest
 from bxgateway.testing.mocks import mock_eth_messages
 
@@ -42,3 +43,31 @@ class EthNodeConnectionTest(AbstractTestCase):
 
         self.node.on_bytes_sent(self.connection_fileno, message_length)
         block_stats.add_block_event_by_block_hash.assert_called_once()
+
+    def test_transactions_batched_within_window(self):
+        self.node.opts.blockchain_tx_batch_window_ms = 10
+        self.node.opts.blockchain_tx_batch_max_bytes = 128 * 1024
+
+        txs = [mock_eth_messages.get_dummy_transaction(i) for i in range(1, 4)]
+        for tx in txs:
+            self.connection.enqueue_msg(TransactionsEthProtocolMessage(None, [tx]))
+        self.assertEqual(0, self.connection.outputbuf.length)
+
+        time.time = MagicMock(return_value=time.time() + 1)
+        self.node.alarm_queue.fire_alarms()
+
+        # all transactions are sent in a single Transactions message
+        batch_message = TransactionsEthProtocolMessage(None, txs)
+        batch_message_length = sum(
+            len(message_bytes) for message_bytes in self.connection.connection_protocol.get_message_bytes(batch_message)
+        )
+        self.assertEqual(batch_message_length, self.connection.outputbuf.length)
+
+    def test_transactions_not_batched_by_default(self):
+        tx_message = TransactionsEthProtocolMessage(None, [mock_eth_messages.get_dummy_transaction(1)])
+        tx_message_length = sum(
+            len(message_bytes) for message_bytes in self.connection.connection_protocol.get_message_bytes(tx_message)
+        )
+
+        self.connection.enqueue_msg(tx_message)
+        self.assertEqual(tx_message_length, self.connection.outputbuf.length)
@@ -2,9 +2,16 @@ from mock import MagicMock, call
 
 from bxcommon.test_utils import helpers
 from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils.object_hash import Sha256Hash
+from bxgateway import eth_constants
 from bxgateway.connections.abstract_gateway_blockchain_connection import AbstractGatewayBlockchainConnection
+from bxgateway.connections.eth import eth_node_connection_protocol
 from bxgateway.connections.eth.eth_node_connection_protocol import EthNodeConnectionProtocol
+from bxgateway.messages.eth.new_block_parts import NewBlockParts
 from bxgateway.messages.eth.protocol.block_bodies_eth_protocol_message import BlockBodiesEthProtocolMessage
+from bxgateway.messages.eth.protocol.block_headers_eth_protocol_message import BlockHeadersEthProtocolMessage
+from bxgateway.messages.eth.protocol.get_block_bodies_eth_protocol_message import GetBlockBodiesEthProtocolMessage
+from bxgateway.messages.eth.protocol.get_block_headers_eth_protocol_message import GetBlockHeadersEthProtocolMessage
 from bxgateway.services.eth.eth_normal_block_cleanup_service import EthNormalBlockCleanupService
 from bxgateway.testing.mocks import mock_eth_messages
 from bxgateway.testing.mocks.mock_gateway_node import MockGatewayNode
@@ -102,3 +109,99 @@ class EthNodeConnectionProtocolTest(AbstractTestCase):
         self.assertEqual(first_kwargs["transaction_service"], self.node.get_tx_service())
         self.assertEqual(first_kwargs["block_hash"], block_hashes_sets[2][0])
         self.assertEqual(list(first_kwargs["transactions_list"]), transactions[2][0])
+
+    def test_request_block_bodies_count_mismatch(self):
+        self.cleanup_service.clean_block_transactions_by_block_components = MagicMock()
+
+        block_hashes_sets = [
+            [helpers.generate_object_hash(), helpers.generate_object_hash()],
+            [helpers.generate_object_hash()]
+        ]
+        for block_hashes_set in block_hashes_sets:
+            for block_hash in block_hashes_set:
+                self.node.block_cleanup_service._block_hash_marked_for_cleanup.add(block_hash)
+            self.sut.request_block_body(block_hashes_set)
+
+        # response to the first request is missing a body, so it is ignored and pending requests are dropped
+        self.sut.msg_block_bodies(
+            BlockBodiesEthProtocolMessage(None, [mock_eth_messages.get_dummy_transient_block_body(1)])
+        )
+        self.cleanup_service.clean_block_transactions_by_block_components.assert_not_called()
+        self.assertEqual(0, len(self.sut._block_bodies_requests))
+
+        self.sut.msg_block_bodies(
+            BlockBodiesEthProtocolMessage(None, [mock_eth_messages.get_dummy_transient_block_body(2)])
+        )
+        self.cleanup_service.clean_block_transactions_by_block_components.assert_not_called()
+
+    def test_get_block_header_ranges(self):
+        block_hashes = [helpers.generate_object_hash() for _ in range(6)]
+
+        self.assertEqual([], eth_node_connection_protocol.get_block_header_ranges([]))
+        self.assertEqual(
+            [(block_hashes[0], 3), (block_hashes[3], 2), (block_hashes[5], 1)],
+            eth_node_connection_protocol.get_block_header_ranges([
+                (block_hashes[2], 12),
+                (block_hashes[0], 10),
+                (block_hashes[4], 11),
+                (block_hashes[1], 11),
+                (block_hashes[3], 10),
+                (block_hashes[5], 20),
+            ])
+        )
+
+    def test_new_block_headers_range(self):
+        block_headers = [mock_eth_messages.get_dummy_block_header(i) for i in range(1, 4)]
+        block_hashes = [block_header.hash_object() for block_header in block_headers]
+        for block_number, block_hash in enumerate(block_hashes):
+            self.sut._pending_new_blocks_parts.add(block_hash, NewBlockParts(None, None, block_number))
+
+        self.sut.msg_block_headers(BlockHeadersEthProtocolMessage(None, block_headers[:2]))
+
+        self.assertIsNotNone(self.sut._pending_new_blocks_parts.contents[block_hashes[0]].block_header_bytes)
+        self.assertIsNotNone(self.sut._pending_new_blocks_parts.contents[block_hashes[1]].block_header_bytes)
+        self.assertIsNone(self.sut._pending_new_blocks_parts.contents[block_hashes[2]].block_header_bytes)
+
+    def test_new_block_headers_partial_match(self):
+        self.cleanup_service.mark_blocks_and_request_cleanup = MagicMock()
+        self.node.block_queuing_service = MagicMock()
+        block_headers = [mock_eth_messages.get_dummy_block_header(i) for i in range(1, 4)]
+        block_hashes = [block_header.hash_object() for block_header in block_headers]
+        self.sut._pending_new_blocks_parts.add(block_hashes[0], NewBlockParts(None, None, 1))
+
+        self.sut.msg_block_headers(BlockHeadersEthProtocolMessage(None, block_headers))
+
+        self.assertIsNotNone(self.sut._pending_new_blocks_parts.contents[block_hashes[0]].block_header_bytes)
+        expected_block_hashes = [Sha256Hash(block_headers[1].prev_hash)] + block_hashes[1:]
+        self.cleanup_service.mark_blocks_and_request_cleanup.assert_called_once_with(expected_block_hashes)
+        self.node.block_queuing_service.mark_blocks_seen_by_blockchain_node.assert_called_once_with(
+            expected_block_hashes
+        )
+
+    def test_retry_missing_new_block_parts(self):
+        self.node.send_msg_to_node = MagicMock()
+
+        block_header = mock_eth_messages.get_dummy_block_header(1)
+        block_with_header_hash = block_header.hash_object()
+        block_with_header = NewBlockParts(None, None, 1)
+        block_with_header.block_header_bytes = memoryview(bytearray(b"header"))
+        block_without_parts_hash = helpers.generate_object_hash()
+        self.sut._pending_new_blocks_parts.add(block_with_header_hash, block_with_header)
+        self.sut._pending_new_blocks_parts.add(block_without_parts_hash, NewBlockParts(None, None, 2))
+
+        self.assertEqual(eth_constants.NEW_BLOCK_PARTS_RETRY_INTERVAL_S, self.sut._retry_missing_new_block_parts())
+
+        sent_messages = [call_args[0][0] for call_args in self.node.send_msg_to_node.call_args_list]
+        self.assertEqual(2, len(sent_messages))
+        self.assertIsInstance(sent_messages[0], GetBlockHeadersEthProtocolMessage)
+        self.assertEqual(block_without_parts_hash.binary, sent_messages[0].get_block_hash())
+        self.assertEqual(1, sent_messages[0].get_amount())
+        self.assertIsInstance(sent_messages[1], GetBlockBodiesEthProtocolMessage)
+        self.assertEqual([block_with_header_hash.binary, block_without_parts_hash.binary],
+                         sent_messages[1].get_block_hashes())
+
+        self.sut._pending_new_blocks_parts.remove_item(block_with_header_hash)
+        self.sut._pending_new_blocks_parts.remove_item(block_without_parts_hash)
+        self.node.send_msg_to_node.reset_mock()
+        self.assertEqual(0, self.sut._retry_missing_new_block_parts())
+        self.node.send_msg_to_node.assert_not_called()
@@ -60,6 +60,24 @@ class AbstractRelayConnectionTest(AbstractTestCase):
 
         mock_handle_decrypted_block.assert_called_once()
 
+    @patch("bxgateway.services.block_processing_service.crypto")
+    def test_msg_broadcast_hashed_while_read(self, mock_crypto):
+        hello_msg = HelloMessage(protocol_version=protocol_version.PROTOCOL_VERSION, network_num=1)
+        self.connection.add_received_bytes(hello_msg.rawbytes())
+        self.connection.add_received_bytes(AckMessage().rawbytes())
+        self.connection.process_message()
+
+        msg_bytes = helpers.generate_bytearray(5000)
+        msg_hash = Sha256Hash(crypto.double_sha256(msg_bytes))
+        broadcast_msg_bytes = BroadcastMessage(message_hash=msg_hash, network_num=1, is_encrypted=True,
+                                               blob=msg_bytes).rawbytes()
+        for chunk_start in range(0, len(broadcast_msg_bytes), 1000):
+            self.connection.add_received_bytes(bytearray(broadcast_msg_bytes[chunk_start:chunk_start + 1000]))
+            self.connection.process_message()
+
+        mock_crypto.double_sha256.assert_not_called()
+        self.assertTrue(self.node.in_progress_blocks.has_ciphertext_for_hash(msg_hash))
+
     def test_msg_tx__full_message(self):
         tx_service = self.connection.node.get_tx_service()
         short_id = 1
@@ -1,15 +1,18 @@
+from bxcommon.exceptions import ParseError
 from bxcommon.test_utils.abstract_test_case import AbstractTestCase
 from bxcommon.utils import convert
 from bxgateway.btc_constants import BTC_HDR_COMMON_OFF, BTC_BLOCK_HDR_SIZE
-from bxgateway.messages.btc.btc_messages_util import btc_varint_to_int, get_next_tx_size
+from bxgateway.messages.btc.btc_messages_util import btc_varint_to_int, get_next_tx_size, get_tx_boundaries, \
+    is_segwit
+
+SEGWIT_BLOCK_HEX = "0b110907626c6f636b00000000000000761701007be2ef740000002061a38b7ac56d7b3697d93618442c260c9d1b1993a5b8d3a33fe6140000000000c2101fd21ed2b31e4e07c605a066f6a7c9fab21c49e02eed3781778daa39eabd214a475c0335011ad84b9f1141010000000001010000000000000000000000000000000000000000000000000000000000000000ffffffff1f03282e1604214a475c00a071844f742400000c2f4d696e696e67436f72652f00000000020000000000000000266a24aa21a9edcfb4ccbe7b5d9497dd2856c64031d29791ac2b606ec8e82adc260898c1eef53e612eb104000000001976a9146d0ca0a7bb477b9327dc7f48431ab4421570e09a88ac0120000000000000000000000000000000000000000000000000000000000000000000000000010000000267d47cfe70b562ca722c5c5d5ca52a3fa0d056e7e7661db8d12c0f1595c10cd0000000006b483045022100d005c2954f9bf9e8ac7c066fe77ce6389149ade3112c607e6f98172c3c6d926702202939a3778032a3856d3c0ab98b945f1cebdaac9ee3b19df360b3221ac8cab6b6012103d06840fd042383b504d910d20a505845713873b24b9966dbd60acf748bc833e9ffffffff3de7fe8f33e73c474a6c8878e2a2ca14dfe78d6006f81f77d776389d27773d2e000000006a47304402206b3f7022c916ac48f6bd09865f72b644fad578cec35c49a0d4e9dac240c55ad702200b2d17db54c99a45012a87cd270c650e5f0e8ce15b84c55ce2361baad85a105f012103d06840fd042383b504d910d20a505845713873b24b9966dbd60acf748bc833e9ffffffff0240420f000000000017a9143c1e28666dfcd79c76fa856c64e4197217272f8c8780fc0a00000000001976a914f12f2c6e408b3cdff1991b8783d1eb428f57814b88ac000000000100000002e8145bc1a8495f9f2dc5112574ee1319f30e9bd6b8c897dc6761c7db178da19c010000006b483045022100ac2e0583388ecba84b9eb6cf6300d4b01ffcd43bf98ee3449c1a93700cc0adef02201b8d46edd63f2580879aa193b2178721561686f950b7f14d6ed776a806c67cff012103d06840fd042383b504d910d20a505845713873b24b9966dbd60acf748bc833e9ffffffff9a33622c4c14ab9862f421e70150e168be588f855a43f14b9bd9ba3efe026bc8010000006b483045022100967afc73528cebf7ac067e5531166aa15638625b900d0ffaee28e3eaf3f49b510220699a4ec1e504300635770a5fa1d8fa5936a8f62931ea95049f3a40d6a4666c4e012103d06840fd042383b504d910d20a505845713873b24b9966dbd60acf748bc833e9ffffffff0240420f000000000017a914ab17cf9a504c530c6ca65564c9faa401086df4f987b8308814000000001976a914f12f2c6e408b3cdff1991b8783d1eb428f57814b88ac000000000200000001dba64d852b4eb5b4f1baf00d6f1838a53d15e356f41106963eb9ec20c77bf829010000006a47304402203dbdc88bf58a934a0b88860dd41de6e639c2ce135d8c86ab7062427b633d17d402207243a2924a755c1b555999f11e847aadc93b17d71cc00526f72b6624376755f6012103f0937a3abc7cf55ee7ede5ecc2a5d8665f4e0f56bf20b4e2bb9a99b2023326f7ffffffff020000000000000000256a23535701966512ea19e958c9644ef61d3aa0a3f5a259770d0f5e790e3aabb51bbc83d36438842000000000001976a914bdad1f4d02035b61fb1d237410e85d8402a1187d88ac000000000100000001dfd3eacf4bbe813a6f74270dd43fa02b195313f482e64478afaea504bd635cbf01000000fd5d0100483045022100de907ffd497cf54ceef155adb2bc5015e0d5cb1847e6db3a6bd1658e46eca77e022032fb6cd66af8b047ebdfba79151a062aa9353990311b5e86e91f7b3862358e9601473044022070b9cbaa95f225d89d6d4210294e1351317393046a86c88d4fe65240fcf975c5022057c7e2d2842d6e33dcc9a43ff135eede351a5df56a06f9fdc0e20f8ff5a4b185014cc95241048aa0d470b7a9328889c84ef0291ed30346986e22558e80c3ae06199391eae21308a00cdcfb34febc0ea9c80dfd16b01f26c7ec67593cb8ab474aca8fa1d7029d4104cf54956634c4d0bdaf00e6b1871c089b7a892d0fecc077f03b91e8d4d146861b0a4fdd237891a9819c878984d4b123f6fe92d9bbc05873a1bb4fe510145bf369410471843c33b2971e4944c73d4500abd6f61f7edf9ec919c408cbe12a6c9132d2cb8ebed8253322760d5ec6081165e0ab68900683de503f1544f03816d47fec699a53aeffffffff02771d1600000000001976a9144e434f5394c0ebf5659a8a4054f2312b724f10a488ac82d6f9010000000017a9145629021f7668d4ec310ac5e99701a6d6cf95eb8f870000000001000000015b1de0c487d74fa4c2c1703599813fa43ec6947da7eabb35a6f11b645010cade000000006b4830450221008ae0b950b302d59fb6807cbe68acab60fbd50b646205880f8b07378bab480173022067cfc333724a624050aaa52ddd695cfeba0184ae9c3e84483d0674414edc604f012103484baa53718094bc00f4d9c48be6d1abb06d282a0e9160910addd9b5c86d4588ffffffff01070c15000000000017a9145629021f7668d4ec310ac5e99701a6d6cf95eb8f87000000000200000000010129e90e1b145dc795ca701cd42cb668f9d1cc2c3a24b26c801f6b20ea4b2723130000000017160014ab47d387fb53e371d777721e7f5283ccd916a9ccfeffffff025833db650800000017a9148154aa08ab384f2a5b937810407d9376ff262d35878d55a7000000000017a914c6953734bacc2f899450175de465f965be0a0f6c8702483045022100c9c7ff70f1bae23ef5104775422c57800dd4a21ebbc1282d9e2d83befae9e16c02206ddd1c56d00f8c7411fab61aaf7ed742c446ffb19cd3425aee19fc4be1806ba801210251c35898c351a535daec06434f0506ce0e893e9afd3bfff147cd2bc6f2773b2d272e16000200000000010198fb9eaa9951fcff8408404144ae9074b38adb870ba053f082ab5ed87af84e4e00000000171600143645f37194c312881c0146965377f81173a32fa7feffffff02a0309d010000000017a914ac2a4d0b5260645e92e3891e88e3e80231059046873369d7540500000017a914cddb1ce06ffee4597419b13759aa748393baefb187024830450221008858f6b6fd52c3cac6c6c95ed89aea2ec4e95593f52a1d07427462cb34585ad4022027b350ed8dd78bf0cf4a9719546a7d4938cee2d15967b2d35e8d2ce5abb219e30121020aa8861a3a87bc2bd44c5aa4217987487b3c22a36e88fd087a5dfb4efe42c59a272e160002000000000101168069c5f80626250a09713ee253dbfaef4fdbe32f617d3ccf8ef294fb6990dd0100000017160014f39ff8983be60886862b727a3456aec819428418feffffff02217eb02e0c00000017a9143216c93a28f69bd8cbb686bfc5e598316a2a4a9f87ea20a600000000001976a914f497b30fe0396a0b06e2dc92e9d3c89c9461790d88ac0247304402204b6b09f5fc2762674ad1d2093bc5060c6957572bc88e4b85419a0cdd9c7b256202204febc4a55abdff6a216496e4a4c733c963215be21eee379b322d4ef91bbec64e012102b9c0104a08835542d217dda7397767058313632109b83b9d5494de097da2e4f2272e160001000000018a633d916565583db78273cfa512bbfa4cf4469d59885952795946718e22ab89000000006b483045022100ed4e2c4d24d86f03963045ca655b4c5cf3ba47e1e4c9fdab5bc8211e5088945002207b69f123ea77785565cd0b4da437c50bf9db9a6d14ef03a684edcf8be7f70c0c01210358670ef559d5ff2f4032b66c6d8eafa87feeafaa2f4b52db90300aef754b7cffffffffff02c16dfc01000000001976a914bf1e72331f8018f66faec356a04ca98b35bf5ee288ac0000000000000000226a20bd5c41369a4e694050452c895351722b951c99ec4523a373ca82cea86f6e162500000000010000000129287a78bc080d7b9572bbe9bfe5baf11051805dd8f33ee97789ff47879ad94400000000fdfd0000483045022100a24a466667dd5ef8247ebc64987587f04ea9a9906712ec19bb6e4d80a82728d70220433e33cebb8386ba9f6e4a1261f376fb138dc2d3c325b226707c93fcd2772182014730440220159dabd708f637982ee616f0f6f9bd403f88141adebf5b375cae3524f57687b2022056ae534b3bf69c7e31095aeabc5e2ea5a0bc45ff2f0b37eeac6a2a3a2e6dfdf6014c695221022650f60dab18fd397f5f8e09e6327f692e6f7949d2ac17019437b988bac1ca80210385e8679c18eb0dd00d1d497ff7773eaa8caf1ca0a48d05eec9d5924ccc458a452103a38489db89bf9c36e3706470af4e5adcd28171d12bbae0c53743dc435bf578ab53aeffffffff02a0bb0d00000000001976a914f12f2c6e408b3cdff1991b8783d1eb428f57814b88acd82a01000000000017a9144841f2154df82090fa4e2170b5c9e7e97323a1b787000000000100000001093f4b7fe3671a24608a9e709bb3dcde71ca923c24b0908e0cfdefd31ce1ecb800000000fdfe0000483045022100f4a1902927374ff1f437f09595dfd9144eac46636365f9ad0c85d2d387a3d8d40220432a953071408af828364e12305bd697f2260af581a9823fde1bbe8a1832f7bf01483045022100c72ec73f60fd966a85a4d0544f283447226aa8515c3816b405b49757679bb55c022020db4845d060f61567c8bcb602018d5bd764c30546a17bce1bef8af2920cda06014c695221022650f60dab18fd397f5f8e09e6327f692e6f7949d2ac17019437b988bac1ca8021025d2bddb2f844f8edf69c87cd2aa21ed8a5fa5142e33a4b0c9120474033f3c6e62103a38489db89bf9c36e3706470af4e5adcd28171d12bbae0c53743dc435bf578ab53aeffffffff02a0bb0d00000000001976a914f12f2c6e408b3cdff1991b8783d1eb428f57814b88acd82a01000000000017a9146f920eec498c4506fd8a96b14c9de8458d4363168700000000010000000001017866a14ca91641aa002618126e35e82c2b925bf8dee54995afdd5d77b732b5ef010000001716001431633dde18be694a5d1f29b3d47d6692a1cf9bf9ffffffff02486c3a0000000000160014cf86b95cd263bb316f3c5f99b3e4fa6e22ea74c0e7d55700000000002200200a6aeeff1118d80cf7a038fe5f4320a282e68742acfbc9b8aa5420a9be2d518b024730440220039e436da58ada9633e987555c79beb169eda1381907e8f1231bcb28c664b822022001d6efee0fed3a84c06d65acd4189b524b418d949577b1fdfade36d9cf38717d012102cd69d69abbe9cf4db40845fc3b74426555a964077969c46ff3237dc5c6a5d00b000000000100000006beaee69b9fe111c8343ab75279ab94374b951395857d2669fac37d6fa7b42400000000006a473044022034192b4927db7514541fb360a26f0cd33b37903023e274794935e37eeca8b73c02202d0c1e37ef9e9c1c93a9e66c7c4ab7dfd2fbdb2a49a73851a8626a9b6eed8345012103dc107e1d9be2a08a2d5c5dcec5adda0127875c52f3dd2f94289373b55a5e6a06feffffffaffe7e5fc069fc8f1e437f1f3b67cac823789b9a7d13a8113654533fde9d8e19000000006b4830450221008e90e296a175b7497ff7d8e01954d784f705b2602e94c5341ef2e13bf0ea032502202aa096f4e07c4b135b1158439a710e56351162a50fde53e8cf226b902a449ae6012103dc107e1d9be2a08a2d5c5dcec5adda0127875c52f3dd2f94289373b55a5e6a06feffffff87fb2e1475d3f5eda484e29617935056180b6625a2c45f489e3923fcd3552685000000006a47304402207ff85f6ff701d169fae5d95d36affd71b87cb571e68917e15638f99de5c8c2e102200f9ab2452d482317ed7313384193675852eb75b56f2ab8ffeddaae41099e3b80012103dc107e1d9be2a08a2d5c5dcec5adda0127875c52f3dd2f94289373b55a5e6a06feffffff7c32e379dd9c6c544ac740d8ec8932c5f91705dbe11c17e36b1be5ee2866a1a0000000006a473044022011756409a24b70345c66f81a825589a10a640512b54e63183e50829543f0cd130220085ec0324a44042ef221d43bd3cc165d3c4ad45d74f887a307230e6a73e5ef61012103dc107e1d9be2a08a2d5c5dcec5adda0127875c52f3dd2f94289373b55a5e6a06feffffff273a3c362d9e3a76aa3d43e56f420f6605706bcc7c31bcb663a52b86f68fd92f000000006a4730440220486e52a7b5d24a5264d6bedbde62fed1ca0bf2dcbe2efb08f492768ff0c7efd202206c0fbdbb2f3489ba3040aaafdc797ee99f9131d70ec0efd92995eee143c0e6ae012103dc107e1d9be2a08a2d5c5dcec5adda0127875c52f3dd2f94289373b55a5e6a06feffffff2014abfef2891d3e9f4d46dd4095a80af5d6a9e3b4c0ede4a8100d1935b4a572000000006a47304402204d2b1e7b646fe65fbaa8f45664c7571f13d96627ec32937c9630f689a52bb2f40220092c00254a3c45c70c525866316726168f3ac5bd373b49941b78526f2b10f5db012103dc107e1d9be2a08a2d5c5dcec5adda0127875c52f3dd2f94289373b55a5e6a06feffffff0280969800000000001976a9147b8fc1ca8b173b7ba08320f26b0127239ed6040f88ac88933e02000000001976a91448c9dbf253a849e14523aa49f48cd05d04fd569388ac000000000100000001f59173ba2426d9938452d0fd0fec517fa9fb6fb56c9d799b48fc95809cff4341010000006b48304502210087b051d6d719082fe0001db04b72bf6e0dfdd7b3ed89af6552e167cd1d04e3b5022019e85854e07f834bab93a8032d362131544ffda5c84ac2da32480fae8c1f48300121027fb2a4204619886bbf6b83045ffaf8036df5fe9c5c3aca00c765d9dc770b169efeffffff02289a01000000000017a914d07d06e0b8def3e701aa4d53fa1ea89d2b6058288730e43700000000001976a914a0da45c432fccd8cfb6a29f993d2a227ed780f5b88ac0000000001000000000101aa354ea6163f86775f68108421428290d09431b5ba0c967dc6f2eeb85f23fca3000000002322002097e5b78f426276cb8feddf09a460ea23062466d9b4b898d1c933b085c9909d26ffffffff02a0bb0d000000000017a914f8b769031f8b511d12938d10032f02fe7cde519387827201000000000017a914b7202c112fceb9292f0ba4df599cd9f45d12132b870400473044022038212d1f2a733a657dc26c9995720df6aca6203a6204770ac1d175536fd96785022000f40d0e67e6eb547ab35d305e6ed5b2b8d05d1ac6bea496bd5dbd4f0311bc800147304402200cc8a3e780037a65193c7e08b03cf841ad5fbf86510916f73f8f0fedf900fe8f022037413def7ed471c02efa40aec0d66139a37ee9bc2429957d17e95b5cd34b07d4014752210319b491f74221ac7e7185e172e297b65b8ff24bcf32ed78c7479161b2f185bbc42103f50b2db2984e8741da7e7b89737b4700b938e77fbee7c5c148dd09496ca1d76852ae00000000010000000001013a4f99f51984548906bd10cff6a251c478c90faf87fbece920330132832cc97d01000000232200200ccf0c84714ac0e08870e25a5a41d6d7a1e2d771fc1c1b16798699f49570d641ffffffff0240420f000000000017a914180c78310f1440da67e6fd07446992e62598caba8736fbc6000000000017a914b8a173e2fc78c13b753757839b0e24be0e26f7fb8704004730440220500b6df55815183a5a455d79b8a605d1f627aa4675c66280ea91966e72511100022033dab55e3efe192bd8342e60479610a2ebe72092852352d225bc944b7d2f722001483045022100b3e9645b06521c32ffeb152ea702449b7f0b6d42507f6eb947fef091c48ae84602207510d389cb53e491c63e186555f8fe06e383a61fd10a7f7862c31abeb25c83b501475221027793a67aee7421002b7efc51ac87de9371fdef93c215964b22a9ef9cf94a938e2103f50b2db2984e8741da7e7b89737b4700b938e77fbee7c5c148dd09496ca1d76852ae00000000010000000001016f5a9f008ec0ee750368cd1b0b06d95ecd8f662332264a27ef121db95bc7bb680000000023220020bcb29feb381341d473d10981927c8c35be4490d71591e5df1e579506e1b6188bffffffff02a0bb0d000000000017a914c186f0062607836020ac1b3fac0eb610e0f0f31c87827201000000000017a914180c78310f1440da67e6fd07446992e62598caba87040047304402203e3f1359d8b9fb5bacc7178c9d73e9a756fe9c111cee3030e778357c72205bfb02207f97a1f443e0ab44b9d8523c9ac1dc374878a30f30938f4acc8d12537692b46501473044022038cd47a4e4881e2ad1d07958ca4068bf766c4772dbd8203ce3621fbfeed25419022061b4b673c27e98693118025851cd7896f0312814dca78c2a7277d5554c91aa800147522103d49f0188ee092a752dd56069fb54bc2cd65f3cc76931cd4c91fbab35b98de8a32103f50b2db2984e8741da7e7b89737b4700b938e77fbee7c5c148dd09496ca1d76852ae0000000001000000000101dcd76aa69f456760d96933a3eadc82a7bb9fef79a9175e48ea28fdd21cc71c280100000023220020f8559c2546d91832e0efbafb8d6ef7f7387bcc09620dff9d759ea1458d5f9d4effffffff0210270000000000001976a914492fce1025793ea7e8609161b2cc6cde64d9ecf288ac202a37110000000017a914816f7da5de170bdc9e4f3330187b39dc628482b7870400473044022025e5ac2ebddda7db3cb2dca34cfb3ccb21a94c4359574bc8194e6308a54f975002205ba36363716652494f12e399d8cb4174d4bc1a1d0c6aac138040cec23bd3e12b01483045022100dd2684068f159cc0bbfd96f7719fe2eec5a91c448870ffc62318b7381d257e89022016ba279d33db64cf29dad9b60ce261ab34b8ba6b047da049d2d192392ad3e4d20147522102e5d9d885abb3113ab4dc311059aa5ef53f304fa959102c7d1bea40232c4aa3b52102c32a93442754b82030f6bce634cb2e09b4dac8d91937fc9c03d52592e0722bd652ae00000000010000000001011a993448a04a1342dfe7aae4e8ae6fdf59eabf629a67492b56d21420f5d8eff80100000023220020f8559c2546d91832e0efbafb8d6ef7f7387bcc09620dff9d759ea1458d5f9d4effffffff0210270000000000001976a914492fce1025793ea7e8609161b2cc6cde64d9ecf288acc0ee36110000000017a914816f7da5de170bdc9e4f3330187b39dc628482b787040047304402205e09011611cab6e21c9cb9e71c3bf10390d4a6031fd931dcaf52fb8ed40f0be5022023a03c91bded2a14752170f462d7390e23c0d975c507765f378b005e98e0f75301483045022100d9bdc1de9fc231ea515fd2441cf5ce9d57af508c3ac0b9d14d716378ddd0872602203b4e3a314eea56b813e8c352875ac1080e47b6d5c7e57837e26dece85ce1dd140147522102e5d9d885abb3113ab4dc311059aa5ef53f304fa959102c7d1bea40232c4aa3b52102c32a93442754b82030f6bce634cb2e09b4dac8d91937fc9c03d52592e0722bd652ae000000000100000001847ed2c362cd9409cc1f7dcaa6610a4c28dc59859172cfcc30a729a194ce8f8e00000000fd5c0100473044022014cdd8c30cac95f87d6523c02c672634d86107e9cf919cf9358a55e5886e870802204161442f8d0a7e7baca076e3e7ae1fc976244970c8b9805c583953bcb541cad70147304402207207f128cc8210c9a6bddcce147d355e65b8f5dc65a7c83483ae4eb859ce126c0220175ea6f58a8a986a46111820459499a816f78c5c360ec659bd1c5530e575df29014cc95241048aa0d470b7a9328889c84ef0291ed30346986e22558e80c3ae06199391eae21308a00cdcfb34febc0ea9c80dfd16b01f26c7ec67593cb8ab474aca8fa1d7029d4104cf54956634c4d0bdaf00e6b1871c089b7a892d0fecc077f03b91e8d4d146861b0a4fdd237891a9819c878984d4b123f6fe92d9bbc05873a1bb4fe510145bf369410471843c33b2971e4944c73d4500abd6f61f7edf9ec919c408cbe12a6c9132d2cb8ebed8253322760d5ec6081165e0ab68900683de503f1544f03816d47fec699a53aeffffffff0202201600000000001976a914d4554500de53d1d2c8f2319f92bdebb8f6e8c97888acd1ba8c020000000017a9145629021f7668d4ec310ac5e99701a6d6cf95eb8f87000000000200000001166da822091a4c67aebf4d2b7dd96cbe043a43d3f949c8dade50381cf02cbf82010000006a47304402203a87d337f940eca6d8d0471ae559199048e12bb3f8c4440731dcd6d3964b2a1a022010949f8e41405e261e3d473341d9c6b7185318b4a4b9fcdb1d49371c4cae78fa0121033703fc32419585657ee4cdea798d511624ad3031bec6a773fb1669001656a364ffffffff0210270000000000001976a914492fce1025793ea7e8609161b2cc6cde64d9ecf288acb026e70f000000001976a914d23fa1ac34074745d8eb964c8b3a7ec11828c62888ac000000000200000001f2aa10ec7504c38b9016ec18190a0fff8313d36e06d5dccdf0c240c8ad51d3f0010000006a4730440220052a505c2ecbb408ca4aaba0bb4f1d12f59cc026c162d923a46c2965a823f15302202d065473079f59593523aaa0a063fcac385a4a480a9facdb68096a1b200c09d40121032128d388d639cc2f5a101f70c6d34b306d160228c8482d1c43a23a5295e0d0e1ffffffff0210270000000000001976a914492fce1025793ea7e8609161b2cc6cde64d9ecf288acd59e9009000000001976a9141b77b73f47e5581ffa64fa75535a3fdde42ec50688ac000000000100000001ae5b87cb7e0fc1028fcb0d0ccf559f23bc9afd528b12a23a7b2d7ec1a6b8c787000000006a4730440220399e0876eba69348cf19574780647dd3a0d54e3e2fecd4503ae15af3f2c8da970220672f9da5c7c6c0a04d200b1e880b5394af0728b2c07201aafc43ff11fc2e8422012102f0a5a088427caeb5d1da04d577252b58c920b99943179cf8055802d16f6cb6a3ffffffff020000000000000000426a40c2b1c3b9c3b9c3adc3a6c3abc3a4c29dc3b4c3b4c3b4c2abc3a4c3acc3acc3a4c3a9c3a2c2abc3a0c3acc3aac2abc39fc3afc29dc2aec29dc2aec2adc2adc2ad0587c700000000001976a91450d448e9e5b9ff77fe55f8b12aee4514fbd6386688ac0000000001000000014c61bfe477e4c84ece13ce2df5e172355ec0f2d72c9857f84d02b57de446f2f5010000006b48304502210097f60999871a4a75d080d6eaf053620d5799368ebe1be9944a8d534ea488a63202201e58932e364275b383c7f1374947887c6effad198152b2c7999b4fb9b6232ed8012102f0a5a088427caeb5d1da04d577252b58c920b99943179cf8055802d16f6cb6a3ffffffff027d73c700000000001976a91450d448e9e5b9ff77fe55f8b12aee4514fbd6386688ac0000000000000000426a40c2b1c3b9c3b9c3adc3a6c3abc3a4c29dc3b4c3b4c3b4c2abc3a4c3acc3acc3a4c3a9c3a2c2abc3a0c3acc3aac2abc39fc3afc29dc2aec29dc2aec2adc2adc2ad00000000010000000195dc9c0ef75f8a7619e203c4a155778c6e0818a5a593624425b9fb879817f1d9000000006b483045022100f459f5a0ed9ff93b81dd39a04c3ad3db52e08603a1ad20478a2058888e152c98022054a503be5ab5f27d3e20e93e64a023e4a7a35e6fe2b93208833ff63726c5f4e2012102f0a5a088427caeb5d1da04d577252b58c920b99943179cf8055802d16f6cb6a3ffffffff020000000000000000426a40c2b1c3b9c3b9c3adc3a6c3abc3a4c29dc3b4c3b4c3b4c2abc3a4c3acc3acc3a4c3a9c3a2c2abc3a0c3acc3aac2abc39fc3afc29dc2aec29dc2aec2adc2adc2adf55fc700000000001976a91450d448e9e5b9ff77fe55f8b12aee4514fbd6386688ac0000000001000000018d7cc3c5112dc8d409d19663a7709ff93d4e6930fb0f1658e2c8b854359770db010000006b483045022100b48a973e42a375898f90ef509a741aee016272f887833d0f55bae5b127e1465c022009bdba5fa7c9f6b736db5618d5145656cd658a7f538574484a7ab8fdff1f68b8012102f0a5a088427caeb5d1da04d577252b58c920b99943179cf8055802d16f6cb6a3ffffffff020000000000000000426a40c2b1c3b9c3b9c3adc3a6c3abc3a4c29dc3b4c3b4c3b4c2abc3a4c3acc3acc3a4c3a9c3a2c2abc3a0c3acc3aac2abc39fc3afc29dc2aec29dc2aec2adc2adc2ad6d4cc700000000001976a91450d448e9e5b9ff77fe55f8b12aee4514fbd6386688ac00000000020000000152e43e3e4a93aeabcbda763c9ffd72ce46e5dd2462462dcb1d16e190a5d3fd2801000000fdfe00004830450221008ecb2511b7beb4ff494496967421304dc0c564b7f9357c3a697207fa8859cdd702201a883ff90e9e57676d210610978cfaf729a6198c744a83c9fdf30a6193be3ce901483045022100cccc710a6ca9b823c5a27125ccffafbd9faaddb6f91f0b316338e4d7ac38566e02200f13b3340cc6bf27d18397b17bdc36a75fc0a08d5cf5324b2e1ab6bbb9927969014c69522103c96dd608e178d4326b54faf7f927f49f4af30108c4f5fe0fa095fb1fcf450ed92103f7c0234bc223da9ae29dec220451bee6534554bf06c26c2962698ed1a227922a2102803acd8b52cad3a7f1e4eb3af76356a38177cb92fd28aaac52a3d7e0aca65ebe53aeffffffff02804f12000000000017a914a78c8df61709bda21c3a179d6829f6296d215bc987e6d9c1000000000017a91400da8e626fb6a57eddf48463ac5edfd1b992362e870000000001000000000103b99373125a053d92a2330d4242d65bc3796a0f2c0da8c92e9ad6ecf216d3136f0100000023220020ee3be5477276bb4a92837a58c3464a453e0af1197745fbd539e85c3a5bb79007ffffffff580eaa9bbdd4500d02f3b2b1dd1f3ee8343c7d0c0d26750cbaf378972e76947a0100000023220020ee3be5477276bb4a92837a58c3464a453e0af1197745fbd539e85c3a5bb79007ffffffff5c44dfff8473e54fcfe8ff784815fe1b87db034676d3ac0b19edb7a6aedaa37e0100000023220020ee3be5477276bb4a92837a58c3464a453e0af1197745fbd539e85c3a5bb79007ffffffff029ab522000000000017a914404dd6af6d1a6c3d95a8ce4b4610922112a4b4898765e70a000000000017a914d736a738a6f2444a829b216e33bc7357a567792787050047304402206612dc4e225cdaa8fc36c44fc688bf084c5d7e0f613d8f8a2ccc6d519358119302203ce713426232452412ff2a25bc476919bb261fa9200da068b2305f8e2b8790de01473044022012e2998e3bbc3b71850ffbc2a471e972639598cfa6f86c25541ccf337102db45022042e5f91631c57410250bdef4b592a61bbb4b4187447ca8d0d07faacdfe2d2d7601483045022100fb71373d27eda0da09c1f24b2d357a715464e844aa6d11d6111dfabba96ca7c802205995ade49f656a8d46f56f491b554a07b2ba02788c973866a43784c55f1b03d4018c21027b34fc673cf918a3638dd7138e167f85f47b26e2d83cfe2387353aff3a46238fad5221032ade5a75c0dfa7fefd2fda11efc66987a21aff4ec6bcc55f66ea7729d20a7a152103a53acf7bf86f19b4749d9f005c316e58f8fe4ec8b5bb5f96aecca8744bde552d2103f72f1126c21923a1bc9183a864dad5909ac01bff9f94015e3ee231fd12cf62e353ae0500473044022020dcfdcbdbe7d351878272c0a790d6ed2ae6f14571b99ef3329ba7c84a558ba5022052411ab03cdd09f7935be3a97790b4c5c3636e91dbec804aba0640f152425c6f01483045022100e96f597396f9ddf0acd65a4037fa56d3481963be93fb4357379e6486444a04b102204d285b650406c01a77002fe1c223f19b239b458558d901c22cf13e03aaa38ace014730440220247f40759f6d847594ce0b9f9f64cf04fe173983428d9faea080c7d76838736a02200c19a4cc60ed8636ece8078379685bf71ff33f734165e7a9503ad404601f35eb018c21027b34fc673cf918a3638dd7138e167f85f47b26e2d83cfe2387353aff3a46238fad5221032ade5a75c0dfa7fefd2fda11efc66987a21aff4ec6bcc55f66ea7729d20a7a152103a53acf7bf86f19b4749d9f005c316e58f8fe4ec8b5bb5f96aecca8744bde552d2103f72f1126c21923a1bc9183a864dad5909ac01bff9f94015e3ee231fd12cf62e353ae0500473044022069b629e1e7516f9f9f161e8a7bc1f1d9f8e220c0868351d9084a78aa2db778d102202d3c0b5d77e63bf9363d15feda3fe1a6c159763f501a3cdc058df858dab2dfe401483045022100d02e13b34c995b86ff2a6a9c52a6926f0cb91afdf6a12cdb6d36720a6d59c53d022018a57dea99cb1e48a65c05640308d6824735a41410fae95a3bdc8930d5b8bf8b0147304402206e8d3582d0ce73bf442f279093e1bc2311529d5d5738a951fe00087eab4d2a5102203ba2f9463992292425b2e6c60d1b8f05ebff5f05e69593f64b73b534c42ce545018c21027b34fc673cf918a3638dd7138e167f85f47b26e2d83cfe2387353aff3a46238fad5221032ade5a75c0dfa7fefd2fda11efc66987a21aff4ec6bcc55f66ea7729d20a7a152103a53acf7bf86f19b4749d9f005c316e58f8fe4ec8b5bb5f96aecca8744bde552d2103f72f1126c21923a1bc9183a864dad5909ac01bff9f94015e3ee231fd12cf62e353ae0000000001000000000101783742859085a1ba83b86059872a220a93701ac199a7ca32cf5c03505d13be550000000023220020c6a880a33968424680d5f27c79186cc172b63b1e1f0edb4cb59f86dede7c7984ffffffff02c63d00000000000017a914d3858161e1277b4c4e82da41713b166cc15dbf1d8709de05000000000017a9143e97fcca9eef801326d83b322330294a7629c1c48705004830450221009d2bc1f14f6d30693c32832b38c7f1e4a36a648f264953aac2187123364bbe7902205b5f732d0c3f662a68e8265431a9f83b33dca9a0be35a8599528eb104611c13c0147304402203f8c1d72e1a0ad2529cea5a194283a801003524e567e3eddd0226725c3361756022031454ca70f3e8815804d8138b9d31ac842b43c53435f0d4e18f6fc211f59381901483045022100f1e259337989b379bf045bd18718f32c3ede3e78af2e601be3f951db3d9439bd0220713fdd9b18a9037d66f013422194ac940207cb73d638d37199ee93d0e2dce4c6018c2103676d60c28e8efa5a9e557a5aa8245568bda7bb6b90c4cb3f3813329a8814bc15ad522102a92fdb37ee5935b6ac438749a5f8aa86a1029a8f692514c862e4b80c63ebc3bb21031586ebe7ed6d8f232bb14e9b1eae589058ca8991d03eeb1cf89865a0bb08d02f2103a2177152243dc8b36a9a4b9fbddeb97fb1ef5af43b86db641fb1de7b52380c6353ae0000000001000000000102c5e18d40f9e2caeaed4cf000bccb43f17a1a08521463eac69a5de86399bee5cc00000000232200205551e81bd1ffbea8c217bb1277c7b212a444d25eb881dc44a2f1d41b0dec1794ffffffff73e8a3262ba3e1a2f6a7c68a5651feaf1cb1871585dfbe36cd23a6739dddb46d00000000232200207c3b2c152b490805689cb8cd1390b2e4737fa03b5ce01c178e19241c13f71522ffffffff02a83b00000000000017a914886e9f4e8a916aeff0be5187b6f182d3640c62c487f9eb03000000000017a914d414a2e0e4dad4e5929c697762365a8aa8661c73870500483045022100fa5328591a828ab03155d4637327eab18b31e1562bc52b0eb4b9f55d3c2f740e02206d43e29b08620bfcb93970827151948250917db3a77593dbbd1b833e3c48311f01483045022100c30983d1676d48f916ab25a3fe779bdd2ec2258c577643594643695fc21f4a49022016f3ea17efc927cfcb127424c7f2d8d012862e864ce1d606f8e45a6e3052b0a7014830450221008b5c73b66105fb6aa08f3f8f86cc1f92c2b3a1dd508ed2599677e159758e124502205140a8d1ad8aef8b7b2899a3c327c765c930dc8b4a3419ebdff4b55165b4cd9b018c2102e096bbba59c6ddfeed310071611fec93ffb9e1faba3de44b6516ec681d773035ad522102306f922aca108018a91a016995083f490b390f4574d4236f789be372772a76752103708a8f2e88aed1247ab91b3dc63da73ad7b31349b9b667474ee9bd91f1b2eeed2103793fb7b0e3e2002c539f0a91b73cd7061809c4401c8c95f10260ae49e03f1f3653ae050048304502210082dab55e6abad52dfc4acd2f7cdb61972b70d3e46ae594615be55a4aa41f92c502206198b5fb21cc2f77c96a582c27a8de1b9c2a98fa8eb43efabbfffb370031f28501473044022060709d78d6fb8221ea22276b47b8219f4585b83f0b78eb730f728c0f2d483ff9022077a3a406c38ebd377b28da778ca5658779834c4592d78abb05012d11e566751501483045022100f70dd70527c62425da14cba04bfa895b9f4cfef24318ccc96eea84bac6967f2f022009a4bee9a9900d964fd07aef02ad632965e875c37dd8f69dd3602c78e63f9ad3018c2103cb51cdef5d97382bec4bf90a65baec275f54265a6189b343ba7aa311c45b3774ad52210283bd54b9208e3abf16c8a6cdce9c2c83a77ebc16647a0605eaa1388bcf8825d92102db4b84d259000fc419712c33e4b6abf33342b78272a06915b98625580054b0b42103e6ee59b76d1992d6721373ce541776a29b4ef037524e57333828e11ac375bbb953ae0000000001000000000101f51e6daeafd42cdd85fa26b4681af99c50cb66768728c7ef9ae27232ac0de2bd0000000023220020012873e69e0269984e55a9023b02118a8b8d8a334b103a7f832aaae925a5cd50ffffffff02b62800000000000017a914e0c9371d23b32d8e5c6e6ad0321f6f582134539887880900000000000017a914515f928c4348109cd239a157e5bfe6741c861069870500473044022040a5dc1ab950cf5e3a601d3eabf8087b90afa9c55debef069792a2ecdc0b3d6402201765fdfa150419dc38183c3c55e1fafcc18f7880d20dd1f7ac44d216a8cd475901483045022100c8d15f7850aa03d88a82952d69b074a7ed0b54e0423f03c0d09bd6e7a1cd0ea102203a66f8c3623b12f59e50f8a41c031a419d222bf0b036e236a68bc267e13a27650147304402203a3c70109213800f3311d6c9b8f0cf5468b47aaa0a15b7394cd0d9d017607d2d022031deab1eb61606b7699825ee1b830482a87b1c868ca18bb5b90a01bc0a13ca6b018c21037af19c4b6a2dd7ed7a3591b45e22887eca645a71fba08264c04479ba10f7b3c2ad52210239d87099e55e43416f5b7e4ad58534a48679ccd9014cd5350182e31b97e56fe72103a12b7b72bf6e5540fd2e263fe5ebd60a54adca9cb2e26087d06b21ca2f36e9242103be3d908b75b3920f8c4c6ba54eaa51d81f3aa91e640b69ffa974576b958f3eb153ae00000000010000000001016bb48b3017416295d66ca2a0702550c90fc2fd1379d779a8a12baa5ec3ae7f4e0000000023220020129d13b576e1e88f6a861f20f997b95e43a2c5652cd3327bb6cfa2744c56b7b4ffffffff02867600000000000017a914bdc83160200cff3dc96f1ac95ec471dd7f77375687221e00000000000017a914fbf14daa4220e005860848ba02d6730b9a9bf22c870500473044022041cbf0bf9ffd94a0e2216f0dffea28b4498ecee54fe86182cfd73130f7401bbf0220296e4770cccbb5de5bcffafa104e652654d5fce8213744cad64cda711e8e2ba201483045022100a1b9f62481fb331ec30d44107121df4a3d29a07398651bb87750d1cfd8c8384d02200ad6ceee5359c4b658bcbb44cb972d5e7da8d2aa1fc35805999c0588728a523d0147304402206a4353e1c8911fa305a1948e1f3faf0b24a40d381cd37d998f8ef614136a8cb5022057785debf6fed4d23fd9feca07359b03048fe2d0d2654ea900ed87509fe61330018c21020e42f398eeb53dbfc6b30944a6b85fba33033fc587d725088e915c3d21fe9ff4ad52210312f5731af2929d90c22db71771168471e10a23811b5fe3679d683e25989fc56b2103630e932bea7c477c8e1eda40822a35e81e1d09b13eae810a9a097c0e8ac091212103e74662f0338750a557cb51bef24b9789f6867603df6e9fededfaac6aaeb54c8753ae0000000001000000000101755475e7a90a1ad61516fbc2779ddce64ee1a5c022b5be490bb13563d0732b9b0000000023220020299924b4aec03050530fbad5480358a63bcf7fec8035ff90f81445c94cd39c9effffffff028d1d0f000000000017a914357da0aabec4bb77acd95943b2153bc18f7e034387b62318000000000017a9140129c375744adfb355a73be5d3f374e7b2c65ebb870500483045022100efd80fdac3193afeb556b87b34594cf4351946f174515dc8e2550e3a3f906939022053b0e09ca28dd1124dc7458ad0cc3b94f7fc581344d1cf8fea1eda2b34382365014730440220349affe563b69c19ee769dc67a8346e384e1e63d0279b6014f4afa6d4354476402203653d36b420f1ecf0fe7fdfc9bd5c381948faf631575ddf435b8558367fc280701473044022037e002893797f05666acfe40503536c74067dc118ed024026f44c0656404367a02204166b5c22c38734179c7192b7327aaf39569540df7b61f31200945480783c366018c2103509bda3027c3326d6f97b11fb0f6bdf2f41e58d7cb2881f063bb516216aff8e0ad5221026f39f01e014c967cdb4c899e9272e4d05caf1c4f54ffa072c2b440c65cde42612103c0b980b81e4cf208b2349c32340064d0d6f19b6982fa555663411e275c144d542103c0e3324fd4c4054c27093e5fdc9d0bb9065941b49ed481540ea4d3b600f8aa6e53ae0000000001000000000101e5af1c7849543feb3e0f84fe6937e3526c970df720f466facc6d4cf6e50010f30000000017160014f3508c1f1c2e7ae14e9eae1a17e7aab7cf7565a7ffffffff0240420f0000000000220020275c4b4fce6fcbdff8847e24c7e678991d97cade87716d63c12bc0bbbd83ae6e699efc0000000000160014849c481a266e0e2361f1e776ab794716c3d65d820247304402204be4100887b3ed656e2e0fcbe5aa2b50e2d6e63eae0774752756468068d2390002207fb6b56e5ba243e27ef94ff9812c0dba20f58d58aba85a7769b6ddae01cec638012102e1a15d63a739a853dc8f213947d609f413c4284e29398a1cb261a3a5b7eed00600000000010000000001021bc1cdec90bdf112d289346b616b178a952010643fc26027c7906942b4383d190200000023220020b30231ca3a5afc7ed4320cfa3f7bb7209e25ca29cdc1459af7041e41c22be5aaffffffff6419991318dc4ac5de815dbd27e5f4e2f3a7b9e474d2326c42202982c40b738e050000002322002080025340770d83da8cac39b92d24ba29b8dbc007a1d152a796e7189f36a2bb22ffffffff07022f0a000000000017a914e517950cdd43f6daec46976d40e24ea3382e0c1287423e0b00000000001976a91491f095aa40db649de568ca6e58395e5f2f869a2788ac941108000000000017a914d729a2d249c6dd0d1536e28f0bbb2909c614d0ba87b4ca0500000000001976a914d603ba8fbb0e12fb8f5d241ec8a75dd52db54cd788ac86ea0d000000000017a914f62c41160ab5133aa870dbec2fed119f27a1712087de9f8a010000000017a91495d1bb81594d6387c687dae9888895bea09fd54887f4050800000000001976a9148fe278735814712914e1f4dd4feacf890a0440b488ac040047304402207e005f7eda3b46989b3dbc38a92e6167c9f7a4b5bae5299c0faf19c369f9bb7b02206b0b0bc13560e8c792e7aa157876641b7227542b156705d063b27570bb853f7c01483045022100b65c7429b69eb49532235a68c5cf7206e82eaf61d1fcbc84d39845cd0bca8a2a02207430d1b67b59a8bcfd55e67a4173c9b6432de4d7183b02812a7031fde0037af901695221039bbb140645775dd4a925754f7870a095904a732cb69a6640f5587ca37c01890621030690623ef3ee26c5a30db82316502d3be70728a1f6ec18357d37016517391f512102d6f00cc1ad0adbd36febc862817165c063350b253939cc0f3a899a2a27456d7853ae04004730440220100b72d74c6077635f4c5598507b4c66ca42f52f9b3763b658c373141906c6dc02203e9d4c9fb5e838d98e50904d733c3376cf6a7f4c5c67c81571258611b250b97a0148304502210081ffe77dbc98823262ecd8809aec84cb5575eb769bd0e99945a3f8599ffff17902202d4bd0a930f1c2458363c9fa7972f3f83232ad77e326fc4a3d856aa99e427ced0169522103416ca25eb6428e5dca90bd2252d8cb267756aec7aa91f7df60fe7c680aa25fd121039c95a9d5a5ef35596da4105c61cfc1eed5fd889d275fc7ee66689b6c2334760b2102fcf9bfbb6af3cababeed5926376f7552cb7e6f50fbc37d7766bc5b7b2268723053ae282e1600010000000001016a1a788f5907c751a3bd1a71253971eec5800e0e8f1be78017dbfbe48543ed6c0000000023220020961badc70ceb133ad62900c6a1ce44798382a1d602bbfc3cb268733f5eb9ab51ffffffff0290f81400000000001976a914f865469a9c30bb5839563a0fac6e1eedb4d1976888ac28094a0a0000000017a9148232de979b8640b3bb8797f7249562cdece7efa8870400483045022100cc801ad4c157b83c5e82bf8f945f2808c0840408c69bd4c2b56056183891b11a0220555a78549635f18e2e8156e06d9a2293193bbd5847dedc9d0c33f0e8b8a77b030147304402200f8d0c489b405d3496b4336ee56740bd06f3fa11bddd02d70c12f204344f482c0220055d4702e50f4b4a9511b3aecd5e68869ef9cb88c72c62e705c9f68db357f83401695221038f5aa46817d58edfd7f38c2b61185d5390a36c517c7e8866af668f3a47dbea7a2102ec03d7a5801c2acba06e5759ea0c9fb4d0fa753e49bd64f9e1505d183f5c1fa12102339fcf4fb1a9cc1d73abac893d48481b1523c76a17cca5d78759a749b85c9e5253ae282e16000100000001bf2991cbdff3c11c41eb2ccc60d95acd486d732f7ac4d8912949209e4b2b7e4b01000000fdfe0000483045022100bfdd733688ffeefdd2bc34b3214fd82146fe6029cf024c467caaa065a1ca3070022064c21747549ddb9c0bb60ab44dacb9f62b012439741ac0e32a897472d9611adb01483045022100cb725490821e50fd958dd61a5e1e2c0df63f1a075c4200ef6741c7613414aea002206de34e75c6b5cd9b0a20010182d86a79c76506c423b0f4fd5da1e0e3dc57704c014c695221031d81994d8c030f3937f5e4b45bb07000996be31d2b8d76296f2d9026d5f58222210219b046379a32ab3cf21884b3062eb38193384b59db4faeabeb6ff181abb1e385210308f0fa1c203f6aa3ff855eda9c40b19a7beb337b1372d46a85ab040fb1fedb5253aeffffffff02102700000000000017a914c21694b06428f73d53536e7143e38b751bb4004c8789e202000000000017a9142655164bf94309abf4fea7ba380190b31551655887282e1600010000000001024022fcc4109ec62bd81587d0546eb4f9370118285297ed667b6edbbc44fc21b40000000023220020df857d7e8a6b3e3ead6eeb7081fd2ea3817934124f43c9c8303b29818c57934fffffffff0ef0d843e8c4fcf813b643b89320ef40dec88813fb1e867f9ad829588ad87c490100000023220020f4e8a2799966a7975cb8a8fad960242252a344c0cd8044818b967b5be449a469ffffffff0211bdbc00000000001976a914d4d248c5caf5a56517602b11d02b513eafc0200588ac57bb5e000000000017a914fb4e152780ad55999d2716dec6005056bec11f57870400473044022042664a2c52d6810ac6c82d1c38bdafc1ca9df3965da69ba45f43e6b7768503730220788b9d9fa0cb694622ab7936e08c79ef241677b9862782ea4c9ba6f8849acc9e0147304402202f654cfd7e39a0df189013914beaf367f333e5c6ac9d71b7348a8670d135ad6d02204bfe6e4dede9b0e666458a7f8578845311f1981e951240852bc5a6847f622c6a01695221020f70307f346ba978c843f9d6d06a469fd5d0bec55c45a6f1446d29d2ada766c621028d97868438981be108c00f43c96fe3bc240646c5ab230002bbc725bddd614b51210265931c67e68567b09af5a36fc09639cd604fe2686a9eaa38d9eb947196f1f2bb53ae0400483045022100aec8e837cccee7f1910a35266e0d266f3ee3a1d432fe5457555618af1cfafa4e02205752e9ed9d567fe9a7d8414d6cb8496a4c28e5ba8e71af258ae17d0206ddadc301483045022100f1670e023ddc3db07ae82e0f701ec2237492bc061445aecf2b1d00d9dfb255cb02202eafc245489da9e1560dc2b0d22c6d6df2bc0654a04309fce08823ca1ff9c3f80169522103d06a1d91aa6a007953133e6098cfa9dada47a174dfea930923a2bd20c25f522a2102c14ddb040441a3f3dcd120fea097ecc5a19b405f0de3729372b6bd45dd73860521021c770434376c5aac6c1146eba883213b7d8f395527bda01b15a1633c0ee7c4b653ae282e160001000000000106376b733300be4310cb41f993ec8ae3c5096715c13f4a312014a3e062117d40b301000000fdfe0000483045022100c664f7105a0552a730210470b0741ffe09280eea87ce15e1496608f8f0b51234022053c8af616da053b4fba529cafaf1dfd1dd55f339577c6b61c316ecb78f17a0f001483045022100e459db926bdfc8f57af3f96d07bc98705ba08b51cdeb3be43431ef3b01abb76602200a7f43accbbdf3b5d5ecff4633870b46fa3a506bb2b4178e718c728c83da8436014c69522103a81417973d3d687d738b1dbe03a19c1b3722aec5c61242232d736a8ad73260a02102758f07f9c08fb6cec29412f3d50a5b120dcd22b084fa583eb9d947badc76950c2102927d062dae2bd8cd067ad73d1e65887ec504bcfbe71ce0ac5658154ccbfcf4e953aeffffffffa09ae749a38783430e029bcfc0d783cf4b97e4f1001dbbb0c77c7c0fd860d5c701000000fdfd00004730440220322fce3f6fa1769490f89c81e079b74d3ab561e16a824fff8a7a927fec4598f202207725fe45c320895a95fa1e0425bb3de12dc6f8026c486dfb0e37da5fd34c094801483045022100f641b4284b8199b4648fb060429e5e837f9d3297329117d7434747a21462709f022073a1f7c3597b6396b56165572d06b204bfe64a14bef3942777c5a4d25a8f5754014c69522102a7bb709f576a8e0d6f1522ed618474c61301d98e21a5ead8d69414694f4c7f172103f0838c2daa1572e0c92dadb962c3d981647de1a07bfa38273f3b762f005c71012103476c7a4a9a07c52afda5b9735795301bd32a8f8762d5320b5d8586c86db259dd53aeffffffff698afcd3c131143c07114f80ab8113ed3bcad883d6e6a734c3e7c044c7d55c2800000000fdfd0000483045022100ba998c695d7e7ced1bc9805839204e2c5d9a63ede96dc973d527b2903c496daa022045ecc5315af6dfb164851d57c0960c444fa48ab96b2699e3c9ecaf9f20395efb01473044022059c6720a260fe9ef69f8db1c8657f9bbe65bfca31bbdd729682d6c3cdcaf298d02201e9d3dff095d9070996a3ba2d233dfa10b940d4d7da8e31016fb81f9aea2c89c014c695221035cc710d90499eccacd8a78c1077e4f4bf31e30fdeadb9945a432f6940836dca9210365583312c0bf91733f53e3e05f71036c455ba962ad1375efe0ad23aed8bfa48e21035d3517321374a373c8f71355623ab472c9f0289d649b285c25c62ad6e8db7c4553aeffffffff42f4eb8a3185e0be508e6ee2e4835b4cea37a8ced6ae25e2b425cd938200e5ef00000000fdfd000048304502210097d82b77310fab53fdccfd8abeef998091ba5015409f4c4eee3acf827007f563022061da5ede746c1fdffb0e36479e4ba8a412f40c84c481ac548c1b0fc64a02db7c0147304402204fe1f67b15fb97000c414e42df4b4aaa17cd11279153b4e7def4d55a80429e6602203d8884b8f9c1727358216c02e2f3fee85fca7d69c9a93e8547b014193d1ed4b3014c69522103397b578d3f9fa9bc40ceea808266dea7d21bdc5da1c072da0c6ed444570621452103608f2b435497cfd26ca6b804b1d122e0898c48ab4ca969e20aed3a6b67756d72210312d3bb0b132f1e41aad18c741d61487c87eb69da8b69312e704c0f92ac5277d753aeffffffff85960ee68c2a957cf0676f29973cff076b78dae1093592344b1abe09767674230100000023220020c8f2d928ecb534bdf300dda8c7779c545e47d615aa9372fa17b012f7a6bbf949ffffffffc7412ef795f3fda2b7467a55393861fb4891d29a6ab8e1332dacef412de6a2a900000000fc0047304402200156a9e6c1a5712c188552e5e8e52b70f73bf94ab6b7aea0c79a92bfacadb89702206a3e326dfc4cdf7fbc3feb1eb53a664a6168cdb54d2317f19d9ecf98913ca7d90147304402204101e113a82813a7f6fe043624968899a1f25ff0a769e9fedfcd3a8acf543fef02205da13082bc4c310894ac3b59ef7fbf32a88a34824ded0481cf9e570dcd5798ad014c695221026674760119afcef2dc1eddef46c48ab7c48bcdd7f4ad24ef6b3b3f1a98b7157221033c1ae5a9b237124debac0966483a1b60a5f2b6deb610802719cd3afc77028d16210355895424b5a3cae8ed6c651bd0f0b5cc06c71017fb9945071ab806183b50f9bd53aeffffffff02a08601000000000017a91492bf2cadaa524d997e9b11b16cfc342e5b60742a8759880a000000000017a914bc5e0a92e814675087f25c53c42514e9614f882c8700000000040047304402206a0776e9fdebe186e0c571908e37f3ccd4da114cb90877b72e72600b47ff86ef02206e0f94239fe3af453a7e2745f4b571c85ae8d20ee279187d2d651be463fce81e01483045022100e895ee75161f5eb67f831e49ec8b635f2169b3783338eedd2b0b343202fd590302207be655b874c18b6f6a62a2449983dba1ab522db94a8f58d64048709e834266900169522102b0b8f59535adfb417276774be1951113e3119ede78d3912c633f9f126e1b3d3d2102f8e6a36c3529f70abb30a968cc08c9bfe32987a91433fa3654087790153e2bf2210271f6f8961fb9964e7836e654434eb7f6bdbf55e751d28b426990faa55618d02853ae00282e160001000000000101ac3ca984fa2d8a4e34547cdac1dcd763485d4162ed09462f6f2b8585b61901770000000000ffffffff02a0860100000000001976a9149b4c63166ec69472a62e6b197e0b7306f0c8b0b088acb4560700000000001600147fd1ffb597eb0ba638e58cff1feab40ab1e9a2640247304402200d96826a4f207c4fea0db5304b214ce64f8bdf5b14cb263621917d135f8458b30220040f55e17eae9d5aa6984517ec5c9e3a28f12ee4049426630381cc5bad65f864012103b571de8d687903a3e03bc075288db665c7dca0678df465ee319ff8ab62c22d42000000000200000000010186fa2d4c2aba065aba3d49ae45309644db7ebbfba3e1e9ccd1795235b0d561c70000000000ffffffff02f9850c0000000000160014032930b67fbc04176b152f5b1cd7af9bc7dddbf6079de7000000000017a914e2247d0485c584949114bd4f28d773d005b43a57870400483045022100db415db5370d5cc684910e7d77eb7e13d68bb180b51f0fe7bdc94806296f08c70220699d68bce8c715a5b47a4c9802223c44e28127e1acd14e721e1bfe61a00cf05d01483045022100d9aae6cf7889a92c89aa812e27af7b3ac9d2a8a12d25e58f59f0c1d4adf816230220664d98b2bd26bc37a4404341304c2fd9764e73b8ceb6dec21eda3daf652eb23d01475221027adf381ba54824f16f2d8b74117ced7ab2f25e09d34ece74b1d739d404bb801721028e24143fc8c02c8ef8b82bde13bab2ddf41f6fe4fa3b73f5baeeb88223f8281952ae000000000100000001a56b243a960b0b5cc61d401465b035d01aade58a1e21b4b4525d0da3f951488a000000006b483045022100ab340ef34bef61fcfc02e755d899c01f5da5e6dc9188a52e2d44fec5bbbcd44402200a194a40fd5290587e2b61307abd28b63a1a2a9a5449e7de26e965ca858f189c012103f35ce23074de2ed32b68b49b82edb3a3d14331c7b4b034b346dacf08b9786a48feffffff02a0860100000000001976a914a091bbb34a14e85f0ee455ef4d109ed1b1b7d75d88acdc150600000000001976a914de81c1be516867b0f58e582d48d17f0d499bb6a088ac272e1600010000000001019f574d1350753959f3936df8c20b4d715f457e08dd4eb8730603635c470e7e8c0700000000ffffffff080000000000000000426a401f6da2800fc7bfbb83907c0ed39b311f1408237d03cfe5fece31f4b1008b5f73a40bcc1fb108cb85f43ee4934973677db88085d0a7dac655bf6f59ba21a6e76d1027000000000000160014c3473bece8220457c59e59bb44e9334d732726ddb9420f000000000016001462c4448b73016645ef52093720afbf3c3dc214ccb9420f0000000000160014680e3d391cdfb1e118d8181d1c33b4e52bf3628bb9420f00000000001600148f53ce68c39e81825c82d73f98aa7938d225fe38b9420f0000000000160014a870c28dac8e1655dcbc07a548e2c6aa9ac7a90db9420f0000000000160014e26918a48e026c9b1d1604c7e5370d88f7b4a71d7ebe0f010000000016001466c426ecfca004ed819193cf9ba918f05a91a73102483045022100f5bdc9e2a7faa9d0ab75d8d7adbd1e788613caf0d1db6556dce17d5d78d2f8bf02203b7f55c309e1909aed46aa0ab9532390cf76f7adcc73c917c5edf35ca510d56501210254f191cb77dda35b452d11adbd9fb42f74484a28e95373e87810cf8db05575f70000000001000000000101dc23a8ec68404e861dc99cfb5e0a02eface4f44038e6fc673ff6e3565dcec77f0700000000ffffffff080000000000000000426a40188778e3f04d1a4bcbe303493e67821b22542b8a872b3b70f6fc7b484dd9ebc1bd72b3fe1112e7f77f9372b067cbfb19753683b6540651d95e0854a0571fa9a4102700000000000016001489c46baf3235da1e1dcdc8f443a1b864ea21818cb9420f0000000000160014800e92e430730f1c5b35004bcc1d0a0d4a2c8a6cb9420f00000000001600148fa4216befeb4f0048ebcfb58e7dc5061f53807bb9420f0000000000160014d84150e05d34b711376301802df7c83a84864b45b9420f0000000000160014e0260def62efcdbb6e07270f3fa95be12a192176b9420f0000000000160014e0b238625578ca7cac627fab6faa9a12da850eb5b7f1e90000000000160014bc9e2b6bbeb5603224e67a00bb585df73c0dd4340247304402204458de1209fce1467f37626542d8f11d26267fd5eb107a8690de4a8b86676f21022074f62983984a62fb3e97abdc86b5117bb86a6588b842d3ef28320c8162408216012102c337bf44b938ed698a0a4b3b3f77473628a6d52a71c7b5e9e9e4634b167198440000000001000000000101e5b037a6b63a6ec6f1728cf5d5d9aeb5faa65fc6091d94de055724149404071a0700000000ffffffff080000000000000000426a40f8891dd3370f764eef99116a8af7690807b42655595dadaf040e3680a866969b4681c67a65f58b59dde484b2cdc931902abd22131e17a2419b792b62d2d3adbd1027000000000000160014165df090d36fb85064a0461ebb3b77e929642167b9420f000000000016001444f244f4fc5b3025d1283b227ae73bc12962fc70b9420f0000000000160014490eb494d20a21739c1564d83f8f251fb1ded76db9420f000000000016001462c43f20a1547929f4244b3feb58fe66e2654bbfb9420f000000000016001478907e6a39783ba9fcedcafbdd3676819c3a957eb9420f0000000000160014c877c8ede58cddb18b0412ebc16d12876e428e592a7b9d0000000000160014f39a7db5ee8a99e486b2f4ef67ee410505ccb9eb0247304402203065349138ca1cc20a1729e9c7ce8960bdf988a97c2d719799dc107dae4b0ef202206c653a0e1f99680ffed1e4698497b94e76d9c38bcb117a883c5c99fe4bb6d4a6012103b2ab86965e1d9c0fd7cf93b2f78b2d42e35c50038b2f314930f0ee0ab95cc0d700000000010000000001015872f80d7c73249673ac5d49079b2f57429dbd28e2f53f708046aeca86894d730700000000ffffffff080000000000000000426a40b5a0691637f1d69f4a731f8c0d269d82ffdfa5582c8794e305846f89435e0db0f8229a9827b021599c5bb22ff92091b2ca080c07c555d6a91104e84c294877b71027000000000000160014cca43260fe68caab35ac15f9271dd2931447003cb9420f00000000001600146285e07d5532ea91cf107ea7160ef5887ee4051eb9420f00000000001600146f7b50fc2161c8d4c86b25bc7f1957ddd08d9f9cb9420f0000000000160014ac4b662ff8d183ecc8d5c1e94eb8d27d746eb6eab9420f0000000000160014c50af2fe86bb97930e3ff392ae4660caf944085db9420f0000000000160014ec91a8ffce08064d3e3f7da3f60838a00f1d8ce69d04510000000000160014ceb96aaa49b36ce9fdd0053accd39eab9d901b2802483045022100c8921e18981cb56df738d4a33faef5a047b7baf833803062e8bb36fad8cc838e022064adc5966f8b20fa55fc07a369477ff8b8fd8bd18bfb1bc213dfe1358aff68e9012102033d8bbec38725a37577854fe7c0ad5551e0c3c90844d58e81e9a30991a72dd8000000000100000000010105b3415e96195a2619d70611297870a9d72e09fff9ac1d65744e7beb2bab2ee60700000000ffffffff080000000000000000426a40a6f583b2c9073c122c43f1ac0b549f9004e77d106a4efee42abf6ec4205413ce8fec2f6dd445f08b6205d0daeb81c9dbdd16b97bb65b7025a0070bf2ab5e174110270000000000001600148df6bb0dd7fb2ddffd8e576d12dcb53116b97716b9420f00000000001600141cfb0f1fd6f0c4313f62054fcb9049cde6d95965b9420f00000000001600142e08cc7a08d609a1cef5c5c4dc51c121acc6e735b9420f00000000001600143efb7eabc4b06558c2446f686539df00ca71e816b9420f00000000001600143f9269fb79fad7bbcc9665b34af65a6b59555918b9420f0000000000160014de7d5007a269f084741c9ea95666002783501c59f147c3000000000016001463f516111359f85bfbf3c2c90674e69e95f8976d02483045022100e46a182506b3d58b9ff40b167cf6a22cbc52d9960a3f42764c09c23469e99c9002201aa8937757e287f92daba1c0c48d6ae8c45fa5ed8395e9afbcef764440c3dd9401210209868fa9569649df756fd64e8a62de7d7dd1f8ae54d13b6c72e521e1397fdc8000000000010000000001010c4d92257fa34e78a30452c5fceefae7265423264c7309738818d33361c114b30700000000ffffffff080000000000000000426a40778cb22043326693e50594fdfd2f3e3d97d9cf5d8f8b0edb429481e1a807cd5e5a9fb2daf08aac36589b723a80dd7f5d3248127a9aa9ef48df1690b81a3d2b6210270000000000001600145d84aea17910471362e5e1b2ebf24adeade33026b9420f00000000001600142f08770d31f9d6b5a63d3fca6ca8df29bb7bf1f3b9420f00000000001600143d489fd981621dab6cf37b1b2a390e4c2927e310b9420f0000000000160014672946bdf9feaedb1cf06244eeae16227f72a696b9420f0000000000160014b9f8d05b2faa4d54a132295ab2186c2c8609fd19b9420f0000000000160014c95c36a5a21f859261478ce15ec144ffe2fcb2f75b1c9a0200000000160014aacaced13b0c6bfe8320a84ed29eee7f6b8bffbd02483045022100d7a06d2c72313934480c19b1f8ee0287676000e8cbde90d78727db4f37617c0002203b120acbd233cf486343b36e1ccab3e74d3b6e3f249c0337ca1263e2ca0e9fda01210262cbe4070b52e0d1bf2fbde044b1e45814f6004d95f5dbee49d015efaedc3f000000000001000000000101170086bc90a5119475815ea72c9cc100f5e8c35435050a9b8522e47b0ffcb71f0700000000ffffffff080000000000000000426a403b68b8bd86ad92d9babb3d9891c679334e7c09a6c35b49f744a27e2a7b6b83b127fb107270de4d2e92c3726e9be2d8888e86f47f52b9a7ee580151ac6a465e7a1027000000000000160014ebd000531088b2133683eab7f64dd222c763b095108e040000000000160014a049fabc2ac6ff0b4a64fb1d8976c2ee411b035fb9420f0000000000160014000b71c5c1d74490c685bb27e3ff20b83edd34a3b9420f00000000001600144330a8347ab251aed580272d230ab6c132beb0beb9420f00000000001600144f594a1ff6b1938be0e3b019fee595df528b3740b9420f00000000001600145a20c2f4a4eaba95fcbba6e558aae05a6ec876b6b9420f0000000000160014e9c418eeac00a5a457920b6a349a4f6b18d8b722024730440220298a64cc59525970f942636cda2c9387be3153769d77a9a5cad7d1c5c9d083e2022048a72b64c1dd67ef1c4a605211dd4dab48fa3d4c787e16a94a4a36254411f29401210258fabe134f3cb5e8e64a1a2abd595cb81fde5aaadf8b043bc2ea77249077a7ae00000000010000000001012077156ba605d6ed07bac08932d11e7d465bd9ea8c1e7f6ed23b89baac05851b0700000000ffffffff080000000000000000426a4025c861080ae0c61ea25ded51105bf4908156429677e3bbf866b5251fc23872fd6bc1b32a04b256b9e3ab61433d45c52a01eaafe846402b18c7931760d4c3118e10270000000000001600143464c2e2b02c94c1a3551ab3a8d6c707f1c70d25b9420f00000000001600141f8c4b7673982f4538ca18bc7f64c374b52ee5e3b9420f0000000000160014215b4c2fa77168e1fe5b1f96e5cf65dc1eaaa874b9420f0000000000160014b23ad3aa1466e122c63395f0b4ba67ba26a26bb5b9420f0000000000160014fe9251dd5f65baffa91ce1e98aa826d90baf1f3db9420f0000000000160014ffe0a02d60ed9da874ff640813c3351341dabbff64d17600000000001600145cdcb7b392bc4ffeb751c79e757794f91174790402473044022004940d98a716f14b13d795a09de447897348050f8aa72d39754d3bd9ef51aae8022030c78a0c2445b607211a80e635584bfc84c971f3efe548d4012c53c18e6eef17012102c287dfdc6586d7ddab302befe0776a6e8327227f2af9d3716fc587c1534b04810000000001000000000105e5b037a6b63a6ec6f1728cf5d5d9aeb5faa65fc6091d94de055724149404071a0500000000ffffffff5872f80d7c73249673ac5d49079b2f57429dbd28e2f53f708046aeca86894d730200000000ffffffff79110aa1883e14c5cdee4767e7406a1908dcb28ed75c302133e986740cf6307e0400000000ffffffffdc23a8ec68404e861dc99cfb5e0a02eface4f44038e6fc673ff6e3565dcec77f0200000000ffffffff12266e548fb215c8dd897d0f270b2c6d699146ddb44ea760ae2105f8be6983b70400000000ffffffff0540420f0000000000160014210011f488eacc9ab0b672c532565ef69b8c254b40420f00000000001600142d8cb338931568e9fb3824c7953bf873b9034f6040420f00000000001600144e72956727da37c22267f1b8119f5df9c038995a40420f0000000000160014abae590319b172ee14bfbd3abd5865639a83f9f940420f0000000000160014ac9ae83ba9dc0e5b8b768ec98d0ccee17a3722dc0247304402204246c84c9f26b9e07a81c2639e906281b19521134237222ba878fed6cfdc614f02203b25f47ea0349bc0e5adb966dcb8228626f9d36316c26fbf4d4da1fcce2894af01210286b2c1fa614cd643d6e8fbc554d718d779c3ccaedcddd7605ccab88a7dfe77a00247304402201c8fa3aa73d8a5ab6125b8bf10bc8565a326fea818944c29f88a6af7686597850220086ae0cf8f0892779faf312ef325e3a887947865cc765b0c5cc0a80cf6ec0b770121031446a4e474388622eb1435ccc15cffe80aa6402150dffc761bc2501a2b893f5f02473044022063c603bf27f4ec2a7bc84e9133b0cd1ef73847352384e84258349c1f3bf2117a022023a05e3b35f18ff1a550202bcabbc977525a0fa556d1a2c294a1d9558befc476012103ac258f6a610102145e29910f20e6d7f237dcf04f3f8751c1c39499d124078b050247304402207b147ca1230aa1b94143dc6c798fc30b2b0e1ff52d82ea5a514b92faeca915f2022038c7b6d05cfe5285bcf7a8bcfb5822895a3a5429fcc2b77a1cb757a3f17e39920121020b49512be6b34bd41ba74511f0fcc18cca93b797446cc88ba93875022d33497d0248304502210085ec97c93eac9a70cee0a0f3b866c260d55fa6fa8a55055813f06c7dfd52c0c202207d2a0c67c39edf7c72041a063184c50d528e1a52681aa721b8ca4632f68d92bb012102f3a43d7901d63e70d7f90dd372db0687de6c490ed443bcb24b0cf53a029d34310000000001000000000105170086bc90a5119475815ea72c9cc100f5e8c35435050a9b8522e47b0ffcb71f0200000000ffffffff37d3cc2f52284854ea68d2b79f0103cd03ee13c27fe334514df46b55adb1f6430400000000ffffffff0c4d92257fa34e78a30452c5fceefae7265423264c7309738818d33361c114b30200000000ffffffff50b95164469b0ea83bd903e180d3252f950a044839de6c8702d6f02c2673a7d60500000000ffffffff526db28c24715302d79249907767789975dd34aade5bf79a5fb82022d331c5e70600000000ffffffff0540420f000000000016001407fa1c6ba0baab63f85f75923b9d7e101bdb148140420f0000000000160014a27bff562ab39e89b849f79418183b311875d18e40420f0000000000160014b261f794e40cfbcf0e206271c7dce700c35b9e6840420f0000000000160014bae0039fd24cf28e880b56dfa78365db01a4b34240420f0000000000160014d59d8f4ff62c0165283d1d29f7e7bd7ef3901b620247304402206b61501c72282d790c1bdfaf727d603b5d71c3edb7f2c7109e9c3ed534c86f2702201dfcec6424ce3ad16fb399ba82030ff707bcf36bce0f892ea038c4b466f9f8e3012102578f300df5151a23998b270eabf270bb40d7597bc93dc2497092763bec8b3f5d0247304402205fcd259f9dc8dcdee700ba92e61fbe0c9074be5690910d84c66115000c67c1b402203aaec7cbe424a8a9963ce9d1a9cd939bf97bbaa82734aa6a7aac5339f134c600012102cf457a4e184a70e78ca863fa5d67800dd17a318b5f84e726f3b07c9e2706320602483045022100eb8ccd123e4320dbd6de69bfb9f961ec6e8051989e3a97775fe0a6c418b0aace02204eb10eca584297ec6a975e291d53ebc47dd316873d2c7a0c188c04fe4a3420e7012103c4ebeecec523a09a38d838a0d343fc947a6b9278bc754c4d8015e72a1eaf112a02483045022100ed1ea63252588bd12ef20f6f75c3b6eec89704ea80db4200cb390f04f3e9d8a8022060a9031d70b6bc4fc231600010c5ef740442f5da42ebbf1e8610a0e8c9131dcc012103e822abda440292083d39168cc1b0890c051498595646b4a0b06ac7afc57e04ff024830450221008c3f4c32cf3a1a6443090acb7490d7bf701ad24c5a65280cdc2fefef944671c902200f87b0ac708f0e8cb9ce2f30abcab2869a90ec7b3856c9b76109811e34f5effd012103f24a62693bb8583a980d7d434db5b34ccf65b1522b5ea5975a72f0bb8f8ca61600000000010000000001050a6ba13ed05fe8dbe404a2b6494cca724ebbb322e8aa7a69fa302b2cdd702f830400000000ffffffff9f574d1350753959f3936df8c20b4d715f457e08dd4eb8730603635c470e7e8c0300000000ffffffff0c4d92257fa34e78a30452c5fceefae7265423264c7309738818d33361c114b30600000000ffffffff1aeb89601951cf2de2f507d067a75d2653fd32b998bcdf18984efde659b39cc90400000000ffffffff526db28c24715302d79249907767789975dd34aade5bf79a5fb82022d331c5e70400000000ffffffff0540420f000000000016001437d35f7488a9c092db66a77e278f717bcf4448d740420f00000000001600144b5da2b632708ae7cb70e7c31055cc5dd9bc37e140420f0000000000160014a7d15fda51d40ee3c18206836cb7640d4fc2cc9e40420f0000000000160014c8a8ec38b3000e13d726d187298756ad8007c54840420f0000000000160014f90584a6c4f31e63ccac5feafd90f841a21790620247304402200e8c44efe7181a69ef583a0e41623514428d68033fbc8f97ef88bed284178e3302207b1027d52a7324820b8757c274dfed89ca6b7a57f599333075f61387ab127a0401210245ba97af77bddcdc1a0e5994fdebf5d3bf06105bd94adad4bef1fb82c2877c830247304402207379bf9b68428246342ee1e81060059fbd8943bad2bcd744cd6bb09f26aea0a302201712e9345387d04539873b6f401bd539d8f77c8d984b1d585b30552a72fb56130121031881807ecde9de561b15fbee33241d6daac53ede1a52f61d4cf65f877cb5059d024730440220760c5ad5159e5bcde4cc6174698015a5a3b09a3ec36f9d8f84e3b7665bbb50a802207258386b9691ed0aa64180b5b66a3166874452fb73aab13e7ae2738f850cc726012103a0b664adca4f8fc74ce25840674ee7ff0a9bde6f739e17ad2f48ddf58673414302483045022100fcd436430db2f2dd740b0574e423466a97749c565bb3a3d8eb18af37720a2c15022021f59169245f755475fef6d8c0fcd2aab774d6629416f5cea74cc4c76f6fa23e012103180d76919af5aebb2aece8ed272a5697e44ddbd19d8c130235c4903ad102aefb02483045022100e6bb941fe1f234e389931ac1e17aa5f1d7c809cb79171cb7e5ec86a676080a630220783df9466b6557e81f2edecb5fbfe2a326e074479e4e429b345a12c7a7c5491e012102fd8a1bda47fe804c9f6a6cad40b2a7860e5883c39ed5af5f4cb047482ed38fec0000000001000000000105d2fe5910ed97e9aff993387b5cacf51afeb353540f91774673de5121f2410c130400000000ffffffff2077156ba605d6ed07bac08932d11e7d465bd9ea8c1e7f6ed23b89baac05851b0200000000fffffffff0a27be97952ffd9f86fe67372af5b24e8f37778b0b04c7fa77b8684d00cf05b0400000000ffffffffec17a38907da5600d8d89f8eff6cd1e005697162162bf4afc9d1bf35180a6b750200000000ffffffff79110aa1883e14c5cdee4767e7406a1908dcb28ed75c302133e986740cf6307e0300000000ffffffff0540420f00000000001600141f77fe8176f0e9d0452ce337e62657a26c37b6a340420f00000000001600142360025c3b7ee8a9e3e5b68323d21d9efcc942a940420f0000000000160014688161e78aeecdc76da57c20147620b7b444ed9340420f00000000001600147ddc6de2c630eba772ba473ea352d1df0405c6ea40420f0000000000160014cf8239db79c955fdf9d1d70ad36833f1bbec7ca902473044022058dbdfe9731f5b4c8f6a85e2e2d01c3f343a875206ae4b964c5c9c07102f05af022014df70a63d920c43809dfd4897461f3ea4a6013ae6f8ffafe43aa44456032721012103fdee88713ad971ee2cb73f58706b6f57fe4d0840a9dcbcc43cc96489b3095fdb02483045022100f882e6d3592606a629e9e92e64376a64b5ce85130e44b39ee31123d6dae4557d0220099f5b675750f11a1f0259d6435f9a964d6b7ab659242f8fcf27642707b963ce0121031148df73cecfb9b05375e478fc6ad0f97f3a04216275c550fbab97f83a0ac7c602483045022100f3e47a24ff4a0a86b7f667c3338002169148aeb3a95c74f926360b85faafc06e0220795cf68b0a24f620c5d35c61fb0ad3751e68442065a091d63d66cd9b08657085012102f61d8aac49b8bcd7c920c890e07f40c7e649bfea78c1e5697b88d851761faf820248304502210081eff63bafbb276fccc8a691f76b8e56b03bcc20652d74159a84d24e5aedbd5702207edcab86486f9d234f4e10539e27cf642c5e01dc0e2d6037f0c96edfabc3f9f50121038ba0ebcb767c5f0c620f7355ff3a52332cd76af25fd87b3f28db04c0f2cdfdfb02473044022066aafcd58ede5049a1d3ad991f27fcba8d80ffdb59c021d87cdafecc44907f69022059bb229f58ab263ec8f6e33c8eac946b229486b9467d743361a5f9365b92edca012102e54465c6b8d22a158da914b186dabc77a8fd7b9ecd3c36747b93b22e3b58bce40000000001000000000105d2fe5910ed97e9aff993387b5cacf51afeb353540f91774673de5121f2410c130500000000ffffffff170086bc90a5119475815ea72c9cc100f5e8c35435050a9b8522e47b0ffcb71f0300000000ffffffff59e924baeac24cced25f4ebcfb86b514646a889699c78b82c8ed07cf5f564f510400000000ffffffffec17a38907da5600d8d89f8eff6cd1e005697162162bf4afc9d1bf35180a6b750600000000ffffffff50b95164469b0ea83bd903e180d3252f950a044839de6c8702d6f02c2673a7d60300000000ffffffff0540420f000000000016001418409789372c867e6592c28a8c5230b69b39233040420f000000000016001432244447fd866001c587d75b2dcec7660b08aae340420f000000000016001437e9d2bdb830e51a02b1ea7ae10c495e9ae471c040420f0000000000160014412a8f7827d5ecc3cfb721632391ee1ad20710a940420f0000000000160014fd5b1bb123ca72faeb7aa2881a9c3d45d65b3a5b0248304502210098c37ab84c35fd0526e092b68005adb31013f8d4da1d26c83ebc9a1c2aea4a4202202317859d0a1aaedfbffaa158b2b8a771eb1bc386f22ca004ef48c0250f7be21f0121021ce0417843c482fb59ad8acd3d56f17b7b47f2c32f976619cf36788357d3a3b902483045022100a590fdbf93b9c56e1fab713309841f602be343e302a662de1004eac8b928c81d02200dd0b851e5ed31fcadfaaee462b12b2ffce4e2f28e4963909e4f1a2edecafd87012102b5a17a524356b4cada0b86845a531612a2bee1c986f1959b12b7f4a43b1de1b20247304402202bc461ad4b81c95ca13b6fd72f3f49241041f120b9d6d3afe15e1530e34ddd3b02202e60ca7590ba48597a3df2aef1fdb49edef2078abfd8f4da7e1081511531468f0121024ec4fddde6d6775aa18ef72d48d2cb0cfbc4f09f13fcfbe99ee8f14b2e37881c0247304402205020fdbf31c9d042a43c861782c4833dc1b6bcc9579d7c0354f6d45f869c563a0220788bdfe7763336a60886d106e9a7551aeff1df1201f10c275fb9785b91561e190121031dd0986142726e97b15bbbc1727f49afbf2802d1cac2b14f54aa283a125b695b024730440220287b2958597d0bdb520f4160e4da7eaf5da960f99c0994e97e8576a9cec9e1ec022019ed06e2a72c98b52be6ef47bff4e194dae3a3fb0d5a8ff15450b27a54c0625d012103eef661841d9bf436ed0cd704560d603b2417d1a28eacf5c9f3adc16145708414000000000100000000010506d74d44dccd2798343b17613e73d4b13f1263de261ec47dae93d01fdda4592c0200000000ffffffffec17a38907da5600d8d89f8eff6cd1e005697162162bf4afc9d1bf35180a6b750300000000ffffffff4ee1d7ebe10657631a1200b885d19f535dd45801cbd2fb70a6f8d5f6c38cf8890500000000ffffffff12266e548fb215c8dd897d0f270b2c6d699146ddb44ea760ae2105f8be6983b70600000000ffffffff02775dd9ad160bee1fa2130d30d528bd9205c37db1cab8bc2220756f734726f50400000000ffffffff0540420f00000000001600140152237541cdbc01abc0de3a82adb8dc1785819f40420f00000000001600141328a3e29519ee651707adc9926b5cbf571104f740420f0000000000160014a315b3021bc5bf23cf25ea77dc66dc1674bd28e140420f0000000000160014ac12d06ed6a18c2f3ff8c8158b63e2aaf45bc8ff40420f0000000000160014bbcc5deea9a7e200a2ed563dc5265a56269b637002483045022100a250e319a6e8f6ba1616e9ea58c66033bc5a40fd84806a5a1467a87f74b0cf9a02205c602ffeedcad47c2ce181ce8f0536bae00cad0260fd285045607f4dd81863d70121023233ce7e34b63a3985ac3e65ab3f8ec3df566535fbe0f941665e6ded7f8423a102483045022100aec036ed8099ef8136003533f895af34702af87b984f80231bd33fb0abd3e3510220723f6bad802e8b2626a4a508a2eeebaf6ed2f8d2f3bfdf4122d718200581436801210255b2f768f6fa97ba1db9ad8a0eb992148392404732989412a1184088a23d12eb02483045022100f86ddb24c5f667e5dae45485577db43ff21d68178bffffbe6ef4bea46e3d87d402206e7b251bfdb380cf0f37464540abe478c56e0a72c642d1ed6133139d26c57f4c0121032e0bcfa9d8d36b9bc0a7a34cf6152ec8dcb4a0064da0ad0fce62aeab0e850958024830450221008e76978a8804ecbdb3d36d87b2ba3f5efee72b44ab3a315d60f347e76a97070d0220765ed68fceb7bffd647f4e22ea9c240fe93210dd16c7bdfe97ff30f4fe3fc9810121023bf73b07ce50c28d0a20a4ed28c3acc74fd933606e1dc6ab649f3f480937b18602473044022004e20d0cc39be4e25c9f8e2cc320038eb9b9b24fa4c85debb13bdfd1258f637c02202d695942d2fa6e2fac5ce472ec6ab0d43296b0ebc0d2bc3e2e96c0f531829a74012102ad8a9062bc706ee37ea3eb867f4076549b99d6baec2a44a32c1c77229a03671c0000000001000000000101ec34b3aef3fa8ca7e5a60d57987cc296fa47b48fac8e0012f8c10662b5ea457e0100000000ffffffff02a87f000000000000160014725583e973c7fe4149ab4ac5a440f3bb5caa4395b03600000000000017a914d9fa1d36e6785f7e61dcc4fe94e47cf6925f4bc88702483045022100e69b000702723f44a01f2484e386ae70fe535746f2d10d3675028e58ba726cfb02200c28f63ee221c606b9450cde04bddf91905a8ccf2f677f3d8e35f389be0f304901210249770ce7a746ccddd4838f810394295508952da6958c46d21378d1c40fdb908400000000010000000001015eafda04a45c16f459829fbb441a4db81b57a3e975f0994d3ac6cd0425aa9b370100000000ffffffff02b510000000000000160014fd0c01d23e961b11bd645cedcc2d1829ddf2d4cfe23600000000000017a914d9fa1d36e6785f7e61dcc4fe94e47cf6925f4bc88702483045022100874a787f2f1d66e197a71b3e1a2ba80367becb99deeb0f33fc8d507d72c824250220366bc8d76ac0cf75ee3b902bc9123f6bd9b4f6307297eb95f9004e7bb490e91a012102382d1ab4570f4616add0407cdc30012b1cd5b083ec2b9628ef0ada9c3be0348400000000010000000001010e18ebaab040812eceffe8a56c5d03ad6feec9baf1a75adb3e590e55eeee10ed0000000000ffffffff02102700000000000017a914d9fa1d36e6785f7e61dcc4fe94e47cf6925f4bc8876508000000000000160014d469b4510ef11a72421c4712bf8cc73ed5ee4d5402473044022077525667e92c5d155422313ec4546a2cb16e57492410fb5e1779293e2ddcfbc402201a63cf1d894741a33154cee939737f5adf9c82202631e42de46e6d0f3e5c03f0012103e29fe41442c4f88a08e4cb6c0788207d551b1cb3f8b3707ae90c21cdf12d0dc6000000000100000000010123de7a28fdb63494674ffeab8f66aa847f727f03af147f5f071b7f652044cb670000000017160014a3107d2251f1cedabfff6a027e1a9a7ebe939fbdfdffffff021e7479000000000017a914d858cc193e77b7558dec5b04e0c9e0da780ad09a870000000000000000226a20a517806067bd023d479bd91838e112656ed274db0cd2f4c799fe0a6eb69289ed024730440220153c04ad4338f128d2d0427bc6e95629c8358c092fb27695a8aef1c3043f37bf02200f47b330758a3be5c4afbd1b2fcd7aef7dc76135c32c7a3027fd6d0e68d0eeb001210287da90db67cdecd4c59277fe5399f3362d61531ad4ab2500e7a6db7f74d39d78272e160001000000000101f68c9571aee1eba0821abdc976c0b992eb0b9d9800f6e9743520e7d88d6f48700000000017160014bc4ba930bfa944b6acdc93a15f3086fdd501cb55fdffffff02f46891000000000017a9149cdac32b184e32f56f9ca6c248455cac0a8d347c870000000000000000226a20d4723e942f45490b5db02076af578c29a9b35a5ea6c0e923fb7c9fd858018ae9024730440220357e783e7c06f502fba19c58441c2db3442b3e6d1fb51b86b44753630e28f5c20220769ac833815cf31566f69d14c9cc522e980602186aa46f1675dd283839add31a012102b4ec0ce937ff5fb7d9569c590a20210229f89499b6e051e6cd88c68d55ab6bdb272e1600010000000001012581e82e36682de73401031f5b1b8bfc62da81107da6cc5143a1f12daeedea270000000000ffffffff0237410f00000000001600147b283009e67a6c7ff7c95b9eef4992aeb06825fe40420f0000000000220020a8b906b50a0306580981c8530a02cdef8ec1595f0559532de971e629103ae65b02483045022100fbbd2dcd491a3bf06d36ba42db02fe80a2de25eca75cb6b51a72880ead721ee9022078e75bb3f715326ffd1dfb50837554b2b5f3a19a2ca077311502a55145a399b4012102d2c738fe222ddb8ef85a552847fcccae562c06120bcdefd5d0349d62bc7e16af0000000002000000fd1b010084a80bae8df308757df40919d809894283d8f46131311b5ea9481c72aae189010000006b48304502210090409e9e61e58c9f966b3db7d340f636a41b97a3edb198d810149b6ddd587bda02203e2ab75fb1be0a8c5156d0b19d8c725ec9d55db443606d17da417c83931baeb50121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff028a16f18c152fe0bae74ca06bc3b022f14beb505a265ee524bf3b20961cedec000000006b483045022100a3d7793fcc3e8d9b9da8212def5effe49e9a7029e9238bcf0d33791056907b3502202448f7fb12f993741df4fdae3742b25f5e601caf1036816ab8dd82cc99f841560121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff02c0b49b80694b276457c8cbf2c8af8e2befde44d64d7c98d1274d5f6024e278000000006a4730440220537cf1fa732e7a9cfdb20f9dbbc10820075d6fa096515f7dd69a4f6816f8225b0220790dc00e5be14a49891c601409f37e440fadcb70574e4b237994524cbfc3dc540121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff02c7b6881f6d70a8bce9a4c06cb15d25b345e244fc6960a73978881863cc331f000000006a47304402203807f8f4d98173dfad242141139b0725d5955bb136ebb4ef022782771e6b58fe02201879b63b29b1bcf3bc26dc544a873d78aee32197b122f3f921d7c7d560266b010121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff02d1ba7e985ddf146500c7b41cd02f21b07ea48589bf43db21fefda67225ebc6010000006a473044022011e4f478b30982e620e17ab2dadd49e94a22072008f28e69a9f45467d2a3acf902207b92bc4048b9f56957484a3fa1cfb670ac972e80a07a7f8ef2dd0add267f804f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff031a7e889676aa9fafa815c38975db59210b0dd14af6487675f5b065ed2e8801000000006a473044022022118a9540d62ba1a97978fb2d98e2c5801396d99afa28251d0fbc6b6b06baf9022027a1aa74cbae4b5c6e5285aa78175bb2d2b1d11199ea66914ffe93fda9c388f20121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff03fa0b3a85b0fee72029f030f4ba8a05a4913ac911d2eac3deeee25c1a83cc50000000006b483045022100c86ae8d5fe69f557e4e2704f852d45819a9210f7011ba6205601dc21ba4edcd00220479f79ca4a2c2af2a88ca8234ceebc024613a1598ceea2bb6beb30780ae7b5270121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff058714dfa96fddc38cbe99f90600220af2839f47f1b6aaacc38f444addd1adbf000000006a473044022007332560d80662ead42c258d2de62ea685559a51f777975a0da73664358e588802207b75ee031ef00d231d4576d40e1488cdd1a4039a8a5ffb40c7070efa43a23cf90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff05df336346ca5acf8c5ef0b7bd9df1c41dbc2a8f8eb8fdf022d09b0882d22710000000006a4730440220533aa56cf1156fec280cc5e5019ace36a7b3c1fcd770a609823a053c6668123f022021131d988e0f3afbd497c715807816b2c72022a23ab07bf41c184783d50305730121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff05e6d9c48e2768c3ca67c3685f07318512555f3dfd962be7db8098d9ae09403b000000006a47304402207f599d6856a7166bb23155321d38f098a8b2aa88105de3f14a504ed890201e7502204a70aa727321247ddb65f50ef35bc59cf793a69a299048ee836248c28e3db4d40121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff0678271bb3ae7f0feee09c23edd71bdd8fd7029a65c20e0f5c78b2a9c76cd0b2000000006a47304402206768056595616cded4ff8f2876ba5f21214c93a7e020d5f9958643949e946b3502207483500f2469bf9196232313f125df9036e247d1b2a0116837e9af2786b573850121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff06e6a532f9d1c943f30d4083837be462b4e763035fb8827d67f4db191004e39c000000006b483045022100d9dfe5de4d325a84c57e857b2e1ec447ea0ba7de783f1220c49a40350f3c74c80220363f7f9cd8691f13838dfcd6f09c2a9a04337e1de76b02c9eb9f85170a502e210121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff07a6f0b87f7d1a38c6ec36771c65ec5533fe075a4fcb7777b2ba60aaa9bbe3f9000000006b483045022100e884bf992c7ea890a0dc92a4426bef9e6197bd8021e22cfb7cd3e50919046598022022b7487afe90ac936cb72fc5c7bdae497519f1888b6b202cf51ed6288dfc72cb0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff087303adc5e657d8ef9df68959d2cf209c4370052c1a0e28a05b2818d892c8ca000000006b483045022100ae5851c3a3001df89cdb432f9df71e3efaf22c8f391c960692e1bfa31c528e0d02205a201051ff6023333f80be2f59e9aa05641242c9a1e0593fd76fd0652e8db7680121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff0a071e9bcbd86155e42fa8f754e34580f589f955da3af5891ab34f24d7713f10000000006b483045022100c59866c958ab8df90e482fe4b1ac97703fdd04591409c92352b22c9d5d39c4d80220412a805cf754d470ae8460399a2f450c10ec750ad63caaf077eb9fa9017a74ec0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff0a3f82dfbbfc9d889cb7273d99d4e229a90adb34bbe258d50058b32494ae7648000000006a473044022049853a918c602cfb13fe48fd0d7dbbf0359b8e06198611c5129dd0af05e530af02203c10d0743138f826b9c46720e66a480618e962047ee02c12fbdae92c44f098190121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff0a7a89437c96efedb935edb6608b9074bbf124031b53ba03bf67ecbd9b1acc43010000006a473044022001e7225c634b8651d1924c9e1aeaa90c2e33b55bf02616074a5b7eff84178991022050ea2f0a5a9d3bbf888cb937448f61a8743a1f1158770529e6d5e1a48c0ca31f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff0af77ff75661935213bd0892d16db7264d20be47a9199a2569d150ac5225baab010000006a473044022003245acafc7c492afda1022f15d5e6314f2459c5620b529151c4f1cc8bbefdfd02200ef972a3aee6d4d114171dacecffb311aa0a2671ba93dd8d1813bab5ebca66230121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff0b7a6d5e6314dff9f4c3ca182496a95c231cbd15e280d6b65f6f03dcf7325a87000000006a47304402204e5ba58b0f40166afe79aa4f805024a1ea91f91daf5890146fe62e92951c142802206683f0df0ef46a1816ee36d07d80a5e9b1212b8923d875286e3cd5f2636b7bcc0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff0c7ca90d414a6fc0f5a075240bd31c5f13712512564182adb7ccef21f05b48c7000000006a47304402200d5d59b37cc12c7e5e6083c8fe309675e625f54e3a609ab110c9113571da8a700220192a01da86c1e60e9aca9ac07ca5926a68d5cea68c13133804352b8cce57508e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff0d93720602be16c9e024509b2684de33c425f8a0acb30098b41d88b751fbaa9f000000006a4730440220285f84e9b91497b90a5ca8a22ce29150e3a9994b780f385965518140325dd3af022017065e03a5bde3d1aa0a7b01ac8cd8c0f85846f12f6c2470a731f61446eb58190121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff0e335606cfb595681f0a89ec1efcd658642231d03363626e34b66af262289fb8000000006b483045022100faf1eb2704274aeee6d4f063a17f3fa0a61dbeefadec5b7a3851b57bd66a622e022037ee7ef8ff9f0c6333704e22b72efc3d4cab5fec115d4dad32c5dc8762118b620121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff0ea1cfb649f86c91a163478d06f5e9277e15223d37bf20c185e9d3be097cf5aa000000006a4730440220448d807b32c899ec9cc0a9aca664e303468923ae051c32f3e891fd1413b1fd1402200fcdfe0ddb4362182ce326b01cc70d0ba365ef306a262bbacf440038e8d2829f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff1144e611da95a5c963a0267d82dcb6d65c6f3f8b0fd05037ef28b5722142a7e9000000006a4730440220432a77782aefdda3ca3cce3593125e8ec2b187ee6effa451706073ba48384698022017d3980f60e619ffd1f015b769aeb157a8968e360fd19c8ac67d8d0a78d436640121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff11b9ba24b8983303d192fd6b1314d6c1dc60350af08c06320df436dcddb9032e000000006a4730440220617a31673d0f4a02f3d8a67b0c67ee2924bc332ef09c9869b658e84c82150b7302204eb4b6a507038178c006a71c5149a5f3eb28ae3741bd70a1ca47e1b5eb90ae9c0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff11dcd081700477fca8f5c92eaa6c69ec5ce6109b2e049b5fd94b1c7b641c81bd000000006a47304402205f5be173c9498d799c49dd339a70f74a540ec4c739639765b36ca12134db4eda022051872a55f7c5f4cfd8cbda546eb15f8253bbe19001c34d40eff56014be9cac1a0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff121c23d29c3d6c6391d3f63d96e57448b24ca036f1984b98440c416444b55e09000000006a473044022030017a06105de48a28c7f4b1edc6a530bd9904f7dcc29584b0d81abf75b6d2020220657501c1a36cbf0575ef40410bd648a27e804c5b71627e8c0ba66a4cc78bdd060121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff132987deaebcfabb2f23359d2b3db3337a7883c41b5d18c29d6a5200f42f8cbc010000006a47304402204688c3aa0a57688645ddcb80e99a4bef579a45f917289faa71dc281767065d0402206368e805a17f2548d044d3d30935a609cccb372594f743a0123668d0f929bcd00121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff13da76c0ed49ef8cd88ff2ca52fdc3e9f6a12c4fbc0161d4b480e4f146046fcd000000006a4730440220543a4ac965e31dbd3477b412e9dd96be5f152cad178d485584c27be00c77056f02206b10d39d2dbf4ae06cfcd583bb8caef205ebc434e63970ab4e512d3ddc34c9de0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff140224a4e586982c7215590f371e0892764c1054fc7455e92187abdbcb7691c1000000006b483045022100c518ec2569e99cc29cde8fe46776f67c8b979c102be2193eb70909f8a74a9d9e02207401b9b6604e14c8e303d18ad9d368ea9c30119d1e560a84ffac9646ff17976e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff14061b212628b8136b2cfc135b3f28e3bccdb9fba453a996f75b9f2574e2d21a010000006b483045022100bbfc647d0918bdd59a4f9ce4b0cd65e314f9a3d790bd505ee93d8da1e2ce420902204bf63f05731259b656f94466e1b755deae2e2f9ac958613dca270921a3628bd50121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff1534e8361588a7b188b0a5e5c42362f4fed1ee9b397bd4e9a36139e5549a1bc0000000006b483045022100a2cead800c5c0261f6ba534574ee35283b177cb9e223e20d09df96d361ea844302205ec52d9d67092d76a3246b6a82b69ae411434aaef01eb502b0a84bb9d1bf3ca80121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff165af779aaa4817216d31e781f8dcc9e75a795f1b0c5a4a6c3d3689563082214000000006b483045022100b03e32f57f622c2d3001bfdc94d5bf0490a54289adbab7e8b2a137058d1b7b3902203c4bdf449680c5268139bab2605e0679592c70febe0dd73a411d184e7e1dbbca0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff1711c634bc904bc76e71182b4a6559e5a8f42173265be9420897bc98fd50ec14000000006b483045022100c36b41325553e23043ced286c0fd0bdcdc62c98b8d925b24360b9ea272d8911d02206590f84acd379ee108f2b5e0b923a35a46952b1f66e7ffa22b1fd991d0749db80121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff17ffba4037ea0638e16f22afd6dc965c6a7dab00319900bb813bae1d516cb29b000000006a47304402207d191ee6680ad4329b62f83b42fd19bcf9f2e6508f966be09894be97784664e102207f08e7a744a05c700b57fc15fb139ade4c77164b1928f3882d8964d8f0feb65b0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff19dbe0a70544118ae44a8d53eace13eee56e1b4f3cd30abeb5c443436eb5a0c5000000006b483045022100d724563e08e387c680b94df416f7b7ae020b1c18e335d0c40dc7c3fafa36b15402203c55e6e8fdba129e6e1f0b365f79b93b2973b9c8b41335916f83c1f275a568820121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff19fa2c07fc4edaa2e6fcff068fe42e6369057523143e1cb169f10de3d5f00c1a000000006b48304502210082cddf905dc4f4cc443855513fd9118b2f0aed5b036175e9d74936c6bdd5981602204c3721c25be2b811acbb971086231d1d19585b2e323b62d891fe9adf454c19b20121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff1bb61e6a1403980af02c3d0ff81e3a83fba198c0aca95d66cc1c60836a126815000000006b483045022100d3e7eff5910cdf83f0f478e77a0165bd8ec68f8d59ca3dda60ab2e6fb1a6b0f3022066bae662721dbbba18ffc87513c62ff168a88fd9e9c92589ef78203b81f4ca770121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff1bd2b929c4952d87f8fa2b04f0694f5dee580e95fc4b078f6a0409463be3d172000000006a473044022026c585409ce7d31bac7982997d4a29185cc7db18994587a1f33cf367747f9d7102207425d8ee07603f4eb9fcad8fdb7c6b332a9bbfd6029faf09487046cbff4d771d0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff1c277114382154457f825dc7497d886819d4f76b7e8d636f51135059ce2e8b06000000006a47304402200ea2c820e206caa095602fa15f3287d2e33dd72fa39c24946455dc729090454202207ad1867b96287d0d7828b16e650c30ba1a46f9b9df0e305c28273c384826f4220121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff1dfc43b6e6f96d5441136c5011a59856e64e1201288e8b8074de359b2a249aee000000006b483045022100ca4a205362e049ec568d09c80136b765be33c3b473e606e62d587f4bc6131f1402204e4969be217232030943a5eea395cf07addf9e53a940a242947f500336ba86370121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff1e7e7d9e0f56ae1b8885c4793afa41e149540d92b9d3e9311d913859fb86c9a5000000006b483045022100e525a14a68165ba7ad63e1bb317f79482e2c18c16757121ffa204c391ea9e9cd02201bb3572a82ec5335eaf3c0143985094aa60be16ce57cf2417b07bb02a2747dfa0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff20453b178e05bc0157f57838fcd510fc89e0a34449a229a73ef3855b2243889c000000006b483045022100d565ae3050d8ffb0537a13fe31a80af56f3570c5c914a0e5840bef25457a368b02206afabff90b6dfeac3d087dc9436ae98d50a4efd18e7a094319f432ef37452bb80121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff21627df51690a9c14660e2ad543cb8ba8dc99df82036bcef0b9c374902b5293b000000006b483045022100f0ea18558ab213cf614a649a482c36ea9d86913439aac7cce28714ca025ca0800220177ecaf3c56563597998941fa2937f718b0101e277fe60be544202ec23cb1f7f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff22aee164242ba8936caa785e82c07476b53e12e68ddfe5f1dd9be39ce6d2f2d4000000006b483045022100e1bb637b3f65c47a68c237d8837d178594d639edbd8f435520a45e2718fbd469022079779487ad9baed2962533d21095fc9f49242ad2705d8f9162db444494e876690121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff22d538859f2961012b397ae47d0f94cbd14cee3e266ed2b25a7e93e1b3d4c2e3000000006b483045022100875db173464ccf17325f51d3a8e9b031166b9c5bdbcb8d9868e896796ea7bc4a022071aff61cc96dc7ab820840347abaee8147fd6f2ab9410ad862a29e315c0a36000121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff23c644b9e7f5b08c21e669517613fd6fb525737d9e67a5a3cf716583b3f8390e000000006b483045022100ada89666417ffb0ce0d9e037c2cf17bf061cab040e6bac5c792007480702bd92022075d431369a086cdb4ac6a99898d52aaeeb17c5f80bb4b97df1911c3fdd415f420121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff2496c166e7adff13ceea3097813720669fc547d24b77a6e736c14a0e7bd06112000000006b483045022100f10ac392bfe05474be10c36bd09403f289bc0079b7ca73a774d2a4fde63e7dc40220402c0505186d9d90f609e89b570f1a1fa70edbb09cfdabf355dee5e88efee7c10121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff24fed706d186203f9dd560342716f1eb93361c34a22175d5c2ab1e6432f6759a000000006a473044022038b99bd30308dbed7616593e989603d473edbb1007f8734696247bdf1346e8a802205f1b174eb63868ceceb02034731299d52182c5eb6f6e73ab4d822c25ea75ab800121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff26e7fc225ad3bde04a68b5e7aee304f81e671c2969034bb86e7a2d8b84e692bf000000006b4830450221009fd1f1d2f74898eb87e7844bb2da643590b19d5f246ea2a2d705d208740e60f60220636e5aff5c0198855d7db9fcd00e125fb848c3b644091eed64092e83ca6e2b7e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff29698a45dff5895fa405a25952dc51f48eb90c1202652ecc85382d62770390e4000000006b483045022100968c03cdf4e215d0a0d62b8c0da9d31264c5573119e7843a2c0bb8d9b08b4de20220561d320bdff848688e0da53c28a635c403a38a77e5ff5b5661bb9fa3af200c270121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff2ae7dc104d6e8dde0757f3d91d4079995347609f7ed7ff1539ca19448b683a82000000006b483045022100d40afba7c972b2188b50e83bc9b954d6321d1cab74461ce50e2a53f1e317f88d022048b5c2c4518ba281effeea5efacef0b9e2f8ddde92f2864ef794bad11673794e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff2cecd10312c3d68b7f5a3e6d01ec39a67cacd328649a1c749002893f1e9e86e9010000006a473044022022de1e8a3232dcccefee9f00c6a5eb80b640159ab5c2a22ff291a892dd59fdf202200ce18396f9f8570546a962a8aa4e90dcb077d2801604ef64d6febb7d2a29c0af0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff2d4babbcc970b619f55209b17a8c1fb80dd486b6a41647aeeb7a1e99f737b0ec000000006a473044022003f7bd6da592c02de155a45afae3fa766c72f71390fe91401d443bd297635eea0220520fa1462e5349bb7711d3e569b05afe687a1ce07ea4b7186b2f5df6c616a2ab0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff2df87457cb2c8cdf4e61423d8f3e87a6dadda6a596497c2abc1aa78f1361e347000000006b48304502210086f67985fcfa308b03dce8f45b0edae8d5c19dfd801f0c1781bde96a9f8b700202207266c75d625016b6744313ddf232fd3e56841f31fa97105212d2d3af23fe3b620121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff2e1ea9147fdc2aeee4e05b1419d9e2c0f430205169c96960064f2aff9e78259c000000006b483045022100b6100bc8d9fc7404cd75276192a2024586588a346c9636620c1c524ea8465a3d022040e7a62e9e1408b203a17da560f8c51004c25f953de578764a7cd06f8bfcafd50121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff30712fd58c36a3b3399ce0902820cc921534071b3ae889716f5f8a107ff23eea000000006b48304502210092406df143eb117fe7bebfcf36f29547551e323b7214f3bb91a236e1c81da6b902201bfb23cd93474c75849436d84c63770d6fa3b2d54b589cb4e21a6baeca7ebc9e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff31a4c4ecd80325785186df9cbbe8d86b2856c1d1916042c36bf74b84ac08030e000000006a473044022065cbdb760628acb789db43fc451baa0cc5a5997553c0ec1add80d0f79e4e17e402206cfd0ce83fe9447264952cea06c18b4417a264b33e7e6cd0d9a45480ecd7a9ee0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff321fac7134f011439bcca1d04c62da395a53708c5b45428a64995c3604dd8d0a000000006b483045022100bde99dbe7173feb3c7db6e60a1f6943f6161685aeccef936200d35824d9bf80c02204e2cd7a96732903659910a7920bfdf5f6301c57c1efe11b4567058a670dac5cb0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3495e3f3261e01aaa8b1e2517c21f195f3f96a7953879dd9646e90ef485cc5dc000000006b4830450221008d3d5743c48ebb3f4ed9b45940c47740617eba2177090206ba8912b88a3eb3b002207f62368301552e1cce73d7a3a8671471c00e4d770a4424393c11b58fbf81683f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff34f0f075c1912e90d3e1d5918c595d3b8426929904400c78d9b4a640fc6c3b05000000006a473044022010c31856a7b867c5dcb18af2441ba21364fd0338d80463a389774372c18fabc902207a968c05a8fd1751aeb9bd71de1d008c7f9e14d66c6651df67d8b53f2753985c0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff35847298ac78f82a508b0a47431093f582591e5410e07bd689d236de02440f1b000000006a4730440220406e6fe51356f2144f898a2673e4a86a1ce9f1b98503b609bc5f0012c2eb61f602205f4590235b0082cb9e316c054e70c178f8ad8d0204621cb36dae583e4ea3d5b70121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff36802b86fb5024986d8433ddae016908bfa1ea468f47346ece051959d3c558d2000000006b483045022100f2cfabc9571743d356d9d866ed8267a3ab40df705106d112506d2c75790dde2302205dab87c6aec30f7d9760e36847cb80c16390975ae1615318e313564b945f56250121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff36e1be99e226feb8cb89204b960ccf64744e15a6fc272c74e5f5b9d13cd60d59010000006a47304402202f806d987e31b09aa51b3b3339c50a7ca7033291bc839502bd089a08b3c56f0102205025e519723f4a578786fe000ef48e4a7d516ecb22a1b4a758121134f28737c00121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff37db5a9de63d5a1927e371eed20f8c25f12a83fde2c64e0d95b2041fc2223088000000006a47304402206c538e8255e186991e7b979cc56bb775aaa723dea3735abcacae16d55b92b6ef02201db4047198ccee178c5dc67ae9f1745c38d28bafae0817217565b4c9294243080121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff387e2bf2d27f25476a9710ba2bb7c0a05c28afe294fd07db8242e04b569760e1000000006a47304402206f9fc0347dae54d89886ae78fadd25d054eac0e27db37d8b6ddcb9c662d543c302204d2b4b072a7c57ac67a848cafee3550b98d9e648b325e0280d2155d44cdeb9d40121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3ab1adb8f86dc087bb6a3c5c55aea4bd55da8cf656caebc0392386816832ab1f000000006a47304402204b509370bace257a81c63a9347afa4ef5762e7b2c6abed1eaeb9a2022a92200002204ca2a4ab5842e705772846531335ccbb93919b60eb121dbfa8fbf4a5bc59c7500121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3b5b8f1f2bf400992a678ee80f345a7e7edbe13e2a5ce56f9d950e2d16befc6a000000006b483045022100f368f71c52a07c8042598389da93fc0527d9f83b2b79ae18e86da030835af8c20220169cd0144828f1f6ccd7339c5e59cf15a19c3b568dd0fa08d18e9dc6527e00b80121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3b86b31ec02ae7923d70db309a11127cc690108c9f653a58e3f63d78c187d640000000006a47304402204a7389252af318697434aca9b1b7ccf86a610ccf3e4a3d0f5feec9e8f0110eb8022008167da28fd5ea03eae3f461bb4e8f3e522c0b800ea4be9a3eb9acf720ab2cb50121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3b9a55453f244b173b78c483b2591ee52d502ded44f9c565c093d33c99cf4353000000006a473044022020733b41147465c53b7df8f4a10138b6d405b992224c62e05eb38fdf7365efaa022065d371eb9d9953493442bb37795bd7560646d0fe8d48959b2d625fad8c3a7a140121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3bce43c6dea6627c29527aaef7641d9e5854147008bf165ac0002a68058a3927000000006a473044022064e9f5f04be98982db5f96126638367b4a9258a0e912d52a48fe4aafccf098b102207b2eef00a3138e4761bcb46796d4ccf580cf4d73978df64956fee64a74e227980121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3caf7ffdf0d49e015c40030e1255c374bb73cbd4d0ec80f92a751a0a85002e8e000000006a47304402200a9a3ad7da2411201a8b981cbcc10fe43e2889b734250a6f7ff4069dfe072fa102204efa4023ebe399681238a88c64ab2ca67c9ea941b5c02e716cb07548e0b129760121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3cbcc4402729356e568e67755ffc4ca1ff90d136b31d51adb9a2d67e4be4b2c0000000006b4830450221008abdf550ff008eb76111f23352dd808fe494d056f7399561cfcbeef9aed969fa02205b68e04ba5cc87558f8c59fa0fc9775d53f1cfb94a6026b3f4fcd66f2d0505eb0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3cf5c39b737bd4f736d9417a0b33204b8e5e7d037ee5ad52b8c1690f4b04d31c010000006a473044022041d2605098460450d1a540ec9a1650c43f3fd519dea08176b566f5822cbc5c48022032cfec201f43076263df6c61e1a5814e267bf30f515f88c445838d12e5422ec20121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3d290218a363d74e6a0ebc12f8750a1b6b7233c7f1845cba8336a67295449067000000006a47304402205b9dc1198514815d9eb15c570530bad872a3d4d3ca52060e6c7a64b723e9749202204045911bb8c647f6e2bd1ac21507133ccbfd66c1986cb5971dbfa8c942b90a220121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3d5847da44efcf64b2b390a3ef02dba3adf9890268d1caa0bec39ec01a1c9750000000006a473044022054188ab156bd4a77e3d31d58a44d6aec9e894b9c1ebee33043241958c2671d9302204705630fd2672af7f4f5cb5630f6fd08d0023edd8b70eb74bacb66cf80361a4e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3d7f584095ecf1e804997bad0537e275c0be8956981c16eb5014554c5db55ed2000000006a4730440220190dad90c7f9ef3dae7ddb3505146a2191fafbc11d8e5ec7b92da5e7fde2a26802203eaf7bba4c44eeed89c81f5104a74552859047844560aba0c862d9907b2c8b980121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3df696233681c5d7b13024e4853c188d6fe20dd372b9a3473d2f736c325624aa000000006a47304402206a3280365041ef72ad6a0e14ea45e9ae7b60e02b9897fb23a7e98766f0f2082e02206e9871004a181f480e546bf63b3633f6d4681d3029941a6d14324383c47e8a1d0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3f61be6a7848dd634b5a4ebf1af802727f2c98fe187ac0f8f8c08e27dfe9d4d0000000006b483045022100d9fe42ab02f15ccc016e9cbe0b307a085d956a18850e9e19b0baa0f7bb84ca72022027c2b58f5adf479e9c164a30fc1b7fbff75f4b9fb78b3d25bc7fbb666f3380ad0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3f81e0d2f666190e29ec8f76ac25f54fef6c2898d15345a4b060173d8e6fe808000000006b483045022100cc395175ec8564c669cc6f4bd9a68ae66b134232ba870e3e0f05a4f13a5f769e022049536ad4502c7468951aa58cabad92e063ab9bbd7b6f0f30805f8721d4527dcd0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3ff392bda2570a7e0965e7ab6d2a30ec72894f9e12e3d8e7bf72b8db7eab2134000000006b483045022100c849dc7bc84fe3d632f47ff282683974b3f6a3b701defa4b57b2abf3043dc0500220122b171ee711e3172ab8b90a16b948887624c674e010b89705eb40b7a10d60210121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff41d5da6f6df1260048d00d0a57e1fedb016a710a2f2bddfa30db4da9e4de0395000000006a4730440220275fbd0c721e296cd43c1742c51bd3471a19833c20e2f6459e02910c273d8c88022045e4947dd8e834a4fcde18b7f93932a6e7079e99e7e8298f281ec12c2470c1460121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff46342a9415d4ac18d2a6622a028d0690afd6a4403016ad17e1b3501de68b31ec000000006a47304402202ea6f48204e4c268062eb2a55eba3c0c0500378a9f6fb533a1b77e5fd10d2e9e02200f22ed542498da5a0b90aa75c0c318e5d4e9d64a78aaf516a6a1103b580af6dd0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff464f7670c5b48b6a19386db577cab682e92beb157cd65b964746b4b3d263d552000000006b483045022100d7ffb5ecca3971f83288ddcb13bb1b1a2a85096de4cf18cd1a7ec199e4fb151a02207dbf346fe4395f88f98a851fd425ec9a5c5dafae9d854726193c1ba22778bc4f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff489070d169220da6b10583f34f923bc423e8e8b67269284f41e2e1b989dfb726000000006a47304402202518270d2143a4542d529fc41e514273d724750a749b345d0192218af63eae1502206e744eb0be02dc54e1388abee6fecdcf7171f5bcaf40190c332980b62dd2159e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff491abfa895dbaf240e703fcfd5a61838c2279381d68edd4b4cc84ca301deb800000000006a47304402205c6772a33722b5282fd9f510c8337cbfc619718546343f3487e9500ba140d03b02204ff229df9106e660522ecea15bcc91ef7d1a06d5222befa069b179a58d5b2a5a0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff4a03845de787f4b18efd0700f9c1eec02e9925a3de4b47e1b3147d3bc93dd6f8000000006a47304402205c0a2b7feacdeb4b35f9951cc1aa449c8339b254c2ccaee090a2ed52f76224530220344444b6c8d49e866929b05bfaee16415b46e730d7a4befb887c2c307317249d0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff4a304e554f61b5ac7296ee5c101d5e85a2fba9e3c2e2db90ffb8f427c4263281000000006a47304402202e97c56ac00b9b80ef1d4dff7c0afe0f2a1aca3d93e24fa84ca2f7201e7154df02203960f99500a4c4398685e8496f63f32efbe00d3b627f5cee4b3f00a87f0e3ba90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff4a6d366bf75e83602e5894f05dc240f26b08fe8c4815bed60bacf24ca66a635e000000006b483045022100cd2f11218e111fce33cce33af1a77ae24bfe5a7bd7aaec26028ea174e14ad3a30220422c52d3c9248ac54fe3ffefd0bcfea4c22991fa2f556ce2beed669f1dde1c7e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff4b677492927075dd74b791bcfa3ba3c29afe096c182268bcd0e5c3dcb8e2093a010000006a473044022005e7a6b24dc791aeb7b39285f0da5a64fdf02b34947b7c905fe9e92c5454578a02200a83d8aef248e75bc19da1611fc617f485fa6bc091b33570a3ff88dbc09e7db80121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff4c767e6514696602f65ff639548e0e45a01b4b5ea0a5b34a5d7a0f8944594747000000006a4730440220643b8f96022af15ac3f02868f00f198fa443e80c41f707c0ab200ef57edd44bc02206d1356317de110d67921858cd253bb1388e70ee23493d4a1f338f0fae6050c290121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff4d14755baa405c66d7ab60dec12d0ab00902d25bd0c0f861efe452644ae2cd82000000006a4730440220129733c14fcdfc5b8ad79f5b0ef5c19d89b68189e08e4ea0211d4951fa2bf0bf02206bfab3c268e3782fb1fc02c30b3454da499f5592336cafa0a758923359bce57b0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff4e0399d0edc01ce0947624606ab03aa404658a83e0856338782bfdcd42a3d8fb000000006b483045022100ae7b2649c747bc9ad0e63a0989e44101b31da666d06a3d153ff6c577b548828c02201b126c2746e4266a14803e97d57e82f74e31cd232a30011cc0f4147b427500a70121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff4ebd82bcc5922a02fe8d1af639bdc47ef328f44a0d90837726ff933fa01bd91e000000006b483045022100faa88f39d43a5fdbd7d9115888624bcfb16bdb28b947ed9efaac85184cc2638302207cf863846249fbaf1b4f99ed6e22760be44fa8789805273bbbacefc67aaf52e50121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff4f1d6f448e3470311b1db52687e4a143fb5053fb8136f33dfd4697fa855fcbbc000000006a47304402204bb5e3e33ca254a88e9bdee6abdd7e5060e0bae1b01353caeceffdcc37c251aa022067d4eebc90632af8fe96c05cbbd63656d5baace8cc0de42fbb904dca4eb10a970121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff4fb633db6d569eb6541ea9988e7d7caef9eaaeb8c4d44ebe29d069908cbbe0ee000000006a473044022050853135a4d7bc3367f1c2541a2a0daa650b1e5dbbc0844232aac207be988a9102206e9acde4872712e1a055d56611c33aeb763dda618ef3aa5416382412eda212ba0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff50c781bf7db9d9104f55d0e9f2797184e637f4fd374d66f7f5362223a5d6cc72000000006b483045022100b41c10160d2a1a3f25968a027396606484207a0f37ae54c086fcb89e72ac45410220494a912f55f88cd44e9e1b25fb8064b22467c27b4519609aa8b8c04f996ff1390121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff5255c2da9f8cbf83e51b098274b3fe12ea28f6faee738a3f84554100ab6a1220000000006b483045022100bb2b823328531b6115ee60db0839b80c0a6bf16da985032ab3f2e184a61b36f702206374b8f9d9c64a8bbf3c77f107c3cc5ebcf74bfc53be3a42d95ddc33f91670ed0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff54a45113bdfce9cb41c82bb9c5768de9fa9a07e9654000bb19f81e85ba36d634000000006a473044022059f8dbbfe0981badd334e3cb1eb7ddce6160c6cb32b1ebb50d9a905d521a679b02201b6739de34a866f65a8557c78679c45266c0c712fd8e5e587361c2535c65ac910121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff54ac5e0600d738edaf762d1c0b1ca7e7038cdb3e1c1b3aa5f09da5db9c6a8831000000006b4830450221009a1465a45dd82b0c9500f99f5d48fee07e0aa678b6e774021811daf535849a5a02200de2512010ebe6e219c073d34d30289661defbea7c166a539dafabfaf69ce47b0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff552b331a02cbf56812a3146ed83f3cbe0530ce79283b3cb6ba27c6cc03b5baf6000000006a47304402200e2b8a3a184723626ddbc2ac1d8070eb88969db1953268059246f5555377c0aa02204cb8fe45403ac98aeaa6ad384f2c2f91c19d5a5e3ca623fa44ad5733a257e23e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff556c759f8f89347b7d81852e856fc3d3d39e37b18c0efa5c056acfd7ce8c7fed000000006b483045022100b87069bc069d6e6412037fb239b42c0c538a84f6c25a8a191a30c0f2c4891d0602205d6b24a8da8a42c88f4669cf86c5c92260fce35e82242c7e2ce249c5613d42390121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff55e57d77840977165a934b5cbd21edd27bebf524cd99898ea83d8398c388c0e4000000006b48304502210080baed436cfcba7cba167e3172a7f8047298d9bb00aa13061c6b2056bffdc423022015d7315f37843a4b026a6911d838c937a81189e05ffc64fb23511330994ceb060121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff564b90b39e8f114b3ff55a225f6ff8d03f26a8520d6d32a4e35331a472e0cd3e000000006a47304402200f5305143fb9d8aa7203f08eccb78086a95131da9163b6f832284c799779bf2002201bb1b4787bca4cbe8a27f74e5f0abeedb8108e29367ad8ea5a50101bf1ffccea0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff5b79ce3097be6f305a3449f76fe4f8288e90d60238e305aebf0c763db527a219000000006a4730440220465b8359087917e1e36a81c69d9f539bda9d6e191cac43baebd2e3ff791208d502207777621d147022bee1bdcea0cdaa12ab87efe7c7cef61d38a3a44502b94f53dc0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff5e967548c1e73bbe0ab2f4eed4a21b6de2a561eb58efbbb0ed6f6e58b9221207000000006a4730440220698228e2e5594ddedcfa4d81a4f2fce7182cc8b064a1411b0c67cc9819161ec302206c30b6de9b68fc67f3a3faef2bd99976fb22b4df045e8ac80b8504d831b7b1000121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff60e7fd457367701d86110f6676503c1a162a429817437f1a319d4f9defab9d4b000000006b4830450221008382e166ee8a53231f54d39df8adcbbc346be5a3912afd14a1e0927a64fe36d10220758f2282d1684cdf18d3fcef298569091183d9391be130ab8e6e4d712ba67ce70121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff61af2435668c59e576023da02717d5fea7126773921517b6026534a8b1f7d101000000006b483045022100a058b60d0e591fbe917236606699f9f781e2be234bb64dfb46b301ac9a80d58802207544dea7ef970b4bd9cc779a944263d24369b7cde6c55fd8d7d1d965e01714cc0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff6225b14555cd588e58b9f712ffb775f96517cebd42cdd2c96f7c7841f5a0c63b010000006b48304502210082c8e59eb55ac9e6bfe044f2ed99ec06baaf7405ced4f2370c344cb027f8f540022072acb30571545d3834b76bede21593de0b2b69337ed9d3677a8448ce70912ea10121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff6318b6b2c2172c90fbcb8345fc8c924a78da1a23fcdc98481ed77fc42b98defa010000006b483045022100dae6cb5b4baeaa012e9da47fffb91be8636bb20f0373012b6ff2cf97e3e99b5c02203f5cbfc3e3f6df01c9b044439b078589a582b148073d674a77a85263f9bd2af90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff640353dd651b1466c5747ac2ad11fdf7fe76ce6fdcda96df4146787f621ad6f0000000006b483045022100bb786a7fab06250e5542b3c3b3862daf34b665f39e6d501ec00a36e5ecf3f9590220260160de386f2f12c7266f7f4274e3e11e6f53deb0b85705ec965ae623e4d6ea0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff64281aac73fb9cd399c0376847ccee418864fd1e75d3eea3889e09a51f6705b5000000006b483045022100ce4b03d8992f5171beb496c0547b0c29f5be6db5b9058812b41104c3113dc254022028918cb222df385692d16f90d685237e127febab17ab6b0b14919efef8920fd10121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff64b2d4a0af86ae2f8a7a7827559de9b11d5e44d1a6e98b69fb1c5dd59c8ed0dd000000006b483045022100e33fb71d10b9d736cb613f322e9b362ce3a83c291eefe07546e7ccaae75d459a02201b3cf44ed4069ac6d34bde7e7d21a28d8c0cdd81bce9a7b1803c2cf851e5e3180121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff64c87a3cb6922b581eef454527b4c7bc8d2eb194caf91221e8472eb2c851e578000000006a47304402206fbe0263e0c6713bb5b2e4c89f96eb1bc9b989caa3d75f73ffa25011673a9b4d02201b9b170fe28f7f9e87bcaaeb9d44de0187168d5f1004b96026ec5c4d7b8456080121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff64f9b148882f43abd5961b880b782927c72db2ee1477de0fa67edab163e19eb1000000006b483045022100fb781b6d8170bb3695f3e8653eb1a83c64669888e339c915ea4edcd2b230cf5402205a5b6055930956b454875b2286777437b09d15123f30b6efbf32d614338c1faa0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff666c83631b9cd89d3b2afdcfa0f7945eec9713e26e874d9464dbda04db0f6f47000000006a47304402201128e9708bd01b91991e9fb0fbeab699a06e696889a54711d4b66b4bb73554ef02207f5dbf77652cb4c1724642d3052ce5d97a65f69e22af7a74e1e0e4fbad65e6ee0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff67a3d0f12343177d793fa47d8d3578632647f5ab785754f9fb808e6c0964204d000000006b483045022100bd51f91ba0c09c9df22f39608b500a02471e9efb8918d21b34bf45e9025373db02207d5c012abab7d24b766748632ed16f8b472e2ee7ad2c2ae71332fc2fd65ae0e70121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff67c628f20d85589df43c9183a1113ad899fe1cb16c7c7862e661a4de94646d90000000006a473044022038df25b36a85ef67db53766050d706efd0898ced3b041ea428f55ec0f6115aa0022039075855fb20629717ac05facb5b31f7c1c0198b71b44a161aa817c0f71a89e20121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff69013068458f33210d89b959f0b84c1205f60ae223587795e899c77d3566f151000000006a473044022071ad69a2a847de9d9109d969a361ea031bfb202fbdb082f19f5c3528626d57f602202f44cc6d08509e05140a08521a54a3c86d53d1c4490f2063d30388979799d40e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff6a2a3b75e260357851204aa333c187e50d28eec62575e294f559e8e925b35c3e000000006b483045022100f48b808408fb35a01cfe97c00b273c864bd72cbe902d5932a0f7aab82fe8295a02204e8be3a05bbbc7fbfe7cfc13ef656ab3b41e31926c4d40241c1d8089527520e10121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff6b58d586065489d747f3ec87d37ba56a8d769ca2d1929b35d267f59461a5964f000000006a4730440220581fc2c176d232f0b5825e8c92888465ba008405e1d202bee2b3e409eccb56070220308d8cbed282effd2496742a148f59a017e32b76d113fd6211904a5f5edffce60121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff6ca5cc6c890b5bdc1a9cc9d8e0e597cb1911b962c3aa78a762234d0949e9fb60000000006b483045022100f9abe72e09384712088f2689fb05a3791d983debcc5d0e040eb65bc23117b60202201ddfa4ba5518188a27e2d4b18dcd0c1b7f1174ff5d135a80243f54a1436754ce0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff6d05f3f04b3b550be8d76d8c460c433ce4c8f25abd7b055dd6182edbccc5d430000000006a473044022043f3b72d1b041a9879482d5cc59aa175d9a932059b9cec3d2784d5a9e06d0c2f022015e199fa1962488ed68df0617c17ea5c9ad11ebdea32c4f7125cb2a32644f6c60121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff7246f629f35099b69fe796449a82e1e184760b36fd28e4440a79e76280752350000000006a47304402202fecd492cdb23794b0169e71746694b61a000d51ca9e9d277e7dff6cc60eec0202206db01df1708440c49790587d8da90b175a3effdf07e203a794b7b03dc70a59390121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff73ce1fe602e452d78a22e9b56b064a8c1d0f0700d9c64e0bce540a420063fc96000000006a47304402207f2651e0570c94f2744158a2f80a2a728f8b787619802a1d5f5b6eb69adf1165022024fa788180e11f5141cb9dfb385dac0daa294c9ed1ab8482120c1742c1df8c6e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff75d4e39ebc26f1d70010a56e401ec8e5d901e697bd50af8be2cb2aa91ff43410000000006a47304402202da343f99739886b254458b6aca79deb9360f3f3cb4b9cabc57df7e1434accef022006966f4763f6f2994fd20f324f1d277bac2b90a302aca1d6dc4553c1497fbab90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff76d86ca0c7cfb62339bb8e8146fee2ed697b4f27f8df11def0673350ded80fd7000000006b483045022100b6d3f03d4403d1e9a6fbb70e941a0965855730c938a7e58932d50ded368e338a022057c1d0d778632ac221521279052fd47090b000978561d7a31304600e13ffe2690121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff76e3759ba3c8217aa00c9245b2985bd661872e754edecebc55ff61b50c0c22b4000000006b483045022100d26f291f14c9b4086e6e15df2389c4dab2f211499ab3f790d5b31c89c248947d02202cb32df891f87017635ad32c7597962278f61b108f9026e4b4b19650a440ae5f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff7807abedfc28be758a8442a64c0b0035d6b72474c0078106fce089a991e73453000000006a4730440220043a294e1ed03ca72fc88acf8a810709a3a62baba8be8dbd961e9a19a98dff0d02205548d8cdd664018aadf7f22f58cc946bc4aebd8c53756b8f595194fbfd74410e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff783afd18b72d4094f2f1b72e30449571daea5482341745af5be9d170277ad309000000006a47304402206fbac02aa8cf99d5216efacb777ce13d2bd0b56a77f57d2cc606fbab5778f47202200f2de0e997c04b4c7ef0feb00ea7ba40accd59a09118e70b844341252359a3ad0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff7b443e453f084e7eecbc21245608890aa77cfbf48bcc53c10c8ebc67eaed138d000000006b483045022100f3f61b7fc130fd659184067edbdc5c62e2bce70417af59b6c721170a8f8338e002205d5426322db7441fb00bc2506657e3e6a54f0a1f16c3a5aedfb1aef702957ba90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff7b4d8797d983b1fd19c3d7b87f22ed664b6af1d5d8230146b4aa0d2b24184d83000000006a473044022045bfb22168c425df94185f7c8f97a1f53cc40162f688a42508dadf61fbae5d1602205bacee7448b74c7fe8f096572b6749910bdd4340fe386c0eb1bcb318a9cf2da60121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff7d342fbfa0a6209f9da59bcfec6725791de1829dc80ff9d5d77cf9ed4519154d010000006a473044022078b1e523bc3d4f7bedc51ea3e54144087d923b9cbc1ed46746592cd8a0d764c6022027914896efa68580b8e52919178fa239664c4b9436a3cb6451b4298f2d15ccdb0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff7d9d27e0d4c95299fef82ffbd0fd19a61dc94b48984e7b300cb78efdc2d6b538010000006a47304402200a5f1028051a65388420061b83fdcfc87f9216f6fafbcffab812def05c17eb7e0220036da2434fcdd0249f11a885f1da5ee812f209aa7cd687262c482887df9758240121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff7daa075297f67fba9b4a80c3a45d961d7bca099c977c06b82cd1d6369a394374000000006a47304402203b7693db93ad2d987f94ba7a7f1b5a1c188a19a6e1d37dfb7d79b1fb0fd45360022003d84f40d71a80e72e799a094ed4b8e1f834ea7b1f513c6f3956e5c29fe4ef720121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff7e94487fb72e7bb972ae5cb61afc949631e06d704fdb23ab6522f061a27af49b000000006b483045022100ea988b3ffbdb09abde8a4710529e4562268258c77a0b2da2ae713b489087923302203044c14cda43891b99ecfa11a9c374740fa87a9b4ac61ea07bcea7e216a88a720121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff7ee766ee8e6ced4f8951056803b8746263e4e59b4d8d0ccf16b8fcf00b8ef1a6000000006b483045022100ae2746e00bf5d29987abd60c56aa6ef061122cbddc3b7bb57ac06e388b34fcee02206b2f35facd9353c7c8f24df1978c3214f5d2f39c8dd2b51f3bb83118618e83b50121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff7f21a6fc1f33e7e2eff393350b868fb94fae21308c23833a8fb2ee7b61d78629000000006a4730440220626229f2a5f98ba4133716a6d31475e2bdd769ab7f7e8e399a45b4a2cf060ef10220600ea6394b72dccba13fe948eed57af1599425df5ab3ac9089286f44f9e4a35e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff81c0a7b3b4d522118b895572d735dc1c3e9f8f3c67ded177ee164adf91d4cf85000000006b483045022100f773c998772da0d0449ce395fa5055fe4808fe11afcf28d7fdd90eb5f163e1d70220660bc99e11f143ded61954eb13027f7ae70aa739eb76b60e4a1320325829f1dd0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff870d474810f7ad3bf704d0a1ad87998a2788b56abdb031983d70a8953c2553df000000006b483045022100d6096ac1e54ab364415e1ca43c989570dc2469ae3251e4773392ae36349241a302203b13f7c9d36bc05154c3ae4118db5fcdb50b1d30e96a127385e715b64d9c6bd10121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8741b266f6672e440347d9dd06bc69dddb9170c3e4566e6bd76874fbfaef3e8e000000006a473044022023ff4b7be3441aa30c825dc8d0adf2bc4d69f6ee0997b99495cfb3f79567f07b0220193ee53be40de24039009e31d1a28b37d0c0a321c111ac5dd18b9a217a42d92d0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff878fb51a1530c087ab76b6bf87d142710393a3ad40bf94e2ffe698b1b0d221d5000000006a47304402206ff1eb701310226087d7c043572527678d18a74b3e62f32ad49645dcdbfb1d1e0220615fc5cdd2a2672bf471ac0bb216d815329420cd4950ea00e63a308f12dfdf6f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff880c8c94dcec88fbbca3fad28361b642f42818279652f38746e5be1559c69627000000006b483045022100d340f924beeef1efe1b5e13587d52c79721da72eecb6e3211f570d763cff44f702200efd7ef3eb44dc6db5d14045606f381a4c226b2ee3f366e0684aac26955779870121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff884b318994a94ebabedf599d9308d38fc619fd039f8c05f9ed8ceed47b873da7000000006a4730440220267240bfc3ac528f04608540ba919791039ae3ff4ebdacfe7457f8116d0abd3402203c40c9d5cb185de974905f28cfdb92a2ffb281e7e9eb678c568c66c8328d27990121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8856550305834c72267eead8a00d792bb89c84cf50ef2a2cd7c5065c2afd05f1000000006b483045022100831ff34e5b3ee9e6d0e1b5315e748381fad1fa7c73a46ce6beffbf6e46b98d8902203fe97803c3627ded0ff7948969d983397d344616aa1c6bcaf614f0f4e1696ce60121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8888a5836dbeb12af6e2dbf85b2c346751afae11a86ce966dadd0450862a1c42000000006a4730440220037e2dae47e1d2161546a96c69164b0b840fc433e32f1db86d12d1a86329153a022067a91a4f99ec1bcb649b64b9b38926f092ea6a7c498607019822b1955f8951e40121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8981544bf927fbcf89b30bb161074c3552f131b1671c86ff71d7f0c35bbcd16a000000006b483045022100feb0efe8129f3ef26990b4de5241a1dc829577fb0a3948bff1d0eec19f61b28202207bab7820e63c8511d08210e18e32d933db3540bc338defad8c3d471c6c01bdc20121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8ad2c279c8b75ae9c5b4c52145891ca63260b38d84bfa03f9eee8b44bd5b984f000000006a47304402205a733cbb555544e7dd8e38cb500f2451970f3cd9c03a0acb5e3d7641dcdc93280220321aea8a8df3d8b9f207378ded7bafe300612535c6a81a569ef1000de24fa6ae0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8bc22a60e709e196545e5fb3f33c2019a689dbfbcd58fb5af1039f42572c7b31000000006a47304402207dc0af02a15597eac63443637e8288ef2014149f271b2efb7ebc50b49251f8fd02202b583f57bb83551032bcd7c63d8cb2a43d389d8f912a998096a3d661a7a125960121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8c16e73d249eca0ba0719db799da102db9cccec82082dbb59d5bd9728318f1f1000000006a4730440220665a6671795482ad3bf9fbc50867f4528cfde28af066a7128f25d6b47299f5e80220532e7f48260c99c8eec6db4ccc06baf1be12375238e65f62025f996f798e875f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8c1c6f393453251249cc2bbfeb7d77b5b7d4d143221c4e5870dfd761edd5137f000000006b4830450221009c58cd27b2f16e9a0cff11369147f52d801d6261edf6d4cbb121a0ff9903d3d802200cb3c0b2d0d75bc8e995a5dd4a519755ef043b5abb9a76f9485e07b679a815510121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8c57426347c0f39030877146e80d49ce84c911017f3f44d7b0b7e5dcf350d751000000006b483045022100a53e2fb7a3b9df620434e6bc550f7d512c3be6fcfcc66aab58837e7af262a61002205759a8bffec998730b806ada49b60cf60d91e04e4337637e4e329b8f91219e950121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8c91327228a160fa37326535cdbb35d8d41f5817e426dedb599305b0e6c36af8000000006b483045022100b30e8407227897c1f6da61e308215442658bd20d2d2a3e57f6ec74437fc150fe022028225a09c718ed86e6320360ca14a86fce90531c863e4ce2fe27639efe78dcca0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8d82b4db7cd6a27624cadf6099769bb9fbb7a12c8e77d9b564f0628ca00fd7ea000000006b48304502210093d87d5407ed1d7d923e4fdd352d477cdf802f038fd2bb7042ac24d0bfb1dde2022059952f5a755a3d4491b5d5c9405eb211bc5804727f6137c0c6b3577c8c193e0f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8f92265b8a2281a0eca530c678763a555d2f9798b3fe60b49d01b5dcbefd61b4000000006b483045022100d37e5962b8d274eb29aafd4cc3511990707f01dca5e425ed817c8d5411096c0c02203928fb735cb4d654200bfb408a2e2b6b4ac47737229c3204cf466abe9c3837500121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff92fe1250807bb3565a974ee45064854cb50c8bf8d136dfecfc134dfb4af53816010000006b483045022100ddb2b093284838dc4b5db91401ac72e4802e1504eecf981f511075828a809e730220394fecd573a5724d0cc63e14d1cd9c02fc8797ab2390ea9d6c10823967bb2c860121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff930481d072c7637e0031b3281365bcddff3417b7e8decd69e60a4998a28128f8000000006b483045022100d3562839c77a35cb9e210b9c4b9bf20db559c03269b29cd5fb20fb8211e97d33022046a7b33205624b4cab8ecad786a74e9ba80ab7b7222b1c0b61f84b49575ceea00121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff938dd167bd43232bac8b71e4cb31950330665d86639497aa879bcb10b7e81d74000000006b483045022100ed5c15d3f3cfb09064063ab88188b28f9a7f2a0fcba2ae737749cd7bec83722b02202064a51422807cf4fe93b870fb06aed7752c72835c7856cd6bafeffaad4a731c0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff93bc631439f6efe44f8a13771395fbc103ca940ea903765a6ba23569de04506b010000006a47304402201fbbe6990e3e9ea3b281c8ac346d226f8010bf0a190686c8a8357364ac461fb10220088dad99f3c6f8333a8642c2a4f4437689e832a8af7ccb309d76d6f30fcd94f80121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff93ddcb60d077910299ac32a12d32cfa719d3ef9bda9b324be6230ee944ef3465000000006b483045022100841a811609895d89468a171e515adf402723090e5a85753296f37c2f4f97ff5a02206581f16350f91a8d57c0340defe9cd324bd9936bac23a65b1cb8bdda608636e60121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff94015fb8a9792971f60c765ddea49a324b55a1e7620ff0fab35db0177b510bf4000000006a473044022032353b41eff05f2accc21415adc303e6a64d7cac41ae117a2b5f0037d028501c02206c152301f758787d4cc151d1bcd7c803888532f70d34ccf334e27470a39896e60121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff94a248fa927ed91b533ce296a93ba86953691652d47a394b3555b14a0e689776000000006a47304402203b63e11dbbb00a98c932a68d9c5089747b9f6996cbdec2e5b0e62f643dfce66f022056cd9296904b126bf132a84a7bb9e6411969e5cf4a5549633770bcad36d4dc560121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff951f88cc251abb718b7730619f7caf1b9ae76f56a88628963c42f848446a3f63000000006a473044022069a6d69b88a3d1e124bd7e5789712487f884e2b2eb29071ace42e8bc43eaf7b70220695b735363c04eac48f1cf4025acf44f2abba0ea823694c5eeab00feb8f869610121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff953261971121afb8e7fca6736f2dc8bebb20a10b75b67392457f213799d7e38c000000006a4730440220309f99a51c47c472c16f61739a2bf0d63e55ace758fce13601db030b9b6a26c90220554e1483930a474ea285543589866d49d0b5a7fd96c75bd1de174da14915b7550121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff960f712676591c0adeac2ccf43c100e1a3ba69378768b5321396294cdfdd52cb000000006b483045022100f96a813c6e50b65e93b497b3858c1096d539dba30c6f527227efcd8039caa41502201eea43d73fbfca64248e745769cded642915c3c749316efffe563819406db7120121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff98d7d638ae27390d49a3b168ae071208e58e90f56f65ef3e9904fae9522ac24e000000006a47304402205417b042c5f6c485235809e70e6de9c20fc48fd64d887c3aaa8905481e7a53ec022070398c54ced8ce1753ec52648d877cac1da7ba84ea82a557f0d109902d6104cb0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff99e279c2e45e8bcfaf23ca320810bb1dfff2aaa37a3e13e3da3d4c6eeeb22322000000006a473044022079aa99ede566aa7420cf6c584f42a0bf366e2df46c954ae616ca4d48684a0f700220729484ab6e035da727463309d3021eecaacbcf411f20abdb636f30e26cb1a68a0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff9b3a0bcd9acbde4924fc54bdfbda31a744f00e1109062c70d41af89a4d7a5852000000006b483045022100de6bdfa72d6086f9ef9352f73c6144797aa70c673236071a710ba15dd7afb00802205d8201ba1618c67ff75a79a7281345466ebb6fb55c1178f10cd61a262e3a4fcf0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff9c5b101006ddbb2b23601a3c38c1573716daba5b48437ba408cd30ce1baf50d5000000006a473044022050ee6c8b5e8931361f090b1bc582a3fe0d027c4a742f55596a4b7a1f36d58780022031be1d4a22e841a114c55f294e6b25591bd0cc51689d9666a37d283d5b3708ab0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff9cbb4f16cab66bf6184bec5bfd64737fa2a8d1aa81f5cc4d8170c0dfd50bdfae000000006b483045022100d9054e8955d89b255b4b9691dc3ebf06884953d7ed140edf3623aca547f8bc2502200d6225827de12d54374937a2caa0d65712bc126fb0ad1ab17696d2035de49e740121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff9d74732e709107dd101f1ce39cb66d4075166bb733f0150a48f3a5408509458a010000006a47304402203fb5d342f0a6a5a43dc92b818f3f6730c25edc794c8d4ab5f313550e7d5cff7c02207cce1bf73bf48ee99d524e65043e96668f984be9f7e733404392a72ba527ab8a0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff9d92a6d54de45ec676d0667d71b1ac5ef596b16f56736de4f20c0b5d8fc31037010000006b483045022100867340a45da15c8c5b7e04ec88abaff8633c5e6ddcfd4aecd209de14ee1ccf9f022079893d6215893d9fdb63ec6297f560bfbd9d2595244e29e541e1b941ec090d650121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff9e2c1a3b90d7a40ac2a67394d6724001ef863e3ddb698acf79821fc82e8ca7ff010000006b483045022100e998effdbb51f7f144bfe7ecf87bf214211527e04d3d0f4d69dc060b02fd45fa02203c34e1076b77007e6b198ddf6181ad11028a8c077beb01637df2d4a802186b8b0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff9f5326b65079fd90ba03d4c274982c791d35d3288f3a60f1d6499e4b8fc5ff54010000006b483045022100d0efeab8353361b23b9a444e0423fb8d233f1fd3ef3098d5ec37ee30ce16de5c022047fd7d1935b112ff265f03d24dffaeef6d355997e5ba13b5bfc29c57734489480121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff9fe7dc77fe8f39735bebabe0ba079003956c59e3f5499dd5eb88483bc75ccc48000000006b483045022100dd209754c229823f4ffe7c61fb9831f397ec243865d254d821c145b9d6cad3b90220624e3062e471fbaf0ebd65ef492e0b5d09f048c491f609dc39d68c19158445cb0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa041a8ab6b95762510c788bf39da9ca6641404f56883d0b3b4c2699b14e511c6000000006a47304402204ec163f05866e53c346eec4c8da3b4e9cff91b864498d71c9492e3ad952460ca022042aac30fd46012baa62325f46c347c9cf5b512eae8ff66fb7eb9430ade7ccdfd0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa22f3562ee44f62c95f6694467a15e06037a6506e7298773ccba3cb31f653392000000006a473044022005281648daaebcf84dcaa7fa7bdf6e81f40ecacd8da590515ff1bdc4683e974a022017b49acb8b1e85c2cb691dbb12fe5ad6110ac76a64d5aa42e2d2a017e24ce5cd0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa3c78a0a721cb68de5ecb549a9f40d86045970bf12e077d9b06af1f5fce365cc000000006a47304402203a887eb15cf545c0aedb8089898aa8510591235d9dc87b19a3b70d8afbf96c7a02200f75943f8195de6e66a4bbf293f49c766dfe8e313bc04d6304fc2633f27f761f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa47d43fe6923c76f855957e142681bb26eedf1910ca2461791f4ab5c2c1e59a9000000006a4730440220235593a50511479dd44d721db3b85487f4a716ada57f5d8a6c68cc43f3b71af102203806ecf4582904c330c84c000a0d9903de595557d31f59f7eea4f395a3b6185c0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa781d1a9ba1f05928041b7176866cbab71ca2e19abf43d22348c3b20261cf5d3010000006a47304402204aa2e51e85b5e63ca132cac6c1a3eb9154a1ce4496d9e975b5a50352351c2cee022044c5b693f737410b694a608b0a3c7e46abfd25126c056c7995e17c022ded51cb0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa7acacd1ca538a36045bd0bbfdb050c9d73aa070717f897dddb102831411157b000000006b483045022100bbf6ef0363b250eacae23a0408ae7efa03f900bfeecd1f1dd4d17308e2247f89022024412a1655ef2656c70a0c803d27d106396c09cdeb67c6875ec28b20812a43310121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa8d24b1c948c48a06bdf525d091ad0474df246c8ba728de33a8f523664fdbe18000000006a473044022050877b21695de88b83298bd7e8e3d6cb729ea43800955027670f8f5120c7aece0220581abde2a3aeb2c45e5eeb58b328d4f80185e5612fd194da0e7293dc3a0e63ee0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa907ee329d49db29a45711066a0fa1e0a9f74db46a2f18f4a3faf1f69d0d808a010000006a473044022008d121f1171ff2b68399e9509a37ce7a98a1ccf843b38c1b02e51cd7fb1387e702205509f004a6c11bac4745f24c672825a1c574504b07865b4b024740e730f7ef850121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa91863c48ee31bed275af6b32b98723f28909a5862596830aba9e2ea69933686000000006b4830450221008a1a042dc8aeee6f42c7ac396bc90bf6ad2dd3fa62d1a5fbb57fb450384c267a02204182f41932ae3d17a3938a6dabb3d94b61b6948c01c53675fb99d7535049960b0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa994d6b5eaaf2a627917f4f895b136b3da8c4dc23fe1d1498750455c4e36ac82000000006a47304402200458c25e2e65d08c8c8fec6f7b8d785206faca8e4988e81dbb7b706fc921421902203dc624f7484b951149a24921256b0f801add4b76af8bbfe4f6917a042974c6380121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa9d42497eeeb81bd04bf03840479155e86b390457a31dfffcf4599b1c8a73a35000000006a473044022023bb94feb30df847b04500568b14d46dac9e3cbc4b45800588ba83e98ed43c5702205e5d1e3e9c982628508a20232bc151a5b6b000a2a52e704214ef271a56413e4b0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa9e6189feca69cf5fb597760a305ec86a76d8d8b10bad0c66c18391f88787ade000000006a47304402202ba0f7757ffa6f4d99d8e38650bf5987c06b6647157a217a6ac9e18699501c1102204558eb5b3761ce64c2aa9d0e9185962457b1f4a4714de2ff22b45f063bc5f3ac0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffaa2582ec0dff9e8ac119836446f2d662228b683eb263c9938b641352379996bc000000006b483045022100faa07edd491147f70e80055a59961c64233a9413af2babd3ab84ef3e9464bbc902207412d2878403ff844bc961c1027b39c6d865849dd92875856e2b3bd2679365e00121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffaa519c67c9eaf7838cbf46ab9eacfd6acddc4d7552597b393a09f3b8e8b12145000000006b483045022100ae0359d654aea81bc500a806e62c5a56a2a96b92bf0109e2c39b01d713f4a06d02200bbe2e707c1b56cbabbae128829feb0d7eb9da6dbd23ae57b085a25ca3942d910121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffaaac35ffb106e7cea120441728ea3422aec289e3853c0d06e06e7505c207db7a000000006a47304402203a8d3e5844c1345a7dc49c9719898bac9ad73ebccbb666ba73f6a6fd655bf380022044a3d80745671a6f6ee7f8603b3950aa5fd881669cb36bec4dd19fe04a2c70b00121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffac30ba083c13f3ac8f619b830f55c5771d66acc2bb3288f3da9f8384ab253fa3000000006a47304402203d8ad96e4279e1333fdaea795b153389f80f14725cd401ade32294fe3e2994220220229c1e366e8050a24797d89c32fd1555602d2bf08a602b93e314cae434c9c1950121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffac9a2f95c204216b00422f1a7809910b41a6041fe43eb7644556ffe43d84753c000000006a473044022007c19ad7fe9cc7bb9104efade29efef1fe44936f87460ab5a28b5b56d21e9c6002207fa43dd27ac9cc2f90c3def2fbeee12515584e1d46696d2dce8803eabe2c12640121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffad86683a608cbb55849f6bd1d72ca533b4b0a2421983ad8d59113c388b74c3f1000000006a473044022062ab1854bf94cb32586e3ef3797ec1b7ee3ea1410082ea5671723d73476bdf44022027922c0c34be7aa670e82a296e4fc114ca5b92b14f9d59f4632572870ad5cbd80121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffae23f677ee66b4b62f017e93df298a54ce1035c600649470631054d29be22b01000000006b483045022100e60cbfa15599f66acd7f3d914ed2b6709aa2876b9c7cded6b0ff4e38bc82c4fb022047a6549abab689d61f2eaefc8e04b1226b64d49a67936c27c969934359ae5e060121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffaf04f9c096054d7b5f0dd85dd525a81865efeb2e4675a9a67c84ef22f18d790b000000006a4730440220104150ccd8e5a689d843e555176be5c1692a120696f8d0c6f149fd4fde6592dd022009fb9c07cefad44cd31fd88ddeca54b49a4ac1f00c451d2857345cb281fb297a0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffafebe05182ec72742a7430222ead89d3578cc136b5c611f772b1c78dbd8dac76000000006a4730440220390d30ac506250b940f6a27963da4be56a518c30b72f6296bed8cc67103eda590220643641b1a0deb825d58be995091098ab3dd0657733c6e220c261b936d8d6dd2d0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb0c548c262ff721f2987449a245599e2bacbc13d76eb367e4f82b50190bed666000000006b4830450221008f4949ec2c9e7d16d24366a4923c8bed231f898a6da9b531cabb514fc946991002204be138a7f1da448e39042ddaaf03294bce13d418f64d424a4af2da9b54c0c7850121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb0e3c6f1068912e5d01f88060fdfe0a70dcc414eb07a6b834edc3af420e2ccfd000000006a4730440220127369abc46130b929403341d3fbf9c05e173a8d561f1f0fef5444ed63ac46a702200bd23c874960dad2920f484ad9c3346740fb1922cfccb4e583eb2300143039080121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb0f20186163ad2345f5762fc4c69bbb0e3b5aa13e27836d15384e7ed747477f4000000006a473044022024a312a0faf913d05413ac6e07e97985cfbc836ca3c1b8a43cee18948f3d7ef40220681e2d17755c08a31112de8aadfe0b1c2ba204bb1810649f3fd0d556c31e83570121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb25a0ed8ce02582927af3a54d3fba2b52a3e16d7f5d0c7788e0076cc73040a1b010000006a4730440220452e760ff56a8526273169b81e59c8c21bd5f53ec364bbfe732757d07fcb81df0220411f7477391956b2c88671557ba022c1bd16009c7a3a906fa4a28dfed1b857fd0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb2bc941a152e0469de7234a3fdbb2c61114f7d0964455e510675bba747ea33cd000000006a4730440220500682a03cdd37c81f982fd1862d9962f7fec32c5e8c26d1c9ac54fa2c433e40022012844cc3d3a4179a7c9034ff9cbb85a19f07ae1a4b1dadb5540db0aeeb3d687e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb3dbba61710f03fcf6bb808038d4ec4b0ba3389f9e032b9e32d2af60e7b08fbd000000006a47304402205c31da4d4154a2d02c01d23331a3e7e201ee524084b6568ad5c02cea87099a260220713f217a097b005671ca5722bf1b3bb7ff09af1f180588cb218548d5259b96f90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb55e800fc21258d468f3083c23fb9bea53e8df1f4bafa70611b8e3962f962c4a000000006a47304402203a81e035fdc369fca3b4754e6f8e0d8e31bf6db24ce9f73a14cca19d96cb2ba3022068e4e2d14bb3d20183501b4e8b94de3d8e034b0cd16ffe3c80b3a6cce5940db20121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb5b38d9e6c9e7f9be54066aa59711ee0617343bdaf5dbd1678b7c6182fd941ae000000006b483045022100f888a84ab42ac789753f1e99f1bcd8209770e5b4d86143fee7d3bea937f254e802204a43ea0629d74de358fdb0f01d64d1f26607b772b207d428acbdfa33ee2c2d090121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb6db9493a34df6469dfea3b42ca2f1a25e14fafb997d86f8db2f4af3bd6164fd000000006b483045022100aff4711a2be643f27c9846e608048bd700e8045505bca115db016fac9ae8185002207d513711d8ae82a27edca6b82909a3a290b8becec2eed00241d1220f4ff28f510121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb6eb859dd5057ee23bfc3f1fc60ff5d04da1c1dc3c54b1cc3230afc03cf16faf000000006a47304402200c8e5ed23a8ea018d03e96c82883098c9d3cb59e9f30b1680081e8863b55be9a0220543b5f70667d181561d3e5b67b139bfd30f480b8ea2e87e133d191436abf32f90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb70d0b9165758843ffcaafe2138cb9d4a49172bdc568a1e7783c506374532179000000006a4730440220453516b001177edba5fd195e1e4378c9f81819cd918dc661c4bb16215a5a344302203231cd02e5ce2f303b16181915af4656bd7a4953a9f99ad64696d46f8d1d9acb0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb77b5c1ab9fe6cefd40562203eb7fb4a05650fe2099364874504c7afd4339f44000000006b4830450221009e8fe143a248aa99204dbd46f554a740d5ef8773f95a6d3822b10f2d97a8d7670220599bf23ed1750697771a0f4a71363082dd58545cc8634a59b97f14f4baef14990121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb7bb0e4b1fdfc237117b1e967663956bc01284943e842b64b9dca9d8ba015eb6000000006a47304402204734b0c6ae20b54ee43b8702ecffcb6d8346fd2c266ff61c5534d9766f8d452e022070b078441e5d33aaf85d31e4d28a2f6c62d5dc7e27cbf08590580961370b9c170121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffba9e30e05c00c6922779163da0f0a983294770191449201c87d6ff62a86564f8000000006b483045022100d27bc37a60c711c654c40c48cd6ebeccc8c3ee46e756ee18f967e5cc2cd7335b02202fc1075382576b3366a4adffa6edb63b2b11a48a99f30b2c503271b9a7a016540121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffbb192a43a374efbf4c8a8131c74140867f6174dd576c70146849851eee61177c000000006b483045022100c9ce9b33f4cd4a074380ff9244386ef3613c7e6d96f1e5798ae46807e898622a022064e3ef8efda203930a5038f6528e292fc109468132f5ff98474abc0ea3953ceb0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffbd033eb17852a254e6a3d2b5768f1c2a5bf76dda57249afb34debb8b2d11405b000000006b483045022100f89f7ce37fe0c3b07438a34d0bbc08d02c101a4eda08bc88c0bbea1c40a97be902206f7b048c451aa91c4e04c18ad1efc0cb384c8841979bd43d2fdcf749c9f0bc730121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffbd108201926eee57dde17429cee0d0c39e3ed87d3b17fb135c6fa02ebe4951e6010000006a4730440220108cf7cd5b22ea7301f0cdc92b0f114bbcf0888c575cd20ed47ce1cfaea61b4202206f9f45c76481bebcda40627f18d4b8a33afc9c9807da61972a798f7d94098b730121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffbd5ca8f88d02f0949d5ebd5cb3f55aa29e6fcfe579e22d17aacaf5b326fc190b010000006b4830450221008d62b2e3e95586c7c04f01162eb27ccf84afa3c6584c88de17be2fa449e8d54e0220378eede595dd2dcfa0ea321ad226a6f9f9ba7083ad6dc644dc9447cd187d0da10121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffbda50b579fce635fbd5c221202d4b9053d0b5c4c1892f8acb8dd48fca605cad8000000006a47304402200eab482f47b34d9dec4eafa181bd47fe7ed3a4af4ee6d072ef9caa2a9bd01bbd02200dba2573a77541a671fad34efee98b95dca4bb0d1077475b53e677e75b76a3b20121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffbe635eb9523af40227bf3cdaf0d7f873ea49ad4af84abe8569892eec5e8c98fd000000006a47304402201b931bad9c6bbfae42fe047a7c6f229d91f5e8405814bc0839d17c4143925237022034ce2af3daad37a569e60f7654220b7ab177744ff3b4adbbceecf30ef28d2eb70121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffbf2089806a6cf30943a6126e24dc898d8d1c54927409ffe4366093b87f5e285d000000006a473044022008105ed0c20763d64939c815b8338834a0ac54b57b3d07e397e8a15dbd4883fe0220755c99ebcf6228bcd6c138148e9b1cf81572f46ae675e9d233fcdf53499890860121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffbf99addb3dbb82499590a1ffbf81ddf7f35c0775c1a6b154296cc2aafbacc715010000006b483045022100ff2d4d37db8e0f8017b3f6ce68ec2338c35cadba5f5cab6479ec0801b74efa92022054a95e235a851e84600647002a09e3b8708dccdca8f871f4c533216fc8fbcf350121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffbfee7a63d529933ef9f3d2e46ad9737edd219e995684c225d3325b962ab112dc010000006a4730440220706a08ca4cb305c6fd9d70472263d5f721da33d4f8a60f972add6883f2957b4d022004e1bdbbe5764f55c7448b1bf95aaa5d0ccc66438643d8f88b456a30eed3f8dc0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffc0bb402fd1a215aaea6332d655178e5075e5c9bf6ea10f750d5a8b7018918481000000006a473044022045e8b54352085606b169f69cf7303be2694601fd1e500920919ea253596409700220648549a6feca824b17d4585767bfc568233f227fc82baf3f5847b51cfd63d1c30121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffc11d3a8072f6b4e4d5df29a4dfff8b087aabc1e5ca5f9dfd14556e6bd2ccbf91010000006a47304402207f5fabacb50c5be6bd60a3adffd61e230c08abb1ac075a27ea58cf2c96bfd12302204d20ba436f6531492750ce536cc132ea20f2d04ab9eece00eb9bda4544c10e140121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffc259de25effc3f923a85e3dd26385bb6cca994914e0821e2b77da6ae38527456000000006a47304402207bf11a929a26808fd0748c7ba1c596786d905d2747959e625cedc0fc1bbd0deb0220431155c9421d1a2f603ad88eecff6ec27f106fd80444a6710a5ca2db92282b9f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffc3e862358b92d43bc6bd63a434ae25c5ab98f0a59a6495b7aa4491edbbbaa8cf000000006a47304402201b499c3fbeab7cbd86ccd5523dcc2cdf53e367d01d8b88a1f9a967f8ba188a6902205833ab47cea14ba0c5d5fe2373480bd949003c7b000b635fe4c6f7a4fc93c7c90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffc45f6339d6c97baa2edd16a62cd7e491a5db03e923c6202c94376157df16de51000000006a47304402202736bebb5d6a7db8f211e1c233ad743186bc3c3151f5b14b2ed43c10c03bc3f702202c124288c6ec7bae8a4eaa183966ff34bc4132039486649f87edc6871d0a7dd30121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffc6689b667b0e08ed20e74f0fed6dfd0f8f49aec6f928e63f0e1836b63741c8a2000000006a473044022015bd26bdcd224664acf1498985c1eac6d5ba0631949c225319a4a0ac9ff9862102205130be8314961cc9c20719ef164f11e95d0942a54083469b060831e5af7b15020121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffc77b747e967f3bfacb975dbd476935a16f603ab7a6a912c2c42bc7be311d24da000000006b483045022100a5047855f768b20f4ac4e925dea8b206579c769b6c198de9038e01457b3c3843022022b4b6531c017f6ff3993abb174bd49377c2249c552ed33239297fac9c7cf8300121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffc79ce5df8ebe7c27161cb6e8fc1fc41e88826e729f11910769a8b23a9b5ba9d1000000006a473044022067196c4b172d2fb8201bf13c3ba1b411ddd4df676f7c3d2a62afa1d51bfc86420220183e2d9c7d7f80d34859f23404b842b4d619fadea0f6e0ae9889320c88111c780121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffc7de8f45fa7b1352318cfd7f33e8a0a5f2db650512ba1fa2af5fb04721fa4c8b000000006a473044022017dd4400b66ccd099e398d73dada95948d07affb906baf8d6bb9cebac6bf403702205581479b9e56a2aefbf8ca0dc51432b355dfefa58fbdffd9a0e652baf90cc6520121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffc82243ef0be0a420765e68cbbe6016392964183a3c8dd86b1ff376f710e86fa7000000006b483045022100f36548d481f6e291325c4891b2a99798141124db0f0eeffd51ada175bbe1141e02205336966c409dc66eca7b976fa53bf5add6fa438f4744b9fe87aa6187b5a03f860121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffc930baf44528052f6433f02f3b4d67d7a59f5c737f84751b3f242f2debee45c5000000006b48304502210080f3262f8964f9210f190f2d0ef04965b513d7ff3408ec9947d9665424bc531102203495ee60fec1ec0487566d4aea1c11b515238dbac9f4527cbd41d1fc134500cf0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffcac26af3732d34aa5738db083fdd42ddeb44349c0135463a501746caeeacb9ab000000006b483045022100887e17cac882ee8dbf9b003cac28be34b42fae50003661791b25a7b7874901ee02206767a28e4bb1575b83711275afe32c5a87ecd281ed1a35e8b8c57fb870e6a4b10121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffcc95a02c701be990284ce8dcabf905bb0e0bbdab0fc67172806d6718819f77b3000000006a47304402200ed8ebf853104ad54088a32ac1757cab221f27c67e3e08d3a708767a6f3d3b54022073e9fbdfe2733247a5d5b6f67ca0b583d85d185a81274ed0ad374dd4a5851f2c0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffccc059f13e57c2f8ed0eb6818537e55890a43a02d41560e04e0fbe38cdaae00a000000006b483045022100ac6ea3856bf3a156bc7d5a648df5ac1846ffdc75c68a5c866c8ab48659fcca2c0220400cc9f99a0e5e518edc5c8b97a93d151699afbaf6c1321f29842ccd4190e8e00121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffce1dbb2868ecf22a4b1fbf7f140ec284cebfd008eecf1c846f7f8eed2e30c0eb000000006b4830450221008a848f17579dec5a57fcdbb69e38ddc13ef13612e152e6363d10b5203ff222d502204d0d58efe619c23fa61b84266e7be0074372b8713e8e9a723a5bd65bb357bcf90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffce282ce5b81e68803c317883c7bc7e047148739912e90f648e53d516ee6935cb000000006b483045022100ca5f02e740c4edeb5d2c05a7fe35314be672f96758a88f20796491a8d28f991302200fec9eeebc50e0d268086db841cab0a833bf2ee92744e929f7d147626139f56a0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffcf0be33ffaffcec97c0b8ce7984f409adb6633ae2b4b000b57f74d9f5c675c62010000006a47304402206bddd6a58f5e4ce68bf81a35af323adab54ca420207f010e8cceb1fe395474d802203d3bdc008ee39edd9c5aa51ea2da255c26f186cdfc84b28b93b556bdcd83bfef0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffcf641d2f9dded5bca42d26e4adaa014ee59918f4fa97f56b05e086b54eab750a000000006b483045022100d1a1b73ed669b896afdca0ba1b498cb247f5d7472d182a6778fe640852ac8e9d022028063470cfd3bd6fbed7f91a26a066d55a782455e6cd26979d618de1ed0c406b0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffd25662a40bba3b15f65f045e895ac73cafc03e0659bd0f109f24348feb050738000000006a473044022048ac49ca916fde0251d089c56effff46b0aa83381e45f58c54f00ac140e6e07f0220052b8b544231fe12dd59bc59cffacc69779a33603f1ecbeec7cee5bec3f41d3e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffd71f6f137e6019b4b44d52050f96f5146d2bea07138d46cc3e0092af2a02fb19000000006a4730440220554d1f01312aefad2a8fb1ab193eea71817142c1ee4c2f8a9f61cf0a5af9d708022002786374d0de92c667fc21aab1c3e9dceb750a396262e8356e387b60aaf606a40121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffd7f6698ef060752bcbc51fad9edd3cc0ab678b50cc240a317f4b2e8b17653309000000006a47304402201e5bf034f9f5c4d7a29ab179b02216f02e55989aacd26a4b3bccdc76cb0d149c02204c5d6320c0851c2188be9d21dda93bfa5bd635f5bcecbc0107623b9938ade3410121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffd9c95aab74a5d7b3e484a7143127d4f6d3f8ad990ff26da82764463b10f66842010000006b483045022100afaa0896c1334e7f2e2c68fc2f5175311a597ab2a7c00bee918f3c8fc95841a302202778c7d41c4179f49449ccf1e2dc4df3fc8067759befb9382374231773b333c90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffdd74c27ba795279d7e191bb067fb615f1a3b04553baf410c3f442bb9b3dc809f010000006a47304402201605547d28538418bb940fee20b0f660901f38a3347502771ee271316503b4b60220789b0e98575ae56ddb1c32a6a0d3fec0a11fa4dc551a114870a55186a37e5db00121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffdd9821077b65c95d6f93c7a39553b2602ce57fc1781f90ddae04aff0f3bc5f61000000006b483045022100dafac6ff0b47c344f6d1434121a76792e832c13ce05d72f7f91965ed5ccacee3022019f0545c4cda79de05591592bc0bc5ec53ca0424f1b2b9d129259c22b59aa3b50121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffde0ecb6db067c2ef47d94c4afa9ba8ce65f0d07e853b03ca06e0a940f166ff29000000006a47304402207cba2c16b0a3342b0c7e541f9a8c3fe6f57db992a8e67c82e9cb1e7472e7bcef022013207556063c1449d71c7bd2aa296c63f9e90dc447e3ee9d3ffc98ede64a2ed90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffe0d9484309fe694cf94384457c7351014f6a68ed2e6e1a131917de4231277465010000006b483045022100c56c703cc24247847c3f23f10493970cd14be9a6df3c77eb4bca2778f8c13c12022030674b89acf9d78ae8245fa59064bad44a401352de2752697fe089e55a816e270121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffe1d2352d8a9a57c60d193f2f0f0a5528a846c9ed5cb85f7bcd2bf133d9038180000000006a47304402206fff304cc1539707ab33c4cc132dc42aff05d4fcb2e8eebdba42688915949d3f02205db261120f15c7825d926363d703fe86522ba01902ef84bfb7ee6754ca15ab130121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffe234b4b8f618613466b89bae8fac4f38f79585b8f640cedd25252c1eb66594df000000006a47304402203190dc24dd3c9833336b7060737e8f8e83014cec727b2a7b8e7be106adb88e540220233aa64f36b0a0908072bdc6a5a2ef5bfdbc90c26bd9741e98fe68ea711f03310121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffe30521f04d98cb6dbde485b0d737ad1c013a937150d5fc5c90da4eb3823e7dda000000006b483045022100c0e4234deb51620056bdaee7f315e39e94218c2ed7ffdb997c6536003834ec3602205b3160ce7a6344ebc2d4cef600115cbb112ac59b2cab542912b85e0b8bfdc4e30121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffe3ce3acbf8f52e34d784e0006141d425bdf64e52d9ea4ba6387bf658c2667adb010000006b483045022100f4d5523e696d9f25e9ccef52ff623f95f100678e8e9939f9de44ae1272f077d702207f38da16592a3fbdcda8bf25bd3de34dbc14ef3f8ee7a9e58110d1d4b53c193d0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffe66d7e4c9166e784fae5a614a12a38d25085e982289c948d405cbd42cd120733000000006a473044022079ad5738f41fb8583ad8ff42d972c8344e007ccb0f37fd40c8d197e5806075fa02200b008a31d8ad1561e570952991e2931475664258cb23129f410e5ea963463eb40121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffe704ac601aae73f19603f1572912e8807edd57fb44034d9b212fd32cd53af429000000006b483045022100c6f77756a1ddbab7053035a84e8640edcc0c5e7656a40a752249c1b7207e43690220789900bee0e8f7c6af4fef1533367aa466be9f693e2af45a44609172fca2084b0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffe7e4c487cd709d05565474536e69a87e81c4e64995163b3359fc4ab5bf174add000000006a4730440220696086f5358f0af697ac0d54203ac27ed28008f5d7afb1892b2371499d1da72702205dab0f963a19c1079f62259f0e3654d44714903f4c909c43fab4885de50a1ea10121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffe8591bd9c6c7ad5043f6c477408931286246f2200456e987c96bd35c470ee913000000006a47304402205de653442a9903900e8e043e01ccbe87a183401b13f14aca10e05f26156e84a802207230de43b29a5b28a3cda65e8f34f1fcd58324ccd3af9869f3923b0a9d5676830121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffe8fcfb61f7498545af326a30c3c44695a521d2cc91dc02b8a52ddefe5af1195d010000006b4830450221008ca534a11c3862bf7f5e84b59247e2662110a79c7220bf8aa81599da5bd73caa0220187eb77f9c3d1531e17b2f591a1e3d634c8a8498c0a766ffeae099be06e933250121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffe927957d22a3ffa39e3bb8e7792786c20089e281a0d7e023907fcbb3390e9e32000000006b483045022100990c7104331956db7cd8fd1d77dedf36f3195055f69ab37f86f3c7099310872a022030109ba5419fc09f8a5b502721c560fc6140c5a038fd5a03dd7fdd229d07a8a90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffea371b075fa7e598ba231d515de9830bd5214d357f0deaefb9571ba4591da5cb000000006a473044022031f1dd3c9a155c6c7f9b0b68ecfdfbe91e8bd74479082c6ce92b49d678a53cc802204178bcc728499d48b472043a20b508ee8e0312f17b813efa6a77e8f474407a640121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffea4fca994d1ef3b93f7b965be034cac10a72db74b0fdbc8dc36a93e3360b1c17000000006b483045022100cfbf496ddf62e8c93312f018f1ddf0613745739b58e5bbf8672559e762297d9a02201208c70ce45659dfd092e618ae94c5f4f705981fa2879212e9cdf6220ff3f4390121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffeaa428f44c8b351de03a2c683f698fb97fc4b6f25ec1d72f88dd678ecde65f1d000000006a4730440220762f9bc2f889fff0aeaa2c1278a7a24a00e055711809fd8f7f4a0fe2e16d70a2022008b92950483db2993ddca07bbeba1b0f3a08f75d00d28edbd7a59a2829668cab0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffeaa66d86626167c1c0b1ae3c5fc96a66d5900e376ac4faafac579ce15292b8d8000000006b483045022100ba932b6204b00810402310c9a1eec20c13b99b0097e0b9698406717aa2d4a67c02207033fd8cbba0e24496649d463a0ee3bae4b5226ae6f931a20d665d9b0e31a9910121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffeaf28830f302f40eac1183ac1d041423573298f4c640f2e69ecf50762f20c094000000006a4730440220284c9048420afcdf09e27906049cbc819a0d5f6a324565c49fbb2173e546f732022074fbe11fcac088442fb9c97c1164234a0326283bd0982ac261a2f42c5853c22e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffeb0e8dc21c0e3b97ea3d7b120e0145bae9b39572957d5c709f8b2e55e14cc932010000006a47304402204c51f64acb844524c81b79ae07ed08fc4c6f1cd347f05c56f46a48ce41bd48f202207150d317f9a71a6489e69e9869a8dc75c1918f349ab462f5b6e917fe956059150121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffeb39b5fc1752c61fb0d632f73e42f00a4a6491858a067c13153647108144b26a000000006a473044022024ba4338a9ae5fe6fdf8ee866f4cc003803fe2b2f43802c4efe147248362d195022053e816d4dc72f41dc78671bd78c6a63a8f0a4809bc46337122eb972b2ebd772a0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffeb64cc6215a86228b2d4df67740389de4e321994d39655da89e130711c954268000000006b48304502210090b50982a505ab0de9d7045c82e822f2aafd08c35e7bfcfc2b235a2b52bdca1c02200bb3ad31a3c090de8fce89d8eb885328a53a20bf14efd41c28e0bd074b01e0aa0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffeba23e0c498dc3ea07430f9dad72890b05458ee0a3e3d8480d1060441808cfff000000006a4730440220452d2ff9489d2c7962e3d0b20097d9ae239f2f0b7ab80c8856ebcd79de00e3430220300bed07dc6736eb8d60c7f1501b67206cd0a7a4641011b611d51632b3bb51c30121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffebecd74e1e432534e35ef041f624dae3c836ff95dcdae495f9abfae367982404000000006a473044022018d9dc45aa0dcb5e5cf9931b4afd4e77e2a2ecdf0348f5fa7da1cea51cf2cc6c022059007a6281a38fd83addb5280fbd314940819003f25db36ed194901848e43aaf0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffedcdf9c428b19aaecaff8fe19cbe0b1e1b5989dca25f5f9a88508130049bed4a000000006b483045022100f9d6965f14cd18319550200fbdea7d1d2712b4d3f6687ea519409d08f6700281022009555a880a0c79c6dab4c93c0f37a860a680aeabd85c4db25a7d10f243ae830e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffee452d4dda3f3568f0ecbecd3cdb5430085a22dfb0c40d370d85794b65df3e8e000000006a473044022009c24fe724924f44aa2f40802870f9f2974a589e60901d993f895185af898c5102205f1de0a98e5bef06991f4a0ecbbf78769c76eee60ef784afc31f5b6ab33585360121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffef2f16af18893848feeae7861dc68bd12ed794c46b534a191698c2e9742d7e66010000006a4730440220399b636e9d98f0126c1b5941d010bb20756aa844164437f3412397df1d34b88d022040484d93303a170666408ef024351e8f6ce7de7eb59bcc6e3de17c7943f8e3c30121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffff07aef29877108cd676fe709090190949c6df8a53422084e2114689cca0ae1dc000000006a47304402204238b44564987fde4668ae6145e7e1ab556834c96103813cffd9a042cc572d1f022051eb54fa1d213c10193640c70899b7dfa9b4a2b377dc5c5c3bf9c2bcf406e96f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffff1c26b96131878d28775850a53691a82bd25f30352ff1e37ddb47b3011269f3e000000006b483045022100afa3f1caa5b5b3e9364eb03da68385b8a750788684afe1d0c79c783cb65e51f80220036903e5966add38f5eff86ac06c4fcc44249fdb475c55ffce61ab845ebe2f4e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffff41b3fbd4efd92419f5b06c2d2e5c0df71dfead9d14b824d45046d75d69cc63c000000006a47304402207328eb181f4020e37f5037556ddc0cddd851bd8bbae1d05955fe3f1aaaaf4256022061f003533d5d440933a3ac82551a01d3f153c1775d446ea14cf2aceee40917be0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffff4c7406bf59fc57c2c9be3466b1475d57551b6c35a361b933db0c2533c1957d5000000006a47304402201718a84f87b3e257aef763414620cfc4662f9bb2e5a8fcbdc390ed1aa46afd2902205098a6f1f53e20b4b2a1afeb3a35ce942775c7b2e66b20ede16156cd13791b1d0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffff5b590ccd5c38556fbf35daa1557a82d1c9f4aac07497658b84c54f215cc3e00010000006b4830450221009601180a48f20b718b2c4172a13ab758aa91258540a875575a8e1d1e1a039d290220608af9b9b28a5c38b4c60ffac508136a8c3fee94f8c64e99d178d4eede6824770121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffff72a3230db3e78f21393ece76b8f9f41e3a1a2739290b3f18ce4e94b81e468c4000000006a4730440220184aeeb212a7b5b487e33cf513fa16fd53f6c09254bc1ee60145c95d0071370e02200ae59368df71c1ef8caf1a0f71339e6b8af5b531d7b955b4dc2984c08aeefd620121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffff8086db0fb0eed0df150f9e43995f1b7a0295b59e04bf466c7c18ddcea26d483000000006a473044022064e33f86810006a8a8e249cc88ab2a2d47e688ffed12446ad9249799e09e3a5102204a283be835f8b79c19fc423f0e9220fb56a483ddbf576e1eae25fcc0fdf55b710121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffff94d664a357c197ec89bf5e91e573d3926d6aac881d44cf10baef75b3d5cc6da000000006b483045022100e611387e956cac63daa9c3e116a73abdff1da852d259096b3cdc1f3f9b94aeda02207285c6dbb7d0d13311977c38da9180dd62f3415520faaa614c24c6195053af300121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffffa4a510ab2dc230c26f84cd252c7fce66d36d66654e2b634794242d6b5ba6404000000006a47304402206bbcc0d9d5f949757cef6415e6b3e9252d58830994d2f374e6d584bbc7904d2002204df280f1f4319275b67edc25ff61b87d0acd745ce88064ddb5f9690f1352ab670121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffffa7f7c0120824cbb885291f7c9c24c5facc7677f87d97fbfeaf81b930c5cbe14000000006a473044022063ba9496a37eb81bde78feb531187567fa957fdc45933092c173186a4cb2de670220757934dbe159e9a6411b7e597b11b6eeef7a38ff57d54a4891303d3fe7b58d150121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffffab1a7f322d18aab5c19e26a46e89cbb028c7de9751495102553195072f34cfe000000006a473044022024ddc6dc25a41ecab466f2bf912b9469ddbdcda344ef82b48af651e3f9291a590220037f641457612e77c364b47926291b73deb1f6ba2b47e0176de65354de0169af0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffffbd01e443b38afe9584b6f3661efd6f248bdb07989f652b4656edbe32586e53b000000006a4730440220277bd2ed2c8c60ddcf4064cf995636e4b403d451fee0f7c8ad6d8bf5689953c002202039a568733b1ea4316284a8bf0ff68b634b7e7a86d86d5160ca9ed0f6a778740121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffffd4e7a1146cc34603da4daeb52c895e94a55337adc634c313285c1bfad1bc56c000000006a47304402203cabce70168071c56c7fcc8fdf67f57ba7e3b35b15afa1a848b72b34a1ee71d902204f59c01111c03fa0ec1a0ac435330d2ecb26f9ecafd269adbfdbf7cab6a0c21b0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffff37097e5155ebe5d9afa500d471aaa2d3530081bdbdbba015aa97ebe7f89d0b000000006b483045022100f9dd302552fb316a6f9c181517eeac15e1c49826a0d774daf391e75efe1717b602203d43934b1a87e9877f99c2ee520f3e3b1ef4f318adee7027f7f4848e49c262760121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffff68d82ccfaeef761c54f9e05d4bc88beb203414ee8d19bc631ed6901667186e000000006a47304402206319d9d9970ea82c9b7107da05c87811f77d9073169fe31b546f3f1d3cb5192a02201dd1a2434c2b7bb14fa15a754a8014261cf5e6eadef8f110bf3bb656c80e137b0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff01ad8e64aa040000001976a91456511d88bb5037afd0142c2e5d1de0785141ce1088ac272e1600020000000001013efef40f59e8d4344a5f88533c1b7a3837f4baecf714309fde39b7f97117c4d201000000171600143e73b902e26f6f983eb83b9130332a67b0544405feffffff024c936e000000000017a9142e154b7137d2656d71b5f4f554f0424f086e048f8720f40e000000000017a91464df97e85f298dcb76d60766cc3fc448cd284efd87024730440220118f74a9d82b42ac4707256350f696eae7a7a12497ae7cf24aeb2ea7802be8bd02201c32bda2c0dc07ccdc4ee08c33cf7fa3d6a19eb9eb3ad042ad58388f3db676c4012102b2362f1c01d06aafdee1b940b3ad0a3e40f9e90e6ccd82409e311b6314e64a56272e1600"
 
 
 class BtcMessagesUtilTests(AbstractTestCase):
 
     def test_get_next_tx_size(self):
 
-        segwit_block_hex = "0b110907626c6f636b00000000000000761701007be2ef740000002061a38b7ac56d7b3697d93618442c260c9d1b1993a5b8d3a33fe6140000000000c2101fd21ed2b31e4e07c605a066f6a7c9fab21c49e02eed3781778daa39eabd214a475c0335011ad84b9f1141010000000001010000000000000000000000000000000000000000000000000000000000000000ffffffff1f03282e1604214a475c00a071844f742400000c2f4d696e696e67436f72652f00000000020000000000000000266a24aa21a9edcfb4ccbe7b5d9497dd2856c64031d29791ac2b606ec8e82adc260898c1eef53e612eb104000000001976a9146d0ca0a7bb477b9327dc7f48431ab4421570e09a88ac0120000000000000000000000000000000000000000000000000000000000000000000000000010000000267d47cfe70b562ca722c5c5d5ca52a3fa0d056e7e7661db8d12c0f1595c10cd0000000006b483045022100d005c2954f9bf9e8ac7c066fe77ce6389149ade3112c607e6f98172c3c6d926702202939a3778032a3856d3c0ab98b945f1cebdaac9ee3b19df360b3221ac8cab6b6012103d06840fd042383b504d910d20a505845713873b24b9966dbd60acf748bc833e9ffffffff3de7fe8f33e73c474a6c8878e2a2ca14dfe78d6006f81f77d776389d27773d2e000000006a47304402206b3f7022c916ac48f6bd09865f72b644fad578cec35c49a0d4e9dac240c55ad702200b2d17db54c99a45012a87cd270c650e5f0e8ce15b84c55ce2361baad85a105f012103d06840fd042383b504d910d20a505845713873b24b9966dbd60acf748bc833e9ffffffff0240420f000000000017a9143c1e28666dfcd79c76fa856c64e4197217272f8c8780fc0a00000000001976a914f12f2c6e408b3cdff1991b8783d1eb428f57814b88ac000000000100000002e8145bc1a8495f9f2dc5112574ee1319f30e9bd6b8c897dc6761c7db178da19c010000006b483045022100ac2e0583388ecba84b9eb6cf6300d4b01ffcd43bf98ee3449c1a93700cc0adef02201b8d46edd63f2580879aa193b2178721561686f950b7f14d6ed776a806c67cff012103d06840fd042383b504d910d20a505845713873b24b9966dbd60acf748bc833e9ffffffff9a33622c4c14ab9862f421e70150e168be588f855a43f14b9bd9ba3efe026bc8010000006b483045022100967afc73528cebf7ac067e5531166aa15638625b900d0ffaee28e3eaf3f49b510220699a4ec1e504300635770a5fa1d8fa5936a8f62931ea95049f3a40d6a4666c4e012103d06840fd042383b504d910d20a505845713873b24b9966dbd60acf748bc833e9ffffffff0240420f000000000017a914ab17cf9a504c530c6ca65564c9faa401086df4f987b8308814000000001976a914f12f2c6e408b3cdff1991b8783d1eb428f57814b88ac000000000200000001dba64d852b4eb5b4f1baf00d6f1838a53d15e356f41106963eb9ec20c77bf829010000006a47304402203dbdc88bf58a934a0b88860dd41de6e639c2ce135d8c86ab7062427b633d17d402207243a2924a755c1b555999f11e847aadc93b17d71cc00526f72b6624376755f6012103f0937a3abc7cf55ee7ede5ecc2a5d8665f4e0f56bf20b4e2bb9a99b2023326f7ffffffff020000000000000000256a23535701966512ea19e958c9644ef61d3aa0a3f5a259770d0f5e790e3aabb51bbc83d36438842000000000001976a914bdad1f4d02035b61fb1d237410e85d8402a1187d88ac000000000100000001dfd3eacf4bbe813a6f74270dd43fa02b195313f482e64478afaea504bd635cbf01000000fd5d0100483045022100de907ffd497cf54ceef155adb2bc5015e0d5cb1847e6db3a6bd1658e46eca77e022032fb6cd66af8b047ebdfba79151a062aa9353990311b5e86e91f7b3862358e9601473044022070b9cbaa95f225d89d6d4210294e1351317393046a86c88d4fe65240fcf975c5022057c7e2d2842d6e33dcc9a43ff135eede351a5df56a06f9fdc0e20f8ff5a4b185014cc95241048aa0d470b7a9328889c84ef0291ed30346986e22558e80c3ae06199391eae21308a00cdcfb34febc0ea9c80dfd16b01f26c7ec67593cb8ab474aca8fa1d7029d4104cf54956634c4d0bdaf00e6b1871c089b7a892d0fecc077f03b91e8d4d146861b0a4fdd237891a9819c878984d4b123f6fe92d9bbc05873a1bb4fe510145bf369410471843c33b2971e4944c73d4500abd6f61f7edf9ec919c408cbe12a6c9132d2cb8ebed8253322760d5ec6081165e0ab68900683de503f1544f03816d47fec699a53aeffffffff02771d1600000000001976a9144e434f5394c0ebf5659a8a4054f2312b724f10a488ac82d6f9010000000017a9145629021f7668d4ec310ac5e99701a6d6cf95eb8f870000000001000000015b1de0c487d74fa4c2c1703599813fa43ec6947da7eabb35a6f11b645010cade000000006b4830450221008ae0b950b302d59fb6807cbe68acab60fbd50b646205880f8b07378bab480173022067cfc333724a624050aaa52ddd695cfeba0184ae9c3e84483d0674414edc604f012103484baa53718094bc00f4d9c48be6d1abb06d282a0e9160910addd9b5c86d4588ffffffff01070c15000000000017a9145629021f7668d4ec310ac5e99701a6d6cf95eb8f87000000000200000000010129e90e1b145dc795ca701cd42cb668f9d1cc2c3a24b26c801f6b20ea4b2723130000000017160014ab47d387fb53e371d777721e7f5283ccd916a9ccfeffffff025833db650800000017a9148154aa08ab384f2a5b937810407d9376ff262d35878d55a7000000000017a914c6953734bacc2f899450175de465f965be0a0f6c8702483045022100c9c7ff70f1bae23ef5104775422c57800dd4a21ebbc1282d9e2d83befae9e16c02206ddd1c56d00f8c7411fab61aaf7ed742c446ffb19cd3425aee19fc4be1806ba801210251c35898c351a535daec06434f0506ce0e893e9afd3bfff147cd2bc6f2773b2d272e16000200000000010198fb9eaa9951fcff8408404144ae9074b38adb870ba053f082ab5ed87af84e4e00000000171600143645f37194c312881c0146965377f81173a32fa7feffffff02a0309d010000000017a914ac2a4d0b5260645e92e3891e88e3e80231059046873369d7540500000017a914cddb1ce06ffee4597419b13759aa748393baefb187024830450221008858f6b6fd52c3cac6c6c95ed89aea2ec4e95593f52a1d07427462cb34585ad4022027b350ed8dd78bf0cf4a9719546a7d4938cee2d15967b2d35e8d2ce5abb219e30121020aa8861a3a87bc2bd44c5aa4217987487b3c22a36e88fd087a5dfb4efe42c59a272e160002000000000101168069c5f80626250a09713ee253dbfaef4fdbe32f617d3ccf8ef294fb6990dd0100000017160014f39ff8983be60886862b727a3456aec819428418feffffff02217eb02e0c00000017a9143216c93a28f69bd8cbb686bfc5e598316a2a4a9f87ea20a600000000001976a914f497b30fe0396a0b06e2dc92e9d3c89c9461790d88ac0247304402204b6b09f5fc2762674ad1d2093bc5060c6957572bc88e4b85419a0cdd9c7b256202204febc4a55abdff6a216496e4a4c733c963215be21eee379b322d4ef91bbec64e012102b9c0104a08835542d217dda7397767058313632109b83b9d5494de097da2e4f2272e160001000000018a633d916565583db78273cfa512bbfa4cf4469d59885952795946718e22ab89000000006b483045022100ed4e2c4d24d86f03963045ca655b4c5cf3ba47e1e4c9fdab5bc8211e5088945002207b69f123ea77785565cd0b4da437c50bf9db9a6d14ef03a684edcf8be7f70c0c01210358670ef559d5ff2f4032b66c6d8eafa87feeafaa2f4b52db90300aef754b7cffffffffff02c16dfc01000000001976a914bf1e72331f8018f66faec356a04ca98b35bf5ee288ac0000000000000000226a20bd5c41369a4e694050452c895351722b951c99ec4523a373ca82cea86f6e162500000000010000000129287a78bc080d7b9572bbe9bfe5baf11051805dd8f33ee97789ff47879ad94400000000fdfd0000483045022100a24a466667dd5ef8247ebc64987587f04ea9a9906712ec19bb6e4d80a82728d70220433e33cebb8386ba9f6e4a1261f376fb138dc2d3c325b226707c93fcd2772182014730440220159dabd708f637982ee616f0f6f9bd403f88141adebf5b375cae3524f57687b2022056ae534b3bf69c7e31095aeabc5e2ea5a0bc45ff2f0b37eeac6a2a3a2e6dfdf6014c695221022650f60dab18fd397f5f8e09e6327f692e6f7949d2ac17019437b988bac1ca80210385e8679c18eb0dd00d1d497ff7773eaa8caf1ca0a48d05eec9d5924ccc458a452103a38489db89bf9c36e3706470af4e5adcd28171d12bbae0c53743dc435bf578ab53aeffffffff02a0bb0d00000000001976a914f12f2c6e408b3cdff1991b8783d1eb428f57814b88acd82a01000000000017a9144841f2154df82090fa4e2170b5c9e7e97323a1b787000000000100000001093f4b7fe3671a24608a9e709bb3dcde71ca923c24b0908e0cfdefd31ce1ecb800000000fdfe0000483045022100f4a1902927374ff1f437f09595dfd9144eac46636365f9ad0c85d2d387a3d8d40220432a953071408af828364e12305bd697f2260af581a9823fde1bbe8a1832f7bf01483045022100c72ec73f60fd966a85a4d0544f283447226aa8515c3816b405b49757679bb55c022020db4845d060f61567c8bcb602018d5bd764c30546a17bce1bef8af2920cda06014c695221022650f60dab18fd397f5f8e09e6327f692e6f7949d2ac17019437b988bac1ca8021025d2bddb2f844f8edf69c87cd2aa21ed8a5fa5142e33a4b0c9120474033f3c6e62103a38489db89bf9c36e3706470af4e5adcd28171d12bbae0c53743dc435bf578ab53aeffffffff02a0bb0d00000000001976a914f12f2c6e408b3cdff1991b8783d1eb428f57814b88acd82a01000000000017a9146f920eec498c4506fd8a96b14c9de8458d4363168700000000010000000001017866a14ca91641aa002618126e35e82c2b925bf8dee54995afdd5d77b732b5ef010000001716001431633dde18be694a5d1f29b3d47d6692a1cf9bf9ffffffff02486c3a0000000000160014cf86b95cd263bb316f3c5f99b3e4fa6e22ea74c0e7d55700000000002200200a6aeeff1118d80cf7a038fe5f4320a282e68742acfbc9b8aa5420a9be2d518b024730440220039e436da58ada9633e987555c79beb169eda1381907e8f1231bcb28c664b822022001d6efee0fed3a84c06d65acd4189b524b418d949577b1fdfade36d9cf38717d012102cd69d69abbe9cf4db40845fc3b74426555a964077969c46ff3237dc5c6a5d00b000000000100000006beaee69b9fe111c8343ab75279ab94374b951395857d2669fac37d6fa7b42400000000006a473044022034192b4927db7514541fb360a26f0cd33b37903023e274794935e37eeca8b73c02202d0c1e37ef9e9c1c93a9e66c7c4ab7dfd2fbdb2a49a73851a8626a9b6eed8345012103dc107e1d9be2a08a2d5c5dcec5adda0127875c52f3dd2f94289373b55a5e6a06feffffffaffe7e5fc069fc8f1e437f1f3b67cac823789b9a7d13a8113654533fde9d8e19000000006b4830450221008e90e296a175b7497ff7d8e01954d784f705b2602e94c5341ef2e13bf0ea032502202aa096f4e07c4b135b1158439a710e56351162a50fde53e8cf226b902a449ae6012103dc107e1d9be2a08a2d5c5dcec5adda0127875c52f3dd2f94289373b55a5e6a06feffffff87fb2e1475d3f5eda484e29617935056180b6625a2c45f489e3923fcd3552685000000006a47304402207ff85f6ff701d169fae5d95d36affd71b87cb571e68917e15638f99de5c8c2e102200f9ab2452d482317ed7313384193675852eb75b56f2ab8ffeddaae41099e3b80012103dc107e1d9be2a08a2d5c5dcec5adda0127875c52f3dd2f94289373b55a5e6a06feffffff7c32e379dd9c6c544ac740d8ec8932c5f91705dbe11c17e36b1be5ee2866a1a0000000006a473044022011756409a24b70345c66f81a825589a10a640512b54e63183e50829543f0cd130220085ec0324a44042ef221d43bd3cc165d3c4ad45d74f887a307230e6a73e5ef61012103dc107e1d9be2a08a2d5c5dcec5adda0127875c52f3dd2f94289373b55a5e6a06feffffff273a3c362d9e3a76aa3d43e56f420f6605706bcc7c31bcb663a52b86f68fd92f000000006a4730440220486e52a7b5d24a5264d6bedbde62fed1ca0bf2dcbe2efb08f492768ff0c7efd202206c0fbdbb2f3489ba3040aaafdc797ee99f9131d70ec0efd92995eee143c0e6ae012103dc107e1d9be2a08a2d5c5dcec5adda0127875c52f3dd2f94289373b55a5e6a06feffffff2014abfef2891d3e9f4d46dd4095a80af5d6a9e3b4c0ede4a8100d1935b4a572000000006a47304402204d2b1e7b646fe65fbaa8f45664c7571f13d96627ec32937c9630f689a52bb2f40220092c00254a3c45c70c525866316726168f3ac5bd373b49941b78526f2b10f5db012103dc107e1d9be2a08a2d5c5dcec5adda0127875c52f3dd2f94289373b55a5e6a06feffffff0280969800000000001976a9147b8fc1ca8b173b7ba08320f26b0127239ed6040f88ac88933e02000000001976a91448c9dbf253a849e14523aa49f48cd05d04fd569388ac000000000100000001f59173ba2426d9938452d0fd0fec517fa9fb6fb56c9d799b48fc95809cff4341010000006b48304502210087b051d6d719082fe0001db04b72bf6e0dfdd7b3ed89af6552e167cd1d04e3b5022019e85854e07f834bab93a8032d362131544ffda5c84ac2da32480fae8c1f48300121027fb2a4204619886bbf6b83045ffaf8036df5fe9c5c3aca00c765d9dc770b169efeffffff02289a01000000000017a914d07d06e0b8def3e701aa4d53fa1ea89d2b6058288730e43700000000001976a914a0da45c432fccd8cfb6a29f993d2a227ed780f5b88ac0000000001000000000101aa354ea6163f86775f68108421428290d09431b5ba0c967dc6f2eeb85f23fca3000000002322002097e5b78f426276cb8feddf09a460ea23062466d9b4b898d1c933b085c9909d26ffffffff02a0bb0d000000000017a914f8b769031f8b511d12938d10032f02fe7cde519387827201000000000017a914b7202c112fceb9292f0ba4df599cd9f45d12132b870400473044022038212d1f2a733a657dc26c9995720df6aca6203a6204770ac1d175536fd96785022000f40d0e67e6eb547ab35d305e6ed5b2b8d05d1ac6bea496bd5dbd4f0311bc800147304402200cc8a3e780037a65193c7e08b03cf841ad5fbf86510916f73f8f0fedf900fe8f022037413def7ed471c02efa40aec0d66139a37ee9bc2429957d17e95b5cd34b07d4014752210319b491f74221ac7e7185e172e297b65b8ff24bcf32ed78c7479161b2f185bbc42103f50b2db2984e8741da7e7b89737b4700b938e77fbee7c5c148dd09496ca1d76852ae00000000010000000001013a4f99f51984548906bd10cff6a251c478c90faf87fbece920330132832cc97d01000000232200200ccf0c84714ac0e08870e25a5a41d6d7a1e2d771fc1c1b16798699f49570d641ffffffff0240420f000000000017a914180c78310f1440da67e6fd07446992e62598caba8736fbc6000000000017a914b8a173e2fc78c13b753757839b0e24be0e26f7fb8704004730440220500b6df55815183a5a455d79b8a605d1f627aa4675c66280ea91966e72511100022033dab55e3efe192bd8342e60479610a2ebe72092852352d225bc944b7d2f722001483045022100b3e9645b06521c32ffeb152ea702449b7f0b6d42507f6eb947fef091c48ae84602207510d389cb53e491c63e186555f8fe06e383a61fd10a7f7862c31abeb25c83b501475221027793a67aee7421002b7efc51ac87de9371fdef93c215964b22a9ef9cf94a938e2103f50b2db2984e8741da7e7b89737b4700b938e77fbee7c5c148dd09496ca1d76852ae00000000010000000001016f5a9f008ec0ee750368cd1b0b06d95ecd8f662332264a27ef121db95bc7bb680000000023220020bcb29feb381341d473d10981927c8c35be4490d71591e5df1e579506e1b6188bffffffff02a0bb0d000000000017a914c186f0062607836020ac1b3fac0eb610e0f0f31c87827201000000000017a914180c78310f1440da67e6fd07446992e62598caba87040047304402203e3f1359d8b9fb5bacc7178c9d73e9a756fe9c111cee3030e778357c72205bfb02207f97a1f443e0ab44b9d8523c9ac1dc374878a30f30938f4acc8d12537692b46501473044022038cd47a4e4881e2ad1d07958ca4068bf766c4772dbd8203ce3621fbfeed25419022061b4b673c27e98693118025851cd7896f0312814dca78c2a7277d5554c91aa800147522103d49f0188ee092a752dd56069fb54bc2cd65f3cc76931cd4c91fbab35b98de8a32103f50b2db2984e8741da7e7b89737b4700b938e77fbee7c5c148dd09496ca1d76852ae0000000001000000000101dcd76aa69f456760d96933a3eadc82a7bb9fef79a9175e48ea28fdd21cc71c280100000023220020f8559c2546d91832e0efbafb8d6ef7f7387bcc09620dff9d759ea1458d5f9d4effffffff0210270000000000001976a914492fce1025793ea7e8609161b2cc6cde64d9ecf288ac202a37110000000017a914816f7da5de170bdc9e4f3330187b39dc628482b7870400473044022025e5ac2ebddda7db3cb2dca34cfb3ccb21a94c4359574bc8194e6308a54f975002205ba36363716652494f12e399d8cb4174d4bc1a1d0c6aac138040cec23bd3e12b01483045022100dd2684068f159cc0bbfd96f7719fe2eec5a91c448870ffc62318b7381d257e89022016ba279d33db64cf29dad9b60ce261ab34b8ba6b047da049d2d192392ad3e4d20147522102e5d9d885abb3113ab4dc311059aa5ef53f304fa959102c7d1bea40232c4aa3b52102c32a93442754b82030f6bce634cb2e09b4dac8d91937fc9c03d52592e0722bd652ae00000000010000000001011a993448a04a1342dfe7aae4e8ae6fdf59eabf629a67492b56d21420f5d8eff80100000023220020f8559c2546d91832e0efbafb8d6ef7f7387bcc09620dff9d759ea1458d5f9d4effffffff0210270000000000001976a914492fce1025793ea7e8609161b2cc6cde64d9ecf288acc0ee36110000000017a914816f7da5de170bdc9e4f3330187b39dc628482b787040047304402205e09011611cab6e21c9cb9e71c3bf10390d4a6031fd931dcaf52fb8ed40f0be5022023a03c91bded2a14752170f462d7390e23c0d975c507765f378b005e98e0f75301483045022100d9bdc1de9fc231ea515fd2441cf5ce9d57af508c3ac0b9d14d716378ddd0872602203b4e3a314eea56b813e8c352875ac1080e47b6d5c7e57837e26dece85ce1dd140147522102e5d9d885abb3113ab4dc311059aa5ef53f304fa959102c7d1bea40232c4aa3b52102c32a93442754b82030f6bce634cb2e09b4dac8d91937fc9c03d52592e0722bd652ae000000000100000001847ed2c362cd9409cc1f7dcaa6610a4c28dc59859172cfcc30a729a194ce8f8e00000000fd5c0100473044022014cdd8c30cac95f87d6523c02c672634d86107e9cf919cf9358a55e5886e870802204161442f8d0a7e7baca076e3e7ae1fc976244970c8b9805c583953bcb541cad70147304402207207f128cc8210c9a6bddcce147d355e65b8f5dc65a7c83483ae4eb859ce126c0220175ea6f58a8a986a46111820459499a816f78c5c360ec659bd1c5530e575df29014cc95241048aa0d470b7a9328889c84ef0291ed30346986e22558e80c3ae06199391eae21308a00cdcfb34febc0ea9c80dfd16b01f26c7ec67593cb8ab474aca8fa1d7029d4104cf54956634c4d0bdaf00e6b1871c089b7a892d0fecc077f03b91e8d4d146861b0a4fdd237891a9819c878984d4b123f6fe92d9bbc05873a1bb4fe510145bf369410471843c33b2971e4944c73d4500abd6f61f7edf9ec919c408cbe12a6c9132d2cb8ebed8253322760d5ec6081165e0ab68900683de503f1544f03816d47fec699a53aeffffffff0202201600000000001976a914d4554500de53d1d2c8f2319f92bdebb8f6e8c97888acd1ba8c020000000017a9145629021f7668d4ec310ac5e99701a6d6cf95eb8f87000000000200000001166da822091a4c67aebf4d2b7dd96cbe043a43d3f949c8dade50381cf02cbf82010000006a47304402203a87d337f940eca6d8d0471ae559199048e12bb3f8c4440731dcd6d3964b2a1a022010949f8e41405e261e3d473341d9c6b7185318b4a4b9fcdb1d49371c4cae78fa0121033703fc32419585657ee4cdea798d511624ad3031bec6a773fb1669001656a364ffffffff0210270000000000001976a914492fce1025793ea7e8609161b2cc6cde64d9ecf288acb026e70f000000001976a914d23fa1ac34074745d8eb964c8b3a7ec11828c62888ac000000000200000001f2aa10ec7504c38b9016ec18190a0fff8313d36e06d5dccdf0c240c8ad51d3f0010000006a4730440220052a505c2ecbb408ca4aaba0bb4f1d12f59cc026c162d923a46c2965a823f15302202d065473079f59593523aaa0a063fcac385a4a480a9facdb68096a1b200c09d40121032128d388d639cc2f5a101f70c6d34b306d160228c8482d1c43a23a5295e0d0e1ffffffff0210270000000000001976a914492fce1025793ea7e8609161b2cc6cde64d9ecf288acd59e9009000000001976a9141b77b73f47e5581ffa64fa75535a3fdde42ec50688ac000000000100000001ae5b87cb7e0fc1028fcb0d0ccf559f23bc9afd528b12a23a7b2d7ec1a6b8c787000000006a4730440220399e0876eba69348cf19574780647dd3a0d54e3e2fecd4503ae15af3f2c8da970220672f9da5c7c6c0a04d200b1e880b5394af0728b2c07201aafc43ff11fc2e8422012102f0a5a088427caeb5d1da04d577252b58c920b99943179cf8055802d16f6cb6a3ffffffff020000000000000000426a40c2b1c3b9c3b9c3adc3a6c3abc3a4c29dc3b4c3b4c3b4c2abc3a4c3acc3acc3a4c3a9c3a2c2abc3a0c3acc3aac2abc39fc3afc29dc2aec29dc2aec2adc2adc2ad0587c700000000001976a91450d448e9e5b9ff77fe55f8b12aee4514fbd6386688ac0000000001000000014c61bfe477e4c84ece13ce2df5e172355ec0f2d72c9857f84d02b57de446f2f5010000006b48304502210097f60999871a4a75d080d6eaf053620d5799368ebe1be9944a8d534ea488a63202201e58932e364275b383c7f1374947887c6effad198152b2c7999b4fb9b6232ed8012102f0a5a088427caeb5d1da04d577252b58c920b99943179cf8055802d16f6cb6a3ffffffff027d73c700000000001976a91450d448e9e5b9ff77fe55f8b12aee4514fbd6386688ac0000000000000000426a40c2b1c3b9c3b9c3adc3a6c3abc3a4c29dc3b4c3b4c3b4c2abc3a4c3acc3acc3a4c3a9c3a2c2abc3a0c3acc3aac2abc39fc3afc29dc2aec29dc2aec2adc2adc2ad00000000010000000195dc9c0ef75f8a7619e203c4a155778c6e0818a5a593624425b9fb879817f1d9000000006b483045022100f459f5a0ed9ff93b81dd39a04c3ad3db52e08603a1ad20478a2058888e152c98022054a503be5ab5f27d3e20e93e64a023e4a7a35e6fe2b93208833ff63726c5f4e2012102f0a5a088427caeb5d1da04d577252b58c920b99943179cf8055802d16f6cb6a3ffffffff020000000000000000426a40c2b1c3b9c3b9c3adc3a6c3abc3a4c29dc3b4c3b4c3b4c2abc3a4c3acc3acc3a4c3a9c3a2c2abc3a0c3acc3aac2abc39fc3afc29dc2aec29dc2aec2adc2adc2adf55fc700000000001976a91450d448e9e5b9ff77fe55f8b12aee4514fbd6386688ac0000000001000000018d7cc3c5112dc8d409d19663a7709ff93d4e6930fb0f1658e2c8b854359770db010000006b483045022100b48a973e42a375898f90ef509a741aee016272f887833d0f55bae5b127e1465c022009bdba5fa7c9f6b736db5618d5145656cd658a7f538574484a7ab8fdff1f68b8012102f0a5a088427caeb5d1da04d577252b58c920b99943179cf8055802d16f6cb6a3ffffffff020000000000000000426a40c2b1c3b9c3b9c3adc3a6c3abc3a4c29dc3b4c3b4c3b4c2abc3a4c3acc3acc3a4c3a9c3a2c2abc3a0c3acc3aac2abc39fc3afc29dc2aec29dc2aec2adc2adc2ad6d4cc700000000001976a91450d448e9e5b9ff77fe55f8b12aee4514fbd6386688ac00000000020000000152e43e3e4a93aeabcbda763c9ffd72ce46e5dd2462462dcb1d16e190a5d3fd2801000000fdfe00004830450221008ecb2511b7beb4ff494496967421304dc0c564b7f9357c3a697207fa8859cdd702201a883ff90e9e57676d210610978cfaf729a6198c744a83c9fdf30a6193be3ce901483045022100cccc710a6ca9b823c5a27125ccffafbd9faaddb6f91f0b316338e4d7ac38566e02200f13b3340cc6bf27d18397b17bdc36a75fc0a08d5cf5324b2e1ab6bbb9927969014c69522103c96dd608e178d4326b54faf7f927f49f4af30108c4f5fe0fa095fb1fcf450ed92103f7c0234bc223da9ae29dec220451bee6534554bf06c26c2962698ed1a227922a2102803acd8b52cad3a7f1e4eb3af76356a38177cb92fd28aaac52a3d7e0aca65ebe53aeffffffff02804f12000000000017a914a78c8df61709bda21c3a179d6829f6296d215bc987e6d9c1000000000017a91400da8e626fb6a57eddf48463ac5edfd1b992362e870000000001000000000103b99373125a053d92a2330d4242d65bc3796a0f2c0da8c92e9ad6ecf216d3136f0100000023220020ee3be5477276bb4a92837a58c3464a453e0af1197745fbd539e85c3a5bb79007ffffffff580eaa9bbdd4500d02f3b2b1dd1f3ee8343c7d0c0d26750cbaf378972e76947a0100000023220020ee3be5477276bb4a92837a58c3464a453e0af1197745fbd539e85c3a5bb79007ffffffff5c44dfff8473e54fcfe8ff784815fe1b87db034676d3ac0b19edb7a6aedaa37e0100000023220020ee3be5477276bb4a92837a58c3464a453e0af1197745fbd539e85c3a5bb79007ffffffff029ab522000000000017a914404dd6af6d1a6c3d95a8ce4b4610922112a4b4898765e70a000000000017a914d736a738a6f2444a829b216e33bc7357a567792787050047304402206612dc4e225cdaa8fc36c44fc688bf084c5d7e0f613d8f8a2ccc6d519358119302203ce713426232452412ff2a25bc476919bb261fa9200da068b2305f8e2b8790de01473044022012e2998e3bbc3b71850ffbc2a471e972639598cfa6f86c25541ccf337102db45022042e5f91631c57410250bdef4b592a61bbb4b4187447ca8d0d07faacdfe2d2d7601483045022100fb71373d27eda0da09c1f24b2d357a715464e844aa6d11d6111dfabba96ca7c802205995ade49f656a8d46f56f491b554a07b2ba02788c973866a43784c55f1b03d4018c21027b34fc673cf918a3638dd7138e167f85f47b26e2d83cfe2387353aff3a46238fad5221032ade5a75c0dfa7fefd2fda11efc66987a21aff4ec6bcc55f66ea7729d20a7a152103a53acf7bf86f19b4749d9f005c316e58f8fe4ec8b5bb5f96aecca8744bde552d2103f72f1126c21923a1bc9183a864dad5909ac01bff9f94015e3ee231fd12cf62e353ae0500473044022020dcfdcbdbe7d351878272c0a790d6ed2ae6f14571b99ef3329ba7c84a558ba5022052411ab03cdd09f7935be3a97790b4c5c3636e91dbec804aba0640f152425c6f01483045022100e96f597396f9ddf0acd65a4037fa56d3481963be93fb4357379e6486444a04b102204d285b650406c01a77002fe1c223f19b239b458558d901c22cf13e03aaa38ace014730440220247f40759f6d847594ce0b9f9f64cf04fe173983428d9faea080c7d76838736a02200c19a4cc60ed8636ece8078379685bf71ff33f734165e7a9503ad404601f35eb018c21027b34fc673cf918a3638dd7138e167f85f47b26e2d83cfe2387353aff3a46238fad5221032ade5a75c0dfa7fefd2fda11efc66987a21aff4ec6bcc55f66ea7729d20a7a152103a53acf7bf86f19b4749d9f005c316e58f8fe4ec8b5bb5f96aecca8744bde552d2103f72f1126c21923a1bc9183a864dad5909ac01bff9f94015e3ee231fd12cf62e353ae0500473044022069b629e1e7516f9f9f161e8a7bc1f1d9f8e220c0868351d9084a78aa2db778d102202d3c0b5d77e63bf9363d15feda3fe1a6c159763f501a3cdc058df858dab2dfe401483045022100d02e13b34c995b86ff2a6a9c52a6926f0cb91afdf6a12cdb6d36720a6d59c53d022018a57dea99cb1e48a65c05640308d6824735a41410fae95a3bdc8930d5b8bf8b0147304402206e8d3582d0ce73bf442f279093e1bc2311529d5d5738a951fe00087eab4d2a5102203ba2f9463992292425b2e6c60d1b8f05ebff5f05e69593f64b73b534c42ce545018c21027b34fc673cf918a3638dd7138e167f85f47b26e2d83cfe2387353aff3a46238fad5221032ade5a75c0dfa7fefd2fda11efc66987a21aff4ec6bcc55f66ea7729d20a7a152103a53acf7bf86f19b4749d9f005c316e58f8fe4ec8b5bb5f96aecca8744bde552d2103f72f1126c21923a1bc9183a864dad5909ac01bff9f94015e3ee231fd12cf62e353ae0000000001000000000101783742859085a1ba83b86059872a220a93701ac199a7ca32cf5c03505d13be550000000023220020c6a880a33968424680d5f27c79186cc172b63b1e1f0edb4cb59f86dede7c7984ffffffff02c63d00000000000017a914d3858161e1277b4c4e82da41713b166cc15dbf1d8709de05000000000017a9143e97fcca9eef801326d83b322330294a7629c1c48705004830450221009d2bc1f14f6d30693c32832b38c7f1e4a36a648f264953aac2187123364bbe7902205b5f732d0c3f662a68e8265431a9f83b33dca9a0be35a8599528eb104611c13c0147304402203f8c1d72e1a0ad2529cea5a194283a801003524e567e3eddd0226725c3361756022031454ca70f3e8815804d8138b9d31ac842b43c53435f0d4e18f6fc211f59381901483045022100f1e259337989b379bf045bd18718f32c3ede3e78af2e601be3f951db3d9439bd0220713fdd9b18a9037d66f013422194ac940207cb73d638d37199ee93d0e2dce4c6018c2103676d60c28e8efa5a9e557a5aa8245568bda7bb6b90c4cb3f3813329a8814bc15ad522102a92fdb37ee5935b6ac438749a5f8aa86a1029a8f692514c862e4b80c63ebc3bb21031586ebe7ed6d8f232bb14e9b1eae589058ca8991d03eeb1cf89865a0bb08d02f2103a2177152243dc8b36a9a4b9fbddeb97fb1ef5af43b86db641fb1de7b52380c6353ae0000000001000000000102c5e18d40f9e2caeaed4cf000bccb43f17a1a08521463eac69a5de86399bee5cc00000000232200205551e81bd1ffbea8c217bb1277c7b212a444d25eb881dc44a2f1d41b0dec1794ffffffff73e8a3262ba3e1a2f6a7c68a5651feaf1cb1871585dfbe36cd23a6739dddb46d00000000232200207c3b2c152b490805689cb8cd1390b2e4737fa03b5ce01c178e19241c13f71522ffffffff02a83b00000000000017a914886e9f4e8a916aeff0be5187b6f182d3640c62c487f9eb03000000000017a914d414a2e0e4dad4e5929c697762365a8aa8661c73870500483045022100fa5328591a828ab03155d4637327eab18b31e1562bc52b0eb4b9f55d3c2f740e02206d43e29b08620bfcb93970827151948250917db3a77593dbbd1b833e3c48311f01483045022100c30983d1676d48f916ab25a3fe779bdd2ec2258c577643594643695fc21f4a49022016f3ea17efc927cfcb127424c7f2d8d012862e864ce1d606f8e45a6e3052b0a7014830450221008b5c73b66105fb6aa08f3f8f86cc1f92c2b3a1dd508ed2599677e159758e124502205140a8d1ad8aef8b7b2899a3c327c765c930dc8b4a3419ebdff4b55165b4cd9b018c2102e096bbba59c6ddfeed310071611fec93ffb9e1faba3de44b6516ec681d773035ad522102306f922aca108018a91a016995083f490b390f4574d4236f789be372772a76752103708a8f2e88aed1247ab91b3dc63da73ad7b31349b9b667474ee9bd91f1b2eeed2103793fb7b0e3e2002c539f0a91b73cd7061809c4401c8c95f10260ae49e03f1f3653ae050048304502210082dab55e6abad52dfc4acd2f7cdb61972b70d3e46ae594615be55a4aa41f92c502206198b5fb21cc2f77c96a582c27a8de1b9c2a98fa8eb43efabbfffb370031f28501473044022060709d78d6fb8221ea22276b47b8219f4585b83f0b78eb730f728c0f2d483ff9022077a3a406c38ebd377b28da778ca5658779834c4592d78abb05012d11e566751501483045022100f70dd70527c62425da14cba04bfa895b9f4cfef24318ccc96eea84bac6967f2f022009a4bee9a9900d964fd07aef02ad632965e875c37dd8f69dd3602c78e63f9ad3018c2103cb51cdef5d97382bec4bf90a65baec275f54265a6189b343ba7aa311c45b3774ad52210283bd54b9208e3abf16c8a6cdce9c2c83a77ebc16647a0605eaa1388bcf8825d92102db4b84d259000fc419712c33e4b6abf33342b78272a06915b98625580054b0b42103e6ee59b76d1992d6721373ce541776a29b4ef037524e57333828e11ac375bbb953ae0000000001000000000101f51e6daeafd42cdd85fa26b4681af99c50cb66768728c7ef9ae27232ac0de2bd0000000023220020012873e69e0269984e55a9023b02118a8b8d8a334b103a7f832aaae925a5cd50ffffffff02b62800000000000017a914e0c9371d23b32d8e5c6e6ad0321f6f582134539887880900000000000017a914515f928c4348109cd239a157e5bfe6741c861069870500473044022040a5dc1ab950cf5e3a601d3eabf8087b90afa9c55debef069792a2ecdc0b3d6402201765fdfa150419dc38183c3c55e1fafcc18f7880d20dd1f7ac44d216a8cd475901483045022100c8d15f7850aa03d88a82952d69b074a7ed0b54e0423f03c0d09bd6e7a1cd0ea102203a66f8c3623b12f59e50f8a41c031a419d222bf0b036e236a68bc267e13a27650147304402203a3c70109213800f3311d6c9b8f0cf5468b47aaa0a15b7394cd0d9d017607d2d022031deab1eb61606b7699825ee1b830482a87b1c868ca18bb5b90a01bc0a13ca6b018c21037af19c4b6a2dd7ed7a3591b45e22887eca645a71fba08264c04479ba10f7b3c2ad52210239d87099e55e43416f5b7e4ad58534a48679ccd9014cd5350182e31b97e56fe72103a12b7b72bf6e5540fd2e263fe5ebd60a54adca9cb2e26087d06b21ca2f36e9242103be3d908b75b3920f8c4c6ba54eaa51d81f3aa91e640b69ffa974576b958f3eb153ae00000000010000000001016bb48b3017416295d66ca2a0702550c90fc2fd1379d779a8a12baa5ec3ae7f4e0000000023220020129d13b576e1e88f6a861f20f997b95e43a2c5652cd3327bb6cfa2744c56b7b4ffffffff02867600000000000017a914bdc83160200cff3dc96f1ac95ec471dd7f77375687221e00000000000017a914fbf14daa4220e005860848ba02d6730b9a9bf22c870500473044022041cbf0bf9ffd94a0e2216f0dffea28b4498ecee54fe86182cfd73130f7401bbf0220296e4770cccbb5de5bcffafa104e652654d5fce8213744cad64cda711e8e2ba201483045022100a1b9f62481fb331ec30d44107121df4a3d29a07398651bb87750d1cfd8c8384d02200ad6ceee5359c4b658bcbb44cb972d5e7da8d2aa1fc35805999c0588728a523d0147304402206a4353e1c8911fa305a1948e1f3faf0b24a40d381cd37d998f8ef614136a8cb5022057785debf6fed4d23fd9feca07359b03048fe2d0d2654ea900ed87509fe61330018c21020e42f398eeb53dbfc6b30944a6b85fba33033fc587d725088e915c3d21fe9ff4ad52210312f5731af2929d90c22db71771168471e10a23811b5fe3679d683e25989fc56b2103630e932bea7c477c8e1eda40822a35e81e1d09b13eae810a9a097c0e8ac091212103e74662f0338750a557cb51bef24b9789f6867603df6e9fededfaac6aaeb54c8753ae0000000001000000000101755475e7a90a1ad61516fbc2779ddce64ee1a5c022b5be490bb13563d0732b9b0000000023220020299924b4aec03050530fbad5480358a63bcf7fec8035ff90f81445c94cd39c9effffffff028d1d0f000000000017a914357da0aabec4bb77acd95943b2153bc18f7e034387b62318000000000017a9140129c375744adfb355a73be5d3f374e7b2c65ebb870500483045022100efd80fdac3193afeb556b87b34594cf4351946f174515dc8e2550e3a3f906939022053b0e09ca28dd1124dc7458ad0cc3b94f7fc581344d1cf8fea1eda2b34382365014730440220349affe563b69c19ee769dc67a8346e384e1e63d0279b6014f4afa6d4354476402203653d36b420f1ecf0fe7fdfc9bd5c381948faf631575ddf435b8558367fc280701473044022037e002893797f05666acfe40503536c74067dc118ed024026f44c0656404367a02204166b5c22c38734179c7192b7327aaf39569540df7b61f31200945480783c366018c2103509bda3027c3326d6f97b11fb0f6bdf2f41e58d7cb2881f063bb516216aff8e0ad5221026f39f01e014c967cdb4c899e9272e4d05caf1c4f54ffa072c2b440c65cde42612103c0b980b81e4cf208b2349c32340064d0d6f19b6982fa555663411e275c144d542103c0e3324fd4c4054c27093e5fdc9d0bb9065941b49ed481540ea4d3b600f8aa6e53ae0000000001000000000101e5af1c7849543feb3e0f84fe6937e3526c970df720f466facc6d4cf6e50010f30000000017160014f3508c1f1c2e7ae14e9eae1a17e7aab7cf7565a7ffffffff0240420f0000000000220020275c4b4fce6fcbdff8847e24c7e678991d97cade87716d63c12bc0bbbd83ae6e699efc0000000000160014849c481a266e0e2361f1e776ab794716c3d65d820247304402204be4100887b3ed656e2e0fcbe5aa2b50e2d6e63eae0774752756468068d2390002207fb6b56e5ba243e27ef94ff9812c0dba20f58d58aba85a7769b6ddae01cec638012102e1a15d63a739a853dc8f213947d609f413c4284e29398a1cb261a3a5b7eed00600000000010000000001021bc1cdec90bdf112d289346b616b178a952010643fc26027c7906942b4383d190200000023220020b30231ca3a5afc7ed4320cfa3f7bb7209e25ca29cdc1459af7041e41c22be5aaffffffff6419991318dc4ac5de815dbd27e5f4e2f3a7b9e474d2326c42202982c40b738e050000002322002080025340770d83da8cac39b92d24ba29b8dbc007a1d152a796e7189f36a2bb22ffffffff07022f0a000000000017a914e517950cdd43f6daec46976d40e24ea3382e0c1287423e0b00000000001976a91491f095aa40db649de568ca6e58395e5f2f869a2788ac941108000000000017a914d729a2d249c6dd0d1536e28f0bbb2909c614d0ba87b4ca0500000000001976a914d603ba8fbb0e12fb8f5d241ec8a75dd52db54cd788ac86ea0d000000000017a914f62c41160ab5133aa870dbec2fed119f27a1712087de9f8a010000000017a91495d1bb81594d6387c687dae9888895bea09fd54887f4050800000000001976a9148fe278735814712914e1f4dd4feacf890a0440b488ac040047304402207e005f7eda3b46989b3dbc38a92e6167c9f7a4b5bae5299c0faf19c369f9bb7b02206b0b0bc13560e8c792e7aa157876641b7227542b156705d063b27570bb853f7c01483045022100b65c7429b69eb49532235a68c5cf7206e82eaf61d1fcbc84d39845cd0bca8a2a02207430d1b67b59a8bcfd55e67a4173c9b6432de4d7183b02812a7031fde0037af901695221039bbb140645775dd4a925754f7870a095904a732cb69a6640f5587ca37c01890621030690623ef3ee26c5a30db82316502d3be70728a1f6ec18357d37016517391f512102d6f00cc1ad0adbd36febc862817165c063350b253939cc0f3a899a2a27456d7853ae04004730440220100b72d74c6077635f4c5598507b4c66ca42f52f9b3763b658c373141906c6dc02203e9d4c9fb5e838d98e50904d733c3376cf6a7f4c5c67c81571258611b250b97a0148304502210081ffe77dbc98823262ecd8809aec84cb5575eb769bd0e99945a3f8599ffff17902202d4bd0a930f1c2458363c9fa7972f3f83232ad77e326fc4a3d856aa99e427ced0169522103416ca25eb6428e5dca90bd2252d8cb267756aec7aa91f7df60fe7c680aa25fd121039c95a9d5a5ef35596da4105c61cfc1eed5fd889d275fc7ee66689b6c2334760b2102fcf9bfbb6af3cababeed5926376f7552cb7e6f50fbc37d7766bc5b7b2268723053ae282e1600010000000001016a1a788f5907c751a3bd1a71253971eec5800e0e8f1be78017dbfbe48543ed6c0000000023220020961badc70ceb133ad62900c6a1ce44798382a1d602bbfc3cb268733f5eb9ab51ffffffff0290f81400000000001976a914f865469a9c30bb5839563a0fac6e1eedb4d1976888ac28094a0a0000000017a9148232de979b8640b3bb8797f7249562cdece7efa8870400483045022100cc801ad4c157b83c5e82bf8f945f2808c0840408c69bd4c2b56056183891b11a0220555a78549635f18e2e8156e06d9a2293193bbd5847dedc9d0c33f0e8b8a77b030147304402200f8d0c489b405d3496b4336ee56740bd06f3fa11bddd02d70c12f204344f482c0220055d4702e50f4b4a9511b3aecd5e68869ef9cb88c72c62e705c9f68db357f83401695221038f5aa46817d58edfd7f38c2b61185d5390a36c517c7e8866af668f3a47dbea7a2102ec03d7a5801c2acba06e5759ea0c9fb4d0fa753e49bd64f9e1505d183f5c1fa12102339fcf4fb1a9cc1d73abac893d48481b1523c76a17cca5d78759a749b85c9e5253ae282e16000100000001bf2991cbdff3c11c41eb2ccc60d95acd486d732f7ac4d8912949209e4b2b7e4b01000000fdfe0000483045022100bfdd733688ffeefdd2bc34b3214fd82146fe6029cf024c467caaa065a1ca3070022064c21747549ddb9c0bb60ab44dacb9f62b012439741ac0e32a897472d9611adb01483045022100cb725490821e50fd958dd61a5e1e2c0df63f1a075c4200ef6741c7613414aea002206de34e75c6b5cd9b0a20010182d86a79c76506c423b0f4fd5da1e0e3dc57704c014c695221031d81994d8c030f3937f5e4b45bb07000996be31d2b8d76296f2d9026d5f58222210219b046379a32ab3cf21884b3062eb38193384b59db4faeabeb6ff181abb1e385210308f0fa1c203f6aa3ff855eda9c40b19a7beb337b1372d46a85ab040fb1fedb5253aeffffffff02102700000000000017a914c21694b06428f73d53536e7143e38b751bb4004c8789e202000000000017a9142655164bf94309abf4fea7ba380190b31551655887282e1600010000000001024022fcc4109ec62bd81587d0546eb4f9370118285297ed667b6edbbc44fc21b40000000023220020df857d7e8a6b3e3ead6eeb7081fd2ea3817934124f43c9c8303b29818c57934fffffffff0ef0d843e8c4fcf813b643b89320ef40dec88813fb1e867f9ad829588ad87c490100000023220020f4e8a2799966a7975cb8a8fad960242252a344c0cd8044818b967b5be449a469ffffffff0211bdbc00000000001976a914d4d248c5caf5a56517602b11d02b513eafc0200588ac57bb5e000000000017a914fb4e152780ad55999d2716dec6005056bec11f57870400473044022042664a2c52d6810ac6c82d1c38bdafc1ca9df3965da69ba45f43e6b7768503730220788b9d9fa0cb694622ab7936e08c79ef241677b9862782ea4c9ba6f8849acc9e0147304402202f654cfd7e39a0df189013914beaf367f333e5c6ac9d71b7348a8670d135ad6d02204bfe6e4dede9b0e666458a7f8578845311f1981e951240852bc5a6847f622c6a01695221020f70307f346ba978c843f9d6d06a469fd5d0bec55c45a6f1446d29d2ada766c621028d97868438981be108c00f43c96fe3bc240646c5ab230002bbc725bddd614b51210265931c67e68567b09af5a36fc09639cd604fe2686a9eaa38d9eb947196f1f2bb53ae0400483045022100aec8e837cccee7f1910a35266e0d266f3ee3a1d432fe5457555618af1cfafa4e02205752e9ed9d567fe9a7d8414d6cb8496a4c28e5ba8e71af258ae17d0206ddadc301483045022100f1670e023ddc3db07ae82e0f701ec2237492bc061445aecf2b1d00d9dfb255cb02202eafc245489da9e1560dc2b0d22c6d6df2bc0654a04309fce08823ca1ff9c3f80169522103d06a1d91aa6a007953133e6098cfa9dada47a174dfea930923a2bd20c25f522a2102c14ddb040441a3f3dcd120fea097ecc5a19b405f0de3729372b6bd45dd73860521021c770434376c5aac6c1146eba883213b7d8f395527bda01b15a1633c0ee7c4b653ae282e160001000000000106376b733300be4310cb41f993ec8ae3c5096715c13f4a312014a3e062117d40b301000000fdfe0000483045022100c664f7105a0552a730210470b0741ffe09280eea87ce15e1496608f8f0b51234022053c8af616da053b4fba529cafaf1dfd1dd55f339577c6b61c316ecb78f17a0f001483045022100e459db926bdfc8f57af3f96d07bc98705ba08b51cdeb3be43431ef3b01abb76602200a7f43accbbdf3b5d5ecff4633870b46fa3a506bb2b4178e718c728c83da8436014c69522103a81417973d3d687d738b1dbe03a19c1b3722aec5c61242232d736a8ad73260a02102758f07f9c08fb6cec29412f3d50a5b120dcd22b084fa583eb9d947badc76950c2102927d062dae2bd8cd067ad73d1e65887ec504bcfbe71ce0ac5658154ccbfcf4e953aeffffffffa09ae749a38783430e029bcfc0d783cf4b97e4f1001dbbb0c77c7c0fd860d5c701000000fdfd00004730440220322fce3f6fa1769490f89c81e079b74d3ab561e16a824fff8a7a927fec4598f202207725fe45c320895a95fa1e0425bb3de12dc6f8026c486dfb0e37da5fd34c094801483045022100f641b4284b8199b4648fb060429e5e837f9d3297329117d7434747a21462709f022073a1f7c3597b6396b56165572d06b204bfe64a14bef3942777c5a4d25a8f5754014c69522102a7bb709f576a8e0d6f1522ed618474c61301d98e21a5ead8d69414694f4c7f172103f0838c2daa1572e0c92dadb962c3d981647de1a07bfa38273f3b762f005c71012103476c7a4a9a07c52afda5b9735795301bd32a8f8762d5320b5d8586c86db259dd53aeffffffff698afcd3c131143c07114f80ab8113ed3bcad883d6e6a734c3e7c044c7d55c2800000000fdfd0000483045022100ba998c695d7e7ced1bc9805839204e2c5d9a63ede96dc973d527b2903c496daa022045ecc5315af6dfb164851d57c0960c444fa48ab96b2699e3c9ecaf9f20395efb01473044022059c6720a260fe9ef69f8db1c8657f9bbe65bfca31bbdd729682d6c3cdcaf298d02201e9d3dff095d9070996a3ba2d233dfa10b940d4d7da8e31016fb81f9aea2c89c014c695221035cc710d90499eccacd8a78c1077e4f4bf31e30fdeadb9945a432f6940836dca9210365583312c0bf91733f53e3e05f71036c455ba962ad1375efe0ad23aed8bfa48e21035d3517321374a373c8f71355623ab472c9f0289d649b285c25c62ad6e8db7c4553aeffffffff42f4eb8a3185e0be508e6ee2e4835b4cea37a8ced6ae25e2b425cd938200e5ef00000000fdfd000048304502210097d82b77310fab53fdccfd8abeef998091ba5015409f4c4eee3acf827007f563022061da5ede746c1fdffb0e36479e4ba8a412f40c84c481ac548c1b0fc64a02db7c0147304402204fe1f67b15fb97000c414e42df4b4aaa17cd11279153b4e7def4d55a80429e6602203d8884b8f9c1727358216c02e2f3fee85fca7d69c9a93e8547b014193d1ed4b3014c69522103397b578d3f9fa9bc40ceea808266dea7d21bdc5da1c072da0c6ed444570621452103608f2b435497cfd26ca6b804b1d122e0898c48ab4ca969e20aed3a6b67756d72210312d3bb0b132f1e41aad18c741d61487c87eb69da8b69312e704c0f92ac5277d753aeffffffff85960ee68c2a957cf0676f29973cff076b78dae1093592344b1abe09767674230100000023220020c8f2d928ecb534bdf300dda8c7779c545e47d615aa9372fa17b012f7a6bbf949ffffffffc7412ef795f3fda2b7467a55393861fb4891d29a6ab8e1332dacef412de6a2a900000000fc0047304402200156a9e6c1a5712c188552e5e8e52b70f73bf94ab6b7aea0c79a92bfacadb89702206a3e326dfc4cdf7fbc3feb1eb53a664a6168cdb54d2317f19d9ecf98913ca7d90147304402204101e113a82813a7f6fe043624968899a1f25ff0a769e9fedfcd3a8acf543fef02205da13082bc4c310894ac3b59ef7fbf32a88a34824ded0481cf9e570dcd5798ad014c695221026674760119afcef2dc1eddef46c48ab7c48bcdd7f4ad24ef6b3b3f1a98b7157221033c1ae5a9b237124debac0966483a1b60a5f2b6deb610802719cd3afc77028d16210355895424b5a3cae8ed6c651bd0f0b5cc06c71017fb9945071ab806183b50f9bd53aeffffffff02a08601000000000017a91492bf2cadaa524d997e9b11b16cfc342e5b60742a8759880a000000000017a914bc5e0a92e814675087f25c53c42514e9614f882c8700000000040047304402206a0776e9fdebe186e0c571908e37f3ccd4da114cb90877b72e72600b47ff86ef02206e0f94239fe3af453a7e2745f4b571c85ae8d20ee279187d2d651be463fce81e01483045022100e895ee75161f5eb67f831e49ec8b635f2169b3783338eedd2b0b343202fd590302207be655b874c18b6f6a62a2449983dba1ab522db94a8f58d64048709e834266900169522102b0b8f59535adfb417276774be1951113e3119ede78d3912c633f9f126e1b3d3d2102f8e6a36c3529f70abb30a968cc08c9bfe32987a91433fa3654087790153e2bf2210271f6f8961fb9964e7836e654434eb7f6bdbf55e751d28b426990faa55618d02853ae00282e160001000000000101ac3ca984fa2d8a4e34547cdac1dcd763485d4162ed09462f6f2b8585b61901770000000000ffffffff02a0860100000000001976a9149b4c63166ec69472a62e6b197e0b7306f0c8b0b088acb4560700000000001600147fd1ffb597eb0ba638e58cff1feab40ab1e9a2640247304402200d96826a4f207c4fea0db5304b214ce64f8bdf5b14cb263621917d135f8458b30220040f55e17eae9d5aa6984517ec5c9e3a28f12ee4049426630381cc5bad65f864012103b571de8d687903a3e03bc075288db665c7dca0678df465ee319ff8ab62c22d42000000000200000000010186fa2d4c2aba065aba3d49ae45309644db7ebbfba3e1e9ccd1795235b0d561c70000000000ffffffff02f9850c0000000000160014032930b67fbc04176b152f5b1cd7af9bc7dddbf6079de7000000000017a914e2247d0485c584949114bd4f28d773d005b43a57870400483045022100db415db5370d5cc684910e7d77eb7e13d68bb180b51f0fe7bdc94806296f08c70220699d68bce8c715a5b47a4c9802223c44e28127e1acd14e721e1bfe61a00cf05d01483045022100d9aae6cf7889a92c89aa812e27af7b3ac9d2a8a12d25e58f59f0c1d4adf816230220664d98b2bd26bc37a4404341304c2fd9764e73b8ceb6dec21eda3daf652eb23d01475221027adf381ba54824f16f2d8b74117ced7ab2f25e09d34ece74b1d739d404bb801721028e24143fc8c02c8ef8b82bde13bab2ddf41f6fe4fa3b73f5baeeb88223f8281952ae000000000100000001a56b243a960b0b5cc61d401465b035d01aade58a1e21b4b4525d0da3f951488a000000006b483045022100ab340ef34bef61fcfc02e755d899c01f5da5e6dc9188a52e2d44fec5bbbcd44402200a194a40fd5290587e2b61307abd28b63a1a2a9a5449e7de26e965ca858f189c012103f35ce23074de2ed32b68b49b82edb3a3d14331c7b4b034b346dacf08b9786a48feffffff02a0860100000000001976a914a091bbb34a14e85f0ee455ef4d109ed1b1b7d75d88acdc150600000000001976a914de81c1be516867b0f58e582d48d17f0d499bb6a088ac272e1600010000000001019f574d1350753959f3936df8c20b4d715f457e08dd4eb8730603635c470e7e8c0700000000ffffffff080000000000000000426a401f6da2800fc7bfbb83907c0ed39b311f1408237d03cfe5fece31f4b1008b5f73a40bcc1fb108cb85f43ee4934973677db88085d0a7dac655bf6f59ba21a6e76d1027000000000000160014c3473bece8220457c59e59bb44e9334d732726ddb9420f000000000016001462c4448b73016645ef52093720afbf3c3dc214ccb9420f0000000000160014680e3d391cdfb1e118d8181d1c33b4e52bf3628bb9420f00000000001600148f53ce68c39e81825c82d73f98aa7938d225fe38b9420f0000000000160014a870c28dac8e1655dcbc07a548e2c6aa9ac7a90db9420f0000000000160014e26918a48e026c9b1d1604c7e5370d88f7b4a71d7ebe0f010000000016001466c426ecfca004ed819193cf9ba918f05a91a73102483045022100f5bdc9e2a7faa9d0ab75d8d7adbd1e788613caf0d1db6556dce17d5d78d2f8bf02203b7f55c309e1909aed46aa0ab9532390cf76f7adcc73c917c5edf35ca510d56501210254f191cb77dda35b452d11adbd9fb42f74484a28e95373e87810cf8db05575f70000000001000000000101dc23a8ec68404e861dc99cfb5e0a02eface4f44038e6fc673ff6e3565dcec77f0700000000ffffffff080000000000000000426a40188778e3f04d1a4bcbe303493e67821b22542b8a872b3b70f6fc7b484dd9ebc1bd72b3fe1112e7f77f9372b067cbfb19753683b6540651d95e0854a0571fa9a4102700000000000016001489c46baf3235da1e1dcdc8f443a1b864ea21818cb9420f0000000000160014800e92e430730f1c5b35004bcc1d0a0d4a2c8a6cb9420f00000000001600148fa4216befeb4f0048ebcfb58e7dc5061f53807bb9420f0000000000160014d84150e05d34b711376301802df7c83a84864b45b9420f0000000000160014e0260def62efcdbb6e07270f3fa95be12a192176b9420f0000000000160014e0b238625578ca7cac627fab6faa9a12da850eb5b7f1e90000000000160014bc9e2b6bbeb5603224e67a00bb585df73c0dd4340247304402204458de1209fce1467f37626542d8f11d26267fd5eb107a8690de4a8b86676f21022074f62983984a62fb3e97abdc86b5117bb86a6588b842d3ef28320c8162408216012102c337bf44b938ed698a0a4b3b3f77473628a6d52a71c7b5e9e9e4634b167198440000000001000000000101e5b037a6b63a6ec6f1728cf5d5d9aeb5faa65fc6091d94de055724149404071a0700000000ffffffff080000000000000000426a40f8891dd3370f764eef99116a8af7690807b42655595dadaf040e3680a866969b4681c67a65f58b59dde484b2cdc931902abd22131e17a2419b792b62d2d3adbd1027000000000000160014165df090d36fb85064a0461ebb3b77e929642167b9420f000000000016001444f244f4fc5b3025d1283b227ae73bc12962fc70b9420f0000000000160014490eb494d20a21739c1564d83f8f251fb1ded76db9420f000000000016001462c43f20a1547929f4244b3feb58fe66e2654bbfb9420f000000000016001478907e6a39783ba9fcedcafbdd3676819c3a957eb9420f0000000000160014c877c8ede58cddb18b0412ebc16d12876e428e592a7b9d0000000000160014f39a7db5ee8a99e486b2f4ef67ee410505ccb9eb0247304402203065349138ca1cc20a1729e9c7ce8960bdf988a97c2d719799dc107dae4b0ef202206c653a0e1f99680ffed1e4698497b94e76d9c38bcb117a883c5c99fe4bb6d4a6012103b2ab86965e1d9c0fd7cf93b2f78b2d42e35c50038b2f314930f0ee0ab95cc0d700000000010000000001015872f80d7c73249673ac5d49079b2f57429dbd28e2f53f708046aeca86894d730700000000ffffffff080000000000000000426a40b5a0691637f1d69f4a731f8c0d269d82ffdfa5582c8794e305846f89435e0db0f8229a9827b021599c5bb22ff92091b2ca080c07c555d6a91104e84c294877b71027000000000000160014cca43260fe68caab35ac15f9271dd2931447003cb9420f00000000001600146285e07d5532ea91cf107ea7160ef5887ee4051eb9420f00000000001600146f7b50fc2161c8d4c86b25bc7f1957ddd08d9f9cb9420f0000000000160014ac4b662ff8d183ecc8d5c1e94eb8d27d746eb6eab9420f0000000000160014c50af2fe86bb97930e3ff392ae4660caf944085db9420f0000000000160014ec91a8ffce08064d3e3f7da3f60838a00f1d8ce69d04510000000000160014ceb96aaa49b36ce9fdd0053accd39eab9d901b2802483045022100c8921e18981cb56df738d4a33faef5a047b7baf833803062e8bb36fad8cc838e022064adc5966f8b20fa55fc07a369477ff8b8fd8bd18bfb1bc213dfe1358aff68e9012102033d8bbec38725a37577854fe7c0ad5551e0c3c90844d58e81e9a30991a72dd8000000000100000000010105b3415e96195a2619d70611297870a9d72e09fff9ac1d65744e7beb2bab2ee60700000000ffffffff080000000000000000426a40a6f583b2c9073c122c43f1ac0b549f9004e77d106a4efee42abf6ec4205413ce8fec2f6dd445f08b6205d0daeb81c9dbdd16b97bb65b7025a0070bf2ab5e174110270000000000001600148df6bb0dd7fb2ddffd8e576d12dcb53116b97716b9420f00000000001600141cfb0f1fd6f0c4313f62054fcb9049cde6d95965b9420f00000000001600142e08cc7a08d609a1cef5c5c4dc51c121acc6e735b9420f00000000001600143efb7eabc4b06558c2446f686539df00ca71e816b9420f00000000001600143f9269fb79fad7bbcc9665b34af65a6b59555918b9420f0000000000160014de7d5007a269f084741c9ea95666002783501c59f147c3000000000016001463f516111359f85bfbf3c2c90674e69e95f8976d02483045022100e46a182506b3d58b9ff40b167cf6a22cbc52d9960a3f42764c09c23469e99c9002201aa8937757e287f92daba1c0c48d6ae8c45fa5ed8395e9afbcef764440c3dd9401210209868fa9569649df756fd64e8a62de7d7dd1f8ae54d13b6c72e521e1397fdc8000000000010000000001010c4d92257fa34e78a30452c5fceefae7265423264c7309738818d33361c114b30700000000ffffffff080000000000000000426a40778cb22043326693e50594fdfd2f3e3d97d9cf5d8f8b0edb429481e1a807cd5e5a9fb2daf08aac36589b723a80dd7f5d3248127a9aa9ef48df1690b81a3d2b6210270000000000001600145d84aea17910471362e5e1b2ebf24adeade33026b9420f00000000001600142f08770d31f9d6b5a63d3fca6ca8df29bb7bf1f3b9420f00000000001600143d489fd981621dab6cf37b1b2a390e4c2927e310b9420f0000000000160014672946bdf9feaedb1cf06244eeae16227f72a696b9420f0000000000160014b9f8d05b2faa4d54a132295ab2186c2c8609fd19b9420f0000000000160014c95c36a5a21f859261478ce15ec144ffe2fcb2f75b1c9a0200000000160014aacaced13b0c6bfe8320a84ed29eee7f6b8bffbd02483045022100d7a06d2c72313934480c19b1f8ee0287676000e8cbde90d78727db4f37617c0002203b120acbd233cf486343b36e1ccab3e74d3b6e3f249c0337ca1263e2ca0e9fda01210262cbe4070b52e0d1bf2fbde044b1e45814f6004d95f5dbee49d015efaedc3f000000000001000000000101170086bc90a5119475815ea72c9cc100f5e8c35435050a9b8522e47b0ffcb71f0700000000ffffffff080000000000000000426a403b68b8bd86ad92d9babb3d9891c679334e7c09a6c35b49f744a27e2a7b6b83b127fb107270de4d2e92c3726e9be2d8888e86f47f52b9a7ee580151ac6a465e7a1027000000000000160014ebd000531088b2133683eab7f64dd222c763b095108e040000000000160014a049fabc2ac6ff0b4a64fb1d8976c2ee411b035fb9420f0000000000160014000b71c5c1d74490c685bb27e3ff20b83edd34a3b9420f00000000001600144330a8347ab251aed580272d230ab6c132beb0beb9420f00000000001600144f594a1ff6b1938be0e3b019fee595df528b3740b9420f00000000001600145a20c2f4a4eaba95fcbba6e558aae05a6ec876b6b9420f0000000000160014e9c418eeac00a5a457920b6a349a4f6b18d8b722024730440220298a64cc59525970f942636cda2c9387be3153769d77a9a5cad7d1c5c9d083e2022048a72b64c1dd67ef1c4a605211dd4dab48fa3d4c787e16a94a4a36254411f29401210258fabe134f3cb5e8e64a1a2abd595cb81fde5aaadf8b043bc2ea77249077a7ae00000000010000000001012077156ba605d6ed07bac08932d11e7d465bd9ea8c1e7f6ed23b89baac05851b0700000000ffffffff080000000000000000426a4025c861080ae0c61ea25ded51105bf4908156429677e3bbf866b5251fc23872fd6bc1b32a04b256b9e3ab61433d45c52a01eaafe846402b18c7931760d4c3118e10270000000000001600143464c2e2b02c94c1a3551ab3a8d6c707f1c70d25b9420f00000000001600141f8c4b7673982f4538ca18bc7f64c374b52ee5e3b9420f0000000000160014215b4c2fa77168e1fe5b1f96e5cf65dc1eaaa874b9420f0000000000160014b23ad3aa1466e122c63395f0b4ba67ba26a26bb5b9420f0000000000160014fe9251dd5f65baffa91ce1e98aa826d90baf1f3db9420f0000000000160014ffe0a02d60ed9da874ff640813c3351341dabbff64d17600000000001600145cdcb7b392bc4ffeb751c79e757794f91174790402473044022004940d98a716f14b13d795a09de447897348050f8aa72d39754d3bd9ef51aae8022030c78a0c2445b607211a80e635584bfc84c971f3efe548d4012c53c18e6eef17012102c287dfdc6586d7ddab302befe0776a6e8327227f2af9d3716fc587c1534b04810000000001000000000105e5b037a6b63a6ec6f1728cf5d5d9aeb5faa65fc6091d94de055724149404071a0500000000ffffffff5872f80d7c73249673ac5d49079b2f57429dbd28e2f53f708046aeca86894d730200000000ffffffff79110aa1883e14c5cdee4767e7406a1908dcb28ed75c302133e986740cf6307e0400000000ffffffffdc23a8ec68404e861dc99cfb5e0a02eface4f44038e6fc673ff6e3565dcec77f0200000000ffffffff12266e548fb215c8dd897d0f270b2c6d699146ddb44ea760ae2105f8be6983b70400000000ffffffff0540420f0000000000160014210011f488eacc9ab0b672c532565ef69b8c254b40420f00000000001600142d8cb338931568e9fb3824c7953bf873b9034f6040420f00000000001600144e72956727da37c22267f1b8119f5df9c038995a40420f0000000000160014abae590319b172ee14bfbd3abd5865639a83f9f940420f0000000000160014ac9ae83ba9dc0e5b8b768ec98d0ccee17a3722dc0247304402204246c84c9f26b9e07a81c2639e906281b19521134237222ba878fed6cfdc614f02203b25f47ea0349bc0e5adb966dcb8228626f9d36316c26fbf4d4da1fcce2894af01210286b2c1fa614cd643d6e8fbc554d718d779c3ccaedcddd7605ccab88a7dfe77a00247304402201c8fa3aa73d8a5ab6125b8bf10bc8565a326fea818944c29f88a6af7686597850220086ae0cf8f0892779faf312ef325e3a887947865cc765b0c5cc0a80cf6ec0b770121031446a4e474388622eb1435ccc15cffe80aa6402150dffc761bc2501a2b893f5f02473044022063c603bf27f4ec2a7bc84e9133b0cd1ef73847352384e84258349c1f3bf2117a022023a05e3b35f18ff1a550202bcabbc977525a0fa556d1a2c294a1d9558befc476012103ac258f6a610102145e29910f20e6d7f237dcf04f3f8751c1c39499d124078b050247304402207b147ca1230aa1b94143dc6c798fc30b2b0e1ff52d82ea5a514b92faeca915f2022038c7b6d05cfe5285bcf7a8bcfb5822895a3a5429fcc2b77a1cb757a3f17e39920121020b49512be6b34bd41ba74511f0fcc18cca93b797446cc88ba93875022d33497d0248304502210085ec97c93eac9a70cee0a0f3b866c260d55fa6fa8a55055813f06c7dfd52c0c202207d2a0c67c39edf7c72041a063184c50d528e1a52681aa721b8ca4632f68d92bb012102f3a43d7901d63e70d7f90dd372db0687de6c490ed443bcb24b0cf53a029d34310000000001000000000105170086bc90a5119475815ea72c9cc100f5e8c35435050a9b8522e47b0ffcb71f0200000000ffffffff37d3cc2f52284854ea68d2b79f0103cd03ee13c27fe334514df46b55adb1f6430400000000ffffffff0c4d92257fa34e78a30452c5fceefae7265423264c7309738818d33361c114b30200000000ffffffff50b95164469b0ea83bd903e180d3252f950a044839de6c8702d6f02c2673a7d60500000000ffffffff526db28c24715302d79249907767789975dd34aade5bf79a5fb82022d331c5e70600000000ffffffff0540420f000000000016001407fa1c6ba0baab63f85f75923b9d7e101bdb148140420f0000000000160014a27bff562ab39e89b849f79418183b311875d18e40420f0000000000160014b261f794e40cfbcf0e206271c7dce700c35b9e6840420f0000000000160014bae0039fd24cf28e880b56dfa78365db01a4b34240420f0000000000160014d59d8f4ff62c0165283d1d29f7e7bd7ef3901b620247304402206b61501c72282d790c1bdfaf727d603b5d71c3edb7f2c7109e9c3ed534c86f2702201dfcec6424ce3ad16fb399ba82030ff707bcf36bce0f892ea038c4b466f9f8e3012102578f300df5151a23998b270eabf270bb40d7597bc93dc2497092763bec8b3f5d0247304402205fcd259f9dc8dcdee700ba92e61fbe0c9074be5690910d84c66115000c67c1b402203aaec7cbe424a8a9963ce9d1a9cd939bf97bbaa82734aa6a7aac5339f134c600012102cf457a4e184a70e78ca863fa5d67800dd17a318b5f84e726f3b07c9e2706320602483045022100eb8ccd123e4320dbd6de69bfb9f961ec6e8051989e3a97775fe0a6c418b0aace02204eb10eca584297ec6a975e291d53ebc47dd316873d2c7a0c188c04fe4a3420e7012103c4ebeecec523a09a38d838a0d343fc947a6b9278bc754c4d8015e72a1eaf112a02483045022100ed1ea63252588bd12ef20f6f75c3b6eec89704ea80db4200cb390f04f3e9d8a8022060a9031d70b6bc4fc231600010c5ef740442f5da42ebbf1e8610a0e8c9131dcc012103e822abda440292083d39168cc1b0890c051498595646b4a0b06ac7afc57e04ff024830450221008c3f4c32cf3a1a6443090acb7490d7bf701ad24c5a65280cdc2fefef944671c902200f87b0ac708f0e8cb9ce2f30abcab2869a90ec7b3856c9b76109811e34f5effd012103f24a62693bb8583a980d7d434db5b34ccf65b1522b5ea5975a72f0bb8f8ca61600000000010000000001050a6ba13ed05fe8dbe404a2b6494cca724ebbb322e8aa7a69fa302b2cdd702f830400000000ffffffff9f574d1350753959f3936df8c20b4d715f457e08dd4eb8730603635c470e7e8c0300000000ffffffff0c4d92257fa34e78a30452c5fceefae7265423264c7309738818d33361c114b30600000000ffffffff1aeb89601951cf2de2f507d067a75d2653fd32b998bcdf18984efde659b39cc90400000000ffffffff526db28c24715302d79249907767789975dd34aade5bf79a5fb82022d331c5e70400000000ffffffff0540420f000000000016001437d35f7488a9c092db66a77e278f717bcf4448d740420f00000000001600144b5da2b632708ae7cb70e7c31055cc5dd9bc37e140420f0000000000160014a7d15fda51d40ee3c18206836cb7640d4fc2cc9e40420f0000000000160014c8a8ec38b3000e13d726d187298756ad8007c54840420f0000000000160014f90584a6c4f31e63ccac5feafd90f841a21790620247304402200e8c44efe7181a69ef583a0e41623514428d68033fbc8f97ef88bed284178e3302207b1027d52a7324820b8757c274dfed89ca6b7a57f599333075f61387ab127a0401210245ba97af77bddcdc1a0e5994fdebf5d3bf06105bd94adad4bef1fb82c2877c830247304402207379bf9b68428246342ee1e81060059fbd8943bad2bcd744cd6bb09f26aea0a302201712e9345387d04539873b6f401bd539d8f77c8d984b1d585b30552a72fb56130121031881807ecde9de561b15fbee33241d6daac53ede1a52f61d4cf65f877cb5059d024730440220760c5ad5159e5bcde4cc6174698015a5a3b09a3ec36f9d8f84e3b7665bbb50a802207258386b9691ed0aa64180b5b66a3166874452fb73aab13e7ae2738f850cc726012103a0b664adca4f8fc74ce25840674ee7ff0a9bde6f739e17ad2f48ddf58673414302483045022100fcd436430db2f2dd740b0574e423466a97749c565bb3a3d8eb18af37720a2c15022021f59169245f755475fef6d8c0fcd2aab774d6629416f5cea74cc4c76f6fa23e012103180d76919af5aebb2aece8ed272a5697e44ddbd19d8c130235c4903ad102aefb02483045022100e6bb941fe1f234e389931ac1e17aa5f1d7c809cb79171cb7e5ec86a676080a630220783df9466b6557e81f2edecb5fbfe2a326e074479e4e429b345a12c7a7c5491e012102fd8a1bda47fe804c9f6a6cad40b2a7860e5883c39ed5af5f4cb047482ed38fec0000000001000000000105d2fe5910ed97e9aff993387b5cacf51afeb353540f91774673de5121f2410c130400000000ffffffff2077156ba605d6ed07bac08932d11e7d465bd9ea8c1e7f6ed23b89baac05851b0200000000fffffffff0a27be97952ffd9f86fe67372af5b24e8f37778b0b04c7fa77b8684d00cf05b0400000000ffffffffec17a38907da5600d8d89f8eff6cd1e005697162162bf4afc9d1bf35180a6b750200000000ffffffff79110aa1883e14c5cdee4767e7406a1908dcb28ed75c302133e986740cf6307e0300000000ffffffff0540420f00000000001600141f77fe8176f0e9d0452ce337e62657a26c37b6a340420f00000000001600142360025c3b7ee8a9e3e5b68323d21d9efcc942a940420f0000000000160014688161e78aeecdc76da57c20147620b7b444ed9340420f00000000001600147ddc6de2c630eba772ba473ea352d1df0405c6ea40420f0000000000160014cf8239db79c955fdf9d1d70ad36833f1bbec7ca902473044022058dbdfe9731f5b4c8f6a85e2e2d01c3f343a875206ae4b964c5c9c07102f05af022014df70a63d920c43809dfd4897461f3ea4a6013ae6f8ffafe43aa44456032721012103fdee88713ad971ee2cb73f58706b6f57fe4d0840a9dcbcc43cc96489b3095fdb02483045022100f882e6d3592606a629e9e92e64376a64b5ce85130e44b39ee31123d6dae4557d0220099f5b675750f11a1f0259d6435f9a964d6b7ab659242f8fcf27642707b963ce0121031148df73cecfb9b05375e478fc6ad0f97f3a04216275c550fbab97f83a0ac7c602483045022100f3e47a24ff4a0a86b7f667c3338002169148aeb3a95c74f926360b85faafc06e0220795cf68b0a24f620c5d35c61fb0ad3751e68442065a091d63d66cd9b08657085012102f61d8aac49b8bcd7c920c890e07f40c7e649bfea78c1e5697b88d851761faf820248304502210081eff63bafbb276fccc8a691f76b8e56b03bcc20652d74159a84d24e5aedbd5702207edcab86486f9d234f4e10539e27cf642c5e01dc0e2d6037f0c96edfabc3f9f50121038ba0ebcb767c5f0c620f7355ff3a52332cd76af25fd87b3f28db04c0f2cdfdfb02473044022066aafcd58ede5049a1d3ad991f27fcba8d80ffdb59c021d87cdafecc44907f69022059bb229f58ab263ec8f6e33c8eac946b229486b9467d743361a5f9365b92edca012102e54465c6b8d22a158da914b186dabc77a8fd7b9ecd3c36747b93b22e3b58bce40000000001000000000105d2fe5910ed97e9aff993387b5cacf51afeb353540f91774673de5121f2410c130500000000ffffffff170086bc90a5119475815ea72c9cc100f5e8c35435050a9b8522e47b0ffcb71f0300000000ffffffff59e924baeac24cced25f4ebcfb86b514646a889699c78b82c8ed07cf5f564f510400000000ffffffffec17a38907da5600d8d89f8eff6cd1e005697162162bf4afc9d1bf35180a6b750600000000ffffffff50b95164469b0ea83bd903e180d3252f950a044839de6c8702d6f02c2673a7d60300000000ffffffff0540420f000000000016001418409789372c867e6592c28a8c5230b69b39233040420f000000000016001432244447fd866001c587d75b2dcec7660b08aae340420f000000000016001437e9d2bdb830e51a02b1ea7ae10c495e9ae471c040420f0000000000160014412a8f7827d5ecc3cfb721632391ee1ad20710a940420f0000000000160014fd5b1bb123ca72faeb7aa2881a9c3d45d65b3a5b0248304502210098c37ab84c35fd0526e092b68005adb31013f8d4da1d26c83ebc9a1c2aea4a4202202317859d0a1aaedfbffaa158b2b8a771eb1bc386f22ca004ef48c0250f7be21f0121021ce0417843c482fb59ad8acd3d56f17b7b47f2c32f976619cf36788357d3a3b902483045022100a590fdbf93b9c56e1fab713309841f602be343e302a662de1004eac8b928c81d02200dd0b851e5ed31fcadfaaee462b12b2ffce4e2f28e4963909e4f1a2edecafd87012102b5a17a524356b4cada0b86845a531612a2bee1c986f1959b12b7f4a43b1de1b20247304402202bc461ad4b81c95ca13b6fd72f3f49241041f120b9d6d3afe15e1530e34ddd3b02202e60ca7590ba48597a3df2aef1fdb49edef2078abfd8f4da7e1081511531468f0121024ec4fddde6d6775aa18ef72d48d2cb0cfbc4f09f13fcfbe99ee8f14b2e37881c0247304402205020fdbf31c9d042a43c861782c4833dc1b6bcc9579d7c0354f6d45f869c563a0220788bdfe7763336a60886d106e9a7551aeff1df1201f10c275fb9785b91561e190121031dd0986142726e97b15bbbc1727f49afbf2802d1cac2b14f54aa283a125b695b024730440220287b2958597d0bdb520f4160e4da7eaf5da960f99c0994e97e8576a9cec9e1ec022019ed06e2a72c98b52be6ef47bff4e194dae3a3fb0d5a8ff15450b27a54c0625d012103eef661841d9bf436ed0cd704560d603b2417d1a28eacf5c9f3adc16145708414000000000100000000010506d74d44dccd2798343b17613e73d4b13f1263de261ec47dae93d01fdda4592c0200000000ffffffffec17a38907da5600d8d89f8eff6cd1e005697162162bf4afc9d1bf35180a6b750300000000ffffffff4ee1d7ebe10657631a1200b885d19f535dd45801cbd2fb70a6f8d5f6c38cf8890500000000ffffffff12266e548fb215c8dd897d0f270b2c6d699146ddb44ea760ae2105f8be6983b70600000000ffffffff02775dd9ad160bee1fa2130d30d528bd9205c37db1cab8bc2220756f734726f50400000000ffffffff0540420f00000000001600140152237541cdbc01abc0de3a82adb8dc1785819f40420f00000000001600141328a3e29519ee651707adc9926b5cbf571104f740420f0000000000160014a315b3021bc5bf23cf25ea77dc66dc1674bd28e140420f0000000000160014ac12d06ed6a18c2f3ff8c8158b63e2aaf45bc8ff40420f0000000000160014bbcc5deea9a7e200a2ed563dc5265a56269b637002483045022100a250e319a6e8f6ba1616e9ea58c66033bc5a40fd84806a5a1467a87f74b0cf9a02205c602ffeedcad47c2ce181ce8f0536bae00cad0260fd285045607f4dd81863d70121023233ce7e34b63a3985ac3e65ab3f8ec3df566535fbe0f941665e6ded7f8423a102483045022100aec036ed8099ef8136003533f895af34702af87b984f80231bd33fb0abd3e3510220723f6bad802e8b2626a4a508a2eeebaf6ed2f8d2f3bfdf4122d718200581436801210255b2f768f6fa97ba1db9ad8a0eb992148392404732989412a1184088a23d12eb02483045022100f86ddb24c5f667e5dae45485577db43ff21d68178bffffbe6ef4bea46e3d87d402206e7b251bfdb380cf0f37464540abe478c56e0a72c642d1ed6133139d26c57f4c0121032e0bcfa9d8d36b9bc0a7a34cf6152ec8dcb4a0064da0ad0fce62aeab0e850958024830450221008e76978a8804ecbdb3d36d87b2ba3f5efee72b44ab3a315d60f347e76a97070d0220765ed68fceb7bffd647f4e22ea9c240fe93210dd16c7bdfe97ff30f4fe3fc9810121023bf73b07ce50c28d0a20a4ed28c3acc74fd933606e1dc6ab649f3f480937b18602473044022004e20d0cc39be4e25c9f8e2cc320038eb9b9b24fa4c85debb13bdfd1258f637c02202d695942d2fa6e2fac5ce472ec6ab0d43296b0ebc0d2bc3e2e96c0f531829a74012102ad8a9062bc706ee37ea3eb867f4076549b99d6baec2a44a32c1c77229a03671c0000000001000000000101ec34b3aef3fa8ca7e5a60d57987cc296fa47b48fac8e0012f8c10662b5ea457e0100000000ffffffff02a87f000000000000160014725583e973c7fe4149ab4ac5a440f3bb5caa4395b03600000000000017a914d9fa1d36e6785f7e61dcc4fe94e47cf6925f4bc88702483045022100e69b000702723f44a01f2484e386ae70fe535746f2d10d3675028e58ba726cfb02200c28f63ee221c606b9450cde04bddf91905a8ccf2f677f3d8e35f389be0f304901210249770ce7a746ccddd4838f810394295508952da6958c46d21378d1c40fdb908400000000010000000001015eafda04a45c16f459829fbb441a4db81b57a3e975f0994d3ac6cd0425aa9b370100000000ffffffff02b510000000000000160014fd0c01d23e961b11bd645cedcc2d1829ddf2d4cfe23600000000000017a914d9fa1d36e6785f7e61dcc4fe94e47cf6925f4bc88702483045022100874a787f2f1d66e197a71b3e1a2ba80367becb99deeb0f33fc8d507d72c824250220366bc8d76ac0cf75ee3b902bc9123f6bd9b4f6307297eb95f9004e7bb490e91a012102382d1ab4570f4616add0407cdc30012b1cd5b083ec2b9628ef0ada9c3be0348400000000010000000001010e18ebaab040812eceffe8a56c5d03ad6feec9baf1a75adb3e590e55eeee10ed0000000000ffffffff02102700000000000017a914d9fa1d36e6785f7e61dcc4fe94e47cf6925f4bc8876508000000000000160014d469b4510ef11a72421c4712bf8cc73ed5ee4d5402473044022077525667e92c5d155422313ec4546a2cb16e57492410fb5e1779293e2ddcfbc402201a63cf1d894741a33154cee939737f5adf9c82202631e42de46e6d0f3e5c03f0012103e29fe41442c4f88a08e4cb6c0788207d551b1cb3f8b3707ae90c21cdf12d0dc6000000000100000000010123de7a28fdb63494674ffeab8f66aa847f727f03af147f5f071b7f652044cb670000000017160014a3107d2251f1cedabfff6a027e1a9a7ebe939fbdfdffffff021e7479000000000017a914d858cc193e77b7558dec5b04e0c9e0da780ad09a870000000000000000226a20a517806067bd023d479bd91838e112656ed274db0cd2f4c799fe0a6eb69289ed024730440220153c04ad4338f128d2d0427bc6e95629c8358c092fb27695a8aef1c3043f37bf02200f47b330758a3be5c4afbd1b2fcd7aef7dc76135c32c7a3027fd6d0e68d0eeb001210287da90db67cdecd4c59277fe5399f3362d61531ad4ab2500e7a6db7f74d39d78272e160001000000000101f68c9571aee1eba0821abdc976c0b992eb0b9d9800f6e9743520e7d88d6f48700000000017160014bc4ba930bfa944b6acdc93a15f3086fdd501cb55fdffffff02f46891000000000017a9149cdac32b184e32f56f9ca6c248455cac0a8d347c870000000000000000226a20d4723e942f45490b5db02076af578c29a9b35a5ea6c0e923fb7c9fd858018ae9024730440220357e783e7c06f502fba19c58441c2db3442b3e6d1fb51b86b44753630e28f5c20220769ac833815cf31566f69d14c9cc522e980602186aa46f1675dd283839add31a012102b4ec0ce937ff5fb7d9569c590a20210229f89499b6e051e6cd88c68d55ab6bdb272e1600010000000001012581e82e36682de73401031f5b1b8bfc62da81107da6cc5143a1f12daeedea270000000000ffffffff0237410f00000000001600147b283009e67a6c7ff7c95b9eef4992aeb06825fe40420f0000000000220020a8b906b50a0306580981c8530a02cdef8ec1595f0559532de971e629103ae65b02483045022100fbbd2dcd491a3bf06d36ba42db02fe80a2de25eca75cb6b51a72880ead721ee9022078e75bb3f715326ffd1dfb50837554b2b5f3a19a2ca077311502a55145a399b4012102d2c738fe222ddb8ef85a552847fcccae562c06120bcdefd5d0349d62bc7e16af0000000002000000fd1b010084a80bae8df308757df40919d809894283d8f46131311b5ea9481c72aae189010000006b48304502210090409e9e61e58c9f966b3db7d340f636a41b97a3edb198d810149b6ddd587bda02203e2ab75fb1be0a8c5156d0b19d8c725ec9d55db443606d17da417c83931baeb50121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff028a16f18c152fe0bae74ca06bc3b022f14beb505a265ee524bf3b20961cedec000000006b483045022100a3d7793fcc3e8d9b9da8212def5effe49e9a7029e9238bcf0d33791056907b3502202448f7fb12f993741df4fdae3742b25f5e601caf1036816ab8dd82cc99f841560121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff02c0b49b80694b276457c8cbf2c8af8e2befde44d64d7c98d1274d5f6024e278000000006a4730440220537cf1fa732e7a9cfdb20f9dbbc10820075d6fa096515f7dd69a4f6816f8225b0220790dc00e5be14a49891c601409f37e440fadcb70574e4b237994524cbfc3dc540121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff02c7b6881f6d70a8bce9a4c06cb15d25b345e244fc6960a73978881863cc331f000000006a47304402203807f8f4d98173dfad242141139b0725d5955bb136ebb4ef022782771e6b58fe02201879b63b29b1bcf3bc26dc544a873d78aee32197b122f3f921d7c7d560266b010121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff02d1ba7e985ddf146500c7b41cd02f21b07ea48589bf43db21fefda67225ebc6010000006a473044022011e4f478b30982e620e17ab2dadd49e94a22072008f28e69a9f45467d2a3acf902207b92bc4048b9f56957484a3fa1cfb670ac972e80a07a7f8ef2dd0add267f804f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff031a7e889676aa9fafa815c38975db59210b0dd14af6487675f5b065ed2e8801000000006a473044022022118a9540d62ba1a97978fb2d98e2c5801396d99afa28251d0fbc6b6b06baf9022027a1aa74cbae4b5c6e5285aa78175bb2d2b1d11199ea66914ffe93fda9c388f20121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff03fa0b3a85b0fee72029f030f4ba8a05a4913ac911d2eac3deeee25c1a83cc50000000006b483045022100c86ae8d5fe69f557e4e2704f852d45819a9210f7011ba6205601dc21ba4edcd00220479f79ca4a2c2af2a88ca8234ceebc024613a1598ceea2bb6beb30780ae7b5270121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff058714dfa96fddc38cbe99f90600220af2839f47f1b6aaacc38f444addd1adbf000000006a473044022007332560d80662ead42c258d2de62ea685559a51f777975a0da73664358e588802207b75ee031ef00d231d4576d40e1488cdd1a4039a8a5ffb40c7070efa43a23cf90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff05df336346ca5acf8c5ef0b7bd9df1c41dbc2a8f8eb8fdf022d09b0882d22710000000006a4730440220533aa56cf1156fec280cc5e5019ace36a7b3c1fcd770a609823a053c6668123f022021131d988e0f3afbd497c715807816b2c72022a23ab07bf41c184783d50305730121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff05e6d9c48e2768c3ca67c3685f07318512555f3dfd962be7db8098d9ae09403b000000006a47304402207f599d6856a7166bb23155321d38f098a8b2aa88105de3f14a504ed890201e7502204a70aa727321247ddb65f50ef35bc59cf793a69a299048ee836248c28e3db4d40121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff0678271bb3ae7f0feee09c23edd71bdd8fd7029a65c20e0f5c78b2a9c76cd0b2000000006a47304402206768056595616cded4ff8f2876ba5f21214c93a7e020d5f9958643949e946b3502207483500f2469bf9196232313f125df9036e247d1b2a0116837e9af2786b573850121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff06e6a532f9d1c943f30d4083837be462b4e763035fb8827d67f4db191004e39c000000006b483045022100d9dfe5de4d325a84c57e857b2e1ec447ea0ba7de783f1220c49a40350f3c74c80220363f7f9cd8691f13838dfcd6f09c2a9a04337e1de76b02c9eb9f85170a502e210121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff07a6f0b87f7d1a38c6ec36771c65ec5533fe075a4fcb7777b2ba60aaa9bbe3f9000000006b483045022100e884bf992c7ea890a0dc92a4426bef9e6197bd8021e22cfb7cd3e50919046598022022b7487afe90ac936cb72fc5c7bdae497519f1888b6b202cf51ed6288dfc72cb0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff087303adc5e657d8ef9df68959d2cf209c4370052c1a0e28a05b2818d892c8ca000000006b483045022100ae5851c3a3001df89cdb432f9df71e3efaf22c8f391c960692e1bfa31c528e0d02205a201051ff6023333f80be2f59e9aa05641242c9a1e0593fd76fd0652e8db7680121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff0a071e9bcbd86155e42fa8f754e34580f589f955da3af5891ab34f24d7713f10000000006b483045022100c59866c958ab8df90e482fe4b1ac97703fdd04591409c92352b22c9d5d39c4d80220412a805cf754d470ae8460399a2f450c10ec750ad63caaf077eb9fa9017a74ec0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff0a3f82dfbbfc9d889cb7273d99d4e229a90adb34bbe258d50058b32494ae7648000000006a473044022049853a918c602cfb13fe48fd0d7dbbf0359b8e06198611c5129dd0af05e530af02203c10d0743138f826b9c46720e66a480618e962047ee02c12fbdae92c44f098190121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff0a7a89437c96efedb935edb6608b9074bbf124031b53ba03bf67ecbd9b1acc43010000006a473044022001e7225c634b8651d1924c9e1aeaa90c2e33b55bf02616074a5b7eff84178991022050ea2f0a5a9d3bbf888cb937448f61a8743a1f1158770529e6d5e1a48c0ca31f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff0af77ff75661935213bd0892d16db7264d20be47a9199a2569d150ac5225baab010000006a473044022003245acafc7c492afda1022f15d5e6314f2459c5620b529151c4f1cc8bbefdfd02200ef972a3aee6d4d114171dacecffb311aa0a2671ba93dd8d1813bab5ebca66230121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff0b7a6d5e6314dff9f4c3ca182496a95c231cbd15e280d6b65f6f03dcf7325a87000000006a47304402204e5ba58b0f40166afe79aa4f805024a1ea91f91daf5890146fe62e92951c142802206683f0df0ef46a1816ee36d07d80a5e9b1212b8923d875286e3cd5f2636b7bcc0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff0c7ca90d414a6fc0f5a075240bd31c5f13712512564182adb7ccef21f05b48c7000000006a47304402200d5d59b37cc12c7e5e6083c8fe309675e625f54e3a609ab110c9113571da8a700220192a01da86c1e60e9aca9ac07ca5926a68d5cea68c13133804352b8cce57508e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff0d93720602be16c9e024509b2684de33c425f8a0acb30098b41d88b751fbaa9f000000006a4730440220285f84e9b91497b90a5ca8a22ce29150e3a9994b780f385965518140325dd3af022017065e03a5bde3d1aa0a7b01ac8cd8c0f85846f12f6c2470a731f61446eb58190121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff0e335606cfb595681f0a89ec1efcd658642231d03363626e34b66af262289fb8000000006b483045022100faf1eb2704274aeee6d4f063a17f3fa0a61dbeefadec5b7a3851b57bd66a622e022037ee7ef8ff9f0c6333704e22b72efc3d4cab5fec115d4dad32c5dc8762118b620121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff0ea1cfb649f86c91a163478d06f5e9277e15223d37bf20c185e9d3be097cf5aa000000006a4730440220448d807b32c899ec9cc0a9aca664e303468923ae051c32f3e891fd1413b1fd1402200fcdfe0ddb4362182ce326b01cc70d0ba365ef306a262bbacf440038e8d2829f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff1144e611da95a5c963a0267d82dcb6d65c6f3f8b0fd05037ef28b5722142a7e9000000006a4730440220432a77782aefdda3ca3cce3593125e8ec2b187ee6effa451706073ba48384698022017d3980f60e619ffd1f015b769aeb157a8968e360fd19c8ac67d8d0a78d436640121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff11b9ba24b8983303d192fd6b1314d6c1dc60350af08c06320df436dcddb9032e000000006a4730440220617a31673d0f4a02f3d8a67b0c67ee2924bc332ef09c9869b658e84c82150b7302204eb4b6a507038178c006a71c5149a5f3eb28ae3741bd70a1ca47e1b5eb90ae9c0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff11dcd081700477fca8f5c92eaa6c69ec5ce6109b2e049b5fd94b1c7b641c81bd000000006a47304402205f5be173c9498d799c49dd339a70f74a540ec4c739639765b36ca12134db4eda022051872a55f7c5f4cfd8cbda546eb15f8253bbe19001c34d40eff56014be9cac1a0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff121c23d29c3d6c6391d3f63d96e57448b24ca036f1984b98440c416444b55e09000000006a473044022030017a06105de48a28c7f4b1edc6a530bd9904f7dcc29584b0d81abf75b6d2020220657501c1a36cbf0575ef40410bd648a27e804c5b71627e8c0ba66a4cc78bdd060121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff132987deaebcfabb2f23359d2b3db3337a7883c41b5d18c29d6a5200f42f8cbc010000006a47304402204688c3aa0a57688645ddcb80e99a4bef579a45f917289faa71dc281767065d0402206368e805a17f2548d044d3d30935a609cccb372594f743a0123668d0f929bcd00121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff13da76c0ed49ef8cd88ff2ca52fdc3e9f6a12c4fbc0161d4b480e4f146046fcd000000006a4730440220543a4ac965e31dbd3477b412e9dd96be5f152cad178d485584c27be00c77056f02206b10d39d2dbf4ae06cfcd583bb8caef205ebc434e63970ab4e512d3ddc34c9de0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff140224a4e586982c7215590f371e0892764c1054fc7455e92187abdbcb7691c1000000006b483045022100c518ec2569e99cc29cde8fe46776f67c8b979c102be2193eb70909f8a74a9d9e02207401b9b6604e14c8e303d18ad9d368ea9c30119d1e560a84ffac9646ff17976e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff14061b212628b8136b2cfc135b3f28e3bccdb9fba453a996f75b9f2574e2d21a010000006b483045022100bbfc647d0918bdd59a4f9ce4b0cd65e314f9a3d790bd505ee93d8da1e2ce420902204bf63f05731259b656f94466e1b755deae2e2f9ac958613dca270921a3628bd50121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff1534e8361588a7b188b0a5e5c42362f4fed1ee9b397bd4e9a36139e5549a1bc0000000006b483045022100a2cead800c5c0261f6ba534574ee35283b177cb9e223e20d09df96d361ea844302205ec52d9d67092d76a3246b6a82b69ae411434aaef01eb502b0a84bb9d1bf3ca80121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff165af779aaa4817216d31e781f8dcc9e75a795f1b0c5a4a6c3d3689563082214000000006b483045022100b03e32f57f622c2d3001bfdc94d5bf0490a54289adbab7e8b2a137058d1b7b3902203c4bdf449680c5268139bab2605e0679592c70febe0dd73a411d184e7e1dbbca0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff1711c634bc904bc76e71182b4a6559e5a8f42173265be9420897bc98fd50ec14000000006b483045022100c36b41325553e23043ced286c0fd0bdcdc62c98b8d925b24360b9ea272d8911d02206590f84acd379ee108f2b5e0b923a35a46952b1f66e7ffa22b1fd991d0749db80121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff17ffba4037ea0638e16f22afd6dc965c6a7dab00319900bb813bae1d516cb29b000000006a47304402207d191ee6680ad4329b62f83b42fd19bcf9f2e6508f966be09894be97784664e102207f08e7a744a05c700b57fc15fb139ade4c77164b1928f3882d8964d8f0feb65b0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff19dbe0a70544118ae44a8d53eace13eee56e1b4f3cd30abeb5c443436eb5a0c5000000006b483045022100d724563e08e387c680b94df416f7b7ae020b1c18e335d0c40dc7c3fafa36b15402203c55e6e8fdba129e6e1f0b365f79b93b2973b9c8b41335916f83c1f275a568820121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff19fa2c07fc4edaa2e6fcff068fe42e6369057523143e1cb169f10de3d5f00c1a000000006b48304502210082cddf905dc4f4cc443855513fd9118b2f0aed5b036175e9d74936c6bdd5981602204c3721c25be2b811acbb971086231d1d19585b2e323b62d891fe9adf454c19b20121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff1bb61e6a1403980af02c3d0ff81e3a83fba198c0aca95d66cc1c60836a126815000000006b483045022100d3e7eff5910cdf83f0f478e77a0165bd8ec68f8d59ca3dda60ab2e6fb1a6b0f3022066bae662721dbbba18ffc87513c62ff168a88fd9e9c92589ef78203b81f4ca770121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff1bd2b929c4952d87f8fa2b04f0694f5dee580e95fc4b078f6a0409463be3d172000000006a473044022026c585409ce7d31bac7982997d4a29185cc7db18994587a1f33cf367747f9d7102207425d8ee07603f4eb9fcad8fdb7c6b332a9bbfd6029faf09487046cbff4d771d0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff1c277114382154457f825dc7497d886819d4f76b7e8d636f51135059ce2e8b06000000006a47304402200ea2c820e206caa095602fa15f3287d2e33dd72fa39c24946455dc729090454202207ad1867b96287d0d7828b16e650c30ba1a46f9b9df0e305c28273c384826f4220121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff1dfc43b6e6f96d5441136c5011a59856e64e1201288e8b8074de359b2a249aee000000006b483045022100ca4a205362e049ec568d09c80136b765be33c3b473e606e62d587f4bc6131f1402204e4969be217232030943a5eea395cf07addf9e53a940a242947f500336ba86370121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff1e7e7d9e0f56ae1b8885c4793afa41e149540d92b9d3e9311d913859fb86c9a5000000006b483045022100e525a14a68165ba7ad63e1bb317f79482e2c18c16757121ffa204c391ea9e9cd02201bb3572a82ec5335eaf3c0143985094aa60be16ce57cf2417b07bb02a2747dfa0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff20453b178e05bc0157f57838fcd510fc89e0a34449a229a73ef3855b2243889c000000006b483045022100d565ae3050d8ffb0537a13fe31a80af56f3570c5c914a0e5840bef25457a368b02206afabff90b6dfeac3d087dc9436ae98d50a4efd18e7a094319f432ef37452bb80121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff21627df51690a9c14660e2ad543cb8ba8dc99df82036bcef0b9c374902b5293b000000006b483045022100f0ea18558ab213cf614a649a482c36ea9d86913439aac7cce28714ca025ca0800220177ecaf3c56563597998941fa2937f718b0101e277fe60be544202ec23cb1f7f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff22aee164242ba8936caa785e82c07476b53e12e68ddfe5f1dd9be39ce6d2f2d4000000006b483045022100e1bb637b3f65c47a68c237d8837d178594d639edbd8f435520a45e2718fbd469022079779487ad9baed2962533d21095fc9f49242ad2705d8f9162db444494e876690121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff22d538859f2961012b397ae47d0f94cbd14cee3e266ed2b25a7e93e1b3d4c2e3000000006b483045022100875db173464ccf17325f51d3a8e9b031166b9c5bdbcb8d9868e896796ea7bc4a022071aff61cc96dc7ab820840347abaee8147fd6f2ab9410ad862a29e315c0a36000121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff23c644b9e7f5b08c21e669517613fd6fb525737d9e67a5a3cf716583b3f8390e000000006b483045022100ada89666417ffb0ce0d9e037c2cf17bf061cab040e6bac5c792007480702bd92022075d431369a086cdb4ac6a99898d52aaeeb17c5f80bb4b97df1911c3fdd415f420121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff2496c166e7adff13ceea3097813720669fc547d24b77a6e736c14a0e7bd06112000000006b483045022100f10ac392bfe05474be10c36bd09403f289bc0079b7ca73a774d2a4fde63e7dc40220402c0505186d9d90f609e89b570f1a1fa70edbb09cfdabf355dee5e88efee7c10121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff24fed706d186203f9dd560342716f1eb93361c34a22175d5c2ab1e6432f6759a000000006a473044022038b99bd30308dbed7616593e989603d473edbb1007f8734696247bdf1346e8a802205f1b174eb63868ceceb02034731299d52182c5eb6f6e73ab4d822c25ea75ab800121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff26e7fc225ad3bde04a68b5e7aee304f81e671c2969034bb86e7a2d8b84e692bf000000006b4830450221009fd1f1d2f74898eb87e7844bb2da643590b19d5f246ea2a2d705d208740e60f60220636e5aff5c0198855d7db9fcd00e125fb848c3b644091eed64092e83ca6e2b7e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff29698a45dff5895fa405a25952dc51f48eb90c1202652ecc85382d62770390e4000000006b483045022100968c03cdf4e215d0a0d62b8c0da9d31264c5573119e7843a2c0bb8d9b08b4de20220561d320bdff848688e0da53c28a635c403a38a77e5ff5b5661bb9fa3af200c270121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff2ae7dc104d6e8dde0757f3d91d4079995347609f7ed7ff1539ca19448b683a82000000006b483045022100d40afba7c972b2188b50e83bc9b954d6321d1cab74461ce50e2a53f1e317f88d022048b5c2c4518ba281effeea5efacef0b9e2f8ddde92f2864ef794bad11673794e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff2cecd10312c3d68b7f5a3e6d01ec39a67cacd328649a1c749002893f1e9e86e9010000006a473044022022de1e8a3232dcccefee9f00c6a5eb80b640159ab5c2a22ff291a892dd59fdf202200ce18396f9f8570546a962a8aa4e90dcb077d2801604ef64d6febb7d2a29c0af0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff2d4babbcc970b619f55209b17a8c1fb80dd486b6a41647aeeb7a1e99f737b0ec000000006a473044022003f7bd6da592c02de155a45afae3fa766c72f71390fe91401d443bd297635eea0220520fa1462e5349bb7711d3e569b05afe687a1ce07ea4b7186b2f5df6c616a2ab0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff2df87457cb2c8cdf4e61423d8f3e87a6dadda6a596497c2abc1aa78f1361e347000000006b48304502210086f67985fcfa308b03dce8f45b0edae8d5c19dfd801f0c1781bde96a9f8b700202207266c75d625016b6744313ddf232fd3e56841f31fa97105212d2d3af23fe3b620121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff2e1ea9147fdc2aeee4e05b1419d9e2c0f430205169c96960064f2aff9e78259c000000006b483045022100b6100bc8d9fc7404cd75276192a2024586588a346c9636620c1c524ea8465a3d022040e7a62e9e1408b203a17da560f8c51004c25f953de578764a7cd06f8bfcafd50121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff30712fd58c36a3b3399ce0902820cc921534071b3ae889716f5f8a107ff23eea000000006b48304502210092406df143eb117fe7bebfcf36f29547551e323b7214f3bb91a236e1c81da6b902201bfb23cd93474c75849436d84c63770d6fa3b2d54b589cb4e21a6baeca7ebc9e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff31a4c4ecd80325785186df9cbbe8d86b2856c1d1916042c36bf74b84ac08030e000000006a473044022065cbdb760628acb789db43fc451baa0cc5a5997553c0ec1add80d0f79e4e17e402206cfd0ce83fe9447264952cea06c18b4417a264b33e7e6cd0d9a45480ecd7a9ee0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff321fac7134f011439bcca1d04c62da395a53708c5b45428a64995c3604dd8d0a000000006b483045022100bde99dbe7173feb3c7db6e60a1f6943f6161685aeccef936200d35824d9bf80c02204e2cd7a96732903659910a7920bfdf5f6301c57c1efe11b4567058a670dac5cb0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3495e3f3261e01aaa8b1e2517c21f195f3f96a7953879dd9646e90ef485cc5dc000000006b4830450221008d3d5743c48ebb3f4ed9b45940c47740617eba2177090206ba8912b88a3eb3b002207f62368301552e1cce73d7a3a8671471c00e4d770a4424393c11b58fbf81683f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff34f0f075c1912e90d3e1d5918c595d3b8426929904400c78d9b4a640fc6c3b05000000006a473044022010c31856a7b867c5dcb18af2441ba21364fd0338d80463a389774372c18fabc902207a968c05a8fd1751aeb9bd71de1d008c7f9e14d66c6651df67d8b53f2753985c0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff35847298ac78f82a508b0a47431093f582591e5410e07bd689d236de02440f1b000000006a4730440220406e6fe51356f2144f898a2673e4a86a1ce9f1b98503b609bc5f0012c2eb61f602205f4590235b0082cb9e316c054e70c178f8ad8d0204621cb36dae583e4ea3d5b70121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff36802b86fb5024986d8433ddae016908bfa1ea468f47346ece051959d3c558d2000000006b483045022100f2cfabc9571743d356d9d866ed8267a3ab40df705106d112506d2c75790dde2302205dab87c6aec30f7d9760e36847cb80c16390975ae1615318e313564b945f56250121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff36e1be99e226feb8cb89204b960ccf64744e15a6fc272c74e5f5b9d13cd60d59010000006a47304402202f806d987e31b09aa51b3b3339c50a7ca7033291bc839502bd089a08b3c56f0102205025e519723f4a578786fe000ef48e4a7d516ecb22a1b4a758121134f28737c00121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff37db5a9de63d5a1927e371eed20f8c25f12a83fde2c64e0d95b2041fc2223088000000006a47304402206c538e8255e186991e7b979cc56bb775aaa723dea3735abcacae16d55b92b6ef02201db4047198ccee178c5dc67ae9f1745c38d28bafae0817217565b4c9294243080121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff387e2bf2d27f25476a9710ba2bb7c0a05c28afe294fd07db8242e04b569760e1000000006a47304402206f9fc0347dae54d89886ae78fadd25d054eac0e27db37d8b6ddcb9c662d543c302204d2b4b072a7c57ac67a848cafee3550b98d9e648b325e0280d2155d44cdeb9d40121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3ab1adb8f86dc087bb6a3c5c55aea4bd55da8cf656caebc0392386816832ab1f000000006a47304402204b509370bace257a81c63a9347afa4ef5762e7b2c6abed1eaeb9a2022a92200002204ca2a4ab5842e705772846531335ccbb93919b60eb121dbfa8fbf4a5bc59c7500121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3b5b8f1f2bf400992a678ee80f345a7e7edbe13e2a5ce56f9d950e2d16befc6a000000006b483045022100f368f71c52a07c8042598389da93fc0527d9f83b2b79ae18e86da030835af8c20220169cd0144828f1f6ccd7339c5e59cf15a19c3b568dd0fa08d18e9dc6527e00b80121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3b86b31ec02ae7923d70db309a11127cc690108c9f653a58e3f63d78c187d640000000006a47304402204a7389252af318697434aca9b1b7ccf86a610ccf3e4a3d0f5feec9e8f0110eb8022008167da28fd5ea03eae3f461bb4e8f3e522c0b800ea4be9a3eb9acf720ab2cb50121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3b9a55453f244b173b78c483b2591ee52d502ded44f9c565c093d33c99cf4353000000006a473044022020733b41147465c53b7df8f4a10138b6d405b992224c62e05eb38fdf7365efaa022065d371eb9d9953493442bb37795bd7560646d0fe8d48959b2d625fad8c3a7a140121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3bce43c6dea6627c29527aaef7641d9e5854147008bf165ac0002a68058a3927000000006a473044022064e9f5f04be98982db5f96126638367b4a9258a0e912d52a48fe4aafccf098b102207b2eef00a3138e4761bcb46796d4ccf580cf4d73978df64956fee64a74e227980121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3caf7ffdf0d49e015c40030e1255c374bb73cbd4d0ec80f92a751a0a85002e8e000000006a47304402200a9a3ad7da2411201a8b981cbcc10fe43e2889b734250a6f7ff4069dfe072fa102204efa4023ebe399681238a88c64ab2ca67c9ea941b5c02e716cb07548e0b129760121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3cbcc4402729356e568e67755ffc4ca1ff90d136b31d51adb9a2d67e4be4b2c0000000006b4830450221008abdf550ff008eb76111f23352dd808fe494d056f7399561cfcbeef9aed969fa02205b68e04ba5cc87558f8c59fa0fc9775d53f1cfb94a6026b3f4fcd66f2d0505eb0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3cf5c39b737bd4f736d9417a0b33204b8e5e7d037ee5ad52b8c1690f4b04d31c010000006a473044022041d2605098460450d1a540ec9a1650c43f3fd519dea08176b566f5822cbc5c48022032cfec201f43076263df6c61e1a5814e267bf30f515f88c445838d12e5422ec20121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3d290218a363d74e6a0ebc12f8750a1b6b7233c7f1845cba8336a67295449067000000006a47304402205b9dc1198514815d9eb15c570530bad872a3d4d3ca52060e6c7a64b723e9749202204045911bb8c647f6e2bd1ac21507133ccbfd66c1986cb5971dbfa8c942b90a220121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3d5847da44efcf64b2b390a3ef02dba3adf9890268d1caa0bec39ec01a1c9750000000006a473044022054188ab156bd4a77e3d31d58a44d6aec9e894b9c1ebee33043241958c2671d9302204705630fd2672af7f4f5cb5630f6fd08d0023edd8b70eb74bacb66cf80361a4e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3d7f584095ecf1e804997bad0537e275c0be8956981c16eb5014554c5db55ed2000000006a4730440220190dad90c7f9ef3dae7ddb3505146a2191fafbc11d8e5ec7b92da5e7fde2a26802203eaf7bba4c44eeed89c81f5104a74552859047844560aba0c862d9907b2c8b980121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3df696233681c5d7b13024e4853c188d6fe20dd372b9a3473d2f736c325624aa000000006a47304402206a3280365041ef72ad6a0e14ea45e9ae7b60e02b9897fb23a7e98766f0f2082e02206e9871004a181f480e546bf63b3633f6d4681d3029941a6d14324383c47e8a1d0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3f61be6a7848dd634b5a4ebf1af802727f2c98fe187ac0f8f8c08e27dfe9d4d0000000006b483045022100d9fe42ab02f15ccc016e9cbe0b307a085d956a18850e9e19b0baa0f7bb84ca72022027c2b58f5adf479e9c164a30fc1b7fbff75f4b9fb78b3d25bc7fbb666f3380ad0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3f81e0d2f666190e29ec8f76ac25f54fef6c2898d15345a4b060173d8e6fe808000000006b483045022100cc395175ec8564c669cc6f4bd9a68ae66b134232ba870e3e0f05a4f13a5f769e022049536ad4502c7468951aa58cabad92e063ab9bbd7b6f0f30805f8721d4527dcd0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff3ff392bda2570a7e0965e7ab6d2a30ec72894f9e12e3d8e7bf72b8db7eab2134000000006b483045022100c849dc7bc84fe3d632f47ff282683974b3f6a3b701defa4b57b2abf3043dc0500220122b171ee711e3172ab8b90a16b948887624c674e010b89705eb40b7a10d60210121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff41d5da6f6df1260048d00d0a57e1fedb016a710a2f2bddfa30db4da9e4de0395000000006a4730440220275fbd0c721e296cd43c1742c51bd3471a19833c20e2f6459e02910c273d8c88022045e4947dd8e834a4fcde18b7f93932a6e7079e99e7e8298f281ec12c2470c1460121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff46342a9415d4ac18d2a6622a028d0690afd6a4403016ad17e1b3501de68b31ec000000006a47304402202ea6f48204e4c268062eb2a55eba3c0c0500378a9f6fb533a1b77e5fd10d2e9e02200f22ed542498da5a0b90aa75c0c318e5d4e9d64a78aaf516a6a1103b580af6dd0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff464f7670c5b48b6a19386db577cab682e92beb157cd65b964746b4b3d263d552000000006b483045022100d7ffb5ecca3971f83288ddcb13bb1b1a2a85096de4cf18cd1a7ec199e4fb151a02207dbf346fe4395f88f98a851fd425ec9a5c5dafae9d854726193c1ba22778bc4f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff489070d169220da6b10583f34f923bc423e8e8b67269284f41e2e1b989dfb726000000006a47304402202518270d2143a4542d529fc41e514273d724750a749b345d0192218af63eae1502206e744eb0be02dc54e1388abee6fecdcf7171f5bcaf40190c332980b62dd2159e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff491abfa895dbaf240e703fcfd5a61838c2279381d68edd4b4cc84ca301deb800000000006a47304402205c6772a33722b5282fd9f510c8337cbfc619718546343f3487e9500ba140d03b02204ff229df9106e660522ecea15bcc91ef7d1a06d5222befa069b179a58d5b2a5a0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff4a03845de787f4b18efd0700f9c1eec02e9925a3de4b47e1b3147d3bc93dd6f8000000006a47304402205c0a2b7feacdeb4b35f9951cc1aa449c8339b254c2ccaee090a2ed52f76224530220344444b6c8d49e866929b05bfaee16415b46e730d7a4befb887c2c307317249d0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff4a304e554f61b5ac7296ee5c101d5e85a2fba9e3c2e2db90ffb8f427c4263281000000006a47304402202e97c56ac00b9b80ef1d4dff7c0afe0f2a1aca3d93e24fa84ca2f7201e7154df02203960f99500a4c4398685e8496f63f32efbe00d3b627f5cee4b3f00a87f0e3ba90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff4a6d366bf75e83602e5894f05dc240f26b08fe8c4815bed60bacf24ca66a635e000000006b483045022100cd2f11218e111fce33cce33af1a77ae24bfe5a7bd7aaec26028ea174e14ad3a30220422c52d3c9248ac54fe3ffefd0bcfea4c22991fa2f556ce2beed669f1dde1c7e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff4b677492927075dd74b791bcfa3ba3c29afe096c182268bcd0e5c3dcb8e2093a010000006a473044022005e7a6b24dc791aeb7b39285f0da5a64fdf02b34947b7c905fe9e92c5454578a02200a83d8aef248e75bc19da1611fc617f485fa6bc091b33570a3ff88dbc09e7db80121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff4c767e6514696602f65ff639548e0e45a01b4b5ea0a5b34a5d7a0f8944594747000000006a4730440220643b8f96022af15ac3f02868f00f198fa443e80c41f707c0ab200ef57edd44bc02206d1356317de110d67921858cd253bb1388e70ee23493d4a1f338f0fae6050c290121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff4d14755baa405c66d7ab60dec12d0ab00902d25bd0c0f861efe452644ae2cd82000000006a4730440220129733c14fcdfc5b8ad79f5b0ef5c19d89b68189e08e4ea0211d4951fa2bf0bf02206bfab3c268e3782fb1fc02c30b3454da499f5592336cafa0a758923359bce57b0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff4e0399d0edc01ce0947624606ab03aa404658a83e0856338782bfdcd42a3d8fb000000006b483045022100ae7b2649c747bc9ad0e63a0989e44101b31da666d06a3d153ff6c577b548828c02201b126c2746e4266a14803e97d57e82f74e31cd232a30011cc0f4147b427500a70121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff4ebd82bcc5922a02fe8d1af639bdc47ef328f44a0d90837726ff933fa01bd91e000000006b483045022100faa88f39d43a5fdbd7d9115888624bcfb16bdb28b947ed9efaac85184cc2638302207cf863846249fbaf1b4f99ed6e22760be44fa8789805273bbbacefc67aaf52e50121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff4f1d6f448e3470311b1db52687e4a143fb5053fb8136f33dfd4697fa855fcbbc000000006a47304402204bb5e3e33ca254a88e9bdee6abdd7e5060e0bae1b01353caeceffdcc37c251aa022067d4eebc90632af8fe96c05cbbd63656d5baace8cc0de42fbb904dca4eb10a970121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff4fb633db6d569eb6541ea9988e7d7caef9eaaeb8c4d44ebe29d069908cbbe0ee000000006a473044022050853135a4d7bc3367f1c2541a2a0daa650b1e5dbbc0844232aac207be988a9102206e9acde4872712e1a055d56611c33aeb763dda618ef3aa5416382412eda212ba0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff50c781bf7db9d9104f55d0e9f2797184e637f4fd374d66f7f5362223a5d6cc72000000006b483045022100b41c10160d2a1a3f25968a027396606484207a0f37ae54c086fcb89e72ac45410220494a912f55f88cd44e9e1b25fb8064b22467c27b4519609aa8b8c04f996ff1390121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff5255c2da9f8cbf83e51b098274b3fe12ea28f6faee738a3f84554100ab6a1220000000006b483045022100bb2b823328531b6115ee60db0839b80c0a6bf16da985032ab3f2e184a61b36f702206374b8f9d9c64a8bbf3c77f107c3cc5ebcf74bfc53be3a42d95ddc33f91670ed0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff54a45113bdfce9cb41c82bb9c5768de9fa9a07e9654000bb19f81e85ba36d634000000006a473044022059f8dbbfe0981badd334e3cb1eb7ddce6160c6cb32b1ebb50d9a905d521a679b02201b6739de34a866f65a8557c78679c45266c0c712fd8e5e587361c2535c65ac910121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff54ac5e0600d738edaf762d1c0b1ca7e7038cdb3e1c1b3aa5f09da5db9c6a8831000000006b4830450221009a1465a45dd82b0c9500f99f5d48fee07e0aa678b6e774021811daf535849a5a02200de2512010ebe6e219c073d34d30289661defbea7c166a539dafabfaf69ce47b0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff552b331a02cbf56812a3146ed83f3cbe0530ce79283b3cb6ba27c6cc03b5baf6000000006a47304402200e2b8a3a184723626ddbc2ac1d8070eb88969db1953268059246f5555377c0aa02204cb8fe45403ac98aeaa6ad384f2c2f91c19d5a5e3ca623fa44ad5733a257e23e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff556c759f8f89347b7d81852e856fc3d3d39e37b18c0efa5c056acfd7ce8c7fed000000006b483045022100b87069bc069d6e6412037fb239b42c0c538a84f6c25a8a191a30c0f2c4891d0602205d6b24a8da8a42c88f4669cf86c5c92260fce35e82242c7e2ce249c5613d42390121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff55e57d77840977165a934b5cbd21edd27bebf524cd99898ea83d8398c388c0e4000000006b48304502210080baed436cfcba7cba167e3172a7f8047298d9bb00aa13061c6b2056bffdc423022015d7315f37843a4b026a6911d838c937a81189e05ffc64fb23511330994ceb060121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff564b90b39e8f114b3ff55a225f6ff8d03f26a8520d6d32a4e35331a472e0cd3e000000006a47304402200f5305143fb9d8aa7203f08eccb78086a95131da9163b6f832284c799779bf2002201bb1b4787bca4cbe8a27f74e5f0abeedb8108e29367ad8ea5a50101bf1ffccea0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff5b79ce3097be6f305a3449f76fe4f8288e90d60238e305aebf0c763db527a219000000006a4730440220465b8359087917e1e36a81c69d9f539bda9d6e191cac43baebd2e3ff791208d502207777621d147022bee1bdcea0cdaa12ab87efe7c7cef61d38a3a44502b94f53dc0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff5e967548c1e73bbe0ab2f4eed4a21b6de2a561eb58efbbb0ed6f6e58b9221207000000006a4730440220698228e2e5594ddedcfa4d81a4f2fce7182cc8b064a1411b0c67cc9819161ec302206c30b6de9b68fc67f3a3faef2bd99976fb22b4df045e8ac80b8504d831b7b1000121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff60e7fd457367701d86110f6676503c1a162a429817437f1a319d4f9defab9d4b000000006b4830450221008382e166ee8a53231f54d39df8adcbbc346be5a3912afd14a1e0927a64fe36d10220758f2282d1684cdf18d3fcef298569091183d9391be130ab8e6e4d712ba67ce70121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff61af2435668c59e576023da02717d5fea7126773921517b6026534a8b1f7d101000000006b483045022100a058b60d0e591fbe917236606699f9f781e2be234bb64dfb46b301ac9a80d58802207544dea7ef970b4bd9cc779a944263d24369b7cde6c55fd8d7d1d965e01714cc0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff6225b14555cd588e58b9f712ffb775f96517cebd42cdd2c96f7c7841f5a0c63b010000006b48304502210082c8e59eb55ac9e6bfe044f2ed99ec06baaf7405ced4f2370c344cb027f8f540022072acb30571545d3834b76bede21593de0b2b69337ed9d3677a8448ce70912ea10121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff6318b6b2c2172c90fbcb8345fc8c924a78da1a23fcdc98481ed77fc42b98defa010000006b483045022100dae6cb5b4baeaa012e9da47fffb91be8636bb20f0373012b6ff2cf97e3e99b5c02203f5cbfc3e3f6df01c9b044439b078589a582b148073d674a77a85263f9bd2af90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff640353dd651b1466c5747ac2ad11fdf7fe76ce6fdcda96df4146787f621ad6f0000000006b483045022100bb786a7fab06250e5542b3c3b3862daf34b665f39e6d501ec00a36e5ecf3f9590220260160de386f2f12c7266f7f4274e3e11e6f53deb0b85705ec965ae623e4d6ea0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff64281aac73fb9cd399c0376847ccee418864fd1e75d3eea3889e09a51f6705b5000000006b483045022100ce4b03d8992f5171beb496c0547b0c29f5be6db5b9058812b41104c3113dc254022028918cb222df385692d16f90d685237e127febab17ab6b0b14919efef8920fd10121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff64b2d4a0af86ae2f8a7a7827559de9b11d5e44d1a6e98b69fb1c5dd59c8ed0dd000000006b483045022100e33fb71d10b9d736cb613f322e9b362ce3a83c291eefe07546e7ccaae75d459a02201b3cf44ed4069ac6d34bde7e7d21a28d8c0cdd81bce9a7b1803c2cf851e5e3180121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff64c87a3cb6922b581eef454527b4c7bc8d2eb194caf91221e8472eb2c851e578000000006a47304402206fbe0263e0c6713bb5b2e4c89f96eb1bc9b989caa3d75f73ffa25011673a9b4d02201b9b170fe28f7f9e87bcaaeb9d44de0187168d5f1004b96026ec5c4d7b8456080121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff64f9b148882f43abd5961b880b782927c72db2ee1477de0fa67edab163e19eb1000000006b483045022100fb781b6d8170bb3695f3e8653eb1a83c64669888e339c915ea4edcd2b230cf5402205a5b6055930956b454875b2286777437b09d15123f30b6efbf32d614338c1faa0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff666c83631b9cd89d3b2afdcfa0f7945eec9713e26e874d9464dbda04db0f6f47000000006a47304402201128e9708bd01b91991e9fb0fbeab699a06e696889a54711d4b66b4bb73554ef02207f5dbf77652cb4c1724642d3052ce5d97a65f69e22af7a74e1e0e4fbad65e6ee0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff67a3d0f12343177d793fa47d8d3578632647f5ab785754f9fb808e6c0964204d000000006b483045022100bd51f91ba0c09c9df22f39608b500a02471e9efb8918d21b34bf45e9025373db02207d5c012abab7d24b766748632ed16f8b472e2ee7ad2c2ae71332fc2fd65ae0e70121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff67c628f20d85589df43c9183a1113ad899fe1cb16c7c7862e661a4de94646d90000000006a473044022038df25b36a85ef67db53766050d706efd0898ced3b041ea428f55ec0f6115aa0022039075855fb20629717ac05facb5b31f7c1c0198b71b44a161aa817c0f71a89e20121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff69013068458f33210d89b959f0b84c1205f60ae223587795e899c77d3566f151000000006a473044022071ad69a2a847de9d9109d969a361ea031bfb202fbdb082f19f5c3528626d57f602202f44cc6d08509e05140a08521a54a3c86d53d1c4490f2063d30388979799d40e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff6a2a3b75e260357851204aa333c187e50d28eec62575e294f559e8e925b35c3e000000006b483045022100f48b808408fb35a01cfe97c00b273c864bd72cbe902d5932a0f7aab82fe8295a02204e8be3a05bbbc7fbfe7cfc13ef656ab3b41e31926c4d40241c1d8089527520e10121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff6b58d586065489d747f3ec87d37ba56a8d769ca2d1929b35d267f59461a5964f000000006a4730440220581fc2c176d232f0b5825e8c92888465ba008405e1d202bee2b3e409eccb56070220308d8cbed282effd2496742a148f59a017e32b76d113fd6211904a5f5edffce60121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff6ca5cc6c890b5bdc1a9cc9d8e0e597cb1911b962c3aa78a762234d0949e9fb60000000006b483045022100f9abe72e09384712088f2689fb05a3791d983debcc5d0e040eb65bc23117b60202201ddfa4ba5518188a27e2d4b18dcd0c1b7f1174ff5d135a80243f54a1436754ce0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff6d05f3f04b3b550be8d76d8c460c433ce4c8f25abd7b055dd6182edbccc5d430000000006a473044022043f3b72d1b041a9879482d5cc59aa175d9a932059b9cec3d2784d5a9e06d0c2f022015e199fa1962488ed68df0617c17ea5c9ad11ebdea32c4f7125cb2a32644f6c60121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff7246f629f35099b69fe796449a82e1e184760b36fd28e4440a79e76280752350000000006a47304402202fecd492cdb23794b0169e71746694b61a000d51ca9e9d277e7dff6cc60eec0202206db01df1708440c49790587d8da90b175a3effdf07e203a794b7b03dc70a59390121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff73ce1fe602e452d78a22e9b56b064a8c1d0f0700d9c64e0bce540a420063fc96000000006a47304402207f2651e0570c94f2744158a2f80a2a728f8b787619802a1d5f5b6eb69adf1165022024fa788180e11f5141cb9dfb385dac0daa294c9ed1ab8482120c1742c1df8c6e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff75d4e39ebc26f1d70010a56e401ec8e5d901e697bd50af8be2cb2aa91ff43410000000006a47304402202da343f99739886b254458b6aca79deb9360f3f3cb4b9cabc57df7e1434accef022006966f4763f6f2994fd20f324f1d277bac2b90a302aca1d6dc4553c1497fbab90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff76d86ca0c7cfb62339bb8e8146fee2ed697b4f27f8df11def0673350ded80fd7000000006b483045022100b6d3f03d4403d1e9a6fbb70e941a0965855730c938a7e58932d50ded368e338a022057c1d0d778632ac221521279052fd47090b000978561d7a31304600e13ffe2690121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff76e3759ba3c8217aa00c9245b2985bd661872e754edecebc55ff61b50c0c22b4000000006b483045022100d26f291f14c9b4086e6e15df2389c4dab2f211499ab3f790d5b31c89c248947d02202cb32df891f87017635ad32c7597962278f61b108f9026e4b4b19650a440ae5f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff7807abedfc28be758a8442a64c0b0035d6b72474c0078106fce089a991e73453000000006a4730440220043a294e1ed03ca72fc88acf8a810709a3a62baba8be8dbd961e9a19a98dff0d02205548d8cdd664018aadf7f22f58cc946bc4aebd8c53756b8f595194fbfd74410e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff783afd18b72d4094f2f1b72e30449571daea5482341745af5be9d170277ad309000000006a47304402206fbac02aa8cf99d5216efacb777ce13d2bd0b56a77f57d2cc606fbab5778f47202200f2de0e997c04b4c7ef0feb00ea7ba40accd59a09118e70b844341252359a3ad0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff7b443e453f084e7eecbc21245608890aa77cfbf48bcc53c10c8ebc67eaed138d000000006b483045022100f3f61b7fc130fd659184067edbdc5c62e2bce70417af59b6c721170a8f8338e002205d5426322db7441fb00bc2506657e3e6a54f0a1f16c3a5aedfb1aef702957ba90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff7b4d8797d983b1fd19c3d7b87f22ed664b6af1d5d8230146b4aa0d2b24184d83000000006a473044022045bfb22168c425df94185f7c8f97a1f53cc40162f688a42508dadf61fbae5d1602205bacee7448b74c7fe8f096572b6749910bdd4340fe386c0eb1bcb318a9cf2da60121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff7d342fbfa0a6209f9da59bcfec6725791de1829dc80ff9d5d77cf9ed4519154d010000006a473044022078b1e523bc3d4f7bedc51ea3e54144087d923b9cbc1ed46746592cd8a0d764c6022027914896efa68580b8e52919178fa239664c4b9436a3cb6451b4298f2d15ccdb0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff7d9d27e0d4c95299fef82ffbd0fd19a61dc94b48984e7b300cb78efdc2d6b538010000006a47304402200a5f1028051a65388420061b83fdcfc87f9216f6fafbcffab812def05c17eb7e0220036da2434fcdd0249f11a885f1da5ee812f209aa7cd687262c482887df9758240121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff7daa075297f67fba9b4a80c3a45d961d7bca099c977c06b82cd1d6369a394374000000006a47304402203b7693db93ad2d987f94ba7a7f1b5a1c188a19a6e1d37dfb7d79b1fb0fd45360022003d84f40d71a80e72e799a094ed4b8e1f834ea7b1f513c6f3956e5c29fe4ef720121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff7e94487fb72e7bb972ae5cb61afc949631e06d704fdb23ab6522f061a27af49b000000006b483045022100ea988b3ffbdb09abde8a4710529e4562268258c77a0b2da2ae713b489087923302203044c14cda43891b99ecfa11a9c374740fa87a9b4ac61ea07bcea7e216a88a720121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff7ee766ee8e6ced4f8951056803b8746263e4e59b4d8d0ccf16b8fcf00b8ef1a6000000006b483045022100ae2746e00bf5d29987abd60c56aa6ef061122cbddc3b7bb57ac06e388b34fcee02206b2f35facd9353c7c8f24df1978c3214f5d2f39c8dd2b51f3bb83118618e83b50121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff7f21a6fc1f33e7e2eff393350b868fb94fae21308c23833a8fb2ee7b61d78629000000006a4730440220626229f2a5f98ba4133716a6d31475e2bdd769ab7f7e8e399a45b4a2cf060ef10220600ea6394b72dccba13fe948eed57af1599425df5ab3ac9089286f44f9e4a35e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff81c0a7b3b4d522118b895572d735dc1c3e9f8f3c67ded177ee164adf91d4cf85000000006b483045022100f773c998772da0d0449ce395fa5055fe4808fe11afcf28d7fdd90eb5f163e1d70220660bc99e11f143ded61954eb13027f7ae70aa739eb76b60e4a1320325829f1dd0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff870d474810f7ad3bf704d0a1ad87998a2788b56abdb031983d70a8953c2553df000000006b483045022100d6096ac1e54ab364415e1ca43c989570dc2469ae3251e4773392ae36349241a302203b13f7c9d36bc05154c3ae4118db5fcdb50b1d30e96a127385e715b64d9c6bd10121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8741b266f6672e440347d9dd06bc69dddb9170c3e4566e6bd76874fbfaef3e8e000000006a473044022023ff4b7be3441aa30c825dc8d0adf2bc4d69f6ee0997b99495cfb3f79567f07b0220193ee53be40de24039009e31d1a28b37d0c0a321c111ac5dd18b9a217a42d92d0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff878fb51a1530c087ab76b6bf87d142710393a3ad40bf94e2ffe698b1b0d221d5000000006a47304402206ff1eb701310226087d7c043572527678d18a74b3e62f32ad49645dcdbfb1d1e0220615fc5cdd2a2672bf471ac0bb216d815329420cd4950ea00e63a308f12dfdf6f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff880c8c94dcec88fbbca3fad28361b642f42818279652f38746e5be1559c69627000000006b483045022100d340f924beeef1efe1b5e13587d52c79721da72eecb6e3211f570d763cff44f702200efd7ef3eb44dc6db5d14045606f381a4c226b2ee3f366e0684aac26955779870121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff884b318994a94ebabedf599d9308d38fc619fd039f8c05f9ed8ceed47b873da7000000006a4730440220267240bfc3ac528f04608540ba919791039ae3ff4ebdacfe7457f8116d0abd3402203c40c9d5cb185de974905f28cfdb92a2ffb281e7e9eb678c568c66c8328d27990121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8856550305834c72267eead8a00d792bb89c84cf50ef2a2cd7c5065c2afd05f1000000006b483045022100831ff34e5b3ee9e6d0e1b5315e748381fad1fa7c73a46ce6beffbf6e46b98d8902203fe97803c3627ded0ff7948969d983397d344616aa1c6bcaf614f0f4e1696ce60121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8888a5836dbeb12af6e2dbf85b2c346751afae11a86ce966dadd0450862a1c42000000006a4730440220037e2dae47e1d2161546a96c69164b0b840fc433e32f1db86d12d1a86329153a022067a91a4f99ec1bcb649b64b9b38926f092ea6a7c498607019822b1955f8951e40121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8981544bf927fbcf89b30bb161074c3552f131b1671c86ff71d7f0c35bbcd16a000000006b483045022100feb0efe8129f3ef26990b4de5241a1dc829577fb0a3948bff1d0eec19f61b28202207bab7820e63c8511d08210e18e32d933db3540bc338defad8c3d471c6c01bdc20121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8ad2c279c8b75ae9c5b4c52145891ca63260b38d84bfa03f9eee8b44bd5b984f000000006a47304402205a733cbb555544e7dd8e38cb500f2451970f3cd9c03a0acb5e3d7641dcdc93280220321aea8a8df3d8b9f207378ded7bafe300612535c6a81a569ef1000de24fa6ae0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8bc22a60e709e196545e5fb3f33c2019a689dbfbcd58fb5af1039f42572c7b31000000006a47304402207dc0af02a15597eac63443637e8288ef2014149f271b2efb7ebc50b49251f8fd02202b583f57bb83551032bcd7c63d8cb2a43d389d8f912a998096a3d661a7a125960121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8c16e73d249eca0ba0719db799da102db9cccec82082dbb59d5bd9728318f1f1000000006a4730440220665a6671795482ad3bf9fbc50867f4528cfde28af066a7128f25d6b47299f5e80220532e7f48260c99c8eec6db4ccc06baf1be12375238e65f62025f996f798e875f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8c1c6f393453251249cc2bbfeb7d77b5b7d4d143221c4e5870dfd761edd5137f000000006b4830450221009c58cd27b2f16e9a0cff11369147f52d801d6261edf6d4cbb121a0ff9903d3d802200cb3c0b2d0d75bc8e995a5dd4a519755ef043b5abb9a76f9485e07b679a815510121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8c57426347c0f39030877146e80d49ce84c911017f3f44d7b0b7e5dcf350d751000000006b483045022100a53e2fb7a3b9df620434e6bc550f7d512c3be6fcfcc66aab58837e7af262a61002205759a8bffec998730b806ada49b60cf60d91e04e4337637e4e329b8f91219e950121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8c91327228a160fa37326535cdbb35d8d41f5817e426dedb599305b0e6c36af8000000006b483045022100b30e8407227897c1f6da61e308215442658bd20d2d2a3e57f6ec74437fc150fe022028225a09c718ed86e6320360ca14a86fce90531c863e4ce2fe27639efe78dcca0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8d82b4db7cd6a27624cadf6099769bb9fbb7a12c8e77d9b564f0628ca00fd7ea000000006b48304502210093d87d5407ed1d7d923e4fdd352d477cdf802f038fd2bb7042ac24d0bfb1dde2022059952f5a755a3d4491b5d5c9405eb211bc5804727f6137c0c6b3577c8c193e0f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff8f92265b8a2281a0eca530c678763a555d2f9798b3fe60b49d01b5dcbefd61b4000000006b483045022100d37e5962b8d274eb29aafd4cc3511990707f01dca5e425ed817c8d5411096c0c02203928fb735cb4d654200bfb408a2e2b6b4ac47737229c3204cf466abe9c3837500121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff92fe1250807bb3565a974ee45064854cb50c8bf8d136dfecfc134dfb4af53816010000006b483045022100ddb2b093284838dc4b5db91401ac72e4802e1504eecf981f511075828a809e730220394fecd573a5724d0cc63e14d1cd9c02fc8797ab2390ea9d6c10823967bb2c860121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff930481d072c7637e0031b3281365bcddff3417b7e8decd69e60a4998a28128f8000000006b483045022100d3562839c77a35cb9e210b9c4b9bf20db559c03269b29cd5fb20fb8211e97d33022046a7b33205624b4cab8ecad786a74e9ba80ab7b7222b1c0b61f84b49575ceea00121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff938dd167bd43232bac8b71e4cb31950330665d86639497aa879bcb10b7e81d74000000006b483045022100ed5c15d3f3cfb09064063ab88188b28f9a7f2a0fcba2ae737749cd7bec83722b02202064a51422807cf4fe93b870fb06aed7752c72835c7856cd6bafeffaad4a731c0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff93bc631439f6efe44f8a13771395fbc103ca940ea903765a6ba23569de04506b010000006a47304402201fbbe6990e3e9ea3b281c8ac346d226f8010bf0a190686c8a8357364ac461fb10220088dad99f3c6f8333a8642c2a4f4437689e832a8af7ccb309d76d6f30fcd94f80121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff93ddcb60d077910299ac32a12d32cfa719d3ef9bda9b324be6230ee944ef3465000000006b483045022100841a811609895d89468a171e515adf402723090e5a85753296f37c2f4f97ff5a02206581f16350f91a8d57c0340defe9cd324bd9936bac23a65b1cb8bdda608636e60121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff94015fb8a9792971f60c765ddea49a324b55a1e7620ff0fab35db0177b510bf4000000006a473044022032353b41eff05f2accc21415adc303e6a64d7cac41ae117a2b5f0037d028501c02206c152301f758787d4cc151d1bcd7c803888532f70d34ccf334e27470a39896e60121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff94a248fa927ed91b533ce296a93ba86953691652d47a394b3555b14a0e689776000000006a47304402203b63e11dbbb00a98c932a68d9c5089747b9f6996cbdec2e5b0e62f643dfce66f022056cd9296904b126bf132a84a7bb9e6411969e5cf4a5549633770bcad36d4dc560121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff951f88cc251abb718b7730619f7caf1b9ae76f56a88628963c42f848446a3f63000000006a473044022069a6d69b88a3d1e124bd7e5789712487f884e2b2eb29071ace42e8bc43eaf7b70220695b735363c04eac48f1cf4025acf44f2abba0ea823694c5eeab00feb8f869610121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff953261971121afb8e7fca6736f2dc8bebb20a10b75b67392457f213799d7e38c000000006a4730440220309f99a51c47c472c16f61739a2bf0d63e55ace758fce13601db030b9b6a26c90220554e1483930a474ea285543589866d49d0b5a7fd96c75bd1de174da14915b7550121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff960f712676591c0adeac2ccf43c100e1a3ba69378768b5321396294cdfdd52cb000000006b483045022100f96a813c6e50b65e93b497b3858c1096d539dba30c6f527227efcd8039caa41502201eea43d73fbfca64248e745769cded642915c3c749316efffe563819406db7120121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff98d7d638ae27390d49a3b168ae071208e58e90f56f65ef3e9904fae9522ac24e000000006a47304402205417b042c5f6c485235809e70e6de9c20fc48fd64d887c3aaa8905481e7a53ec022070398c54ced8ce1753ec52648d877cac1da7ba84ea82a557f0d109902d6104cb0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff99e279c2e45e8bcfaf23ca320810bb1dfff2aaa37a3e13e3da3d4c6eeeb22322000000006a473044022079aa99ede566aa7420cf6c584f42a0bf366e2df46c954ae616ca4d48684a0f700220729484ab6e035da727463309d3021eecaacbcf411f20abdb636f30e26cb1a68a0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff9b3a0bcd9acbde4924fc54bdfbda31a744f00e1109062c70d41af89a4d7a5852000000006b483045022100de6bdfa72d6086f9ef9352f73c6144797aa70c673236071a710ba15dd7afb00802205d8201ba1618c67ff75a79a7281345466ebb6fb55c1178f10cd61a262e3a4fcf0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff9c5b101006ddbb2b23601a3c38c1573716daba5b48437ba408cd30ce1baf50d5000000006a473044022050ee6c8b5e8931361f090b1bc582a3fe0d027c4a742f55596a4b7a1f36d58780022031be1d4a22e841a114c55f294e6b25591bd0cc51689d9666a37d283d5b3708ab0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff9cbb4f16cab66bf6184bec5bfd64737fa2a8d1aa81f5cc4d8170c0dfd50bdfae000000006b483045022100d9054e8955d89b255b4b9691dc3ebf06884953d7ed140edf3623aca547f8bc2502200d6225827de12d54374937a2caa0d65712bc126fb0ad1ab17696d2035de49e740121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff9d74732e709107dd101f1ce39cb66d4075166bb733f0150a48f3a5408509458a010000006a47304402203fb5d342f0a6a5a43dc92b818f3f6730c25edc794c8d4ab5f313550e7d5cff7c02207cce1bf73bf48ee99d524e65043e96668f984be9f7e733404392a72ba527ab8a0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff9d92a6d54de45ec676d0667d71b1ac5ef596b16f56736de4f20c0b5d8fc31037010000006b483045022100867340a45da15c8c5b7e04ec88abaff8633c5e6ddcfd4aecd209de14ee1ccf9f022079893d6215893d9fdb63ec6297f560bfbd9d2595244e29e541e1b941ec090d650121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff9e2c1a3b90d7a40ac2a67394d6724001ef863e3ddb698acf79821fc82e8ca7ff010000006b483045022100e998effdbb51f7f144bfe7ecf87bf214211527e04d3d0f4d69dc060b02fd45fa02203c34e1076b77007e6b198ddf6181ad11028a8c077beb01637df2d4a802186b8b0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff9f5326b65079fd90ba03d4c274982c791d35d3288f3a60f1d6499e4b8fc5ff54010000006b483045022100d0efeab8353361b23b9a444e0423fb8d233f1fd3ef3098d5ec37ee30ce16de5c022047fd7d1935b112ff265f03d24dffaeef6d355997e5ba13b5bfc29c57734489480121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff9fe7dc77fe8f39735bebabe0ba079003956c59e3f5499dd5eb88483bc75ccc48000000006b483045022100dd209754c229823f4ffe7c61fb9831f397ec243865d254d821c145b9d6cad3b90220624e3062e471fbaf0ebd65ef492e0b5d09f048c491f609dc39d68c19158445cb0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa041a8ab6b95762510c788bf39da9ca6641404f56883d0b3b4c2699b14e511c6000000006a47304402204ec163f05866e53c346eec4c8da3b4e9cff91b864498d71c9492e3ad952460ca022042aac30fd46012baa62325f46c347c9cf5b512eae8ff66fb7eb9430ade7ccdfd0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa22f3562ee44f62c95f6694467a15e06037a6506e7298773ccba3cb31f653392000000006a473044022005281648daaebcf84dcaa7fa7bdf6e81f40ecacd8da590515ff1bdc4683e974a022017b49acb8b1e85c2cb691dbb12fe5ad6110ac76a64d5aa42e2d2a017e24ce5cd0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa3c78a0a721cb68de5ecb549a9f40d86045970bf12e077d9b06af1f5fce365cc000000006a47304402203a887eb15cf545c0aedb8089898aa8510591235d9dc87b19a3b70d8afbf96c7a02200f75943f8195de6e66a4bbf293f49c766dfe8e313bc04d6304fc2633f27f761f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa47d43fe6923c76f855957e142681bb26eedf1910ca2461791f4ab5c2c1e59a9000000006a4730440220235593a50511479dd44d721db3b85487f4a716ada57f5d8a6c68cc43f3b71af102203806ecf4582904c330c84c000a0d9903de595557d31f59f7eea4f395a3b6185c0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa781d1a9ba1f05928041b7176866cbab71ca2e19abf43d22348c3b20261cf5d3010000006a47304402204aa2e51e85b5e63ca132cac6c1a3eb9154a1ce4496d9e975b5a50352351c2cee022044c5b693f737410b694a608b0a3c7e46abfd25126c056c7995e17c022ded51cb0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa7acacd1ca538a36045bd0bbfdb050c9d73aa070717f897dddb102831411157b000000006b483045022100bbf6ef0363b250eacae23a0408ae7efa03f900bfeecd1f1dd4d17308e2247f89022024412a1655ef2656c70a0c803d27d106396c09cdeb67c6875ec28b20812a43310121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa8d24b1c948c48a06bdf525d091ad0474df246c8ba728de33a8f523664fdbe18000000006a473044022050877b21695de88b83298bd7e8e3d6cb729ea43800955027670f8f5120c7aece0220581abde2a3aeb2c45e5eeb58b328d4f80185e5612fd194da0e7293dc3a0e63ee0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa907ee329d49db29a45711066a0fa1e0a9f74db46a2f18f4a3faf1f69d0d808a010000006a473044022008d121f1171ff2b68399e9509a37ce7a98a1ccf843b38c1b02e51cd7fb1387e702205509f004a6c11bac4745f24c672825a1c574504b07865b4b024740e730f7ef850121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa91863c48ee31bed275af6b32b98723f28909a5862596830aba9e2ea69933686000000006b4830450221008a1a042dc8aeee6f42c7ac396bc90bf6ad2dd3fa62d1a5fbb57fb450384c267a02204182f41932ae3d17a3938a6dabb3d94b61b6948c01c53675fb99d7535049960b0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa994d6b5eaaf2a627917f4f895b136b3da8c4dc23fe1d1498750455c4e36ac82000000006a47304402200458c25e2e65d08c8c8fec6f7b8d785206faca8e4988e81dbb7b706fc921421902203dc624f7484b951149a24921256b0f801add4b76af8bbfe4f6917a042974c6380121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa9d42497eeeb81bd04bf03840479155e86b390457a31dfffcf4599b1c8a73a35000000006a473044022023bb94feb30df847b04500568b14d46dac9e3cbc4b45800588ba83e98ed43c5702205e5d1e3e9c982628508a20232bc151a5b6b000a2a52e704214ef271a56413e4b0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffa9e6189feca69cf5fb597760a305ec86a76d8d8b10bad0c66c18391f88787ade000000006a47304402202ba0f7757ffa6f4d99d8e38650bf5987c06b6647157a217a6ac9e18699501c1102204558eb5b3761ce64c2aa9d0e9185962457b1f4a4714de2ff22b45f063bc5f3ac0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffaa2582ec0dff9e8ac119836446f2d662228b683eb263c9938b641352379996bc000000006b483045022100faa07edd491147f70e80055a59961c64233a9413af2babd3ab84ef3e9464bbc902207412d2878403ff844bc961c1027b39c6d865849dd92875856e2b3bd2679365e00121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffaa519c67c9eaf7838cbf46ab9eacfd6acddc4d7552597b393a09f3b8e8b12145000000006b483045022100ae0359d654aea81bc500a806e62c5a56a2a96b92bf0109e2c39b01d713f4a06d02200bbe2e707c1b56cbabbae128829feb0d7eb9da6dbd23ae57b085a25ca3942d910121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffaaac35ffb106e7cea120441728ea3422aec289e3853c0d06e06e7505c207db7a000000006a47304402203a8d3e5844c1345a7dc49c9719898bac9ad73ebccbb666ba73f6a6fd655bf380022044a3d80745671a6f6ee7f8603b3950aa5fd881669cb36bec4dd19fe04a2c70b00121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffac30ba083c13f3ac8f619b830f55c5771d66acc2bb3288f3da9f8384ab253fa3000000006a47304402203d8ad96e4279e1333fdaea795b153389f80f14725cd401ade32294fe3e2994220220229c1e366e8050a24797d89c32fd1555602d2bf08a602b93e314cae434c9c1950121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffac9a2f95c204216b00422f1a7809910b41a6041fe43eb7644556ffe43d84753c000000006a473044022007c19ad7fe9cc7bb9104efade29efef1fe44936f87460ab5a28b5b56d21e9c6002207fa43dd27ac9cc2f90c3def2fbeee12515584e1d46696d2dce8803eabe2c12640121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffad86683a608cbb55849f6bd1d72ca533b4b0a2421983ad8d59113c388b74c3f1000000006a473044022062ab1854bf94cb32586e3ef3797ec1b7ee3ea1410082ea5671723d73476bdf44022027922c0c34be7aa670e82a296e4fc114ca5b92b14f9d59f4632572870ad5cbd80121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffae23f677ee66b4b62f017e93df298a54ce1035c600649470631054d29be22b01000000006b483045022100e60cbfa15599f66acd7f3d914ed2b6709aa2876b9c7cded6b0ff4e38bc82c4fb022047a6549abab689d61f2eaefc8e04b1226b64d49a67936c27c969934359ae5e060121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffaf04f9c096054d7b5f0dd85dd525a81865efeb2e4675a9a67c84ef22f18d790b000000006a4730440220104150ccd8e5a689d843e555176be5c1692a120696f8d0c6f149fd4fde6592dd022009fb9c07cefad44cd31fd88ddeca54b49a4ac1f00c451d2857345cb281fb297a0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffafebe05182ec72742a7430222ead89d3578cc136b5c611f772b1c78dbd8dac76000000006a4730440220390d30ac506250b940f6a27963da4be56a518c30b72f6296bed8cc67103eda590220643641b1a0deb825d58be995091098ab3dd0657733c6e220c261b936d8d6dd2d0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb0c548c262ff721f2987449a245599e2bacbc13d76eb367e4f82b50190bed666000000006b4830450221008f4949ec2c9e7d16d24366a4923c8bed231f898a6da9b531cabb514fc946991002204be138a7f1da448e39042ddaaf03294bce13d418f64d424a4af2da9b54c0c7850121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb0e3c6f1068912e5d01f88060fdfe0a70dcc414eb07a6b834edc3af420e2ccfd000000006a4730440220127369abc46130b929403341d3fbf9c05e173a8d561f1f0fef5444ed63ac46a702200bd23c874960dad2920f484ad9c3346740fb1922cfccb4e583eb2300143039080121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb0f20186163ad2345f5762fc4c69bbb0e3b5aa13e27836d15384e7ed747477f4000000006a473044022024a312a0faf913d05413ac6e07e97985cfbc836ca3c1b8a43cee18948f3d7ef40220681e2d17755c08a31112de8aadfe0b1c2ba204bb1810649f3fd0d556c31e83570121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb25a0ed8ce02582927af3a54d3fba2b52a3e16d7f5d0c7788e0076cc73040a1b010000006a4730440220452e760ff56a8526273169b81e59c8c21bd5f53ec364bbfe732757d07fcb81df0220411f7477391956b2c88671557ba022c1bd16009c7a3a906fa4a28dfed1b857fd0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb2bc941a152e0469de7234a3fdbb2c61114f7d0964455e510675bba747ea33cd000000006a4730440220500682a03cdd37c81f982fd1862d9962f7fec32c5e8c26d1c9ac54fa2c433e40022012844cc3d3a4179a7c9034ff9cbb85a19f07ae1a4b1dadb5540db0aeeb3d687e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb3dbba61710f03fcf6bb808038d4ec4b0ba3389f9e032b9e32d2af60e7b08fbd000000006a47304402205c31da4d4154a2d02c01d23331a3e7e201ee524084b6568ad5c02cea87099a260220713f217a097b005671ca5722bf1b3bb7ff09af1f180588cb218548d5259b96f90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb55e800fc21258d468f3083c23fb9bea53e8df1f4bafa70611b8e3962f962c4a000000006a47304402203a81e035fdc369fca3b4754e6f8e0d8e31bf6db24ce9f73a14cca19d96cb2ba3022068e4e2d14bb3d20183501b4e8b94de3d8e034b0cd16ffe3c80b3a6cce5940db20121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb5b38d9e6c9e7f9be54066aa59711ee0617343bdaf5dbd1678b7c6182fd941ae000000006b483045022100f888a84ab42ac789753f1e99f1bcd8209770e5b4d86143fee7d3bea937f254e802204a43ea0629d74de358fdb0f01d64d1f26607b772b207d428acbdfa33ee2c2d090121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb6db9493a34df6469dfea3b42ca2f1a25e14fafb997d86f8db2f4af3bd6164fd000000006b483045022100aff4711a2be643f27c9846e608048bd700e8045505bca115db016fac9ae8185002207d513711d8ae82a27edca6b82909a3a290b8becec2eed00241d1220f4ff28f510121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb6eb859dd5057ee23bfc3f1fc60ff5d04da1c1dc3c54b1cc3230afc03cf16faf000000006a47304402200c8e5ed23a8ea018d03e96c82883098c9d3cb59e9f30b1680081e8863b55be9a0220543b5f70667d181561d3e5b67b139bfd30f480b8ea2e87e133d191436abf32f90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb70d0b9165758843ffcaafe2138cb9d4a49172bdc568a1e7783c506374532179000000006a4730440220453516b001177edba5fd195e1e4378c9f81819cd918dc661c4bb16215a5a344302203231cd02e5ce2f303b16181915af4656bd7a4953a9f99ad64696d46f8d1d9acb0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb77b5c1ab9fe6cefd40562203eb7fb4a05650fe2099364874504c7afd4339f44000000006b4830450221009e8fe143a248aa99204dbd46f554a740d5ef8773f95a6d3822b10f2d97a8d7670220599bf23ed1750697771a0f4a71363082dd58545cc8634a59b97f14f4baef14990121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffb7bb0e4b1fdfc237117b1e967663956bc01284943e842b64b9dca9d8ba015eb6000000006a47304402204734b0c6ae20b54ee43b8702ecffcb6d8346fd2c266ff61c5534d9766f8d452e022070b078441e5d33aaf85d31e4d28a2f6c62d5dc7e27cbf08590580961370b9c170121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffba9e30e05c00c6922779163da0f0a983294770191449201c87d6ff62a86564f8000000006b483045022100d27bc37a60c711c654c40c48cd6ebeccc8c3ee46e756ee18f967e5cc2cd7335b02202fc1075382576b3366a4adffa6edb63b2b11a48a99f30b2c503271b9a7a016540121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffbb192a43a374efbf4c8a8131c74140867f6174dd576c70146849851eee61177c000000006b483045022100c9ce9b33f4cd4a074380ff9244386ef3613c7e6d96f1e5798ae46807e898622a022064e3ef8efda203930a5038f6528e292fc109468132f5ff98474abc0ea3953ceb0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffbd033eb17852a254e6a3d2b5768f1c2a5bf76dda57249afb34debb8b2d11405b000000006b483045022100f89f7ce37fe0c3b07438a34d0bbc08d02c101a4eda08bc88c0bbea1c40a97be902206f7b048c451aa91c4e04c18ad1efc0cb384c8841979bd43d2fdcf749c9f0bc730121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffbd108201926eee57dde17429cee0d0c39e3ed87d3b17fb135c6fa02ebe4951e6010000006a4730440220108cf7cd5b22ea7301f0cdc92b0f114bbcf0888c575cd20ed47ce1cfaea61b4202206f9f45c76481bebcda40627f18d4b8a33afc9c9807da61972a798f7d94098b730121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffbd5ca8f88d02f0949d5ebd5cb3f55aa29e6fcfe579e22d17aacaf5b326fc190b010000006b4830450221008d62b2e3e95586c7c04f01162eb27ccf84afa3c6584c88de17be2fa449e8d54e0220378eede595dd2dcfa0ea321ad226a6f9f9ba7083ad6dc644dc9447cd187d0da10121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffbda50b579fce635fbd5c221202d4b9053d0b5c4c1892f8acb8dd48fca605cad8000000006a47304402200eab482f47b34d9dec4eafa181bd47fe7ed3a4af4ee6d072ef9caa2a9bd01bbd02200dba2573a77541a671fad34efee98b95dca4bb0d1077475b53e677e75b76a3b20121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffbe635eb9523af40227bf3cdaf0d7f873ea49ad4af84abe8569892eec5e8c98fd000000006a47304402201b931bad9c6bbfae42fe047a7c6f229d91f5e8405814bc0839d17c4143925237022034ce2af3daad37a569e60f7654220b7ab177744ff3b4adbbceecf30ef28d2eb70121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffbf2089806a6cf30943a6126e24dc898d8d1c54927409ffe4366093b87f5e285d000000006a473044022008105ed0c20763d64939c815b8338834a0ac54b57b3d07e397e8a15dbd4883fe0220755c99ebcf6228bcd6c138148e9b1cf81572f46ae675e9d233fcdf53499890860121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffbf99addb3dbb82499590a1ffbf81ddf7f35c0775c1a6b154296cc2aafbacc715010000006b483045022100ff2d4d37db8e0f8017b3f6ce68ec2338c35cadba5f5cab6479ec0801b74efa92022054a95e235a851e84600647002a09e3b8708dccdca8f871f4c533216fc8fbcf350121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffbfee7a63d529933ef9f3d2e46ad9737edd219e995684c225d3325b962ab112dc010000006a4730440220706a08ca4cb305c6fd9d70472263d5f721da33d4f8a60f972add6883f2957b4d022004e1bdbbe5764f55c7448b1bf95aaa5d0ccc66438643d8f88b456a30eed3f8dc0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffc0bb402fd1a215aaea6332d655178e5075e5c9bf6ea10f750d5a8b7018918481000000006a473044022045e8b54352085606b169f69cf7303be2694601fd1e500920919ea253596409700220648549a6feca824b17d4585767bfc568233f227fc82baf3f5847b51cfd63d1c30121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffc11d3a8072f6b4e4d5df29a4dfff8b087aabc1e5ca5f9dfd14556e6bd2ccbf91010000006a47304402207f5fabacb50c5be6bd60a3adffd61e230c08abb1ac075a27ea58cf2c96bfd12302204d20ba436f6531492750ce536cc132ea20f2d04ab9eece00eb9bda4544c10e140121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffc259de25effc3f923a85e3dd26385bb6cca994914e0821e2b77da6ae38527456000000006a47304402207bf11a929a26808fd0748c7ba1c596786d905d2747959e625cedc0fc1bbd0deb0220431155c9421d1a2f603ad88eecff6ec27f106fd80444a6710a5ca2db92282b9f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffc3e862358b92d43bc6bd63a434ae25c5ab98f0a59a6495b7aa4491edbbbaa8cf000000006a47304402201b499c3fbeab7cbd86ccd5523dcc2cdf53e367d01d8b88a1f9a967f8ba188a6902205833ab47cea14ba0c5d5fe2373480bd949003c7b000b635fe4c6f7a4fc93c7c90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffc45f6339d6c97baa2edd16a62cd7e491a5db03e923c6202c94376157df16de51000000006a47304402202736bebb5d6a7db8f211e1c233ad743186bc3c3151f5b14b2ed43c10c03bc3f702202c124288c6ec7bae8a4eaa183966ff34bc4132039486649f87edc6871d0a7dd30121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffc6689b667b0e08ed20e74f0fed6dfd0f8f49aec6f928e63f0e1836b63741c8a2000000006a473044022015bd26bdcd224664acf1498985c1eac6d5ba0631949c225319a4a0ac9ff9862102205130be8314961cc9c20719ef164f11e95d0942a54083469b060831e5af7b15020121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffc77b747e967f3bfacb975dbd476935a16f603ab7a6a912c2c42bc7be311d24da000000006b483045022100a5047855f768b20f4ac4e925dea8b206579c769b6c198de9038e01457b3c3843022022b4b6531c017f6ff3993abb174bd49377c2249c552ed33239297fac9c7cf8300121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffc79ce5df8ebe7c27161cb6e8fc1fc41e88826e729f11910769a8b23a9b5ba9d1000000006a473044022067196c4b172d2fb8201bf13c3ba1b411ddd4df676f7c3d2a62afa1d51bfc86420220183e2d9c7d7f80d34859f23404b842b4d619fadea0f6e0ae9889320c88111c780121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffc7de8f45fa7b1352318cfd7f33e8a0a5f2db650512ba1fa2af5fb04721fa4c8b000000006a473044022017dd4400b66ccd099e398d73dada95948d07affb906baf8d6bb9cebac6bf403702205581479b9e56a2aefbf8ca0dc51432b355dfefa58fbdffd9a0e652baf90cc6520121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffc82243ef0be0a420765e68cbbe6016392964183a3c8dd86b1ff376f710e86fa7000000006b483045022100f36548d481f6e291325c4891b2a99798141124db0f0eeffd51ada175bbe1141e02205336966c409dc66eca7b976fa53bf5add6fa438f4744b9fe87aa6187b5a03f860121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffc930baf44528052f6433f02f3b4d67d7a59f5c737f84751b3f242f2debee45c5000000006b48304502210080f3262f8964f9210f190f2d0ef04965b513d7ff3408ec9947d9665424bc531102203495ee60fec1ec0487566d4aea1c11b515238dbac9f4527cbd41d1fc134500cf0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffcac26af3732d34aa5738db083fdd42ddeb44349c0135463a501746caeeacb9ab000000006b483045022100887e17cac882ee8dbf9b003cac28be34b42fae50003661791b25a7b7874901ee02206767a28e4bb1575b83711275afe32c5a87ecd281ed1a35e8b8c57fb870e6a4b10121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffcc95a02c701be990284ce8dcabf905bb0e0bbdab0fc67172806d6718819f77b3000000006a47304402200ed8ebf853104ad54088a32ac1757cab221f27c67e3e08d3a708767a6f3d3b54022073e9fbdfe2733247a5d5b6f67ca0b583d85d185a81274ed0ad374dd4a5851f2c0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffccc059f13e57c2f8ed0eb6818537e55890a43a02d41560e04e0fbe38cdaae00a000000006b483045022100ac6ea3856bf3a156bc7d5a648df5ac1846ffdc75c68a5c866c8ab48659fcca2c0220400cc9f99a0e5e518edc5c8b97a93d151699afbaf6c1321f29842ccd4190e8e00121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffce1dbb2868ecf22a4b1fbf7f140ec284cebfd008eecf1c846f7f8eed2e30c0eb000000006b4830450221008a848f17579dec5a57fcdbb69e38ddc13ef13612e152e6363d10b5203ff222d502204d0d58efe619c23fa61b84266e7be0074372b8713e8e9a723a5bd65bb357bcf90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffce282ce5b81e68803c317883c7bc7e047148739912e90f648e53d516ee6935cb000000006b483045022100ca5f02e740c4edeb5d2c05a7fe35314be672f96758a88f20796491a8d28f991302200fec9eeebc50e0d268086db841cab0a833bf2ee92744e929f7d147626139f56a0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffcf0be33ffaffcec97c0b8ce7984f409adb6633ae2b4b000b57f74d9f5c675c62010000006a47304402206bddd6a58f5e4ce68bf81a35af323adab54ca420207f010e8cceb1fe395474d802203d3bdc008ee39edd9c5aa51ea2da255c26f186cdfc84b28b93b556bdcd83bfef0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffcf641d2f9dded5bca42d26e4adaa014ee59918f4fa97f56b05e086b54eab750a000000006b483045022100d1a1b73ed669b896afdca0ba1b498cb247f5d7472d182a6778fe640852ac8e9d022028063470cfd3bd6fbed7f91a26a066d55a782455e6cd26979d618de1ed0c406b0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffd25662a40bba3b15f65f045e895ac73cafc03e0659bd0f109f24348feb050738000000006a473044022048ac49ca916fde0251d089c56effff46b0aa83381e45f58c54f00ac140e6e07f0220052b8b544231fe12dd59bc59cffacc69779a33603f1ecbeec7cee5bec3f41d3e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffd71f6f137e6019b4b44d52050f96f5146d2bea07138d46cc3e0092af2a02fb19000000006a4730440220554d1f01312aefad2a8fb1ab193eea71817142c1ee4c2f8a9f61cf0a5af9d708022002786374d0de92c667fc21aab1c3e9dceb750a396262e8356e387b60aaf606a40121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffd7f6698ef060752bcbc51fad9edd3cc0ab678b50cc240a317f4b2e8b17653309000000006a47304402201e5bf034f9f5c4d7a29ab179b02216f02e55989aacd26a4b3bccdc76cb0d149c02204c5d6320c0851c2188be9d21dda93bfa5bd635f5bcecbc0107623b9938ade3410121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffd9c95aab74a5d7b3e484a7143127d4f6d3f8ad990ff26da82764463b10f66842010000006b483045022100afaa0896c1334e7f2e2c68fc2f5175311a597ab2a7c00bee918f3c8fc95841a302202778c7d41c4179f49449ccf1e2dc4df3fc8067759befb9382374231773b333c90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffdd74c27ba795279d7e191bb067fb615f1a3b04553baf410c3f442bb9b3dc809f010000006a47304402201605547d28538418bb940fee20b0f660901f38a3347502771ee271316503b4b60220789b0e98575ae56ddb1c32a6a0d3fec0a11fa4dc551a114870a55186a37e5db00121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffdd9821077b65c95d6f93c7a39553b2602ce57fc1781f90ddae04aff0f3bc5f61000000006b483045022100dafac6ff0b47c344f6d1434121a76792e832c13ce05d72f7f91965ed5ccacee3022019f0545c4cda79de05591592bc0bc5ec53ca0424f1b2b9d129259c22b59aa3b50121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffde0ecb6db067c2ef47d94c4afa9ba8ce65f0d07e853b03ca06e0a940f166ff29000000006a47304402207cba2c16b0a3342b0c7e541f9a8c3fe6f57db992a8e67c82e9cb1e7472e7bcef022013207556063c1449d71c7bd2aa296c63f9e90dc447e3ee9d3ffc98ede64a2ed90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffe0d9484309fe694cf94384457c7351014f6a68ed2e6e1a131917de4231277465010000006b483045022100c56c703cc24247847c3f23f10493970cd14be9a6df3c77eb4bca2778f8c13c12022030674b89acf9d78ae8245fa59064bad44a401352de2752697fe089e55a816e270121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffe1d2352d8a9a57c60d193f2f0f0a5528a846c9ed5cb85f7bcd2bf133d9038180000000006a47304402206fff304cc1539707ab33c4cc132dc42aff05d4fcb2e8eebdba42688915949d3f02205db261120f15c7825d926363d703fe86522ba01902ef84bfb7ee6754ca15ab130121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffe234b4b8f618613466b89bae8fac4f38f79585b8f640cedd25252c1eb66594df000000006a47304402203190dc24dd3c9833336b7060737e8f8e83014cec727b2a7b8e7be106adb88e540220233aa64f36b0a0908072bdc6a5a2ef5bfdbc90c26bd9741e98fe68ea711f03310121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffe30521f04d98cb6dbde485b0d737ad1c013a937150d5fc5c90da4eb3823e7dda000000006b483045022100c0e4234deb51620056bdaee7f315e39e94218c2ed7ffdb997c6536003834ec3602205b3160ce7a6344ebc2d4cef600115cbb112ac59b2cab542912b85e0b8bfdc4e30121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffe3ce3acbf8f52e34d784e0006141d425bdf64e52d9ea4ba6387bf658c2667adb010000006b483045022100f4d5523e696d9f25e9ccef52ff623f95f100678e8e9939f9de44ae1272f077d702207f38da16592a3fbdcda8bf25bd3de34dbc14ef3f8ee7a9e58110d1d4b53c193d0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffe66d7e4c9166e784fae5a614a12a38d25085e982289c948d405cbd42cd120733000000006a473044022079ad5738f41fb8583ad8ff42d972c8344e007ccb0f37fd40c8d197e5806075fa02200b008a31d8ad1561e570952991e2931475664258cb23129f410e5ea963463eb40121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffe704ac601aae73f19603f1572912e8807edd57fb44034d9b212fd32cd53af429000000006b483045022100c6f77756a1ddbab7053035a84e8640edcc0c5e7656a40a752249c1b7207e43690220789900bee0e8f7c6af4fef1533367aa466be9f693e2af45a44609172fca2084b0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffe7e4c487cd709d05565474536e69a87e81c4e64995163b3359fc4ab5bf174add000000006a4730440220696086f5358f0af697ac0d54203ac27ed28008f5d7afb1892b2371499d1da72702205dab0f963a19c1079f62259f0e3654d44714903f4c909c43fab4885de50a1ea10121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffe8591bd9c6c7ad5043f6c477408931286246f2200456e987c96bd35c470ee913000000006a47304402205de653442a9903900e8e043e01ccbe87a183401b13f14aca10e05f26156e84a802207230de43b29a5b28a3cda65e8f34f1fcd58324ccd3af9869f3923b0a9d5676830121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffe8fcfb61f7498545af326a30c3c44695a521d2cc91dc02b8a52ddefe5af1195d010000006b4830450221008ca534a11c3862bf7f5e84b59247e2662110a79c7220bf8aa81599da5bd73caa0220187eb77f9c3d1531e17b2f591a1e3d634c8a8498c0a766ffeae099be06e933250121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffe927957d22a3ffa39e3bb8e7792786c20089e281a0d7e023907fcbb3390e9e32000000006b483045022100990c7104331956db7cd8fd1d77dedf36f3195055f69ab37f86f3c7099310872a022030109ba5419fc09f8a5b502721c560fc6140c5a038fd5a03dd7fdd229d07a8a90121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffea371b075fa7e598ba231d515de9830bd5214d357f0deaefb9571ba4591da5cb000000006a473044022031f1dd3c9a155c6c7f9b0b68ecfdfbe91e8bd74479082c6ce92b49d678a53cc802204178bcc728499d48b472043a20b508ee8e0312f17b813efa6a77e8f474407a640121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffea4fca994d1ef3b93f7b965be034cac10a72db74b0fdbc8dc36a93e3360b1c17000000006b483045022100cfbf496ddf62e8c93312f018f1ddf0613745739b58e5bbf8672559e762297d9a02201208c70ce45659dfd092e618ae94c5f4f705981fa2879212e9cdf6220ff3f4390121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffeaa428f44c8b351de03a2c683f698fb97fc4b6f25ec1d72f88dd678ecde65f1d000000006a4730440220762f9bc2f889fff0aeaa2c1278a7a24a00e055711809fd8f7f4a0fe2e16d70a2022008b92950483db2993ddca07bbeba1b0f3a08f75d00d28edbd7a59a2829668cab0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffeaa66d86626167c1c0b1ae3c5fc96a66d5900e376ac4faafac579ce15292b8d8000000006b483045022100ba932b6204b00810402310c9a1eec20c13b99b0097e0b9698406717aa2d4a67c02207033fd8cbba0e24496649d463a0ee3bae4b5226ae6f931a20d665d9b0e31a9910121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffeaf28830f302f40eac1183ac1d041423573298f4c640f2e69ecf50762f20c094000000006a4730440220284c9048420afcdf09e27906049cbc819a0d5f6a324565c49fbb2173e546f732022074fbe11fcac088442fb9c97c1164234a0326283bd0982ac261a2f42c5853c22e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffeb0e8dc21c0e3b97ea3d7b120e0145bae9b39572957d5c709f8b2e55e14cc932010000006a47304402204c51f64acb844524c81b79ae07ed08fc4c6f1cd347f05c56f46a48ce41bd48f202207150d317f9a71a6489e69e9869a8dc75c1918f349ab462f5b6e917fe956059150121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffeb39b5fc1752c61fb0d632f73e42f00a4a6491858a067c13153647108144b26a000000006a473044022024ba4338a9ae5fe6fdf8ee866f4cc003803fe2b2f43802c4efe147248362d195022053e816d4dc72f41dc78671bd78c6a63a8f0a4809bc46337122eb972b2ebd772a0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffeb64cc6215a86228b2d4df67740389de4e321994d39655da89e130711c954268000000006b48304502210090b50982a505ab0de9d7045c82e822f2aafd08c35e7bfcfc2b235a2b52bdca1c02200bb3ad31a3c090de8fce89d8eb885328a53a20bf14efd41c28e0bd074b01e0aa0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffeba23e0c498dc3ea07430f9dad72890b05458ee0a3e3d8480d1060441808cfff000000006a4730440220452d2ff9489d2c7962e3d0b20097d9ae239f2f0b7ab80c8856ebcd79de00e3430220300bed07dc6736eb8d60c7f1501b67206cd0a7a4641011b611d51632b3bb51c30121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffebecd74e1e432534e35ef041f624dae3c836ff95dcdae495f9abfae367982404000000006a473044022018d9dc45aa0dcb5e5cf9931b4afd4e77e2a2ecdf0348f5fa7da1cea51cf2cc6c022059007a6281a38fd83addb5280fbd314940819003f25db36ed194901848e43aaf0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffedcdf9c428b19aaecaff8fe19cbe0b1e1b5989dca25f5f9a88508130049bed4a000000006b483045022100f9d6965f14cd18319550200fbdea7d1d2712b4d3f6687ea519409d08f6700281022009555a880a0c79c6dab4c93c0f37a860a680aeabd85c4db25a7d10f243ae830e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffee452d4dda3f3568f0ecbecd3cdb5430085a22dfb0c40d370d85794b65df3e8e000000006a473044022009c24fe724924f44aa2f40802870f9f2974a589e60901d993f895185af898c5102205f1de0a98e5bef06991f4a0ecbbf78769c76eee60ef784afc31f5b6ab33585360121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffef2f16af18893848feeae7861dc68bd12ed794c46b534a191698c2e9742d7e66010000006a4730440220399b636e9d98f0126c1b5941d010bb20756aa844164437f3412397df1d34b88d022040484d93303a170666408ef024351e8f6ce7de7eb59bcc6e3de17c7943f8e3c30121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffff07aef29877108cd676fe709090190949c6df8a53422084e2114689cca0ae1dc000000006a47304402204238b44564987fde4668ae6145e7e1ab556834c96103813cffd9a042cc572d1f022051eb54fa1d213c10193640c70899b7dfa9b4a2b377dc5c5c3bf9c2bcf406e96f0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffff1c26b96131878d28775850a53691a82bd25f30352ff1e37ddb47b3011269f3e000000006b483045022100afa3f1caa5b5b3e9364eb03da68385b8a750788684afe1d0c79c783cb65e51f80220036903e5966add38f5eff86ac06c4fcc44249fdb475c55ffce61ab845ebe2f4e0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffff41b3fbd4efd92419f5b06c2d2e5c0df71dfead9d14b824d45046d75d69cc63c000000006a47304402207328eb181f4020e37f5037556ddc0cddd851bd8bbae1d05955fe3f1aaaaf4256022061f003533d5d440933a3ac82551a01d3f153c1775d446ea14cf2aceee40917be0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffff4c7406bf59fc57c2c9be3466b1475d57551b6c35a361b933db0c2533c1957d5000000006a47304402201718a84f87b3e257aef763414620cfc4662f9bb2e5a8fcbdc390ed1aa46afd2902205098a6f1f53e20b4b2a1afeb3a35ce942775c7b2e66b20ede16156cd13791b1d0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffff5b590ccd5c38556fbf35daa1557a82d1c9f4aac07497658b84c54f215cc3e00010000006b4830450221009601180a48f20b718b2c4172a13ab758aa91258540a875575a8e1d1e1a039d290220608af9b9b28a5c38b4c60ffac508136a8c3fee94f8c64e99d178d4eede6824770121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffff72a3230db3e78f21393ece76b8f9f41e3a1a2739290b3f18ce4e94b81e468c4000000006a4730440220184aeeb212a7b5b487e33cf513fa16fd53f6c09254bc1ee60145c95d0071370e02200ae59368df71c1ef8caf1a0f71339e6b8af5b531d7b955b4dc2984c08aeefd620121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffff8086db0fb0eed0df150f9e43995f1b7a0295b59e04bf466c7c18ddcea26d483000000006a473044022064e33f86810006a8a8e249cc88ab2a2d47e688ffed12446ad9249799e09e3a5102204a283be835f8b79c19fc423f0e9220fb56a483ddbf576e1eae25fcc0fdf55b710121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffff94d664a357c197ec89bf5e91e573d3926d6aac881d44cf10baef75b3d5cc6da000000006b483045022100e611387e956cac63daa9c3e116a73abdff1da852d259096b3cdc1f3f9b94aeda02207285c6dbb7d0d13311977c38da9180dd62f3415520faaa614c24c6195053af300121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffffa4a510ab2dc230c26f84cd252c7fce66d36d66654e2b634794242d6b5ba6404000000006a47304402206bbcc0d9d5f949757cef6415e6b3e9252d58830994d2f374e6d584bbc7904d2002204df280f1f4319275b67edc25ff61b87d0acd745ce88064ddb5f9690f1352ab670121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffffa7f7c0120824cbb885291f7c9c24c5facc7677f87d97fbfeaf81b930c5cbe14000000006a473044022063ba9496a37eb81bde78feb531187567fa957fdc45933092c173186a4cb2de670220757934dbe159e9a6411b7e597b11b6eeef7a38ff57d54a4891303d3fe7b58d150121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffffab1a7f322d18aab5c19e26a46e89cbb028c7de9751495102553195072f34cfe000000006a473044022024ddc6dc25a41ecab466f2bf912b9469ddbdcda344ef82b48af651e3f9291a590220037f641457612e77c364b47926291b73deb1f6ba2b47e0176de65354de0169af0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffffbd01e443b38afe9584b6f3661efd6f248bdb07989f652b4656edbe32586e53b000000006a4730440220277bd2ed2c8c60ddcf4064cf995636e4b403d451fee0f7c8ad6d8bf5689953c002202039a568733b1ea4316284a8bf0ff68b634b7e7a86d86d5160ca9ed0f6a778740121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13fefffffffd4e7a1146cc34603da4daeb52c895e94a55337adc634c313285c1bfad1bc56c000000006a47304402203cabce70168071c56c7fcc8fdf67f57ba7e3b35b15afa1a848b72b34a1ee71d902204f59c01111c03fa0ec1a0ac435330d2ecb26f9ecafd269adbfdbf7cab6a0c21b0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffff37097e5155ebe5d9afa500d471aaa2d3530081bdbdbba015aa97ebe7f89d0b000000006b483045022100f9dd302552fb316a6f9c181517eeac15e1c49826a0d774daf391e75efe1717b602203d43934b1a87e9877f99c2ee520f3e3b1ef4f318adee7027f7f4848e49c262760121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffffff68d82ccfaeef761c54f9e05d4bc88beb203414ee8d19bc631ed6901667186e000000006a47304402206319d9d9970ea82c9b7107da05c87811f77d9073169fe31b546f3f1d3cb5192a02201dd1a2434c2b7bb14fa15a754a8014261cf5e6eadef8f110bf3bb656c80e137b0121025f2e83c0a102d247a6c4b93960cc0c82f6f5ac7e18e64c85059daca0e45ecc13feffffff01ad8e64aa040000001976a91456511d88bb5037afd0142c2e5d1de0785141ce1088ac272e1600020000000001013efef40f59e8d4344a5f88533c1b7a3837f4baecf714309fde39b7f97117c4d201000000171600143e73b902e26f6f983eb83b9130332a67b0544405feffffff024c936e000000000017a9142e154b7137d2656d71b5f4f554f0424f086e048f8720f40e000000000017a91464df97e85f298dcb76d60766cc3fc448cd284efd87024730440220118f74a9d82b42ac4707256350f696eae7a7a12497ae7cf24aeb2ea7802be8bd02201c32bda2c0dc07ccdc4ee08c33cf7fa3d6a19eb9eb3ad042ad58388f3db676c4012102b2362f1c01d06aafdee1b940b3ad0a3e40f9e90e6ccd82409e311b6314e64a56272e1600"
-        block_bytes = bytearray(convert.hex_to_bytes(segwit_block_hex))
+        block_bytes = bytearray(convert.hex_to_bytes(SEGWIT_BLOCK_HEX))
 
         off = BTC_HDR_COMMON_OFF + BTC_BLOCK_HDR_SIZE
 
@@ -24,3 +27,29 @@ class BtcMessagesUtilTests(AbstractTestCase):
 
         self.assertEqual(off, len(block_bytes))
 
+    def test_get_tx_boundaries(self):
+        block_bytes = bytearray(convert.hex_to_bytes(SEGWIT_BLOCK_HEX))
+        off = BTC_HDR_COMMON_OFF + BTC_BLOCK_HDR_SIZE
+        tx_count, size = btc_varint_to_int(block_bytes, off)
+        off += size
+
+        offsets, segwit_flags = get_tx_boundaries(memoryview(block_bytes), off, tx_count)
+        self.assertEqual(tx_count + 1, len(offsets))
+        self.assertEqual(tx_count, len(segwit_flags))
+        self.assertEqual(len(block_bytes), offsets[-1])
+
+        for index in range(tx_count):
+            self.assertEqual(off, offsets[index])
+            self.assertEqual(is_segwit(block_bytes, off), segwit_flags[index] == 1)
+            off += get_next_tx_size(block_bytes, off)
+
+    def test_get_tx_boundaries_truncated(self):
+        block_bytes = bytearray(convert.hex_to_bytes(SEGWIT_BLOCK_HEX))
+        off = BTC_HDR_COMMON_OFF + BTC_BLOCK_HDR_SIZE
+        tx_count, size = btc_varint_to_int(block_bytes, off)
+        off += size
+
+        with self.assertRaises(ParseError):
+            get_tx_boundaries(block_bytes[:-1], off, tx_count)
+        with self.assertRaises(ParseError):
+            get_tx_boundaries(block_bytes[:len(block_bytes) // 2], off, tx_count)
@@ -0,0 +1,60 @@
+import os
+
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils import convert
+
+from bxgateway.btc_constants import BTC_HDR_COMMON_OFF
+from bxgateway.messages.btc import btc_messages_util
+from bxgateway.messages.btc.block_btc_message import BlockBtcMessage
+from bxgateway.messages.btc.btc_message import BtcMessage
+
+
+def get_segwit_block() -> BlockBtcMessage:
+    root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    with open(os.path.join(root_dir, "segwit_block.txt")) as sample_file:
+        btc_block = sample_file.read().strip("\n")
+    block = convert.hex_to_bytes(btc_block)
+    buf = bytearray(BTC_HDR_COMMON_OFF + len(block))
+    buf[BTC_HDR_COMMON_OFF:] = block
+    msg = BtcMessage(magic="main", command=BlockBtcMessage.MESSAGE_TYPE, payload_len=len(block), buf=buf)
+    return BlockBtcMessage(buf=msg.buf)
+
+
+class TxOffsetTableTest(AbstractTestCase):
+
+    def setUp(self):
+        self.block = get_segwit_block()
+        self.tx_offset_table = self.block.tx_offset_table()
+
+    def test_offsets(self):
+        self.assertEqual(self.block.txn_count(), len(self.tx_offset_table))
+        self.assertEqual(len(self.block.rawbytes()), self.tx_offset_table.end_offset())
+
+        off = len(self.block.header())
+        for index, tx in enumerate(self.tx_offset_table):
+            tx_size = btc_messages_util.get_next_tx_size(self.block.buf, off)
+            self.assertEqual(tx_size, self.tx_offset_table.tx_size(index))
+            self.assertEqual(self.block.buf[off:off + tx_size], tx)
+            self.assertEqual(btc_messages_util.is_segwit(tx), self.tx_offset_table.is_segwit(index))
+            off += tx_size
+
+        self.assertIn(1, self.tx_offset_table.segwit_flags)
+        self.assertIn(0, self.tx_offset_table.segwit_flags)
+
+    def test_table_is_shared(self):
+        self.assertIs(self.tx_offset_table, self.block.tx_offset_table())
+        self.assertEqual(list(self.tx_offset_table), self.block.txns())
+
+    def test_get_item(self):
+        tx_count = len(self.tx_offset_table)
+        self.assertEqual(self.tx_offset_table[tx_count - 1], self.tx_offset_table[-1])
+        self.assertEqual(list(self.tx_offset_table)[1:5], self.tx_offset_table[1:5])
+        with self.assertRaises(IndexError):
+            _ = self.tx_offset_table[tx_count]
+
+    def test_get_txid_with_segwit_flag(self):
+        for index, tx in enumerate(self.tx_offset_table):
+            self.assertEqual(
+                btc_messages_util.get_txid(tx),
+                btc_messages_util.get_txid(tx, self.tx_offset_table.is_segwit(index))
+            )
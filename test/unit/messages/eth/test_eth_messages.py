@@ -147,6 +147,19 @@ class EthMessagesTests(AbstractTestCase):
                                          mock_eth_messages.get_dummy_transaction(3)
                                      ])
 
+    def test_transactions_msg_from_transactions_messages(self):
+        txs = [mock_eth_messages.get_dummy_transaction(i) for i in range(1, 6)]
+        transactions_messages = [
+            TransactionsEthProtocolMessage(None, txs[:2]),
+            TransactionsEthProtocolMessage(None, txs[2:3]),
+            TransactionsEthProtocolMessage(None, txs[3:]),
+        ]
+
+        merged_msg = TransactionsEthProtocolMessage.from_transactions_messages(transactions_messages)
+
+        self.assertEqual(TransactionsEthProtocolMessage(None, txs).rawbytes(), merged_msg.rawbytes())
+        self.assertEqual(txs, list(merged_msg.get_transactions()))
+
     def test_new_block_eth_message(self):
         self._test_msg_serialization(NewBlockEthProtocolMessage,
                                      False,
@@ -328,6 +341,16 @@ class EthMessagesTests(AbstractTestCase):
         self.assertEqual(block_header, block_headers_msg.get_block_headers()[0])
         self.assertEqual(block_header_bytes.tobytes(), block_headers_msg.get_block_headers_bytes()[0].tobytes())
 
+    def test_block_headers_msg_block_hashes(self):
+        block_headers = [mock_eth_messages.get_dummy_block_header(i) for i in range(1, 4)]
+        block_headers_msg = BlockHeadersEthProtocolMessage(None, block_headers)
+
+        self.assertEqual([block_header.hash_object() for block_header in block_headers],
+                         block_headers_msg.get_block_hashes())
+        self.assertEqual(Sha256Hash(block_headers[0].prev_hash), block_headers_msg.get_previous_block_hash())
+
+        self.assertIsNone(BlockHeadersEthProtocolMessage(None, []).get_previous_block_hash())
+
     def test_block_bodies_msg_from_bodies_bytes(self):
         txs = []
         txs_bytes = []
@@ -359,6 +382,9 @@ class EthMessagesTests(AbstractTestCase):
         self.assertEqual(1, len(block_bodies_msg.get_block_bodies_bytes()))
         self.assertEqual(block_body, block_bodies_msg.get_blocks()[0])
         self.assertEqual(block_body_bytes, block_bodies_msg.get_block_bodies_bytes()[0])
+        self.assertEqual(txs_bytes,
+                         [tx_bytes.tobytes() for tx_bytes in block_bodies_msg.get_block_transactions_bytes(0)])
+        self.assertEqual(txs_hashes, block_bodies_msg.get_block_transaction_hashes(0))
 
     def test_new_block_hashes_msg_from_block_hash(self):
         block_hash_bytes = helpers.generate_bytes(eth_constants.BLOCK_HASH_LEN)
@@ -18,9 +18,13 @@ import bxgateway.messages.btc.btc_message_converter_factory as converter_factory
 from bxgateway.messages.btc.abstract_btc_message_converter import AbstractBtcMessageConverter
 from bxgateway.btc_constants import BTC_HDR_COMMON_OFF, BTC_SHA_HASH_LEN
 from bxgateway.messages.btc.block_btc_message import BlockBtcMessage, BtcMessage
+from bxgateway.messages.btc.btc_normal_message_converter import BtcNormalMessageConverter
 from bxgateway.messages.btc.compact_block_btc_message import CompactBlockBtcMessage
+from bxgateway.messages.btc.streamed_block_btc_message import StreamedBlockBtcMessage
 from bxgateway.messages.btc.tx_btc_message import TxBtcMessage
 from bxgateway.utils.btc.btc_object_hash import BtcObjectHash
+from bxgateway.utils.btc.compact_block_short_id_matcher import CompactBlockShortIdMatcher
+from bxgateway.utils.errors.message_conversion_error import MessageConversionError
 from bxgateway.messages.btc import btc_messages_util
 from bxgateway.testing.mocks import mock_btc_messages
 
@@ -293,6 +297,76 @@ class BtcMessageConverterTests(AbstractTestCase):
         )
         self.assertEqual(recovered_block.rawbytes().tobytes(), ref_block.rawbytes().tobytes())
 
+    def test_compact_block_compression_with_short_id_matcher(self):
+        self.tx_service, _ = self.init(False)
+        short_id_matcher = CompactBlockShortIdMatcher()
+        self.btc_message_converter = BtcNormalMessageConverter(self.MAGIC, short_id_matcher=short_id_matcher)
+        compact_block = get_sample_compact_block()
+        recovered_block = get_recovered_compact_block()
+        for short_id, txn in enumerate(recovered_block.txns()):
+            tx_hash = btc_messages_util.get_txid(txn)
+            self.tx_service.set_transaction_contents(tx_hash, txn)
+            self.tx_service.assign_short_id(tx_hash, short_id + 1)
+            short_id_matcher.add_transaction(tx_hash)
+
+        result = self.btc_message_converter.compact_block_to_bx_block(compact_block, self.tx_service)
+        self.assertTrue(result.success)
+        self.assertEqual(recovered_block.block_hash(), result.block_info.block_hash)
+        self.assertEqual(convert.bytes_to_hex(recovered_block.prev_block_hash().binary),
+                         result.block_info.prev_block_hash)
+        self.assertEqual(recovered_block.txn_count(), result.block_info.txn_count)
+        self.assertEqual(len(recovered_block.rawbytes()), result.block_info.original_size)
+
+        ref_block, _, _, _ = self.btc_message_converter.bx_block_to_block(result.bx_block, self.tx_service)
+        self.assertEqual(recovered_block.rawbytes().tobytes(), ref_block.rawbytes().tobytes())
+
+    def test_segwit_decompression_streamed_block(self):
+        self.tx_service, self.btc_message_converter = self.init(False)
+        parsed_block = get_segwit_block()
+        transactions_short = parsed_block.txns()[:int(parsed_block.txn_count() * 0.9)]
+        for short_id, txn in enumerate(transactions_short):
+            bx_tx_hash = btc_messages_util.get_txid(txn)
+            self.tx_service.assign_short_id(bx_tx_hash, short_id + 1)
+            self.tx_service.set_transaction_contents(bx_tx_hash, txn)
+        bx_block, _ = self.btc_message_converter.block_to_bx_block(parsed_block, self.tx_service)
+
+        ref_block, block_info, _, _ = self.btc_message_converter.bx_block_to_block(bx_block, self.tx_service)
+        self.assertIsInstance(ref_block, StreamedBlockBtcMessage)
+        self.assertEqual(parsed_block.block_hash(), ref_block.block_hash())
+        self.assertEqual(parsed_block.txn_count(), block_info.txn_count)
+        self.assertFalse(ref_block.is_materialized())
+
+        chunks = list(ref_block.iter_chunks(1024))
+        self.assertTrue(all(len(chunk) >= 1024 for chunk in chunks[:-1]))
+        self.assertEqual(parsed_block.rawbytes().tobytes(), b"".join(bytes(chunk) for chunk in chunks))
+        self.assertFalse(ref_block.is_materialized())
+
+        self.assertEqual(parsed_block.rawbytes().tobytes(), ref_block.rawbytes().tobytes())
+        self.assertTrue(ref_block.is_materialized())
+        self.assertEqual(parsed_block.txns()[-1].tobytes(), ref_block.txns()[-1].tobytes())
+
+    def test_segwit_decompression_payload_length_mismatch(self):
+        self.tx_service, self.btc_message_converter = self.init(False)
+        parsed_block = get_segwit_block()
+        for short_id, txn in enumerate(parsed_block.txns()):
+            bx_tx_hash = btc_messages_util.get_txid(txn)
+            self.tx_service.assign_short_id(bx_tx_hash, short_id + 1)
+            self.tx_service.set_transaction_contents(bx_tx_hash, txn)
+        bx_block, _ = self.btc_message_converter.block_to_bx_block(parsed_block, self.tx_service)
+
+        # payload length in the Bitcoin message header, right after the short id offset
+        payload_len_offset = 8 + BTC_HDR_COMMON_OFF - 8
+        corrupted_bx_block = bytearray(bx_block)
+        payload_len = int.from_bytes(corrupted_bx_block[payload_len_offset:payload_len_offset + 4], "little")
+        corrupted_bx_block[payload_len_offset:payload_len_offset + 4] = (payload_len + 1).to_bytes(4, "little")
+
+        with self.assertRaises(MessageConversionError):
+            self.btc_message_converter.bx_block_to_block(corrupted_bx_block, self.tx_service)
+
+        corrupted_bx_block[payload_len_offset:payload_len_offset + 4] = (payload_len - 1).to_bytes(4, "little")
+        with self.assertRaises(MessageConversionError):
+            self.btc_message_converter.bx_block_to_block(corrupted_bx_block, self.tx_service)
+
     def init(self, use_extensions: bool):
         opts = Namespace()
         opts.use_extensions = use_extensions
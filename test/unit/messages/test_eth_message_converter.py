@@ -24,6 +24,7 @@ from bxgateway.messages.eth.serializers.compact_block import CompactBlock
 from bxgateway.messages.eth.serializers.short_transaction import ShortTransaction
 from bxgateway.messages.eth.serializers.transaction import Transaction
 from bxgateway.testing.mocks import mock_eth_messages
+from bxgateway.utils.eth.keccak_cache import KeccakCache
 
 
 class EthMessageConverterTests(AbstractTestCase):
@@ -402,6 +403,27 @@ class EthMessageConverterTests(AbstractTestCase):
         self.assertEqual(len(converted_block_msg_bytes), len(block_msg_bytes))
         self.assertEqual(converted_block_msg_bytes, block_msg_bytes)
 
+    def test_block_to_bx_block__keccak_cache_hashes_received_transactions_once(self):
+        keccak_cache = KeccakCache()
+        self.message_parser = EthMessageConverter(keccak_cache=keccak_cache)
+        txs = [mock_eth_messages.get_dummy_transaction(i) for i in range(1, 10)]
+        bx_tx_msgs = self.message_parser.tx_to_bx_txs(TransactionsEthProtocolMessage(None, txs), self.test_network_num)
+        for i, (_, tx_hash, tx_bytes) in enumerate(bx_tx_msgs, 1):
+            self.assertEqual(txs[i - 1].hash(), tx_hash)
+            self.tx_service.assign_short_id(tx_hash, i)
+            self.tx_service.set_transaction_contents(tx_hash, tx_bytes)
+        self.assertEqual(len(txs), keccak_cache.get_stats().misses)
+
+        block = Block(mock_eth_messages.get_dummy_block_header(100), txs, [mock_eth_messages.get_dummy_block_header(2)])
+        block_msg = NewBlockEthProtocolMessage(None, block, 40000000)
+        internal_new_block_msg = InternalEthBlockInfo.from_new_block_msg(block_msg)
+
+        _, block_info = self.message_parser.block_to_bx_block(internal_new_block_msg, self.tx_service)
+
+        self.assertEqual(list(range(1, 10)), block_info.short_ids)
+        self.assertEqual(len(txs), keccak_cache.get_stats().hits)
+        self.assertEqual(len(txs), keccak_cache.get_stats().misses)
+
     def _assert_values_equal(self, actual_value, expected_value, ):
 
         if isinstance(expected_value, collections.Iterable) and \
@@ -5,6 +5,8 @@ from mock import MagicMock
 from bxcommon.test_utils.abstract_test_case import AbstractTestCase
 from bxcommon.constants import LOCALHOST
 from bxcommon.messages.bloxroute.block_holding_message import BlockHoldingMessage
+from bxcommon.messages.bloxroute.broadcast_message import BroadcastMessage
+from bxcommon.messages.bloxroute.key_message import KeyMessage
 from bxcommon.test_utils import helpers
 from bxcommon.test_utils.mocks.mock_connection import MockConnection
 from bxcommon.test_utils.mocks.mock_socket_connection import MockSocketConnection
@@ -22,7 +24,10 @@ from bxgateway.testing.mocks.mock_gateway_node import MockGatewayNode
 class BlockHoldingServiceTest(AbstractTestCase):
 
     def setUp(self):
-        self.node = MockGatewayNode(helpers.get_gateway_opts(8000))
+        self._set_up_node(helpers.get_gateway_opts(8000))
+
+    def _set_up_node(self, opts):
+        self.node = MockGatewayNode(opts)
         self.sut = BlockProcessingService(self.node)
 
         self.node.block_processing_service = self.sut
@@ -130,5 +135,54 @@ class BlockHoldingServiceTest(AbstractTestCase):
 
         self.assertEqual(0, len(self.sut._holds.contents))
 
+    def test_process_encrypted_blocks_on_workers(self):
+        opts = helpers.get_gateway_opts(8000)
+        opts.block_decryption_workers = 2
+        self._set_up_node(opts)
+        self.sut._handle_decrypted_block = MagicMock()
+
+        blocks = [bytes(helpers.generate_bytearray(1000 + i)) for i in range(3)]
+        messages = []
+        for block in blocks:
+            key, ciphertext = crypto.symmetric_encrypt(block)
+            block_hash = Sha256Hash(crypto.double_sha256(ciphertext))
+            messages.append((BroadcastMessage(block_hash, 1, "", True, ciphertext), KeyMessage(block_hash, 1, "", key)))
+
+        # key of first block arrives before the block, keys of other blocks after
+        self.sut.process_block_key(messages[0][1], self.dummy_connection)
+        for broadcast_message, _ in messages:
+            self.sut.process_block_broadcast(broadcast_message, self.dummy_connection)
+        self._run_encrypted_block_workers()
+        self.sut._handle_decrypted_block.assert_called_once()
+
+        for _, key_message in messages[1:]:
+            self.sut.process_block_key(key_message, self.dummy_connection)
+        self._run_encrypted_block_workers()
+
+        self.assertEqual(blocks, [bytes(call[0][0]) for call in self.sut._handle_decrypted_block.call_args_list])
+        self.assertEqual(0, len(self.sut._encrypted_blocks_awaiting_key.contents))
+        self.sut.close()
+
+    def test_process_encrypted_block_on_workers_inconsistent_hash(self):
+        opts = helpers.get_gateway_opts(8000)
+        opts.block_decryption_workers = 1
+        self._set_up_node(opts)
+        self.sut._handle_decrypted_block = MagicMock()
+
+        _, ciphertext = crypto.symmetric_encrypt(bytes(helpers.generate_bytearray(1000)))
+        block_hash = Sha256Hash(helpers.generate_bytearray(crypto.SHA256_HASH_LEN))
+        self.sut.process_block_broadcast(BroadcastMessage(block_hash, 1, "", True, ciphertext), self.dummy_connection)
+        self._run_encrypted_block_workers()
+
+        self.sut._handle_decrypted_block.assert_not_called()
+        self.assertFalse(self.node.in_progress_blocks.has_ciphertext_for_hash(block_hash))
+        self.sut.close()
+
+    def _run_encrypted_block_workers(self):
+        encrypted_block_workers = self.sut._encrypted_block_workers
+        while len(encrypted_block_workers) > 0:
+            time.sleep(0.001)
+            encrypted_block_workers._run_completed_callbacks()
+
     def _assert_block_propagated(self, block_hash):
         self.node.neutrality_service.propagate_block_to_network.assert_called_once()
@@ -26,7 +26,6 @@ class BlockRecoveryManagerTest(AbstractTestCase):
         self.block_recovery_service = BlockRecoveryService(self.alarm_queue)
         self.blocks = []
         self.block_hashes = []
-        self.bx_block_hashes = []
         self.unknown_tx_sids = []
         self.unknown_tx_hashes = []
 
@@ -42,8 +41,8 @@ class BlockRecoveryManagerTest(AbstractTestCase):
 
         self.block_recovery_service.check_missing_sid(sid)
 
-        self.assertEqual(len(self.block_recovery_service._bx_block_hash_to_sids[self.bx_block_hashes[0]]), 2)
-        self.assertNotIn(sid, self.block_recovery_service._sid_to_bx_block_hashes)
+        self.assertEqual(len(self._get_recovering_block(0).unknown_short_ids), 2)
+        self.assertNotIn(sid, self.block_recovery_service._sid_to_recovery_ids)
 
     def test_check_missing_tx_hash(self):
         self._add_block()
@@ -52,8 +51,8 @@ class BlockRecoveryManagerTest(AbstractTestCase):
 
         self.block_recovery_service.check_missing_tx_hash(tx_hash)
 
-        self.assertEqual(len(self.block_recovery_service._bx_block_hash_to_tx_hashes[self.bx_block_hashes[0]]), 1)
-        self.assertNotIn(tx_hash, self.block_recovery_service._tx_hash_to_bx_block_hashes)
+        self.assertEqual(len(self._get_recovering_block(0).unknown_transaction_hashes), 1)
+        self.assertNotIn(tx_hash, self.block_recovery_service._tx_hash_to_recovery_ids)
 
     def test_cancel_recovery_for_block(self):
         self._add_block()
@@ -107,13 +106,13 @@ class BlockRecoveryManagerTest(AbstractTestCase):
 
         # Run clean up before message expires and check that it is still there
         self.block_recovery_service.cleanup_old_blocks(time.time() + gateway_constants.BLOCK_RECOVERY_MAX_QUEUE_TIME / 2)
-        self.assertEqual(len(self.block_recovery_service._bx_block_hash_to_block), 1)
+        self.assertEqual(len(self.block_recovery_service._recovering_blocks), 1)
         self.assertTrue(self.block_recovery_service._cleanup_scheduled)
 
         # Run clean up after message expires and check that it is removed
         self.block_recovery_service.cleanup_old_blocks(time.time() + gateway_constants.BLOCK_RECOVERY_MAX_QUEUE_TIME + 1)
         self._assert_no_blocks_awaiting_recovery()
-        self.assertEqual(len(self.block_recovery_service._bx_block_hash_to_block), 0)
+        self.assertEqual(len(self.block_recovery_service._recovering_blocks), 0)
         self.assertFalse(self.block_recovery_service._cleanup_scheduled)
 
     def test_clean_up_recovered_blocks(self):
@@ -147,101 +146,142 @@ class BlockRecoveryManagerTest(AbstractTestCase):
 
         # Verify that both blocks are there before the first one expires
         self.block_recovery_service.cleanup_old_blocks(time.time() + gateway_constants.BLOCK_RECOVERY_MAX_QUEUE_TIME / 2)
-        self.assertEqual(len(self.block_recovery_service._bx_block_hash_to_block), 2)
+        self.assertEqual(len(self.block_recovery_service._recovering_blocks), 2)
 
         # Verify that first block is remove and the second left 2 seconds before second block expires
         self.block_recovery_service.cleanup_old_blocks(time.time() + gateway_constants.BLOCK_RECOVERY_MAX_QUEUE_TIME - 2)
-        self.assertEqual(len(self.block_recovery_service._bx_block_hash_to_block), 1)
+        self.assertEqual(len(self.block_recovery_service._recovering_blocks), 1)
 
         self.assertTrue(self.block_recovery_service._cleanup_scheduled)
 
         # verify that the latest block left
-        self.assertNotIn(self.bx_block_hashes[0], self.block_recovery_service._bx_block_hash_to_block)
-        self.assertIn(self.bx_block_hashes[1], self.block_recovery_service._bx_block_hash_to_block)
+        self.assertNotIn(self.block_hashes[0], self.block_recovery_service._block_hash_to_recovery_ids)
+        self.assertIn(self.block_hashes[1], self.block_recovery_service._block_hash_to_recovery_ids)
         self.assertTrue(self.block_recovery_service._cleanup_scheduled)
 
+    def test_add_same_bx_block_again(self):
+        self._add_block()
+        self.block_recovery_service.check_missing_sid(self.unknown_tx_sids[0][0])
+
+        self.block_recovery_service.add_block(memoryview(bytearray(self.blocks[0])), self.block_hashes[0],
+                                              self.unknown_tx_sids[0][1:], self.unknown_tx_hashes[0][:])
+
+        self.assertEqual(1, len(self.block_recovery_service._recovering_blocks))
+        self.assertEqual(len(self.blocks[0]), self.block_recovery_service.get_recovery_stats().bytes_awaiting_recovery)
+        self.assertEqual(2, len(self.block_recovery_service._sid_to_recovery_ids))
+
+    def test_get_blocks_awaiting_recovery(self):
+        self._add_block()
+        self._add_block(1)
+        self.block_recovery_service.check_missing_sid(self.unknown_tx_sids[0][0])
+
+        blocks_awaiting_recovery = {
+            block_info.block_hash: block_info for block_info in self.block_recovery_service.get_blocks_awaiting_recovery()
+        }
+        self.assertEqual(2, len(blocks_awaiting_recovery))
+        self.assertEqual(set(self.unknown_tx_sids[0][1:]),
+                         blocks_awaiting_recovery[self.block_hashes[0]].unknown_short_ids)
+        self.assertEqual(set(self.unknown_tx_hashes[1]),
+                         blocks_awaiting_recovery[self.block_hashes[1]].unknown_transaction_hashes)
+        self.assertEqual(self._get_recovering_block(0).recovery_start_time,
+                         blocks_awaiting_recovery[self.block_hashes[0]].recovery_start_time)
+
+    def test_evict_over_byte_budget(self):
+        self.block_recovery_service = BlockRecoveryService(self.alarm_queue, max_bytes=1200)
+        self._add_block()
+        self._add_block(1)
+        self.assertEqual(0, self.block_recovery_service.get_recovery_stats().evicted_bx_blocks)
+
+        self.blocks.append(_create_block())
+        self.block_recovery_service.add_block(self.blocks[-1], Sha256Hash(os.urandom(32)), [100], [])
+
+        stats = self.block_recovery_service.get_recovery_stats()
+        self.assertEqual(1, stats.evicted_bx_blocks)
+        self.assertEqual(2, stats.bx_blocks_awaiting_recovery)
+        self.assertEqual(1000, stats.bytes_awaiting_recovery)
+        self.assertEqual(4, stats.unknown_short_ids)
+        self.assertEqual(2, stats.unknown_transaction_hashes)
+        self.assertNotIn(self.block_hashes[0], self.block_recovery_service._block_hash_to_recovery_ids)
+        for sid in self.unknown_tx_sids[0]:
+            self.assertNotIn(sid, self.block_recovery_service._sid_to_recovery_ids)
+
+    def _get_recovering_block(self, block_index):
+        recovery_ids = self.block_recovery_service._block_hash_to_recovery_ids[self.block_hashes[block_index]]
+        self.assertEqual(1, len(recovery_ids))
+        return self.block_recovery_service._recovering_blocks[next(iter(recovery_ids))]
+
     def _add_block(self, existing_block_count=0):
         bx_block = _create_block()
         self.blocks.append(bx_block)
         self.block_hashes.append(Sha256Hash(os.urandom(32)))
-        self.bx_block_hashes.append(Sha256Hash(crypto.double_sha256(bx_block)))
 
         sid_base = existing_block_count * 10
         self.unknown_tx_sids.append([sid_base + 1, sid_base + 2, sid_base + 3])
         self.unknown_tx_hashes.append([os.urandom(32), os.urandom(32)])
 
-        self.assertEqual(existing_block_count, len(self.block_recovery_service._bx_block_hash_to_block))
-        self.assertEqual(existing_block_count, len(self.block_recovery_service._bx_block_hash_to_sids))
-        self.assertEqual(existing_block_count, len(self.block_recovery_service._bx_block_hash_to_tx_hashes))
-        self.assertEqual(existing_block_count, len(self.block_recovery_service._bx_block_hash_to_block_hash))
+        self.assertEqual(existing_block_count, len(self.block_recovery_service._recovering_blocks))
+        self.assertEqual(existing_block_count, len(self.block_recovery_service._block_hash_to_recovery_ids))
         self.assertEqual(existing_block_count, len(self.block_recovery_service._blocks_expiration_queue))
-        self.assertEqual(existing_block_count * 3, len(self.block_recovery_service._sid_to_bx_block_hashes))
-        self.assertEqual(existing_block_count * 2, len(self.block_recovery_service._tx_hash_to_bx_block_hashes))
+        self.assertEqual(existing_block_count * 3, len(self.block_recovery_service._sid_to_recovery_ids))
+        self.assertEqual(existing_block_count * 2, len(self.block_recovery_service._tx_hash_to_recovery_ids))
 
         self.block_recovery_service \
             .add_block(self.blocks[-1], self.block_hashes[-1], self.unknown_tx_sids[-1][:],
                        self.unknown_tx_hashes[-1][:])
 
-        self.assertEqual(existing_block_count + 1, len(self.block_recovery_service._bx_block_hash_to_block))
-        self.assertEqual(existing_block_count + 1, len(self.block_recovery_service._bx_block_hash_to_sids))
-        self.assertEqual(existing_block_count + 1, len(self.block_recovery_service._bx_block_hash_to_tx_hashes))
-        self.assertEqual(existing_block_count + 1, len(self.block_recovery_service._bx_block_hash_to_block_hash))
+        self.assertEqual(existing_block_count + 1, len(self.block_recovery_service._recovering_blocks))
+        self.assertEqual(existing_block_count + 1, len(self.block_recovery_service._block_hash_to_recovery_ids))
         self.assertEqual(existing_block_count + 1, len(self.block_recovery_service._blocks_expiration_queue))
-        self.assertEqual(existing_block_count * 3 + 3, len(self.block_recovery_service._sid_to_bx_block_hashes))
-        self.assertEqual(existing_block_count * 2 + 2, len(self.block_recovery_service._tx_hash_to_bx_block_hashes))
+        self.assertEqual(existing_block_count * 3 + 3, len(self.block_recovery_service._sid_to_recovery_ids))
+        self.assertEqual(existing_block_count * 2 + 2, len(self.block_recovery_service._tx_hash_to_recovery_ids))
 
-        self.assertEqual(self.blocks[-1], self.block_recovery_service._bx_block_hash_to_block[self.bx_block_hashes[-1]])
-
-        self.assertEqual(set(self.unknown_tx_sids[-1]),
-                         self.block_recovery_service._bx_block_hash_to_sids[self.bx_block_hashes[-1]])
-        self.assertEqual(set(self.unknown_tx_hashes[-1]),
-                         self.block_recovery_service._bx_block_hash_to_tx_hashes[self.bx_block_hashes[-1]])
+        recovering_block = self._get_recovering_block(-1)
+        self.assertEqual(self.blocks[-1], recovering_block.bx_block)
+        self.assertEqual(set(self.unknown_tx_sids[-1]), recovering_block.unknown_short_ids)
+        self.assertEqual(set(self.unknown_tx_hashes[-1]), recovering_block.unknown_transaction_hashes)
 
         for sid in self.unknown_tx_sids[-1]:
-            self.assertIn(self.bx_block_hashes[-1], self.block_recovery_service._sid_to_bx_block_hashes[sid])
+            self.assertIn(recovering_block.recovery_id, self.block_recovery_service._sid_to_recovery_ids[sid])
 
         for tx_hash in self.unknown_tx_hashes[-1]:
-            self.assertIn(self.bx_block_hashes[-1], self.block_recovery_service._tx_hash_to_bx_block_hashes[tx_hash])
+            self.assertIn(recovering_block.recovery_id, self.block_recovery_service._tx_hash_to_recovery_ids[tx_hash])
 
     def test_multiple_compressed_versions_need_recovery(self):
         block_hash = Sha256Hash(helpers.generate_bytearray(crypto.SHA256_HASH_LEN))
 
         bx_block_1_v1 = helpers.generate_bytearray(100)
-        bx_block_1_v1_hash = Sha256Hash(crypto.double_sha256(bx_block_1_v1))
         unknown_sids_v1 = [i for i in range(10)]
         unknown_hashes_v1 = [Sha256Hash(helpers.generate_bytearray(crypto.SHA256_HASH_LEN)) for i in range(10)]
 
         bx_block_1_v2 = helpers.generate_bytearray(100)
-        bx_block_1_v2_hash = Sha256Hash(crypto.double_sha256(bx_block_1_v2))
         unknown_sids_v2 = [i for i in range(5, 15)]
         unknown_hashes_v2 = unknown_hashes_v1[5:]
         unknown_hashes_v2.extend(Sha256Hash(helpers.generate_bytearray(crypto.SHA256_HASH_LEN)) for i in range(5))
 
         self.block_recovery_service.add_block(bx_block_1_v1, block_hash, unknown_sids_v1, unknown_hashes_v1)
-        self.assertEqual(1, len(self.block_recovery_service._bx_block_hash_to_sids))
-        self.assertEqual(10, len(self.block_recovery_service._bx_block_hash_to_sids[bx_block_1_v1_hash]))
-        self.assertEqual(1, len(self.block_recovery_service._bx_block_hash_to_tx_hashes))
-        self.assertEqual(10, len(self.block_recovery_service._bx_block_hash_to_tx_hashes[bx_block_1_v1_hash]))
-        self.assertEqual(1, len(self.block_recovery_service._bx_block_hash_to_block))
-        self.assertEqual(10, len(self.block_recovery_service._sid_to_bx_block_hashes))
-        self.assertEqual(10, len(self.block_recovery_service._tx_hash_to_bx_block_hashes))
+        self.assertEqual(1, len(self.block_recovery_service._recovering_blocks))
+        recovering_block_v1 = next(iter(self.block_recovery_service._recovering_blocks.values()))
+        self.assertEqual(10, len(recovering_block_v1.unknown_short_ids))
+        self.assertEqual(10, len(recovering_block_v1.unknown_transaction_hashes))
+        self.assertEqual(10, len(self.block_recovery_service._sid_to_recovery_ids))
+        self.assertEqual(10, len(self.block_recovery_service._tx_hash_to_recovery_ids))
 
         self.block_recovery_service.check_missing_sid(unknown_sids_v1[0])
         self.block_recovery_service.check_missing_sid(unknown_sids_v1[1])
         self.block_recovery_service.check_missing_tx_hash(unknown_hashes_v1[0])
 
-        self.assertEqual(8, len(self.block_recovery_service._bx_block_hash_to_sids[bx_block_1_v1_hash]))
-        self.assertEqual(9, len(self.block_recovery_service._bx_block_hash_to_tx_hashes[bx_block_1_v1_hash]))
-        self.assertEqual(8, len(self.block_recovery_service._sid_to_bx_block_hashes))
-        self.assertEqual(9, len(self.block_recovery_service._tx_hash_to_bx_block_hashes))
+        self.assertEqual(8, len(recovering_block_v1.unknown_short_ids))
+        self.assertEqual(9, len(recovering_block_v1.unknown_transaction_hashes))
+        self.assertEqual(8, len(self.block_recovery_service._sid_to_recovery_ids))
+        self.assertEqual(9, len(self.block_recovery_service._tx_hash_to_recovery_ids))
         self.assertEqual(0, len(self.block_recovery_service.recovered_blocks))
 
         self.block_recovery_service.add_block(bx_block_1_v2, block_hash, unknown_sids_v2, unknown_hashes_v2)
 
-        self.assertEqual(10, len(self.block_recovery_service._bx_block_hash_to_sids[bx_block_1_v2_hash]))
-        self.assertEqual(10, len(self.block_recovery_service._bx_block_hash_to_tx_hashes[bx_block_1_v2_hash]))
-        self.assertEqual(13, len(self.block_recovery_service._sid_to_bx_block_hashes))
-        self.assertEqual(14, len(self.block_recovery_service._tx_hash_to_bx_block_hashes))
+        self.assertEqual(2, len(self.block_recovery_service._recovering_blocks))
+        self.assertEqual(2, len(self.block_recovery_service._block_hash_to_recovery_ids[block_hash]))
+        self.assertEqual(13, len(self.block_recovery_service._sid_to_recovery_ids))
+        self.assertEqual(14, len(self.block_recovery_service._tx_hash_to_recovery_ids))
         self.assertEqual(0, len(self.block_recovery_service.recovered_blocks))
 
         for unknown_sid in unknown_sids_v2:
@@ -250,21 +290,16 @@ class BlockRecoveryManagerTest(AbstractTestCase):
             self.block_recovery_service.check_missing_tx_hash(unknown_hash)
 
         # recovering one block should cancel recovery for the second
-        self.assertNotIn(block_hash, self.block_recovery_service._bx_block_hash_to_sids)
-        self.assertNotIn(block_hash, self.block_recovery_service._bx_block_hash_to_tx_hashes)
-        self.assertEqual(0, len(self.block_recovery_service._sid_to_bx_block_hashes))
-        self.assertEqual(0, len(self.block_recovery_service._tx_hash_to_bx_block_hashes))
+        self.assertEqual(0, len(self.block_recovery_service._sid_to_recovery_ids))
+        self.assertEqual(0, len(self.block_recovery_service._tx_hash_to_recovery_ids))
         self.assertEqual(1, len(self.block_recovery_service.recovered_blocks))
+        self.assertEqual(bx_block_1_v2, self.block_recovery_service.recovered_blocks[0])
 
         self._assert_no_blocks_awaiting_recovery()
 
     def _assert_no_blocks_awaiting_recovery(self):
-        self.assertEqual(0, len(self.block_recovery_service._bx_block_hash_to_block))
-        self.assertEqual(0, len(self.block_recovery_service._bx_block_hash_to_sids))
-        self.assertEqual(0, len(self.block_recovery_service._bx_block_hash_to_tx_hashes))
-        self.assertEqual(0, len(self.block_recovery_service._bx_block_hash_to_block_hash))
-
-        self.assertEqual(0, len(self.block_recovery_service._sid_to_bx_block_hashes))
-        self.assertEqual(0, len(self.block_recovery_service._tx_hash_to_bx_block_hashes))
-        self.assertEqual(0, len(self.block_recovery_service._block_hash_to_bx_block_hashes))
-
+        self.assertEqual(0, len(self.block_recovery_service._recovering_blocks))
+        self.assertEqual(0, len(self.block_recovery_service._sid_to_recovery_ids))
+        self.assertEqual(0, len(self.block_recovery_service._tx_hash_to_recovery_ids))
+        self.assertEqual(0, len(self.block_recovery_service._block_hash_to_recovery_ids))
+        self.assertEqual(0, self.block_recovery_service.get_recovery_stats().bytes_awaiting_recovery)
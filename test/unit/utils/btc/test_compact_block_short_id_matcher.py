@@ -0,0 +1,112 @@
+from bxcommon.services.transaction_service import TransactionService
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.test_utils.mocks.mock_node import MockNode
+from bxcommon.utils.crypto import SHA256_HASH_LEN
+from bxcommon.utils.object_hash import Sha256Hash
+
+from bxgateway.messages.btc.btc_normal_message_converter import compute_short_id
+from bxgateway.utils.btc.compact_block_short_id_matcher import CompactBlockShortIdMatcher
+
+KEY = bytes(range(16))
+
+
+class CompactBlockShortIdMatcherTest(AbstractTestCase):
+
+    def setUp(self):
+        self.tx_service = TransactionService(MockNode(helpers.get_gateway_opts(8000)), 0)
+        self.matcher = CompactBlockShortIdMatcher(max_window_size=100, batch_size=4)
+
+    def _add_transactions(self, count: int, add_to_matcher: bool = True):
+        tx_hashes = []
+        for i in range(count):
+            tx_hash = Sha256Hash(helpers.generate_bytearray(SHA256_HASH_LEN))
+            self.tx_service.set_transaction_contents(tx_hash, helpers.generate_bytearray(100 + i))
+            if add_to_matcher:
+                self.matcher.add_transaction(tx_hash)
+            tx_hashes.append(tx_hash)
+        return tx_hashes
+
+    def _short_id(self, tx_hash: Sha256Hash) -> bytes:
+        return compute_short_id(KEY, tx_hash.binary[::-1])
+
+    def test_match(self):
+        tx_hashes = self._add_transactions(20)
+        block_tx_hashes = tx_hashes[2:5] + tx_hashes[17:]
+        unknown_short_id = self._short_id(Sha256Hash(helpers.generate_bytearray(SHA256_HASH_LEN)))
+        short_ids = [self._short_id(tx_hash) for tx_hash in block_tx_hashes] + [unknown_short_id]
+
+        short_id_to_tx = self.matcher.match(KEY, short_ids, self.tx_service)
+
+        self.assertEqual(len(block_tx_hashes), len(short_id_to_tx))
+        for tx_hash in block_tx_hashes:
+            self.assertEqual(
+                (tx_hash, self.tx_service.get_transaction_by_hash(tx_hash)), short_id_to_tx[self._short_id(tx_hash)]
+            )
+        self.assertNotIn(unknown_short_id, short_id_to_tx)
+
+    def test_window_drops_oldest_transactions(self):
+        self.matcher = CompactBlockShortIdMatcher(max_window_size=5, batch_size=2)
+        tx_hashes = self._add_transactions(8)
+
+        self.assertEqual(5, len(self.matcher))
+        for tx_hash in tx_hashes[:3]:
+            self.assertNotIn(tx_hash, self.matcher)
+
+        short_id_to_tx = self.matcher.match(
+            KEY, [self._short_id(tx_hash) for tx_hash in tx_hashes], self.tx_service
+        )
+        self.assertEqual(
+            {self._short_id(tx_hash) for tx_hash in tx_hashes[3:]}, set(short_id_to_tx.keys())
+        )
+
+    def test_removed_transactions_not_matched(self):
+        tx_hashes = self._add_transactions(30)
+        for tx_hash in tx_hashes[:25]:
+            self.tx_service.remove_transaction_by_tx_hash(tx_hash)
+            self.matcher.remove_transaction(tx_hash)
+
+        self.assertEqual(5, len(self.matcher))
+        short_id_to_tx = self.matcher.match(
+            KEY, [self._short_id(tx_hash) for tx_hash in tx_hashes], self.tx_service
+        )
+        self.assertEqual(
+            {self._short_id(tx_hash) for tx_hash in tx_hashes[25:]}, set(short_id_to_tx.keys())
+        )
+
+    def test_transactions_missing_from_tx_service_dropped(self):
+        tx_hashes = self._add_transactions(10)
+        self.tx_service.remove_transaction_by_tx_hash(tx_hashes[0])
+
+        short_id_to_tx = self.matcher.match(KEY, [self._short_id(tx_hashes[0])], self.tx_service)
+
+        self.assertEqual({}, short_id_to_tx)
+        self.assertNotIn(tx_hashes[0], self.matcher)
+
+    def test_match_does_not_read_tx_service_hashes(self):
+        tx_hashes = self._add_transactions(10, add_to_matcher=False)
+
+        short_id_to_tx = self.matcher.match(KEY, [self._short_id(tx_hashes[3])], self.tx_service)
+
+        self.assertEqual({}, short_id_to_tx)
+        self.assertEqual(0, len(self.matcher))
+
+    def test_sync_from_transaction_service(self):
+        self.matcher = CompactBlockShortIdMatcher(max_window_size=5, batch_size=2)
+        synced_tx_hashes = self._add_transactions(6, add_to_matcher=False)
+        seen_tx_hashes = self._add_transactions(3)
+
+        self.matcher.sync_from_transaction_service(self.tx_service)
+
+        self.assertEqual(5, len(self.matcher))
+        for tx_hash in synced_tx_hashes[4:] + seen_tx_hashes:
+            self.assertIn(tx_hash, self.matcher)
+        short_id_to_tx = self.matcher.match(KEY, [self._short_id(synced_tx_hashes[5])], self.tx_service)
+        self.assertIn(self._short_id(synced_tx_hashes[5]), short_id_to_tx)
+
+        # synced transactions are older than transactions seen before sync, so they are dropped first
+        new_tx_hashes = self._add_transactions(2)
+        for tx_hash in synced_tx_hashes:
+            self.assertNotIn(tx_hash, self.matcher)
+        for tx_hash in seen_tx_hashes + new_tx_hashes:
+            self.assertIn(tx_hash, self.matcher)
@@ -0,0 +1,49 @@
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+
+from bxgateway.btc_constants import BTC_HDR_COMMON_OFF
+from bxgateway.messages.btc import btc_messages_util
+from bxgateway.messages.btc.tx_btc_message import TxBtcMessage
+from bxgateway.utils.btc.txid_cache import TxIdCache
+
+
+class TxIdCacheTest(AbstractTestCase):
+
+    def setUp(self):
+        self.txs = [TxBtcMessage(12345, 23456, [], [], i).rawbytes()[BTC_HDR_COMMON_OFF:] for i in range(5)]
+        self.txid_cache = TxIdCache()
+
+    def test_get_txid(self):
+        for tx in self.txs:
+            self.assertEqual(btc_messages_util.get_txid(tx), self.txid_cache.get_txid(tx))
+        for tx in self.txs:
+            self.assertEqual(btc_messages_util.get_txid(tx), self.txid_cache.get_txid(bytearray(tx)))
+
+        stats = self.txid_cache.get_stats()
+        self.assertEqual(5, stats.hits)
+        self.assertEqual(5, stats.misses)
+        self.assertEqual(0.5, stats.hit_rate())
+        self.assertEqual(5, stats.tx_count)
+        self.assertEqual(sum(len(tx) for tx in self.txs), stats.size_bytes)
+
+    def test_pop_txid(self):
+        self.txid_cache.get_txid(self.txs[0])
+
+        self.assertEqual(btc_messages_util.get_txid(self.txs[0]), self.txid_cache.pop_txid(self.txs[0]))
+        self.assertEqual(btc_messages_util.get_txid(self.txs[1]), self.txid_cache.pop_txid(self.txs[1]))
+
+        stats = self.txid_cache.get_stats()
+        self.assertEqual(1, stats.hits)
+        self.assertEqual(2, stats.misses)
+        self.assertEqual(0, stats.tx_count)
+        self.assertEqual(0, stats.size_bytes)
+
+    def test_oldest_transactions_evicted(self):
+        self.txid_cache = TxIdCache(max_size_bytes=len(self.txs[0]) * 3)
+        for tx in self.txs:
+            self.txid_cache.get_txid(tx)
+
+        self.assertEqual(3, len(self.txid_cache))
+        self.assertIsNone(self.txid_cache.get(self.txs[0]))
+        self.assertIsNone(self.txid_cache.get(self.txs[1]))
+        self.assertEqual(btc_messages_util.get_txid(self.txs[4]), self.txid_cache.get(self.txs[4]))
+        self.assertEqual(2, self.txid_cache.get_stats().evicted)
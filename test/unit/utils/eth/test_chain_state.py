@@ -0,0 +1,98 @@
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+
+from bxgateway.utils.eth.chain_state import ChainState
+
+
+class ChainStateTest(AbstractTestCase):
+
+    def setUp(self):
+        self.chain_state = ChainState(max_depth=5, max_block_count=20)
+
+    def test_try_add_child_block(self):
+        head_hash = helpers.generate_object_hash()
+        self.chain_state.add_block(head_hash, 1000)
+
+        block_hash = helpers.generate_object_hash()
+        self.assertEqual(1010, self.chain_state.try_add_child_block(block_hash, head_hash, 10))
+        self.assertEqual(1010, self.chain_state.get_total_difficulty(block_hash))
+        self.assertEqual(head_hash, self.chain_state.get_entry(block_hash).parent_hash)
+
+        unknown_parent_hash = helpers.generate_object_hash()
+        orphan_hash = helpers.generate_object_hash()
+        self.assertIsNone(self.chain_state.try_add_child_block(orphan_hash, unknown_parent_hash, 10))
+        self.assertNotIn(orphan_hash, self.chain_state)
+
+    def test_block_number_from_parent(self):
+        head_hash = helpers.generate_object_hash()
+        self.chain_state.add_block(head_hash, 1000, block_number=100)
+
+        block_hash = helpers.generate_object_hash()
+        self.chain_state.try_add_child_block(block_hash, head_hash, 10)
+        self.assertEqual(101, self.chain_state.get_entry(block_hash).block_number)
+
+    def test_fork(self):
+        head_hash = helpers.generate_object_hash()
+        self.chain_state.add_block(head_hash, 1000, block_number=100)
+
+        fork_1_hash = helpers.generate_object_hash()
+        fork_2_hash = helpers.generate_object_hash()
+        self.assertEqual(1010, self.chain_state.try_add_child_block(fork_1_hash, head_hash, 10, 101))
+        self.assertEqual(1020, self.chain_state.try_add_child_block(fork_2_hash, head_hash, 20, 101))
+
+        self.assertEqual(1015, self.chain_state.try_add_child_block(helpers.generate_object_hash(), fork_1_hash, 5))
+        self.assertEqual(1025, self.chain_state.try_add_child_block(helpers.generate_object_hash(), fork_2_hash, 5))
+
+    def test_max_depth(self):
+        block_hashes = [helpers.generate_object_hash() for _ in range(10)]
+        self.chain_state.add_block(block_hashes[0], 1000, block_number=0)
+        for block_number in range(1, 10):
+            self.chain_state.try_add_child_block(block_hashes[block_number], block_hashes[block_number - 1], 10)
+
+        self.assertEqual(6, len(self.chain_state))
+        for block_hash in block_hashes[:4]:
+            self.assertNotIn(block_hash, self.chain_state)
+        for block_hash in block_hashes[4:]:
+            self.assertIn(block_hash, self.chain_state)
+        self.assertEqual(1090, self.chain_state.get_total_difficulty(block_hashes[-1]))
+
+    def test_max_depth_after_unnumbered_head(self):
+        block_hashes = [helpers.generate_object_hash() for _ in range(10)]
+        # chain head from the Status message has no block number
+        self.chain_state.add_block(block_hashes[0], 1000)
+        self.chain_state.try_add_child_block(block_hashes[1], block_hashes[0], 10, 1)
+        self.assertEqual(0, self.chain_state.get_entry(block_hashes[0]).block_number)
+
+        for block_number in range(2, 10):
+            self.chain_state.try_add_child_block(block_hashes[block_number], block_hashes[block_number - 1], 10)
+
+        self.assertEqual(6, len(self.chain_state))
+        for block_hash in block_hashes[:4]:
+            self.assertNotIn(block_hash, self.chain_state)
+
+    def test_max_depth_skips_unnumbered_blocks(self):
+        unnumbered_hash = helpers.generate_object_hash()
+        self.chain_state.add_block(unnumbered_hash, 1000)
+        block_hashes = [helpers.generate_object_hash() for _ in range(10)]
+        self.chain_state.add_block(block_hashes[0], 2000, block_number=0)
+        for block_number in range(1, 10):
+            self.chain_state.try_add_child_block(block_hashes[block_number], block_hashes[block_number - 1], 10)
+
+        self.assertEqual(7, len(self.chain_state))
+        self.assertIn(unnumbered_hash, self.chain_state)
+        for block_hash in block_hashes[:4]:
+            self.assertNotIn(block_hash, self.chain_state)
+
+    def test_max_block_count(self):
+        block_hashes = [helpers.generate_object_hash() for _ in range(25)]
+        for block_hash in block_hashes:
+            self.chain_state.add_block(block_hash, 1000)
+
+        self.assertEqual(20, len(self.chain_state))
+        self.assertNotIn(block_hashes[4], self.chain_state)
+        self.assertIn(block_hashes[5], self.chain_state)
+
+    def test_clear(self):
+        self.chain_state.add_block(helpers.generate_object_hash(), 1000, block_number=100)
+        self.chain_state.clear()
+        self.assertEqual(0, len(self.chain_state))
@@ -82,3 +82,43 @@ class FramedInputBufferTests(AbstractRLPxCipherTest):
 
         self.assertTrue(is_full)
         self.assertEqual(msg_type, dummy_msg_type)
+
+        message, full_msg_type = framed_input_buffer.get_full_message()
+        self.assertEqual(dummy_payload, message)
+        self.assertEqual(dummy_msg_type, full_msg_type)
+
+    def test_chunked_frames_decrypted_in_single_call(self):
+        cipher1, cipher2 = self.setup_ciphers()
+
+        dummy_msg_type = 10
+        dummy_payload = helpers.generate_bytearray(self.TEST_FRAME_SIZE * 3 + 7)
+        next_dummy_payload = helpers.generate_bytearray(123)
+        dummy_protocol = 0
+
+        input_buffer = InputBuffer()
+        frames = frame_utils.get_frames(dummy_msg_type, memoryview(dummy_payload), dummy_protocol,
+                                        self.TEST_FRAME_SIZE)
+        frames.extend(frame_utils.get_frames(dummy_msg_type + 1, memoryview(next_dummy_payload), dummy_protocol,
+                                             self.TEST_FRAME_SIZE))
+        for frame in frames:
+            input_buffer.add_bytes(cipher1.encrypt_frame(frame))
+
+        framed_input_buffer = FramedInputBuffer(cipher2)
+
+        is_full, msg_type = framed_input_buffer.peek_message(input_buffer)
+        self.assertTrue(is_full)
+        self.assertEqual(dummy_msg_type, msg_type)
+
+        message, full_msg_type = framed_input_buffer.get_full_message()
+        self.assertIsInstance(message, memoryview)
+        self.assertEqual(dummy_payload, message)
+        self.assertEqual(dummy_msg_type, full_msg_type)
+
+        # frames of the next message stay in the input buffer until it is peeked
+        self.assertEqual(frames[-1].get_frame_size(), input_buffer.length)
+        is_full, msg_type = framed_input_buffer.peek_message(input_buffer)
+        self.assertTrue(is_full)
+        message, full_msg_type = framed_input_buffer.get_full_message()
+        self.assertEqual(next_dummy_payload, message)
+        self.assertEqual(dummy_msg_type + 1, full_msg_type)
+        self.assertEqual(0, input_buffer.length)
@@ -0,0 +1,53 @@
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+
+from bxgateway.utils.eth import crypto_utils
+from bxgateway.utils.eth.keccak_cache import KeccakCache
+
+
+class KeccakCacheTest(AbstractTestCase):
+
+    def setUp(self):
+        self.buffers = [helpers.generate_bytearray(100) for _ in range(5)]
+        self.keccak_cache = KeccakCache()
+
+    def test_keccak_hash(self):
+        for buf in self.buffers:
+            self.assertEqual(crypto_utils.keccak_hash(buf), self.keccak_cache.keccak_hash(buf))
+        for buf in self.buffers:
+            self.assertEqual(crypto_utils.keccak_hash(buf), self.keccak_cache.keccak_hash(memoryview(buf)))
+
+        stats = self.keccak_cache.get_stats()
+        self.assertEqual(5, stats.hits)
+        self.assertEqual(5, stats.misses)
+        self.assertEqual(0.5, stats.hit_rate())
+        self.assertEqual(5, stats.entry_count)
+        self.assertEqual(500, stats.size_bytes)
+
+    def test_add_and_get(self):
+        self.assertIsNone(self.keccak_cache.get(self.buffers[0]))
+        self.keccak_cache.add(self.buffers[0], crypto_utils.keccak_hash(self.buffers[0]))
+        self.assertEqual(crypto_utils.keccak_hash(self.buffers[0]), self.keccak_cache.get(self.buffers[0]))
+
+    def test_least_recently_used_evicted(self):
+        self.keccak_cache = KeccakCache(max_size_bytes=300)
+        for buf in self.buffers[:3]:
+            self.keccak_cache.keccak_hash(buf)
+        # first buffer becomes the most recently used
+        self.keccak_cache.keccak_hash(self.buffers[0])
+
+        self.keccak_cache.keccak_hash(self.buffers[3])
+
+        self.assertEqual(3, len(self.keccak_cache))
+        self.assertIsNone(self.keccak_cache.get(self.buffers[1]))
+        self.assertIsNotNone(self.keccak_cache.get(self.buffers[0]))
+        self.assertEqual(1, self.keccak_cache.get_stats().evicted)
+
+    def test_pop_hash(self):
+        self.keccak_cache.keccak_hash(self.buffers[0])
+
+        self.assertEqual(crypto_utils.keccak_hash(self.buffers[0]), self.keccak_cache.pop_hash(self.buffers[0]))
+        self.assertEqual(0, len(self.keccak_cache))
+        self.assertEqual(0, self.keccak_cache.get_stats().size_bytes)
+        self.assertEqual(crypto_utils.keccak_hash(self.buffers[1]), self.keccak_cache.pop_hash(self.buffers[1]))
+        self.assertEqual(0, len(self.keccak_cache))
@@ -0,0 +1,82 @@
+import rlp
+
+from bxcommon.exceptions import ParseError
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+
+from bxgateway.utils.eth.rlp_view import RlpListView
+
+
+class RlpViewTest(AbstractTestCase):
+
+    def setUp(self):
+        self.long_item = b"\x11" * 100
+        self.items = [b"\x05", b"", self.long_item, [b"abc", [b"d", b"e"]], 1000000]
+        self.rlp_bytes = memoryview(rlp.encode(self.items))
+        self.rlp_view = RlpListView(self.rlp_bytes)
+
+    def test_items(self):
+        self.assertEqual(5, len(self.rlp_view))
+        self.assertEqual(self.rlp_bytes, self.rlp_view.raw_bytes())
+
+        self.assertEqual(b"\x05", self.rlp_view.get_item_payload(0))
+        self.assertEqual(b"", self.rlp_view.get_item_payload(1))
+        self.assertEqual(self.long_item, self.rlp_view.get_item_payload(2))
+
+        for index, item in enumerate(self.items):
+            self.assertEqual(rlp.encode(item), self.rlp_view.get_item_bytes(index))
+        self.assertEqual([rlp.encode(item) for item in self.items], self.rlp_view.get_items_list())
+
+    def test_items_are_not_copied(self):
+        item_bytes = self.rlp_view.get_item_payload(2)
+        self.assertIsInstance(item_bytes, memoryview)
+        self.assertIs(self.rlp_bytes.obj, item_bytes.obj)
+
+    def test_get_int(self):
+        self.assertEqual(5, self.rlp_view.get_int(0))
+        self.assertEqual(0, self.rlp_view.get_int(1))
+        self.assertEqual(1000000, self.rlp_view.get_int(4))
+        self.assertEqual(1000000, self.rlp_view.get_int(-1))
+
+    def test_get_list(self):
+        nested_view = self.rlp_view.get_list(3)
+        self.assertEqual(2, len(nested_view))
+        self.assertEqual(b"abc", nested_view.get_item_payload(0))
+        self.assertEqual(rlp.encode([b"d", b"e"]), nested_view.get_item_bytes(1))
+        self.assertEqual(b"e", nested_view.get_list(1).get_item_payload(1))
+        self.assertEqual(rlp.encode(self.items[3]), nested_view.raw_bytes())
+
+        self.assertIs(nested_view, self.rlp_view.get_list(3))
+        self.assertIs(nested_view, self.rlp_view.get_list(-2))
+
+    def test_get_items_bytes(self):
+        self.assertEqual(b"".join(rlp.encode(item) for item in self.items), self.rlp_view.payload())
+        self.assertEqual(self.rlp_view.payload(), self.rlp_view.get_items_bytes())
+        self.assertEqual(rlp.encode(b"") + rlp.encode(self.long_item), self.rlp_view.get_items_bytes(1, 3))
+        self.assertEqual(b"", self.rlp_view.get_items_bytes(2, 2))
+
+    def test_view_at_offset(self):
+        buf = memoryview(b"\xff\xff" + bytes(self.rlp_bytes))
+        rlp_view = RlpListView(buf, 2)
+        self.assertEqual(5, len(rlp_view))
+        self.assertEqual(self.rlp_bytes, rlp_view.raw_bytes())
+        self.assertEqual(b"abc", rlp_view.get_list(3).get_item_payload(0))
+
+    def test_empty_list(self):
+        rlp_view = RlpListView(memoryview(rlp.encode([])))
+        self.assertEqual(0, len(rlp_view))
+        self.assertEqual([], rlp_view.get_items_list())
+        self.assertEqual(b"", rlp_view.get_items_bytes())
+
+    def test_invalid_input(self):
+        with self.assertRaises(ParseError):
+            RlpListView(memoryview(rlp.encode(b"not a list")))
+
+        with self.assertRaises(ParseError):
+            RlpListView(self.rlp_bytes[:-1])
+
+        # list prefix length is larger than its items
+        corrupted_bytes = bytearray(rlp.encode([b"a", b"b"]))
+        corrupted_bytes[0] += 1
+        corrupted_bytes.append(0x80 + 5)
+        with self.assertRaises(ParseError):
+            len(RlpListView(memoryview(corrupted_bytes)))
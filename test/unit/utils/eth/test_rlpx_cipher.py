@@ -34,3 +34,20 @@ class RLPxCipherTests(AbstractRLPxCipherTest):
         mac_ingress2 = cipher2.mac_ingress()
 
         self.assertEqual(mac_egress1, mac_ingress2)
+
+    def test_rlpx_cipher_output_buffer(self):
+        cipher1, cipher2 = self.setup_ciphers()
+
+        dummy_text = memoryview(b"Lorem ipsum dolor sit amet")
+
+        encoded_text = bytearray(len(dummy_text))
+        self.assertIs(encoded_text, cipher1.aes_encode(dummy_text, encoded_text))
+        self.assertNotEqual(dummy_text, encoded_text)
+
+        decoded_text = memoryview(bytearray(len(encoded_text)))
+        cipher2.aes_decode(memoryview(encoded_text), decoded_text)
+        self.assertEqual(dummy_text, decoded_text)
+
+        # in place
+        cipher1.aes_encode(decoded_text, decoded_text)
+        self.assertEqual(dummy_text, cipher2.aes_decode(decoded_text))
@@ -0,0 +1,109 @@
+import time
+from unittest import TestCase
+
+from mock import MagicMock
+
+from bxcommon.messages.bloxroute.ping_message import PingMessage
+from bxgateway.utils.blockchain_message_scheduler import BlockchainMessageScheduler, BlockchainMessagePriority
+
+BLOCK_QUANTUM = 1000
+ANNOUNCE_QUANTUM = 200
+TX_QUANTUM = 100
+
+BLOCK_TTL = 60
+ANNOUNCE_TTL = 30
+TX_TTL = 10
+
+
+class BlockchainMessageSchedulerTest(TestCase):
+
+    def setUp(self) -> None:
+        self.scheduler = BlockchainMessageScheduler(
+            {
+                BlockchainMessagePriority.BLOCK: BLOCK_QUANTUM,
+                BlockchainMessagePriority.BLOCK_ANNOUNCE: ANNOUNCE_QUANTUM,
+                BlockchainMessagePriority.TRANSACTION: TX_QUANTUM,
+            },
+            {
+                BlockchainMessagePriority.BLOCK: BLOCK_TTL,
+                BlockchainMessagePriority.BLOCK_ANNOUNCE: ANNOUNCE_TTL,
+                BlockchainMessagePriority.TRANSACTION: TX_TTL,
+            }
+        )
+
+    def test_pop_empty(self):
+        self.assertIsNone(self.scheduler.pop())
+        self.assertEqual(0, len(self.scheduler))
+
+    def test_pop_in_order_within_priority(self):
+        messages = [PingMessage(i) for i in range(5)]
+        for message in messages:
+            self.scheduler.push(BlockchainMessagePriority.TRANSACTION, message, 10)
+        self.assertEqual(50, self.scheduler.queued_bytes())
+        self.assertEqual(50, self.scheduler.queued_bytes(BlockchainMessagePriority.TRANSACTION))
+        self.assertEqual(0, self.scheduler.queued_bytes(BlockchainMessagePriority.BLOCK))
+
+        for message in messages:
+            self.assertEqual(message, self.scheduler.pop().message)
+        self.assertIsNone(self.scheduler.pop())
+        self.assertEqual(0, self.scheduler.queued_bytes())
+
+    def test_block_preempts_transaction_backlog(self):
+        tx_messages = [PingMessage(i) for i in range(100)]
+        for tx_message in tx_messages:
+            self.scheduler.push(BlockchainMessagePriority.TRANSACTION, tx_message, 10)
+
+        # start draining transactions, then a block arrives
+        self.assertEqual(tx_messages[0], self.scheduler.pop().message)
+        block_message = PingMessage(1000)
+        self.scheduler.push(BlockchainMessagePriority.BLOCK, block_message, 2500)
+
+        tx_bytes_before_block = 0
+        while True:
+            message = self.scheduler.pop().message
+            if message == block_message:
+                break
+            tx_bytes_before_block += 10
+
+        # at most one transaction quantum is written ahead of the block in each round
+        self.assertLessEqual(tx_bytes_before_block, 3 * TX_QUANTUM)
+
+    def test_lower_priorities_not_starved(self):
+        for i in range(10):
+            self.scheduler.push(BlockchainMessagePriority.BLOCK, PingMessage(i), BLOCK_QUANTUM)
+        tx_message = PingMessage(100)
+        announce_message = PingMessage(101)
+        self.scheduler.push(BlockchainMessagePriority.TRANSACTION, tx_message, TX_QUANTUM)
+        self.scheduler.push(BlockchainMessagePriority.BLOCK_ANNOUNCE, announce_message, ANNOUNCE_QUANTUM)
+
+        popped = [self.scheduler.pop().message for _ in range(4)]
+        self.assertIn(tx_message, popped)
+        self.assertIn(announce_message, popped)
+        self.assertEqual(announce_message, popped[1])
+        self.assertEqual(tx_message, popped[2])
+
+    def test_expired_messages_dropped_per_priority(self):
+        block_message = PingMessage(1)
+        tx_message = PingMessage(2)
+        self.scheduler.push(BlockchainMessagePriority.BLOCK, block_message, 10)
+        self.scheduler.push(BlockchainMessagePriority.TRANSACTION, tx_message, 20)
+
+        time.time = MagicMock(return_value=time.time() + TX_TTL + 1)
+
+        self.assertEqual(block_message, self.scheduler.pop().message)
+        self.assertIsNone(self.scheduler.pop())
+
+        stats = self.scheduler.get_stats()
+        self.assertEqual(1, stats.expired_messages[BlockchainMessagePriority.TRANSACTION])
+        self.assertEqual(20, stats.expired_bytes[BlockchainMessagePriority.TRANSACTION])
+        self.assertEqual(0, stats.expired_messages[BlockchainMessagePriority.BLOCK])
+        self.assertEqual(0, self.scheduler.queued_bytes())
+
+    def test_clear(self):
+        self.scheduler.push(BlockchainMessagePriority.BLOCK, PingMessage(1), 10)
+        self.scheduler.push(BlockchainMessagePriority.TRANSACTION, PingMessage(2), 10)
+        self.scheduler.clear()
+
+        self.assertEqual(0, len(self.scheduler))
+        self.assertEqual(0, self.scheduler.queued_bytes())
+        self.assertIsNone(self.scheduler.pop())
@@ -0,0 +1,53 @@
+from bxcommon.messages.bloxroute.broadcast_message import BroadcastMessage
+from bxcommon.messages.bloxroute.ping_message import PingMessage
+from bxcommon.messages.bloxroute.tx_message import TxMessage
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils import crypto
+from bxcommon.utils.object_hash import Sha256Hash
+
+from bxgateway.utils.broadcast_blob_hasher import BroadcastBlobHasher
+
+
+class BroadcastBlobHasherTest(AbstractTestCase):
+
+    def setUp(self):
+        self.hasher = BroadcastBlobHasher()
+
+    def test_hash_broadcast_blobs(self):
+        broadcast_messages = []
+        stream = bytearray()
+        for blob_len in [1, 100, 10000]:
+            blob = helpers.generate_bytearray(blob_len)
+            broadcast_message = BroadcastMessage(Sha256Hash(crypto.double_sha256(blob)), 1, "", True, blob)
+            broadcast_messages.append(broadcast_message)
+            stream += broadcast_message.rawbytes()
+            stream += PingMessage(nonce=blob_len).rawbytes()
+            stream += TxMessage(helpers.generate_object_hash(), 1, tx_val=helpers.generate_bytearray(250)).rawbytes()
+
+        for chunk_size in [1, 7, 1000, len(stream)]:
+            for chunk_start in range(0, len(stream), chunk_size):
+                self.hasher.feed(stream[chunk_start:chunk_start + chunk_size])
+
+            for broadcast_message in broadcast_messages:
+                blob = broadcast_message.blob()
+                self.assertEqual(crypto.double_sha256(blob), self.hasher.pop_digest(len(blob)))
+            self.assertIsNone(self.hasher.pop_digest(0))
+
+    def test_pop_digest_length_mismatch(self):
+        blob = helpers.generate_bytearray(100)
+        broadcast_message = BroadcastMessage(Sha256Hash(crypto.double_sha256(blob)), 1, "", True, blob)
+        self.hasher.feed(broadcast_message.rawbytes())
+        self.hasher.feed(broadcast_message.rawbytes())
+
+        self.assertIsNone(self.hasher.pop_digest(len(blob) + 1))
+        self.assertIsNone(self.hasher.pop_digest(len(blob)))
+
+    def test_partial_message(self):
+        blob = helpers.generate_bytearray(100)
+        broadcast_message = BroadcastMessage(Sha256Hash(crypto.double_sha256(blob)), 1, "", True, blob)
+        self.hasher.feed(broadcast_message.rawbytes()[:-1])
+        self.assertIsNone(self.hasher.pop_digest(len(blob)))
+
+        self.hasher.feed(broadcast_message.rawbytes()[-1:])
+        self.assertEqual(crypto.double_sha256(blob), self.hasher.pop_digest(len(blob)))
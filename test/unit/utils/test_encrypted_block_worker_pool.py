@@ -0,0 +1,77 @@
+import time
+from threading import Event
+
+from mock import MagicMock, patch
+
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils import crypto
+
+from bxgateway.utils import encrypted_block_worker_pool
+from bxgateway.utils.encrypted_block_worker_pool import EncryptedBlockWorkerPool
+
+
+class EncryptedBlockWorkerPoolTest(AbstractTestCase):
+
+    def setUp(self):
+        self.alarm_queue = MagicMock()
+        self.pool = EncryptedBlockWorkerPool(self.alarm_queue, 2)
+        self.results = []
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_process_encrypted_block(self):
+        block = bytes(helpers.generate_bytearray(1000))
+        key, ciphertext = crypto.symmetric_encrypt(block)
+        block_hash = crypto.double_sha256(ciphertext)
+
+        result = encrypted_block_worker_pool.process_encrypted_block(memoryview(ciphertext), block_hash, key)
+        self.assertTrue(result.hash_matches)
+        self.assertEqual(block, result.block)
+
+        result = encrypted_block_worker_pool.process_encrypted_block(ciphertext, block_hash, None)
+        self.assertTrue(result.hash_matches)
+        self.assertIsNone(result.block)
+
+        result = encrypted_block_worker_pool.process_encrypted_block(ciphertext, bytes(len(block_hash)), key)
+        self.assertFalse(result.hash_matches)
+        self.assertIsNone(result.block)
+
+        wrong_key, _ = crypto.symmetric_encrypt(block)
+        result = encrypted_block_worker_pool.process_encrypted_block(ciphertext, None, wrong_key)
+        self.assertTrue(result.hash_matches)
+        self.assertIsNone(result.block)
+
+    def test_callbacks_run_in_submission_order(self):
+        first_block_processed = Event()
+        process_encrypted_block = encrypted_block_worker_pool.process_encrypted_block
+
+        def process_first_block_last(cipherblob, expected_hash, key):
+            if cipherblob == b"first":
+                first_block_processed.wait()
+            else:
+                first_block_processed.set()
+            return process_encrypted_block(cipherblob, expected_hash, key)
+
+        with patch.object(encrypted_block_worker_pool, "process_encrypted_block", process_first_block_last):
+            self.pool.submit(b"first", None, None, lambda result: self.results.append("first"))
+            self.pool.submit(b"second", None, None, lambda result: self.results.append("second"))
+            self.alarm_queue.register_alarm.assert_called_once()
+
+            while len(self.pool) > 0:
+                time.sleep(0.001)
+                self.pool._run_completed_callbacks()
+
+        self.assertEqual(["first", "second"], self.results)
+        self.assertEqual(0, self.pool._run_completed_callbacks())
+
+    def test_create_encrypted_block_worker_pool(self):
+        opts = helpers.get_gateway_opts(8000)
+        # blocks are decrypted on the event loop if the option is not set
+        self.assertIsNone(encrypted_block_worker_pool.create_encrypted_block_worker_pool(opts, self.alarm_queue))
+
+        opts.block_decryption_workers = 2
+        pool = encrypted_block_worker_pool.create_encrypted_block_worker_pool(opts, self.alarm_queue)
+        self.assertEqual(2, pool.worker_count)
+        pool.close()
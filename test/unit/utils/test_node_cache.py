@@ -0,0 +1,93 @@
+import json
+import os
+import tempfile
+from argparse import Namespace
+
+from bxcommon.models.outbound_peer_model import OutboundPeerModel
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils.class_json_encoder import ClassJsonEncoder
+
+from bxgateway.utils import node_cache
+
+
+class NodeCacheTest(AbstractTestCase):
+
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.opts = Namespace(
+            cookie_file_path=os.path.join(self.cache_dir.name, ".gateway_cookies", ".cookie"),
+            enable_node_cache=True,
+            source_version="1.0.0",
+            blockchain_networks=[],
+            blockchain_network_num=1
+        )
+        self.relay_peers = [OutboundPeerModel("1.1.1.{}".format(i), 1609, "relay-{}".format(i)) for i in range(3)]
+
+    def tearDown(self) -> None:
+        self._clear_memory()
+        self.cache_dir.cleanup()
+
+    def test_update_and_read(self):
+        node_cache.update(self.opts, self.relay_peers).result()
+        self.assertEqual(self.relay_peers, node_cache.read(self.opts).relay_peers)
+
+        self._clear_memory()
+        cache_file_info = node_cache.read(self.opts)
+        self.assertEqual("1.0.0", cache_file_info.source_version)
+        self.assertEqual(self.relay_peers, cache_file_info.relay_peers)
+        self.assertEqual([], cache_file_info.blockchain_network)
+
+    def test_update_appends_changed_records(self):
+        node_cache.update(self.opts, self.relay_peers).result()
+        file_size = os.path.getsize(self.opts.cookie_file_path)
+
+        node_cache.update(self.opts, self.relay_peers).result()
+        self.assertEqual(file_size, os.path.getsize(self.opts.cookie_file_path))
+
+        node_cache.update(self.opts, self.relay_peers[:1]).result()
+        self.assertLess(file_size, os.path.getsize(self.opts.cookie_file_path))
+        self.assertEqual(self.relay_peers[:1], node_cache.read(self.opts).relay_peers)
+
+        # incomplete record at the end of the file is ignored
+        with open(self.opts.cookie_file_path, "ab") as cookie_file:
+            cookie_file.write(node_cache.RECORD_HEADER_STRUCT.pack(node_cache.CacheRecordType.RELAY_PEERS, 100))
+
+        self._clear_memory()
+        self.assertEqual(self.relay_peers[:1], node_cache.read(self.opts).relay_peers)
+
+    def test_update_after_upgrade_rewrites_file(self):
+        node_cache.update(self.opts, self.relay_peers).result()
+        node_cache.update(self.opts, self.relay_peers[:1]).result()
+        file_size = os.path.getsize(self.opts.cookie_file_path)
+
+        self.opts.source_version = "1.0.1"
+        node_cache.update(self.opts, self.relay_peers[:1]).result()
+        self.assertGreater(file_size, os.path.getsize(self.opts.cookie_file_path))
+
+        self._clear_memory()
+        cache_file_info = node_cache.read(self.opts)
+        self.assertEqual("1.0.1", cache_file_info.source_version)
+        self.assertEqual(self.relay_peers[:1], cache_file_info.relay_peers)
+
+    def test_read_json_cache_file(self):
+        os.makedirs(os.path.dirname(self.opts.cookie_file_path))
+        with open(self.opts.cookie_file_path, "w") as cookie_file:
+            json.dump({
+                "source_version": "0.9.0",
+                "relay_peers": [relay.__dict__ for relay in self.relay_peers],
+                "blockchain_network": []
+            }, cookie_file, indent=4, cls=ClassJsonEncoder)
+
+        cache_file_info = node_cache.read(self.opts)
+        self.assertEqual("0.9.0", cache_file_info.source_version)
+        self.assertEqual(self.relay_peers, cache_file_info.relay_peers)
+
+    def test_read_disabled(self):
+        node_cache.update(self.opts, self.relay_peers).result()
+        self.opts.enable_node_cache = False
+        self.assertIsNone(node_cache.read(self.opts))
+
+    def _clear_memory(self):
+        # simulates a restart of the gateway
+        node_cache._records_by_path.clear()
+        node_cache._file_size_by_path.clear()
@@ -0,0 +1,56 @@
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+
+from bxgateway.btc_constants import BTC_HDR_COMMON_OFF
+from bxgateway.messages.btc import btc_messages_util
+from bxgateway.messages.btc.btc_normal_message_converter import get_txid_binary
+from bxgateway.messages.btc.tx_btc_message import TxBtcMessage
+from bxgateway.utils.btc.btc_object_hash import BtcObjectHash
+from bxgateway.utils.eth import crypto_utils
+from bxgateway.utils.tx_hash_worker_pool import TxHashWorkerPool, create_tx_hash_worker_pool
+
+
+class TxHashWorkerPoolTest(AbstractTestCase):
+
+    def setUp(self):
+        self.pool = TxHashWorkerPool(2, min_tx_count=1)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_hash_transactions_preserves_order(self):
+        txs = [memoryview(helpers.generate_bytearray(100 + i)) for i in range(11)]
+
+        tx_hashes = self.pool.hash_transactions(crypto_utils.keccak_hash, txs)
+
+        self.assertEqual([crypto_utils.keccak_hash(tx) for tx in txs], tx_hashes)
+
+    def test_hash_btc_transactions(self):
+        txs = [TxBtcMessage(12345, 23456, [], [], i).rawbytes()[BTC_HDR_COMMON_OFF:] for i in range(5)]
+
+        tx_hashes = self.pool.hash_transactions(get_txid_binary, txs)
+
+        self.assertEqual(
+            [btc_messages_util.get_txid(tx) for tx in txs],
+            [BtcObjectHash(binary=tx_hash) for tx_hash in tx_hashes]
+        )
+
+    def test_hash_transactions_below_min_tx_count(self):
+        pool = TxHashWorkerPool(2, min_tx_count=10)
+        txs = [helpers.generate_bytearray(100) for _ in range(3)]
+
+        self.assertEqual(
+            [crypto_utils.keccak_hash(tx) for tx in txs], pool.hash_transactions(crypto_utils.keccak_hash, txs)
+        )
+        self.assertIsNone(pool._executor)
+
+    def test_create_tx_hash_worker_pool(self):
+        opts = helpers.get_gateway_opts(8000)
+        opts.use_extensions = False
+        # compression workers are disabled if the option is not set
+        self.assertIsNone(create_tx_hash_worker_pool(opts))
+
+        opts.compression_workers = 2
+        pool = create_tx_hash_worker_pool(opts)
+        self.assertEqual(2, pool.worker_count)
+        pool.close()
@@ -0,0 +1,106 @@
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
+from bxcommon import constants
+from bxcommon.services.transaction_service import TransactionService
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.test_utils.mocks.mock_node import MockNode
+from bxcommon.utils.object_hash import Sha256Hash
+
+from bxgateway.utils import tx_service_snapshot
+
+
+class TxServiceSnapshotTest(AbstractTestCase):
+
+    def setUp(self) -> None:
+        self.node = MockNode(helpers.get_gateway_opts(8000))
+        self.tx_service = TransactionService(self.node, 1)
+        self.tx_hashes = [Sha256Hash(helpers.generate_bytearray(32)) for _ in range(6)]
+        self.tx_contents = [helpers.generate_bytearray(250) for _ in range(6)]
+        for short_id, (tx_hash, tx_contents) in enumerate(zip(self.tx_hashes, self.tx_contents), 1):
+            # transactions without contents or without short ids are saved as well
+            if short_id % 3 != 0:
+                self.tx_service.assign_short_id(tx_hash, short_id)
+            if short_id % 3 != 1:
+                self.tx_service.set_transaction_contents(tx_hash, tx_contents)
+
+        self.writer = ThreadPoolExecutor(max_workers=1)
+        self.snapshot_dir = tempfile.TemporaryDirectory()
+        self.snapshot_path = os.path.join(self.snapshot_dir.name, "snapshots", "tx_service")
+
+    def tearDown(self) -> None:
+        self.writer.shutdown()
+        self.snapshot_dir.cleanup()
+
+    def test_save_and_load(self):
+        self.assertEqual(6, tx_service_snapshot.save(self.tx_service, 1, self.snapshot_path, self.writer).result())
+        self.assertFalse(os.path.exists("{}.tmp".format(self.snapshot_path)))
+
+        restored_tx_service = TransactionService(self.node, 1)
+        self.assertEqual(6, tx_service_snapshot.load(restored_tx_service, 1, self.snapshot_path))
+
+        for short_id, (tx_hash, tx_contents) in enumerate(zip(self.tx_hashes, self.tx_contents), 1):
+            if short_id % 3 != 0:
+                self.assertEqual(short_id, restored_tx_service.get_short_id(tx_hash))
+            else:
+                self.assertEqual(constants.NULL_TX_SID, restored_tx_service.get_short_id(tx_hash))
+
+            if short_id % 3 != 1:
+                self.assertEqual(tx_contents, restored_tx_service.get_transaction_by_hash(tx_hash))
+            else:
+                self.assertFalse(restored_tx_service.has_transaction_contents(tx_hash))
+
+    def test_save_and_load_multiple_short_ids(self):
+        self.tx_service.assign_short_id(self.tx_hashes[0], 100)
+        tx_service_snapshot.save(self.tx_service, 1, self.snapshot_path, self.writer).result()
+
+        restored_tx_service = TransactionService(self.node, 1)
+        tx_service_snapshot.load(restored_tx_service, 1, self.snapshot_path)
+
+        self.assertEqual({1, 100}, set(restored_tx_service.get_short_ids(self.tx_hashes[0])))
+        self.assertEqual(self.tx_hashes[0], restored_tx_service.get_transaction(100).hash)
+
+    def test_save_skips_transactions_removed_before_write(self):
+        write_allowed = Event()
+        self.writer.submit(write_allowed.wait)
+        snapshot_future = tx_service_snapshot.save(self.tx_service, 1, self.snapshot_path, self.writer)
+        self.tx_service.remove_transaction_by_tx_hash(self.tx_hashes[1])
+        write_allowed.set()
+        self.assertEqual(5, snapshot_future.result())
+
+        restored_tx_service = TransactionService(self.node, 1)
+        self.assertEqual(5, tx_service_snapshot.load(restored_tx_service, 1, self.snapshot_path))
+        self.assertFalse(restored_tx_service.has_transaction_contents(self.tx_hashes[1]))
+
+    def test_load_missing_file(self):
+        self.assertEqual(0, tx_service_snapshot.load(self.tx_service, 1, self.snapshot_path))
+
+    def test_load_ignores_other_network(self):
+        tx_service_snapshot.save(self.tx_service, 1, self.snapshot_path, self.writer).result()
+
+        restored_tx_service = TransactionService(self.node, 2)
+        self.assertEqual(0, tx_service_snapshot.load(restored_tx_service, 2, self.snapshot_path))
+        self.assertEqual(0, restored_tx_service.get_short_id_count())
+
+    def test_load_ignores_old_snapshot(self):
+        tx_service_snapshot.save(self.tx_service, 1, self.snapshot_path, self.writer).result()
+
+        restored_tx_service = TransactionService(self.node, 1)
+        self.assertEqual(0, tx_service_snapshot.load(restored_tx_service, 1, self.snapshot_path, max_age_s=-1))
+
+    def test_load_truncated_snapshot(self):
+        tx_service_snapshot.save(self.tx_service, 1, self.snapshot_path, self.writer).result()
+        with open(self.snapshot_path, "r+b") as snapshot_file:
+            snapshot_file.truncate(os.path.getsize(self.snapshot_path) - 1)
+
+        restored_tx_service = TransactionService(self.node, 1)
+        self.assertEqual(5, tx_service_snapshot.load(restored_tx_service, 1, self.snapshot_path))
+        restored_tx_hashes = [
+            tx_hash for tx_hash in self.tx_hashes
+            if restored_tx_service.get_short_id(tx_hash) != constants.NULL_TX_SID
+            or restored_tx_service.has_transaction_contents(tx_hash)
+        ]
+        self.assertEqual(5, len(restored_tx_hashes))